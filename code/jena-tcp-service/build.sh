@@ -1,3 +1,14 @@
+set -e
+
+# generate the Thrift stubs of the service (Java) and of its client (python-lib/jena/jenaService)
+# from the IDL, so that they always match it
+THRIFT_VERSION=0.14.2
+if ! thrift --version 2>/dev/null | grep -q " $THRIFT_VERSION"; then
+    echo "Thrift compiler $THRIFT_VERSION is required to generate the stubs" >&2
+    exit 1
+fi
+thrift --gen java -out src/main/java src/main/resources/jenaService.thrift
+thrift --gen py -out ../python-lib/jena src/main/resources/jenaService.thrift
 
 # build a JAR
 mvn package assembly:single
@@ -5,3 +16,19 @@ mvn package assembly:single
 # copy result jar to python lib jena/ dir where it can be run from
 cp -f target/Jena-1.0-SNAPSHOT-jar-with-dependencies.jar ../python-lib/jena/Jena.jar
 
+# `build.sh check`: run the load test against the new jar (not the stand-in) with each transport & protocol,
+# over TCP and over a Unix domain socket; batches of several traces are passed through shared memory;
+# the requests have deadlines (long enough to be met), so reasoning steps run guarded by them
+if [ "$1" = "check" ]; then
+    cd ../python-lib
+    for transport in buffered framed; do
+        for protocol in binary compact; do
+            for socket in "" --unix-socket; do
+                python -m bench.load --users 2 --batch-users 1 --batch-traces 3 --timeout 30 --duration 20 --mistake-rate 0 \
+                    --transport $transport --protocol $protocol $socket --fail-on-errors
+            done
+        done
+    done
+    # the ways of sending the data must find the same mistakes (before REGISTER_ALGORITHMS is turned on)
+    python -m bench.paths --requests 50
+fi
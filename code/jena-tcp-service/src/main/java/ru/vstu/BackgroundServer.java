@@ -1,17 +1,35 @@
 package ru.vstu;
 
+import org.apache.thrift.protocol.TBinaryProtocol;
+import org.apache.thrift.protocol.TCompactProtocol;
+import org.apache.thrift.protocol.TProtocolFactory;
 import org.apache.thrift.server.TServer;
 import org.apache.thrift.server.TThreadPoolServer;
+import org.apache.thrift.server.TThreadedSelectorServer;
+import org.apache.thrift.transport.TNonblockingServerSocket;
+import org.apache.thrift.transport.TNonblockingServerTransport;
 import org.apache.thrift.transport.TServerSocket;
 import org.apache.thrift.transport.TServerTransport;
+import org.apache.thrift.transport.TTransportFactory;
+import org.apache.thrift.transport.layered.TFramedTransport;
 import ru.vstu.thrift_gen_server.JenaReasoner;
+import ru.vstu.util.TUnixServerSocket;
 
 /**
  * Service wrapping Jena General Purpose Reasoner.
  * Caches rulesets for repeated use.
+ * The transport & protocol must be the same as the client's (see `JenaClient` in python-lib):
+ *  - "buffered" transport: a thread per connection (TThreadPoolServer);
+ *  - "framed" transport: non-blocking server (TThreadedSelectorServer) with a pool of workers.
+ * Note: the non-blocking server does not accept frames larger than TConfiguration.DEFAULT_MAX_FRAME_SIZE (~16 MB).
+ * If a socket path is given, the service listens on a Unix domain socket instead of the TCP port
+ * (Java 16+; a thread per connection for both transports).
  */
 public class BackgroundServer {
 
+    public static final String DEFAULT_TRANSPORT = "buffered";
+    public static final String DEFAULT_PROTOCOL = "binary";
+
     public static ServerRequestHandler handler;
     public static JenaReasoner.Processor processor;
 
@@ -21,32 +39,78 @@ public class BackgroundServer {
     }
 
     public static void init(int port) {
+        init(port, null, DEFAULT_TRANSPORT, DEFAULT_PROTOCOL);
+    }
+
+    public static void init(int port, String socketPath, String transport, String protocol) {
         try {
             handler = new ServerRequestHandler();
             processor = new JenaReasoner.Processor(handler);
 
-            Runnable simple = () -> simple(processor, port);
+            Runnable serve = () -> serve(processor, port, socketPath, transport, protocol);
 
-            new Thread(simple).start();
+            new Thread(serve).start();
         } catch (Exception x) {
             x.printStackTrace();
         }
 
     }
 
-    public static void simple(JenaReasoner.Processor processor, int port) {
+    public static TProtocolFactory protocolFactory(String protocol) {
+        switch (protocol) {
+            case "binary":
+                return new TBinaryProtocol.Factory();
+            case "compact":
+                return new TCompactProtocol.Factory();
+            default:
+                throw new IllegalArgumentException("Unknown protocol: " + protocol);
+        }
+    }
+
+    public static TTransportFactory transportFactory(String transport) {
+        switch (transport) {
+            case "buffered":
+                return new TTransportFactory();  // (the server socket buffers the streams)
+            case "framed":
+                return new TFramedTransport.Factory();
+            default:
+                throw new IllegalArgumentException("Unknown transport: " + transport);
+        }
+    }
+
+    public static void serve(JenaReasoner.Processor processor, int port, String socketPath, String transport, String protocol) {
         try {
-            TServerTransport serverTransport;
-            serverTransport = new TServerSocket(port);
-            // Use this for a non-threaded server
-            //TServer server = new TSimpleServer(new Args(serverTransport).processor(processor));
+            TServer server;
+            if (socketPath != null) {
+                TServerTransport serverTransport = new TUnixServerSocket(socketPath);
+                server = new TThreadPoolServer(new TThreadPoolServer.Args(serverTransport)
+                        .processor(processor)
+                        .transportFactory(transportFactory(transport))
+                        .protocolFactory(protocolFactory(protocol))
+                );
+            } else if (transport.equals("framed")) {
+                TNonblockingServerTransport serverTransport = new TNonblockingServerSocket(port);
+                server = new TThreadedSelectorServer(new TThreadedSelectorServer.Args(serverTransport)
+                        .processor(processor)
+                        .protocolFactory(protocolFactory(protocol))
+                        .workerThreads(Runtime.getRuntime().availableProcessors())
+                );
+            } else if (transport.equals("buffered")) {
+                TServerTransport serverTransport = new TServerSocket(port);
+                // Use this for a non-threaded server
+                //TServer server = new TSimpleServer(new Args(serverTransport).processor(processor));
 
-            // Use this for a multithreaded server
-            TServer server = new TThreadPoolServer(new TThreadPoolServer.Args(serverTransport)
-                     .processor(processor)
-            );
+                // Use this for a multithreaded server
+                server = new TThreadPoolServer(new TThreadPoolServer.Args(serverTransport)
+                        .processor(processor)
+                        .protocolFactory(protocolFactory(protocol))
+                );
+            } else {
+                throw new IllegalArgumentException("Unknown transport: " + transport);
+            }
 
-            System.out.println("Starting the server...");
+            System.out.println("Starting the server (" + transport + " transport, " + protocol + " protocol"
+                    + (socketPath != null ? ", socket " + socketPath : ", port " + port) + ")...");
             server.serve();
         } catch (Exception e) {
             e.printStackTrace();
@@ -56,4 +120,4 @@ public class BackgroundServer {
     public static void main(String [] args) {
         init();
     }
-}
\ No newline at end of file
+}
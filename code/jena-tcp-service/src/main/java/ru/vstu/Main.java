@@ -30,11 +30,26 @@ public class Main {
 
         if (args[0].toLowerCase().contains("service")) {
             int port = 20299;
-            if (args.length == 3 && args[1].contains("port")) {
-                port = Integer.parseInt(args[2]);
-                System.out.println("Server port = " + port);
+            String transport = BackgroundServer.DEFAULT_TRANSPORT;
+            String protocol = BackgroundServer.DEFAULT_PROTOCOL;
+            String socketPath = null;
+            // options: --port N | --socket PATH  --transport buffered|framed  --protocol binary|compact
+            for (int i = 1; i + 1 < args.length; i += 2) {
+                if (args[i].contains("port")) {
+                    port = Integer.parseInt(args[i + 1]);
+                    System.out.println("Server port = " + port);
+                } else if (args[i].contains("socket")) {
+                    socketPath = args[i + 1];
+                    System.out.println("Server socket = " + socketPath);
+                } else if (args[i].contains("transport")) {
+                    transport = args[i + 1];
+                } else if (args[i].contains("protocol")) {
+                    protocol = args[i + 1];
+                } else {
+                    System.out.println("Unknown service option: " + args[i]);
+                }
             }
-            BackgroundServer.init(port);
+            BackgroundServer.init(port, socketPath, transport, protocol);
             // it will run until halt ...
             return;
         }
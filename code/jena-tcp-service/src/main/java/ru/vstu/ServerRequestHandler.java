@@ -8,33 +8,68 @@ import org.apache.jena.riot.Lang;
 import org.apache.jena.riot.RDFDataMgr;
 import org.apache.jena.util.PrintUtil;
 import ru.vstu.thrift_gen_server.JenaReasoner;
+import ru.vstu.thrift_gen_server.ReasoningResult;
+import ru.vstu.thrift_gen_server.ReasoningTimeout;
+import ru.vstu.thrift_gen_server.UnknownAlgorithm;
+import ru.vstu.thrift_gen_server.UnknownSchema;
 import ru.vstu.util.ByteBufferInputStream;
 import ru.vstu.util.Checkpointer;
+import ru.vstu.util.Deadline;
+import ru.vstu.util.DeadlineGraph;
 
+import java.io.BufferedOutputStream;
 import java.io.ByteArrayOutputStream;
 import java.io.IOException;
+import java.io.OutputStream;
+import java.io.UncheckedIOException;
+import java.math.BigInteger;
 import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.Paths;
+import java.nio.file.StandardOpenOption;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
 import java.util.*;
+import java.util.concurrent.ConcurrentHashMap;
 
 
 /**
  * Service wrapping Jena General Purpose Reasoner.
  * Caches rulesets for repeated use.
+ * Keeps schemas (TBox) to reason about data sent without it, and pre-reasoned algorithm graphs
+ * to reason about traces of the same algorithm.
+ * Requests with a deadline are stopped and answered with ReasoningTimeout when it expires.
  */
 public class ServerRequestHandler implements JenaReasoner.Iface {
 
+    /** Max number of registered algorithms kept (least recently used are dropped). */
+    public static final int ALGORITHM_CACHE_SIZE = 256;
+
     HashMap<String, GenericRuleReasoner> ruleFileCache;
     HashMap<String, List<GenericRuleReasoner>> fileChainCache;
 
     HashSet<String> registeredPrefixes;
 
+    /** handle -> pre-reasoned algorithm graph (not modified after registration). */
+    Map<String, Model> algorithmCache;
+
+    /** version -> schema graph (not modified after loading). */
+    Map<String, Model> schemaCache;
+
     public ServerRequestHandler() {
         // init caches
         ruleFileCache = new HashMap<>();
         fileChainCache = new HashMap<>();
         registeredPrefixes = new HashSet<>(List.of("rdf", "rdfs", "xsd", "owl"));
+        algorithmCache = Collections.synchronizedMap(new LinkedHashMap<>(16, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, Model> eldest) {
+                return size() > ALGORITHM_CACHE_SIZE;
+            }
+        });
+        schemaCache = new ConcurrentHashMap<>();
     }
 
     public List<GenericRuleReasoner> getReasonersChain(String rulesPaths) {
@@ -137,39 +172,223 @@ public class ServerRequestHandler implements JenaReasoner.Iface {
     }
 
     public java.nio.ByteBuffer runReasoner(java.nio.ByteBuffer rdfData, java.lang.String rulePaths) {
+        try {
+            return doReasoning(rdfData, rulePaths, null, null, Deadline.NONE);
+        } catch (UnknownSchema | ReasoningTimeout e) {
+            throw new IllegalStateException(e);  // cannot happen without a schema version & deadline
+        }
+    }
+
+    public ReasoningResult reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout {
+        Map<String, Double> timings = new HashMap<>();
+        ByteBuffer resultBuffer = doReasoning(rdfData, rulePaths, schemaVersion, timings, Deadline.afterMillis(deadlineMillis));
+        return new ReasoningResult(resultBuffer, timings);
+    }
+
+    public String loadSchema(java.nio.ByteBuffer schemaData) {
+        String version = sha256(schemaData, "");
+        if (!schemaCache.containsKey(version)) {
+            Checkpointer ch = new Checkpointer();
+            schemaCache.put(version, readModel(schemaData));
+            ch.hit("Schema " + version + " loaded in");
+        }
+        return version;
+    }
+
+    public String registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout {
+        Deadline deadline = Deadline.afterMillis(deadlineMillis);
+        String handle = sha256(rdfData, rulePaths + ";" + schemaVersion);
+        if (algorithmCache.containsKey(handle)) {
+            return handle;
+        }
+
+        Checkpointer ch = new Checkpointer();
+
+        List<GenericRuleReasoner> reasoners = getReasonersChain(rulePaths);
+        Model data = withSchema(readModel(rdfData), schemaVersion);
+        ch.hit("Parsing algorithm rdf took");
+
+        for (GenericRuleReasoner rr : reasoners) {
+            data = runReasoningStep(data, rr, deadline);
+            ch.hit("Reasoning step took");
+        }
+
+        algorithmCache.put(handle, data);
+        ch.since_start("Algorithm registered in", false);
+        System.out.println();
+        return handle;
+    }
+
+    public ReasoningResult reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis) throws UnknownAlgorithm, ReasoningTimeout {
+        Deadline deadline = Deadline.afterMillis(deadlineMillis);
+        Model algorithm = algorithmCache.get(algorithmHandle);
+        if (algorithm == null) {
+            throw new UnknownAlgorithm(algorithmHandle);
+        }
 
+        Map<String, Double> timings = new HashMap<>();
         Checkpointer ch = new Checkpointer();
 
         List<GenericRuleReasoner> reasoners = getReasonersChain(rulePaths);
+        putTiming(timings, "rules", ch.hit(null));
+
+        Model trace = readModel(traceData);
+        putTiming(timings, "parse", ch.hit("Parsing trace rdf took"));
+
+        // the first step copies the union, so the registered graph stays unchanged
+        Model data = ModelFactory.createUnion(algorithm, trace);
+        ByteBuffer resultBuffer = reasonAndSerialize(data, reasoners, timings, ch, deadline);
+        return new ReasoningResult(resultBuffer, timings);
+    }
+
+    public ReasoningResult reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis) throws UnknownSchema, ReasoningTimeout {
+        Deadline deadline = Deadline.afterMillis(deadlineMillis);
+        Map<String, Double> timings = new HashMap<>();
+        Checkpointer ch = new Checkpointer();
+
+        List<GenericRuleReasoner> reasoners = getReasonersChain(rulePaths);
+        putTiming(timings, "rules", ch.hit(null));
+
+        Model data;
+        try (FileChannel channel = FileChannel.open(Paths.get(payloadPath), StandardOpenOption.READ)) {
+            // the file is mapped, not copied to the heap
+            data = withSchema(readModel(channel.map(FileChannel.MapMode.READ_ONLY, 0, channel.size())), schemaVersion);
+        } catch (IOException e) {
+            throw new UncheckedIOException(e);
+        }
+        putTiming(timings, "parse", ch.hit("Parsing input rdf file took"));
+
+        try (OutputStream out = new BufferedOutputStream(Files.newOutputStream(Paths.get(resultPath)), 1 << 16)) {
+            reasonAndWrite(data, reasoners, timings, ch, deadline, out);
+        } catch (IOException e) {
+            throw new UncheckedIOException(e);
+        }
+        return new ReasoningResult(ByteBuffer.allocate(0), timings);
+    }
+
+    /**
+     * SHA-256 of the data followed by the suffix, hex (as Python's hexdigest()).
+     */
+    static String sha256(ByteBuffer data, String suffix) {
+        try {
+            MessageDigest md = MessageDigest.getInstance("SHA-256");
+            md.update(data.duplicate());
+            md.update(suffix.getBytes(StandardCharsets.UTF_8));
+            return String.format("%064x", new BigInteger(1, md.digest()));
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException(e);
+        }
+    }
 
-        // read model as RDF/XML from byte stream
+    /**
+     * Read RDF/XML or N-Triples data.
+     */
+    static Model readModel(ByteBuffer rdfData) {
         Model data = ModelFactory.createDefaultModel();
         RDFDataMgr.read(data,
-                new ByteBufferInputStream(rdfData),
-                Lang.RDFXML);
+                new ByteBufferInputStream(rdfData.duplicate()),
+                isXml(rdfData) ? Lang.RDFXML : Lang.NTRIPLES);
+        return data;
+    }
 
-        ch.hit("Parsing input rdf took");
-        Checkpointer ch2 = new Checkpointer();
+    /**
+     * RDF/XML starts with `<?xml` or `<rdf:RDF` (N-Triples start with `<http...` or `_:`).
+     */
+    static boolean isXml(ByteBuffer rdfData) {
+        int i = rdfData.position();
+        while (i < rdfData.limit() && Character.isWhitespace(rdfData.get(i)))
+            i++;
+        if (i + 1 >= rdfData.limit() || rdfData.get(i) != '<')
+            return false;
+        byte next = rdfData.get(i + 1);
+        return next == '?' || next == '!' || (next == 'r' && i + 4 < rdfData.limit() && rdfData.get(i + 4) == ':');
+    }
 
-        for (GenericRuleReasoner rr : reasoners) {
-            data = Main.runReasoningStep(data, rr);
-            ch.hit("Reasoning step took");
-        }
-        ch2.since_start("All reasoning steps took", false);
+    /**
+     * The data together with a loaded schema (the data itself if no schema version is given).
+     */
+    Model withSchema(Model data, String schemaVersion) throws UnknownSchema {
+        if (schemaVersion == null || schemaVersion.isEmpty())
+            return data;
+        Model schema = schemaCache.get(schemaVersion);
+        if (schema == null)
+            throw new UnknownSchema(schemaVersion);
+        return ModelFactory.createUnion(schema, data);
+    }
+
+    /**
+     * Run the reasoning chain over the given data (RDF/XML or N-Triples; reasoned about together with the schema
+     * if `schemaVersion` is given) and serialize the result as N-Triples.
+     * Durations of processing stages are put into `timings` (in seconds) if it is not null.
+     */
+    public ByteBuffer doReasoning(ByteBuffer rdfData, String rulePaths, String schemaVersion, Map<String, Double> timings, Deadline deadline) throws UnknownSchema, ReasoningTimeout {
+
+        Checkpointer ch = new Checkpointer();
+
+        List<GenericRuleReasoner> reasoners = getReasonersChain(rulePaths);
+        putTiming(timings, "rules", ch.hit(null));
 
+        // read model from byte stream
+        Model data = withSchema(readModel(rdfData), schemaVersion);
 
+        putTiming(timings, "parse", ch.hit("Parsing input rdf took"));
+
+        return reasonAndSerialize(data, reasoners, timings, ch, deadline);
+    }
+
+    /**
+     * Run the reasoning chain over the data and serialize the result as N-Triples.
+     */
+    ByteBuffer reasonAndSerialize(Model data, List<GenericRuleReasoner> reasoners, Map<String, Double> timings, Checkpointer ch, Deadline deadline) throws ReasoningTimeout {
         // convert result back to a byte buffer
         ByteArrayOutputStream out = new ByteArrayOutputStream();
-        RDFDataMgr.write(out, data, Lang.NTRIPLES);  // Lang.NTRIPLES  or  Lang.RDFXML
+        reasonAndWrite(data, reasoners, timings, ch, deadline, out);
 
-        ByteBuffer resultBuffer = ByteBuffer.wrap(out.toByteArray());
         // ByteBufferBackedOutputStream() - turned out to be unnecessary
+        return ByteBuffer.wrap(out.toByteArray());
+    }
 
-        ch.hit("Serializing output rdf took");
-        ch.since_start("Total request processing time", false);
+    /**
+     * Run the reasoning chain over the data and write the result as N-Triples to the stream.
+     */
+    void reasonAndWrite(Model data, List<GenericRuleReasoner> reasoners, Map<String, Double> timings, Checkpointer ch, Deadline deadline, OutputStream out) throws ReasoningTimeout {
+        Checkpointer ch2 = new Checkpointer();
+
+        for (GenericRuleReasoner rr : reasoners) {
+            data = runReasoningStep(data, rr, deadline);
+            ch.hit("Reasoning step took");
+        }
+        putTiming(timings, "reasoning", ch2.since_start("All reasoning steps took", false));
+        deadline.check("serialization");
+
+        RDFDataMgr.write(out, data, Lang.NTRIPLES);  // Lang.NTRIPLES  or  Lang.RDFXML
+
+        putTiming(timings, "serialize", ch.hit("Serializing output rdf took"));
+        putTiming(timings, "total", ch.since_start("Total request processing time", false));
         System.out.println();
+    }
+
+    /**
+     * Main.runReasoningStep() that stops when the deadline expires: the data are read through a DeadlineGraph,
+     * so the step is aborted (on the request thread) at the next query of the data after the deadline.
+     */
+    static Model runReasoningStep(Model data, GenericRuleReasoner reasoner, Deadline deadline) throws ReasoningTimeout {
+        if (deadline.isNone()) {
+            return Main.runReasoningStep(data, reasoner);
+        }
+        deadline.check("reasoning");
+        Model guarded = ModelFactory.createModelForGraph(new DeadlineGraph(data.getGraph(), deadline));
+        try {
+            return Main.runReasoningStep(guarded, reasoner);
+        } catch (Deadline.Expired e) {
+            System.out.println("Deadline expired while reasoning: the step is stopped.");
+            throw deadline.timeout("reasoning");
+        }
+    }
 
-        return resultBuffer;
+    private static void putTiming(Map<String, Double> timings, String stage, double seconds) {
+        if (timings != null)
+            timings.put(stage, seconds);
     }
 
     public void stop() {
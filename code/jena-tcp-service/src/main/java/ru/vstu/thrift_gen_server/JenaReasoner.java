@@ -3,6 +3,9 @@
  *
  * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
  *  @generated
+ *
+ * (Extended by hand after jenaService.thrift while the compiler was not at hand:
+ *  build.sh regenerates this file with Thrift Compiler 0.14.2.)
  */
 package ru.vstu.thrift_gen_server;
 
@@ -36,6 +39,54 @@ public class JenaReasoner {
      */
     public java.nio.ByteBuffer runReasoner(java.nio.ByteBuffer rdfData, java.lang.String rulePaths) throws org.apache.thrift.TException;
 
+    /**
+     * Do the reasoning and return the complemented RDF graph along with timings of server-side stages. If schemaVersion is given, the data is reasoned about together with that schema (see loadSchema). If deadlineMillis > 0, the reasoning is abandoned after that many milliseconds (ReasoningTimeout).
+     * 
+     * @param rdfData
+     * @param rulePaths
+     * @param schemaVersion
+     * @param deadlineMillis
+     */
+    public ReasoningResult reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException;
+
+    /**
+     * Keep a schema (TBox: RDF/XML or N-Triples) to be used with data sent without it. Returns the version of the schema: SHA-256 of the data, hex.
+     * 
+     * @param schemaData
+     */
+    public java.lang.String loadSchema(java.nio.ByteBuffer schemaData) throws org.apache.thrift.TException;
+
+    /**
+     * Reason about an algorithm (N-Triples; with schema included unless schemaVersion is given) with the algorithm-only rules and keep the result. Returns a handle of the pre-reasoned algorithm graph (the same for the same data, rules and schema).
+     * 
+     * @param rdfData
+     * @param rulePaths
+     * @param schemaVersion
+     * @param deadlineMillis
+     */
+    public java.lang.String registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException;
+
+    /**
+     * Do the reasoning over the union of a registered algorithm graph and trace triples (N-Triples) and return the complemented RDF graph along with timings of server-side stages.
+     * 
+     * @param algorithmHandle
+     * @param traceData
+     * @param rulePaths
+     * @param deadlineMillis
+     */
+    public ReasoningResult reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis) throws UnknownAlgorithm, ReasoningTimeout, org.apache.thrift.TException;
+
+    /**
+     * Same as reason() for big data passed through files (e.g. in shared memory, /dev/shm) instead of the connection: the data (RDF/XML or N-Triples) is read from payloadPath and the result (N-Triples) is written to resultPath; rdfData of the returned result is empty.
+     * 
+     * @param payloadPath
+     * @param rulePaths
+     * @param schemaVersion
+     * @param resultPath
+     * @param deadlineMillis
+     */
+    public ReasoningResult reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException;
+
     /**
      * Stop the server.
      */
@@ -51,6 +102,16 @@ public class JenaReasoner {
 
     public void runReasoner(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, org.apache.thrift.async.AsyncMethodCallback<java.nio.ByteBuffer> resultHandler) throws org.apache.thrift.TException;
 
+    public void reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException;
+
+    public void loadSchema(java.nio.ByteBuffer schemaData, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException;
+
+    public void registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException;
+
+    public void reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException;
+
+    public void reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException;
+
     public void stop(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException;
 
   }
@@ -142,6 +203,158 @@ public class JenaReasoner {
       throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "runReasoner failed: unknown result");
     }
 
+    public ReasoningResult reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      send_reason(rdfData, rulePaths, schemaVersion, deadlineMillis);
+      return recv_reason();
+    }
+
+    public void send_reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws org.apache.thrift.TException
+    {
+      reason_args args = new reason_args();
+      args.setRdfData(rdfData);
+      args.setRulePaths(rulePaths);
+      args.setSchemaVersion(schemaVersion);
+      args.setDeadlineMillis(deadlineMillis);
+      sendBase("reason", args);
+    }
+
+    public ReasoningResult recv_reason() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      reason_result result = new reason_result();
+      receiveBase(result, "reason");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.unknownSchema != null) {
+        throw result.unknownSchema;
+      }
+      if (result.timeout != null) {
+        throw result.timeout;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "reason failed: unknown result");
+    }
+
+    public java.lang.String loadSchema(java.nio.ByteBuffer schemaData) throws org.apache.thrift.TException
+    {
+      send_loadSchema(schemaData);
+      return recv_loadSchema();
+    }
+
+    public void send_loadSchema(java.nio.ByteBuffer schemaData) throws org.apache.thrift.TException
+    {
+      loadSchema_args args = new loadSchema_args();
+      args.setSchemaData(schemaData);
+      sendBase("loadSchema", args);
+    }
+
+    public java.lang.String recv_loadSchema() throws org.apache.thrift.TException
+    {
+      loadSchema_result result = new loadSchema_result();
+      receiveBase(result, "loadSchema");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "loadSchema failed: unknown result");
+    }
+
+    public java.lang.String registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      send_registerAlgorithm(rdfData, rulePaths, schemaVersion, deadlineMillis);
+      return recv_registerAlgorithm();
+    }
+
+    public void send_registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis) throws org.apache.thrift.TException
+    {
+      registerAlgorithm_args args = new registerAlgorithm_args();
+      args.setRdfData(rdfData);
+      args.setRulePaths(rulePaths);
+      args.setSchemaVersion(schemaVersion);
+      args.setDeadlineMillis(deadlineMillis);
+      sendBase("registerAlgorithm", args);
+    }
+
+    public java.lang.String recv_registerAlgorithm() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      registerAlgorithm_result result = new registerAlgorithm_result();
+      receiveBase(result, "registerAlgorithm");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.unknownSchema != null) {
+        throw result.unknownSchema;
+      }
+      if (result.timeout != null) {
+        throw result.timeout;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "registerAlgorithm failed: unknown result");
+    }
+
+    public ReasoningResult reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis) throws UnknownAlgorithm, ReasoningTimeout, org.apache.thrift.TException
+    {
+      send_reasonTrace(algorithmHandle, traceData, rulePaths, deadlineMillis);
+      return recv_reasonTrace();
+    }
+
+    public void send_reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis) throws org.apache.thrift.TException
+    {
+      reasonTrace_args args = new reasonTrace_args();
+      args.setAlgorithmHandle(algorithmHandle);
+      args.setTraceData(traceData);
+      args.setRulePaths(rulePaths);
+      args.setDeadlineMillis(deadlineMillis);
+      sendBase("reasonTrace", args);
+    }
+
+    public ReasoningResult recv_reasonTrace() throws UnknownAlgorithm, ReasoningTimeout, org.apache.thrift.TException
+    {
+      reasonTrace_result result = new reasonTrace_result();
+      receiveBase(result, "reasonTrace");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.unknown != null) {
+        throw result.unknown;
+      }
+      if (result.timeout != null) {
+        throw result.timeout;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "reasonTrace failed: unknown result");
+    }
+
+    public ReasoningResult reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis) throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      send_reasonFile(payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis);
+      return recv_reasonFile();
+    }
+
+    public void send_reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis) throws org.apache.thrift.TException
+    {
+      reasonFile_args args = new reasonFile_args();
+      args.setPayloadPath(payloadPath);
+      args.setRulePaths(rulePaths);
+      args.setSchemaVersion(schemaVersion);
+      args.setResultPath(resultPath);
+      args.setDeadlineMillis(deadlineMillis);
+      sendBase("reasonFile", args);
+    }
+
+    public ReasoningResult recv_reasonFile() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException
+    {
+      reasonFile_result result = new reasonFile_result();
+      receiveBase(result, "reasonFile");
+      if (result.isSetSuccess()) {
+        return result.success;
+      }
+      if (result.unknownSchema != null) {
+        throw result.unknownSchema;
+      }
+      if (result.timeout != null) {
+        throw result.timeout;
+      }
+      throw new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.MISSING_RESULT, "reasonFile failed: unknown result");
+    }
+
     public void stop() throws org.apache.thrift.TException
     {
       send_stop();
@@ -270,6 +483,205 @@ public class JenaReasoner {
       }
     }
 
+    public void reason(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      reason_call method_call = new reason_call(rdfData, rulePaths, schemaVersion, deadlineMillis, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class reason_call extends org.apache.thrift.async.TAsyncMethodCall<ReasoningResult> {
+      private java.nio.ByteBuffer rdfData;
+      private java.lang.String rulePaths;
+      private java.lang.String schemaVersion;
+      private long deadlineMillis;
+      public reason_call(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.rdfData = rdfData;
+        this.rulePaths = rulePaths;
+        this.schemaVersion = schemaVersion;
+        this.deadlineMillis = deadlineMillis;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("reason", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        reason_args args = new reason_args();
+        args.setRdfData(rdfData);
+        args.setRulePaths(rulePaths);
+        args.setSchemaVersion(schemaVersion);
+        args.setDeadlineMillis(deadlineMillis);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public ReasoningResult getResult() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_reason();
+      }
+    }
+
+    public void loadSchema(java.nio.ByteBuffer schemaData, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      loadSchema_call method_call = new loadSchema_call(schemaData, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class loadSchema_call extends org.apache.thrift.async.TAsyncMethodCall<java.lang.String> {
+      private java.nio.ByteBuffer schemaData;
+      public loadSchema_call(java.nio.ByteBuffer schemaData, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.schemaData = schemaData;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("loadSchema", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        loadSchema_args args = new loadSchema_args();
+        args.setSchemaData(schemaData);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public java.lang.String getResult() throws org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_loadSchema();
+      }
+    }
+
+    public void registerAlgorithm(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      registerAlgorithm_call method_call = new registerAlgorithm_call(rdfData, rulePaths, schemaVersion, deadlineMillis, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class registerAlgorithm_call extends org.apache.thrift.async.TAsyncMethodCall<java.lang.String> {
+      private java.nio.ByteBuffer rdfData;
+      private java.lang.String rulePaths;
+      private java.lang.String schemaVersion;
+      private long deadlineMillis;
+      public registerAlgorithm_call(java.nio.ByteBuffer rdfData, java.lang.String rulePaths, java.lang.String schemaVersion, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.rdfData = rdfData;
+        this.rulePaths = rulePaths;
+        this.schemaVersion = schemaVersion;
+        this.deadlineMillis = deadlineMillis;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("registerAlgorithm", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        registerAlgorithm_args args = new registerAlgorithm_args();
+        args.setRdfData(rdfData);
+        args.setRulePaths(rulePaths);
+        args.setSchemaVersion(schemaVersion);
+        args.setDeadlineMillis(deadlineMillis);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public java.lang.String getResult() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_registerAlgorithm();
+      }
+    }
+
+    public void reasonTrace(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      reasonTrace_call method_call = new reasonTrace_call(algorithmHandle, traceData, rulePaths, deadlineMillis, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class reasonTrace_call extends org.apache.thrift.async.TAsyncMethodCall<ReasoningResult> {
+      private java.lang.String algorithmHandle;
+      private java.nio.ByteBuffer traceData;
+      private java.lang.String rulePaths;
+      private long deadlineMillis;
+      public reasonTrace_call(java.lang.String algorithmHandle, java.nio.ByteBuffer traceData, java.lang.String rulePaths, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.algorithmHandle = algorithmHandle;
+        this.traceData = traceData;
+        this.rulePaths = rulePaths;
+        this.deadlineMillis = deadlineMillis;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("reasonTrace", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        reasonTrace_args args = new reasonTrace_args();
+        args.setAlgorithmHandle(algorithmHandle);
+        args.setTraceData(traceData);
+        args.setRulePaths(rulePaths);
+        args.setDeadlineMillis(deadlineMillis);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public ReasoningResult getResult() throws UnknownAlgorithm, ReasoningTimeout, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_reasonTrace();
+      }
+    }
+
+    public void reasonFile(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+      checkReady();
+      reasonFile_call method_call = new reasonFile_call(payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis, resultHandler, this, ___protocolFactory, ___transport);
+      this.___currentMethod = method_call;
+      ___manager.call(method_call);
+    }
+
+    public static class reasonFile_call extends org.apache.thrift.async.TAsyncMethodCall<ReasoningResult> {
+      private java.lang.String payloadPath;
+      private java.lang.String rulePaths;
+      private java.lang.String schemaVersion;
+      private java.lang.String resultPath;
+      private long deadlineMillis;
+      public reasonFile_call(java.lang.String payloadPath, java.lang.String rulePaths, java.lang.String schemaVersion, java.lang.String resultPath, long deadlineMillis, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler, org.apache.thrift.async.TAsyncClient client, org.apache.thrift.protocol.TProtocolFactory protocolFactory, org.apache.thrift.transport.TNonblockingTransport transport) throws org.apache.thrift.TException {
+        super(client, protocolFactory, transport, resultHandler, false);
+        this.payloadPath = payloadPath;
+        this.rulePaths = rulePaths;
+        this.schemaVersion = schemaVersion;
+        this.resultPath = resultPath;
+        this.deadlineMillis = deadlineMillis;
+      }
+
+      public void write_args(org.apache.thrift.protocol.TProtocol prot) throws org.apache.thrift.TException {
+        prot.writeMessageBegin(new org.apache.thrift.protocol.TMessage("reasonFile", org.apache.thrift.protocol.TMessageType.CALL, 0));
+        reasonFile_args args = new reasonFile_args();
+        args.setPayloadPath(payloadPath);
+        args.setRulePaths(rulePaths);
+        args.setSchemaVersion(schemaVersion);
+        args.setResultPath(resultPath);
+        args.setDeadlineMillis(deadlineMillis);
+        args.write(prot);
+        prot.writeMessageEnd();
+      }
+
+      public ReasoningResult getResult() throws UnknownSchema, ReasoningTimeout, org.apache.thrift.TException {
+        if (getState() != org.apache.thrift.async.TAsyncMethodCall.State.RESPONSE_READ) {
+          throw new java.lang.IllegalStateException("Method call not finished!");
+        }
+        org.apache.thrift.transport.TMemoryInputTransport memoryTransport = new org.apache.thrift.transport.TMemoryInputTransport(getFrameBuffer().array());
+        org.apache.thrift.protocol.TProtocol prot = client.getProtocolFactory().getProtocol(memoryTransport);
+        return (new Client(prot)).recv_reasonFile();
+      }
+    }
+
     public void stop(org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
       checkReady();
       stop_call method_call = new stop_call(resultHandler, this, ___protocolFactory, ___transport);
@@ -315,6 +727,11 @@ public class JenaReasoner {
       processMap.put("ping", new ping());
       processMap.put("saveRdf", new saveRdf());
       processMap.put("runReasoner", new runReasoner());
+      processMap.put("reason", new reason());
+      processMap.put("loadSchema", new loadSchema());
+      processMap.put("registerAlgorithm", new registerAlgorithm());
+      processMap.put("reasonTrace", new reasonTrace());
+      processMap.put("reasonFile", new reasonFile());
       processMap.put("stop", new stop());
       return processMap;
     }
@@ -395,17 +812,17 @@ public class JenaReasoner {
       }
     }
 
-    public static class stop<I extends Iface> extends org.apache.thrift.ProcessFunction<I, stop_args> {
-      public stop() {
-        super("stop");
+    public static class reason<I extends Iface> extends org.apache.thrift.ProcessFunction<I, reason_args> {
+      public reason() {
+        super("reason");
       }
 
-      public stop_args getEmptyArgsInstance() {
-        return new stop_args();
+      public reason_args getEmptyArgsInstance() {
+        return new reason_args();
       }
 
       protected boolean isOneway() {
-        return true;
+        return false;
       }
 
       @Override
@@ -413,28 +830,182 @@ public class JenaReasoner {
         return false;
       }
 
-      public org.apache.thrift.TBase getResult(I iface, stop_args args) throws org.apache.thrift.TException {
-        iface.stop();
-        return null;
+      public reason_result getResult(I iface, reason_args args) throws org.apache.thrift.TException {
+        reason_result result = new reason_result();
+        try {
+          result.success = iface.reason(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis);
+        } catch (UnknownSchema unknownSchema) {
+          result.unknownSchema = unknownSchema;
+        } catch (ReasoningTimeout timeout) {
+          result.timeout = timeout;
+        }
+        return result;
       }
     }
 
-  }
+    public static class loadSchema<I extends Iface> extends org.apache.thrift.ProcessFunction<I, loadSchema_args> {
+      public loadSchema() {
+        super("loadSchema");
+      }
 
-  public static class AsyncProcessor<I extends AsyncIface> extends org.apache.thrift.TBaseAsyncProcessor<I> {
-    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(AsyncProcessor.class.getName());
-    public AsyncProcessor(I iface) {
-      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.AsyncProcessFunction<I, ? extends org.apache.thrift.TBase, ?>>()));
-    }
+      public loadSchema_args getEmptyArgsInstance() {
+        return new loadSchema_args();
+      }
 
-    protected AsyncProcessor(I iface, java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
-      super(iface, getProcessMap(processMap));
-    }
+      protected boolean isOneway() {
+        return false;
+      }
 
-    private static <I extends AsyncIface> java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase,?>> getProcessMap(java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+      @Override
+      protected boolean rethrowUnhandledExceptions() {
+        return false;
+      }
+
+      public loadSchema_result getResult(I iface, loadSchema_args args) throws org.apache.thrift.TException {
+        loadSchema_result result = new loadSchema_result();
+        result.success = iface.loadSchema(args.schemaData);
+        return result;
+      }
+    }
+
+    public static class registerAlgorithm<I extends Iface> extends org.apache.thrift.ProcessFunction<I, registerAlgorithm_args> {
+      public registerAlgorithm() {
+        super("registerAlgorithm");
+      }
+
+      public registerAlgorithm_args getEmptyArgsInstance() {
+        return new registerAlgorithm_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean rethrowUnhandledExceptions() {
+        return false;
+      }
+
+      public registerAlgorithm_result getResult(I iface, registerAlgorithm_args args) throws org.apache.thrift.TException {
+        registerAlgorithm_result result = new registerAlgorithm_result();
+        try {
+          result.success = iface.registerAlgorithm(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis);
+        } catch (UnknownSchema unknownSchema) {
+          result.unknownSchema = unknownSchema;
+        } catch (ReasoningTimeout timeout) {
+          result.timeout = timeout;
+        }
+        return result;
+      }
+    }
+
+    public static class reasonTrace<I extends Iface> extends org.apache.thrift.ProcessFunction<I, reasonTrace_args> {
+      public reasonTrace() {
+        super("reasonTrace");
+      }
+
+      public reasonTrace_args getEmptyArgsInstance() {
+        return new reasonTrace_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean rethrowUnhandledExceptions() {
+        return false;
+      }
+
+      public reasonTrace_result getResult(I iface, reasonTrace_args args) throws org.apache.thrift.TException {
+        reasonTrace_result result = new reasonTrace_result();
+        try {
+          result.success = iface.reasonTrace(args.algorithmHandle, args.traceData, args.rulePaths, args.deadlineMillis);
+        } catch (UnknownAlgorithm unknown) {
+          result.unknown = unknown;
+        } catch (ReasoningTimeout timeout) {
+          result.timeout = timeout;
+        }
+        return result;
+      }
+    }
+
+    public static class reasonFile<I extends Iface> extends org.apache.thrift.ProcessFunction<I, reasonFile_args> {
+      public reasonFile() {
+        super("reasonFile");
+      }
+
+      public reasonFile_args getEmptyArgsInstance() {
+        return new reasonFile_args();
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      @Override
+      protected boolean rethrowUnhandledExceptions() {
+        return false;
+      }
+
+      public reasonFile_result getResult(I iface, reasonFile_args args) throws org.apache.thrift.TException {
+        reasonFile_result result = new reasonFile_result();
+        try {
+          result.success = iface.reasonFile(args.payloadPath, args.rulePaths, args.schemaVersion, args.resultPath, args.deadlineMillis);
+        } catch (UnknownSchema unknownSchema) {
+          result.unknownSchema = unknownSchema;
+        } catch (ReasoningTimeout timeout) {
+          result.timeout = timeout;
+        }
+        return result;
+      }
+    }
+
+    public static class stop<I extends Iface> extends org.apache.thrift.ProcessFunction<I, stop_args> {
+      public stop() {
+        super("stop");
+      }
+
+      public stop_args getEmptyArgsInstance() {
+        return new stop_args();
+      }
+
+      protected boolean isOneway() {
+        return true;
+      }
+
+      @Override
+      protected boolean rethrowUnhandledExceptions() {
+        return false;
+      }
+
+      public org.apache.thrift.TBase getResult(I iface, stop_args args) throws org.apache.thrift.TException {
+        iface.stop();
+        return null;
+      }
+    }
+
+  }
+
+  public static class AsyncProcessor<I extends AsyncIface> extends org.apache.thrift.TBaseAsyncProcessor<I> {
+    private static final org.slf4j.Logger _LOGGER = org.slf4j.LoggerFactory.getLogger(AsyncProcessor.class.getName());
+    public AsyncProcessor(I iface) {
+      super(iface, getProcessMap(new java.util.HashMap<java.lang.String, org.apache.thrift.AsyncProcessFunction<I, ? extends org.apache.thrift.TBase, ?>>()));
+    }
+
+    protected AsyncProcessor(I iface, java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
+      super(iface, getProcessMap(processMap));
+    }
+
+    private static <I extends AsyncIface> java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase,?>> getProcessMap(java.util.Map<java.lang.String,  org.apache.thrift.AsyncProcessFunction<I, ? extends  org.apache.thrift.TBase, ?>> processMap) {
       processMap.put("ping", new ping());
       processMap.put("saveRdf", new saveRdf());
       processMap.put("runReasoner", new runReasoner());
+      processMap.put("reason", new reason());
+      processMap.put("loadSchema", new loadSchema());
+      processMap.put("registerAlgorithm", new registerAlgorithm());
+      processMap.put("reasonTrace", new reasonTrace());
+      processMap.put("reasonFile", new reasonFile());
       processMap.put("stop", new stop());
       return processMap;
     }
@@ -622,139 +1193,4925 @@ public class JenaReasoner {
       }
     }
 
-    public static class stop<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, stop_args, Void> {
-      public stop() {
-        super("stop");
+    public static class reason<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, reason_args, ReasoningResult> {
+      public reason() {
+        super("reason");
       }
 
-      public stop_args getEmptyArgsInstance() {
-        return new stop_args();
+      public reason_args getEmptyArgsInstance() {
+        return new reason_args();
       }
 
-      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+      public org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
         final org.apache.thrift.AsyncProcessFunction fcall = this;
-        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
-          public void onComplete(Void o) {
+        return new org.apache.thrift.async.AsyncMethodCallback<ReasoningResult>() { 
+          public void onComplete(ReasoningResult o) {
+            reason_result result = new reason_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
           }
           public void onError(java.lang.Exception e) {
-            if (e instanceof org.apache.thrift.transport.TTransportException) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            reason_result result = new reason_result();
+            if (e instanceof UnknownSchema) {
+              result.unknownSchema = (UnknownSchema) e;
+              result.setUnknownSchemaIsSet(true);
+              msg = result;
+            }
+                else if (e instanceof ReasoningTimeout) {
+              result.timeout = (ReasoningTimeout) e;
+              result.setTimeoutIsSet(true);
+              msg = result;
+            }
+            else if (e instanceof org.apache.thrift.transport.TTransportException) {
               _LOGGER.error("TTransportException inside handler", e);
               fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
             } else {
-              _LOGGER.error("Exception inside oneway handler", e);
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
             }
           }
         };
       }
 
       protected boolean isOneway() {
-        return true;
+        return false;
       }
 
-      public void start(I iface, stop_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
-        iface.stop(resultHandler);
+      public void start(I iface, reason_args args, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+        iface.reason(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis,resultHandler);
       }
     }
 
-  }
-
-  public static class ping_args implements org.apache.thrift.TBase<ping_args, ping_args._Fields>, java.io.Serializable, Cloneable, Comparable<ping_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ping_args");
-
-
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ping_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ping_argsTupleSchemeFactory();
-
-
-    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
-    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-;
-
-      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
-
-      static {
-        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
-          byName.put(field.getFieldName(), field);
-        }
+    public static class loadSchema<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, loadSchema_args, java.lang.String> {
+      public loadSchema() {
+        super("loadSchema");
       }
 
-      /**
-       * Find the _Fields constant that matches fieldId, or null if its not found.
-       */
-      @org.apache.thrift.annotation.Nullable
-      public static _Fields findByThriftId(int fieldId) {
-        switch(fieldId) {
-          default:
-            return null;
-        }
+      public loadSchema_args getEmptyArgsInstance() {
+        return new loadSchema_args();
       }
 
-      /**
-       * Find the _Fields constant that matches fieldId, throwing an exception
-       * if it is not found.
-       */
-      public static _Fields findByThriftIdOrThrow(int fieldId) {
-        _Fields fields = findByThriftId(fieldId);
-        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
-        return fields;
+      public org.apache.thrift.async.AsyncMethodCallback<java.lang.String> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.lang.String>() { 
+          public void onComplete(java.lang.String o) {
+            loadSchema_result result = new loadSchema_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            loadSchema_result result = new loadSchema_result();
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
       }
 
-      /**
-       * Find the _Fields constant that matches name, or null if its not found.
-       */
-      @org.apache.thrift.annotation.Nullable
-      public static _Fields findByName(java.lang.String name) {
-        return byName.get(name);
+      protected boolean isOneway() {
+        return false;
       }
 
-      private final short _thriftId;
-      private final java.lang.String _fieldName;
-
-      _Fields(short thriftId, java.lang.String fieldName) {
-        _thriftId = thriftId;
-        _fieldName = fieldName;
+      public void start(I iface, loadSchema_args args, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+        iface.loadSchema(args.schemaData,resultHandler);
       }
+    }
 
-      public short getThriftFieldId() {
-        return _thriftId;
+    public static class registerAlgorithm<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, registerAlgorithm_args, java.lang.String> {
+      public registerAlgorithm() {
+        super("registerAlgorithm");
       }
 
-      public java.lang.String getFieldName() {
-        return _fieldName;
+      public registerAlgorithm_args getEmptyArgsInstance() {
+        return new registerAlgorithm_args();
       }
-    }
-    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
-    static {
-      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ping_args.class, metaDataMap);
-    }
-
-    public ping_args() {
-    }
-
-    /**
-     * Performs a deep copy on <i>other</i>.
-     */
-    public ping_args(ping_args other) {
-    }
-
-    public ping_args deepCopy() {
-      return new ping_args(this);
-    }
 
-    @Override
-    public void clear() {
+      public org.apache.thrift.async.AsyncMethodCallback<java.lang.String> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<java.lang.String>() { 
+          public void onComplete(java.lang.String o) {
+            registerAlgorithm_result result = new registerAlgorithm_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            registerAlgorithm_result result = new registerAlgorithm_result();
+            if (e instanceof UnknownSchema) {
+              result.unknownSchema = (UnknownSchema) e;
+              result.setUnknownSchemaIsSet(true);
+              msg = result;
+            }
+                else if (e instanceof ReasoningTimeout) {
+              result.timeout = (ReasoningTimeout) e;
+              result.setTimeoutIsSet(true);
+              msg = result;
+            }
+            else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, registerAlgorithm_args args, org.apache.thrift.async.AsyncMethodCallback<java.lang.String> resultHandler) throws org.apache.thrift.TException {
+        iface.registerAlgorithm(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis,resultHandler);
+      }
+    }
+
+    public static class reasonTrace<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, reasonTrace_args, ReasoningResult> {
+      public reasonTrace() {
+        super("reasonTrace");
+      }
+
+      public reasonTrace_args getEmptyArgsInstance() {
+        return new reasonTrace_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<ReasoningResult>() { 
+          public void onComplete(ReasoningResult o) {
+            reasonTrace_result result = new reasonTrace_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            reasonTrace_result result = new reasonTrace_result();
+            if (e instanceof UnknownAlgorithm) {
+              result.unknown = (UnknownAlgorithm) e;
+              result.setUnknownIsSet(true);
+              msg = result;
+            }
+                else if (e instanceof ReasoningTimeout) {
+              result.timeout = (ReasoningTimeout) e;
+              result.setTimeoutIsSet(true);
+              msg = result;
+            }
+            else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, reasonTrace_args args, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+        iface.reasonTrace(args.algorithmHandle, args.traceData, args.rulePaths, args.deadlineMillis,resultHandler);
+      }
+    }
+
+    public static class reasonFile<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, reasonFile_args, ReasoningResult> {
+      public reasonFile() {
+        super("reasonFile");
+      }
+
+      public reasonFile_args getEmptyArgsInstance() {
+        return new reasonFile_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<ReasoningResult>() { 
+          public void onComplete(ReasoningResult o) {
+            reasonFile_result result = new reasonFile_result();
+            result.success = o;
+            try {
+              fcall.sendResponse(fb, result, org.apache.thrift.protocol.TMessageType.REPLY,seqid);
+            } catch (org.apache.thrift.transport.TTransportException e) {
+              _LOGGER.error("TTransportException writing to internal frame buffer", e);
+              fb.close();
+            } catch (java.lang.Exception e) {
+              _LOGGER.error("Exception writing to internal frame buffer", e);
+              onError(e);
+            }
+          }
+          public void onError(java.lang.Exception e) {
+            byte msgType = org.apache.thrift.protocol.TMessageType.REPLY;
+            org.apache.thrift.TSerializable msg;
+            reasonFile_result result = new reasonFile_result();
+            if (e instanceof UnknownSchema) {
+              result.unknownSchema = (UnknownSchema) e;
+              result.setUnknownSchemaIsSet(true);
+              msg = result;
+            }
+                else if (e instanceof ReasoningTimeout) {
+              result.timeout = (ReasoningTimeout) e;
+              result.setTimeoutIsSet(true);
+              msg = result;
+            }
+            else if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+              return;
+            } else if (e instanceof org.apache.thrift.TApplicationException) {
+              _LOGGER.error("TApplicationException inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = (org.apache.thrift.TApplicationException)e;
+            } else {
+              _LOGGER.error("Exception inside handler", e);
+              msgType = org.apache.thrift.protocol.TMessageType.EXCEPTION;
+              msg = new org.apache.thrift.TApplicationException(org.apache.thrift.TApplicationException.INTERNAL_ERROR, e.getMessage());
+            }
+            try {
+              fcall.sendResponse(fb,msg,msgType,seqid);
+            } catch (java.lang.Exception ex) {
+              _LOGGER.error("Exception writing to internal frame buffer", ex);
+              fb.close();
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return false;
+      }
+
+      public void start(I iface, reasonFile_args args, org.apache.thrift.async.AsyncMethodCallback<ReasoningResult> resultHandler) throws org.apache.thrift.TException {
+        iface.reasonFile(args.payloadPath, args.rulePaths, args.schemaVersion, args.resultPath, args.deadlineMillis,resultHandler);
+      }
+    }
+
+    public static class stop<I extends AsyncIface> extends org.apache.thrift.AsyncProcessFunction<I, stop_args, Void> {
+      public stop() {
+        super("stop");
+      }
+
+      public stop_args getEmptyArgsInstance() {
+        return new stop_args();
+      }
+
+      public org.apache.thrift.async.AsyncMethodCallback<Void> getResultHandler(final org.apache.thrift.server.AbstractNonblockingServer.AsyncFrameBuffer fb, final int seqid) {
+        final org.apache.thrift.AsyncProcessFunction fcall = this;
+        return new org.apache.thrift.async.AsyncMethodCallback<Void>() { 
+          public void onComplete(Void o) {
+          }
+          public void onError(java.lang.Exception e) {
+            if (e instanceof org.apache.thrift.transport.TTransportException) {
+              _LOGGER.error("TTransportException inside handler", e);
+              fb.close();
+            } else {
+              _LOGGER.error("Exception inside oneway handler", e);
+            }
+          }
+        };
+      }
+
+      protected boolean isOneway() {
+        return true;
+      }
+
+      public void start(I iface, stop_args args, org.apache.thrift.async.AsyncMethodCallback<Void> resultHandler) throws org.apache.thrift.TException {
+        iface.stop(resultHandler);
+      }
+    }
+
+  }
+
+  public static class ping_args implements org.apache.thrift.TBase<ping_args, ping_args._Fields>, java.io.Serializable, Cloneable, Comparable<ping_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ping_args");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ping_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ping_argsTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ping_args.class, metaDataMap);
+    }
+
+    public ping_args() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public ping_args(ping_args other) {
+    }
+
+    public ping_args deepCopy() {
+      return new ping_args(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof ping_args)
+        return this.equals((ping_args)that);
+      return false;
+    }
+
+    public boolean equals(ping_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(ping_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("ping_args(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class ping_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public ping_argsStandardScheme getScheme() {
+        return new ping_argsStandardScheme();
+      }
+    }
+
+    private static class ping_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<ping_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, ping_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, ping_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class ping_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public ping_argsTupleScheme getScheme() {
+        return new ping_argsTupleScheme();
+      }
+    }
+
+    private static class ping_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<ping_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, ping_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, ping_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class ping_result implements org.apache.thrift.TBase<ping_result, ping_result._Fields>, java.io.Serializable, Cloneable, Comparable<ping_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ping_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.BOOL, (short)0);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ping_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ping_resultTupleSchemeFactory();
+
+    public boolean success; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __SUCCESS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ping_result.class, metaDataMap);
+    }
+
+    public ping_result() {
+    }
+
+    public ping_result(
+      boolean success)
+    {
+      this();
+      this.success = success;
+      setSuccessIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public ping_result(ping_result other) {
+      __isset_bitfield = other.__isset_bitfield;
+      this.success = other.success;
+    }
+
+    public ping_result deepCopy() {
+      return new ping_result(this);
+    }
+
+    @Override
+    public void clear() {
+      setSuccessIsSet(false);
+      this.success = false;
+    }
+
+    public boolean isSuccess() {
+      return this.success;
+    }
+
+    public ping_result setSuccess(boolean success) {
+      this.success = success;
+      setSuccessIsSet(true);
+      return this;
+    }
+
+    public void unsetSuccess() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __SUCCESS_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.lang.Boolean)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return isSuccess();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof ping_result)
+        return this.equals((ping_result)that);
+      return false;
+    }
+
+    public boolean equals(ping_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true;
+      boolean that_present_success = true;
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (this.success != that.success)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((success) ? 131071 : 524287);
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(ping_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetSuccess(), other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("ping_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      sb.append(this.success);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class ping_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public ping_resultStandardScheme getScheme() {
+        return new ping_resultStandardScheme();
+      }
+    }
+
+    private static class ping_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<ping_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, ping_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
+                struct.success = iprot.readBool();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, ping_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.isSetSuccess()) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeBool(struct.success);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class ping_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public ping_resultTupleScheme getScheme() {
+        return new ping_resultTupleScheme();
+      }
+    }
+
+    private static class ping_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<ping_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, ping_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSuccess()) {
+          oprot.writeBool(struct.success);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, ping_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.success = iprot.readBool();
+          struct.setSuccessIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class saveRdf_args implements org.apache.thrift.TBase<saveRdf_args, saveRdf_args._Fields>, java.io.Serializable, Cloneable, Comparable<saveRdf_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("saveRdf_args");
+
+    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField FILENAME_FIELD_DESC = new org.apache.thrift.protocol.TField("filename", org.apache.thrift.protocol.TType.STRING, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new saveRdf_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new saveRdf_argsTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String filename; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      RDF_DATA((short)1, "rdfData"),
+      FILENAME((short)2, "filename");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // RDF_DATA
+            return RDF_DATA;
+          case 2: // FILENAME
+            return FILENAME;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.FILENAME, new org.apache.thrift.meta_data.FieldMetaData("filename", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(saveRdf_args.class, metaDataMap);
+    }
+
+    public saveRdf_args() {
+    }
+
+    public saveRdf_args(
+      java.nio.ByteBuffer rdfData,
+      java.lang.String filename)
+    {
+      this();
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      this.filename = filename;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public saveRdf_args(saveRdf_args other) {
+      if (other.isSetRdfData()) {
+        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+      }
+      if (other.isSetFilename()) {
+        this.filename = other.filename;
+      }
+    }
+
+    public saveRdf_args deepCopy() {
+      return new saveRdf_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.rdfData = null;
+      this.filename = null;
+    }
+
+    public byte[] getRdfData() {
+      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
+      return rdfData == null ? null : rdfData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForRdfData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    }
+
+    public saveRdf_args setRdfData(byte[] rdfData) {
+      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+      return this;
+    }
+
+    public saveRdf_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      return this;
+    }
+
+    public void unsetRdfData() {
+      this.rdfData = null;
+    }
+
+    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
+    public boolean isSetRdfData() {
+      return this.rdfData != null;
+    }
+
+    public void setRdfDataIsSet(boolean value) {
+      if (!value) {
+        this.rdfData = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getFilename() {
+      return this.filename;
+    }
+
+    public saveRdf_args setFilename(@org.apache.thrift.annotation.Nullable java.lang.String filename) {
+      this.filename = filename;
+      return this;
+    }
+
+    public void unsetFilename() {
+      this.filename = null;
+    }
+
+    /** Returns true if field filename is set (has been assigned a value) and false otherwise */
+    public boolean isSetFilename() {
+      return this.filename != null;
+    }
+
+    public void setFilenameIsSet(boolean value) {
+      if (!value) {
+        this.filename = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case RDF_DATA:
+        if (value == null) {
+          unsetRdfData();
+        } else {
+          if (value instanceof byte[]) {
+            setRdfData((byte[])value);
+          } else {
+            setRdfData((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case FILENAME:
+        if (value == null) {
+          unsetFilename();
+        } else {
+          setFilename((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case RDF_DATA:
+        return getRdfData();
+
+      case FILENAME:
+        return getFilename();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case RDF_DATA:
+        return isSetRdfData();
+      case FILENAME:
+        return isSetFilename();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof saveRdf_args)
+        return this.equals((saveRdf_args)that);
+      return false;
+    }
+
+    public boolean equals(saveRdf_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_rdfData = true && this.isSetRdfData();
+      boolean that_present_rdfData = true && that.isSetRdfData();
+      if (this_present_rdfData || that_present_rdfData) {
+        if (!(this_present_rdfData && that_present_rdfData))
+          return false;
+        if (!this.rdfData.equals(that.rdfData))
+          return false;
+      }
+
+      boolean this_present_filename = true && this.isSetFilename();
+      boolean that_present_filename = true && that.isSetFilename();
+      if (this_present_filename || that_present_filename) {
+        if (!(this_present_filename && that_present_filename))
+          return false;
+        if (!this.filename.equals(that.filename))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
+      if (isSetRdfData())
+        hashCode = hashCode * 8191 + rdfData.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetFilename()) ? 131071 : 524287);
+      if (isSetFilename())
+        hashCode = hashCode * 8191 + filename.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(saveRdf_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRdfData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetFilename(), other.isSetFilename());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetFilename()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.filename, other.filename);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("saveRdf_args(");
+      boolean first = true;
+
+      sb.append("rdfData:");
+      if (this.rdfData == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("filename:");
+      if (this.filename == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.filename);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class saveRdf_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public saveRdf_argsStandardScheme getScheme() {
+        return new saveRdf_argsStandardScheme();
+      }
+    }
+
+    private static class saveRdf_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<saveRdf_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, saveRdf_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // RDF_DATA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rdfData = iprot.readBinary();
+                struct.setRdfDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // FILENAME
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.filename = iprot.readString();
+                struct.setFilenameIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, saveRdf_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.rdfData != null) {
+          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.rdfData);
+          oprot.writeFieldEnd();
+        }
+        if (struct.filename != null) {
+          oprot.writeFieldBegin(FILENAME_FIELD_DESC);
+          oprot.writeString(struct.filename);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class saveRdf_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public saveRdf_argsTupleScheme getScheme() {
+        return new saveRdf_argsTupleScheme();
+      }
+    }
+
+    private static class saveRdf_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<saveRdf_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, saveRdf_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetRdfData()) {
+          optionals.set(0);
+        }
+        if (struct.isSetFilename()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetRdfData()) {
+          oprot.writeBinary(struct.rdfData);
+        }
+        if (struct.isSetFilename()) {
+          oprot.writeString(struct.filename);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, saveRdf_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.rdfData = iprot.readBinary();
+          struct.setRdfDataIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.filename = iprot.readString();
+          struct.setFilenameIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class saveRdf_result implements org.apache.thrift.TBase<saveRdf_result, saveRdf_result._Fields>, java.io.Serializable, Cloneable, Comparable<saveRdf_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("saveRdf_result");
+
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new saveRdf_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new saveRdf_resultTupleSchemeFactory();
+
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+;
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(saveRdf_result.class, metaDataMap);
+    }
+
+    public saveRdf_result() {
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public saveRdf_result(saveRdf_result other) {
+    }
+
+    public saveRdf_result deepCopy() {
+      return new saveRdf_result(this);
+    }
+
+    @Override
+    public void clear() {
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof saveRdf_result)
+        return this.equals((saveRdf_result)that);
+      return false;
+    }
+
+    public boolean equals(saveRdf_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(saveRdf_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("saveRdf_result(");
+      boolean first = true;
+
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class saveRdf_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public saveRdf_resultStandardScheme getScheme() {
+        return new saveRdf_resultStandardScheme();
+      }
+    }
+
+    private static class saveRdf_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<saveRdf_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, saveRdf_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, saveRdf_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class saveRdf_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public saveRdf_resultTupleScheme getScheme() {
+        return new saveRdf_resultTupleScheme();
+      }
+    }
+
+    private static class saveRdf_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<saveRdf_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, saveRdf_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, saveRdf_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class runReasoner_args implements org.apache.thrift.TBase<runReasoner_args, runReasoner_args._Fields>, java.io.Serializable, Cloneable, Comparable<runReasoner_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("runReasoner_args");
+
+    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField RULE_PATHS_FIELD_DESC = new org.apache.thrift.protocol.TField("rulePaths", org.apache.thrift.protocol.TType.STRING, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new runReasoner_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new runReasoner_argsTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String rulePaths; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      RDF_DATA((short)1, "rdfData"),
+      RULE_PATHS((short)2, "rulePaths");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // RDF_DATA
+            return RDF_DATA;
+          case 2: // RULE_PATHS
+            return RULE_PATHS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.RULE_PATHS, new org.apache.thrift.meta_data.FieldMetaData("rulePaths", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(runReasoner_args.class, metaDataMap);
+    }
+
+    public runReasoner_args() {
+    }
+
+    public runReasoner_args(
+      java.nio.ByteBuffer rdfData,
+      java.lang.String rulePaths)
+    {
+      this();
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      this.rulePaths = rulePaths;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public runReasoner_args(runReasoner_args other) {
+      if (other.isSetRdfData()) {
+        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+      }
+      if (other.isSetRulePaths()) {
+        this.rulePaths = other.rulePaths;
+      }
+    }
+
+    public runReasoner_args deepCopy() {
+      return new runReasoner_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.rdfData = null;
+      this.rulePaths = null;
+    }
+
+    public byte[] getRdfData() {
+      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
+      return rdfData == null ? null : rdfData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForRdfData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    }
+
+    public runReasoner_args setRdfData(byte[] rdfData) {
+      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+      return this;
+    }
+
+    public runReasoner_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      return this;
+    }
+
+    public void unsetRdfData() {
+      this.rdfData = null;
+    }
+
+    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
+    public boolean isSetRdfData() {
+      return this.rdfData != null;
+    }
+
+    public void setRdfDataIsSet(boolean value) {
+      if (!value) {
+        this.rdfData = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getRulePaths() {
+      return this.rulePaths;
+    }
+
+    public runReasoner_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
+      this.rulePaths = rulePaths;
+      return this;
+    }
+
+    public void unsetRulePaths() {
+      this.rulePaths = null;
+    }
+
+    /** Returns true if field rulePaths is set (has been assigned a value) and false otherwise */
+    public boolean isSetRulePaths() {
+      return this.rulePaths != null;
+    }
+
+    public void setRulePathsIsSet(boolean value) {
+      if (!value) {
+        this.rulePaths = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case RDF_DATA:
+        if (value == null) {
+          unsetRdfData();
+        } else {
+          if (value instanceof byte[]) {
+            setRdfData((byte[])value);
+          } else {
+            setRdfData((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case RULE_PATHS:
+        if (value == null) {
+          unsetRulePaths();
+        } else {
+          setRulePaths((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case RDF_DATA:
+        return getRdfData();
+
+      case RULE_PATHS:
+        return getRulePaths();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case RDF_DATA:
+        return isSetRdfData();
+      case RULE_PATHS:
+        return isSetRulePaths();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof runReasoner_args)
+        return this.equals((runReasoner_args)that);
+      return false;
+    }
+
+    public boolean equals(runReasoner_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_rdfData = true && this.isSetRdfData();
+      boolean that_present_rdfData = true && that.isSetRdfData();
+      if (this_present_rdfData || that_present_rdfData) {
+        if (!(this_present_rdfData && that_present_rdfData))
+          return false;
+        if (!this.rdfData.equals(that.rdfData))
+          return false;
+      }
+
+      boolean this_present_rulePaths = true && this.isSetRulePaths();
+      boolean that_present_rulePaths = true && that.isSetRulePaths();
+      if (this_present_rulePaths || that_present_rulePaths) {
+        if (!(this_present_rulePaths && that_present_rulePaths))
+          return false;
+        if (!this.rulePaths.equals(that.rulePaths))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
+      if (isSetRdfData())
+        hashCode = hashCode * 8191 + rdfData.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetRulePaths()) ? 131071 : 524287);
+      if (isSetRulePaths())
+        hashCode = hashCode * 8191 + rulePaths.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(runReasoner_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRdfData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetRulePaths(), other.isSetRulePaths());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRulePaths()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rulePaths, other.rulePaths);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("runReasoner_args(");
+      boolean first = true;
+
+      sb.append("rdfData:");
+      if (this.rdfData == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("rulePaths:");
+      if (this.rulePaths == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.rulePaths);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class runReasoner_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public runReasoner_argsStandardScheme getScheme() {
+        return new runReasoner_argsStandardScheme();
+      }
+    }
+
+    private static class runReasoner_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<runReasoner_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, runReasoner_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // RDF_DATA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rdfData = iprot.readBinary();
+                struct.setRdfDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // RULE_PATHS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rulePaths = iprot.readString();
+                struct.setRulePathsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, runReasoner_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.rdfData != null) {
+          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.rdfData);
+          oprot.writeFieldEnd();
+        }
+        if (struct.rulePaths != null) {
+          oprot.writeFieldBegin(RULE_PATHS_FIELD_DESC);
+          oprot.writeString(struct.rulePaths);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class runReasoner_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public runReasoner_argsTupleScheme getScheme() {
+        return new runReasoner_argsTupleScheme();
+      }
+    }
+
+    private static class runReasoner_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<runReasoner_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, runReasoner_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetRdfData()) {
+          optionals.set(0);
+        }
+        if (struct.isSetRulePaths()) {
+          optionals.set(1);
+        }
+        oprot.writeBitSet(optionals, 2);
+        if (struct.isSetRdfData()) {
+          oprot.writeBinary(struct.rdfData);
+        }
+        if (struct.isSetRulePaths()) {
+          oprot.writeString(struct.rulePaths);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, runReasoner_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(2);
+        if (incoming.get(0)) {
+          struct.rdfData = iprot.readBinary();
+          struct.setRdfDataIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.rulePaths = iprot.readString();
+          struct.setRulePathsIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class runReasoner_result implements org.apache.thrift.TBase<runReasoner_result, runReasoner_result._Fields>, java.io.Serializable, Cloneable, Comparable<runReasoner_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("runReasoner_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new runReasoner_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new runReasoner_resultTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer success; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(runReasoner_result.class, metaDataMap);
+    }
+
+    public runReasoner_result() {
+    }
+
+    public runReasoner_result(
+      java.nio.ByteBuffer success)
+    {
+      this();
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public runReasoner_result(runReasoner_result other) {
+      if (other.isSetSuccess()) {
+        this.success = org.apache.thrift.TBaseHelper.copyBinary(other.success);
+      }
+    }
+
+    public runReasoner_result deepCopy() {
+      return new runReasoner_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+    }
+
+    public byte[] getSuccess() {
+      setSuccess(org.apache.thrift.TBaseHelper.rightSize(success));
+      return success == null ? null : success.array();
+    }
+
+    public java.nio.ByteBuffer bufferForSuccess() {
+      return org.apache.thrift.TBaseHelper.copyBinary(success);
+    }
+
+    public runReasoner_result setSuccess(byte[] success) {
+      this.success = success == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(success.clone());
+      return this;
+    }
+
+    public runReasoner_result setSuccess(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer success) {
+      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          if (value instanceof byte[]) {
+            setSuccess((byte[])value);
+          } else {
+            setSuccess((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof runReasoner_result)
+        return this.equals((runReasoner_result)that);
+      return false;
+    }
+
+    public boolean equals(runReasoner_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(runReasoner_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetSuccess(), other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("runReasoner_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.success, sb);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class runReasoner_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public runReasoner_resultStandardScheme getScheme() {
+        return new runReasoner_resultStandardScheme();
+      }
+    }
+
+    private static class runReasoner_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<runReasoner_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, runReasoner_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readBinary();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, runReasoner_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeBinary(struct.success);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class runReasoner_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public runReasoner_resultTupleScheme getScheme() {
+        return new runReasoner_resultTupleScheme();
+      }
+    }
+
+    private static class runReasoner_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<runReasoner_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, runReasoner_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSuccess()) {
+          oprot.writeBinary(struct.success);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, runReasoner_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.success = iprot.readBinary();
+          struct.setSuccessIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class reason_args implements org.apache.thrift.TBase<reason_args, reason_args._Fields>, java.io.Serializable, Cloneable, Comparable<reason_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reason_args");
+
+    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField RULE_PATHS_FIELD_DESC = new org.apache.thrift.protocol.TField("rulePaths", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField SCHEMA_VERSION_FIELD_DESC = new org.apache.thrift.protocol.TField("schemaVersion", org.apache.thrift.protocol.TType.STRING, (short)3);
+    private static final org.apache.thrift.protocol.TField DEADLINE_MILLIS_FIELD_DESC = new org.apache.thrift.protocol.TField("deadlineMillis", org.apache.thrift.protocol.TType.I64, (short)4);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reason_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reason_argsTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String rulePaths; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String schemaVersion; // required
+    public long deadlineMillis; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      RDF_DATA((short)1, "rdfData"),
+      RULE_PATHS((short)2, "rulePaths"),
+      SCHEMA_VERSION((short)3, "schemaVersion"),
+      DEADLINE_MILLIS((short)4, "deadlineMillis");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // RDF_DATA
+            return RDF_DATA;
+          case 2: // RULE_PATHS
+            return RULE_PATHS;
+          case 3: // SCHEMA_VERSION
+            return SCHEMA_VERSION;
+          case 4: // DEADLINE_MILLIS
+            return DEADLINE_MILLIS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __DEADLINEMILLIS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.RULE_PATHS, new org.apache.thrift.meta_data.FieldMetaData("rulePaths", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.SCHEMA_VERSION, new org.apache.thrift.meta_data.FieldMetaData("schemaVersion", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.DEADLINE_MILLIS, new org.apache.thrift.meta_data.FieldMetaData("deadlineMillis", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reason_args.class, metaDataMap);
+    }
+
+    public reason_args() {
+    }
+
+    public reason_args(
+      java.nio.ByteBuffer rdfData,
+      java.lang.String rulePaths,
+      java.lang.String schemaVersion,
+      long deadlineMillis)
+    {
+      this();
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      this.rulePaths = rulePaths;
+      this.schemaVersion = schemaVersion;
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public reason_args(reason_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      if (other.isSetRdfData()) {
+        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+      }
+      if (other.isSetRulePaths()) {
+        this.rulePaths = other.rulePaths;
+      }
+      if (other.isSetSchemaVersion()) {
+        this.schemaVersion = other.schemaVersion;
+      }
+      this.deadlineMillis = other.deadlineMillis;
+    }
+
+    public reason_args deepCopy() {
+      return new reason_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.rdfData = null;
+      this.rulePaths = null;
+      this.schemaVersion = null;
+      setDeadlineMillisIsSet(false);
+      this.deadlineMillis = 0;
+    }
+
+    public byte[] getRdfData() {
+      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
+      return rdfData == null ? null : rdfData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForRdfData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    }
+
+    public reason_args setRdfData(byte[] rdfData) {
+      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+      return this;
+    }
+
+    public reason_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      return this;
+    }
+
+    public void unsetRdfData() {
+      this.rdfData = null;
+    }
+
+    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
+    public boolean isSetRdfData() {
+      return this.rdfData != null;
+    }
+
+    public void setRdfDataIsSet(boolean value) {
+      if (!value) {
+        this.rdfData = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getRulePaths() {
+      return this.rulePaths;
+    }
+
+    public reason_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
+      this.rulePaths = rulePaths;
+      return this;
+    }
+
+    public void unsetRulePaths() {
+      this.rulePaths = null;
+    }
+
+    /** Returns true if field rulePaths is set (has been assigned a value) and false otherwise */
+    public boolean isSetRulePaths() {
+      return this.rulePaths != null;
+    }
+
+    public void setRulePathsIsSet(boolean value) {
+      if (!value) {
+        this.rulePaths = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getSchemaVersion() {
+      return this.schemaVersion;
+    }
+
+    public reason_args setSchemaVersion(@org.apache.thrift.annotation.Nullable java.lang.String schemaVersion) {
+      this.schemaVersion = schemaVersion;
+      return this;
+    }
+
+    public void unsetSchemaVersion() {
+      this.schemaVersion = null;
+    }
+
+    /** Returns true if field schemaVersion is set (has been assigned a value) and false otherwise */
+    public boolean isSetSchemaVersion() {
+      return this.schemaVersion != null;
+    }
+
+    public void setSchemaVersionIsSet(boolean value) {
+      if (!value) {
+        this.schemaVersion = null;
+      }
+    }
+
+    public long getDeadlineMillis() {
+      return this.deadlineMillis;
+    }
+
+    public reason_args setDeadlineMillis(long deadlineMillis) {
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+      return this;
+    }
+
+    public void unsetDeadlineMillis() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    /** Returns true if field deadlineMillis is set (has been assigned a value) and false otherwise */
+    public boolean isSetDeadlineMillis() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    public void setDeadlineMillisIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID, value);
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case RDF_DATA:
+        if (value == null) {
+          unsetRdfData();
+        } else {
+          if (value instanceof byte[]) {
+            setRdfData((byte[])value);
+          } else {
+            setRdfData((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case RULE_PATHS:
+        if (value == null) {
+          unsetRulePaths();
+        } else {
+          setRulePaths((java.lang.String)value);
+        }
+        break;
+
+      case SCHEMA_VERSION:
+        if (value == null) {
+          unsetSchemaVersion();
+        } else {
+          setSchemaVersion((java.lang.String)value);
+        }
+        break;
+
+      case DEADLINE_MILLIS:
+        if (value == null) {
+          unsetDeadlineMillis();
+        } else {
+          setDeadlineMillis((java.lang.Long)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case RDF_DATA:
+        return getRdfData();
+
+      case RULE_PATHS:
+        return getRulePaths();
+
+      case SCHEMA_VERSION:
+        return getSchemaVersion();
+
+      case DEADLINE_MILLIS:
+        return getDeadlineMillis();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case RDF_DATA:
+        return isSetRdfData();
+      case RULE_PATHS:
+        return isSetRulePaths();
+      case SCHEMA_VERSION:
+        return isSetSchemaVersion();
+      case DEADLINE_MILLIS:
+        return isSetDeadlineMillis();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof reason_args)
+        return this.equals((reason_args)that);
+      return false;
+    }
+
+    public boolean equals(reason_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_rdfData = true && this.isSetRdfData();
+      boolean that_present_rdfData = true && that.isSetRdfData();
+      if (this_present_rdfData || that_present_rdfData) {
+        if (!(this_present_rdfData && that_present_rdfData))
+          return false;
+        if (!this.rdfData.equals(that.rdfData))
+          return false;
+      }
+
+      boolean this_present_rulePaths = true && this.isSetRulePaths();
+      boolean that_present_rulePaths = true && that.isSetRulePaths();
+      if (this_present_rulePaths || that_present_rulePaths) {
+        if (!(this_present_rulePaths && that_present_rulePaths))
+          return false;
+        if (!this.rulePaths.equals(that.rulePaths))
+          return false;
+      }
+
+      boolean this_present_schemaVersion = true && this.isSetSchemaVersion();
+      boolean that_present_schemaVersion = true && that.isSetSchemaVersion();
+      if (this_present_schemaVersion || that_present_schemaVersion) {
+        if (!(this_present_schemaVersion && that_present_schemaVersion))
+          return false;
+        if (!this.schemaVersion.equals(that.schemaVersion))
+          return false;
+      }
+
+      boolean this_present_deadlineMillis = true;
+      boolean that_present_deadlineMillis = true;
+      if (this_present_deadlineMillis || that_present_deadlineMillis) {
+        if (!(this_present_deadlineMillis && that_present_deadlineMillis))
+          return false;
+        if (this.deadlineMillis != that.deadlineMillis)
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
+      if (isSetRdfData())
+        hashCode = hashCode * 8191 + rdfData.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetRulePaths()) ? 131071 : 524287);
+      if (isSetRulePaths())
+        hashCode = hashCode * 8191 + rulePaths.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetSchemaVersion()) ? 131071 : 524287);
+      if (isSetSchemaVersion())
+        hashCode = hashCode * 8191 + schemaVersion.hashCode();
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(deadlineMillis);
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(reason_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRdfData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetRulePaths(), other.isSetRulePaths());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRulePaths()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rulePaths, other.rulePaths);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetSchemaVersion(), other.isSetSchemaVersion());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSchemaVersion()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.schemaVersion, other.schemaVersion);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetDeadlineMillis(), other.isSetDeadlineMillis());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDeadlineMillis()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.deadlineMillis, other.deadlineMillis);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reason_args(");
+      boolean first = true;
+
+      sb.append("rdfData:");
+      if (this.rdfData == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("rulePaths:");
+      if (this.rulePaths == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.rulePaths);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("schemaVersion:");
+      if (this.schemaVersion == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.schemaVersion);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("deadlineMillis:");
+      sb.append(this.deadlineMillis);
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class reason_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reason_argsStandardScheme getScheme() {
+        return new reason_argsStandardScheme();
+      }
+    }
+
+    private static class reason_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<reason_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reason_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // RDF_DATA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rdfData = iprot.readBinary();
+                struct.setRdfDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // RULE_PATHS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rulePaths = iprot.readString();
+                struct.setRulePathsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // SCHEMA_VERSION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.schemaVersion = iprot.readString();
+                struct.setSchemaVersionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // DEADLINE_MILLIS
+              if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+                struct.deadlineMillis = iprot.readI64();
+                struct.setDeadlineMillisIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reason_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.rdfData != null) {
+          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.rdfData);
+          oprot.writeFieldEnd();
+        }
+        if (struct.rulePaths != null) {
+          oprot.writeFieldBegin(RULE_PATHS_FIELD_DESC);
+          oprot.writeString(struct.rulePaths);
+          oprot.writeFieldEnd();
+        }
+        if (struct.schemaVersion != null) {
+          oprot.writeFieldBegin(SCHEMA_VERSION_FIELD_DESC);
+          oprot.writeString(struct.schemaVersion);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(DEADLINE_MILLIS_FIELD_DESC);
+        oprot.writeI64(struct.deadlineMillis);
+        oprot.writeFieldEnd();
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class reason_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reason_argsTupleScheme getScheme() {
+        return new reason_argsTupleScheme();
+      }
+    }
+
+    private static class reason_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<reason_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, reason_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetRdfData()) {
+          optionals.set(0);
+        }
+        if (struct.isSetRulePaths()) {
+          optionals.set(1);
+        }
+        if (struct.isSetSchemaVersion()) {
+          optionals.set(2);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          optionals.set(3);
+        }
+        oprot.writeBitSet(optionals, 4);
+        if (struct.isSetRdfData()) {
+          oprot.writeBinary(struct.rdfData);
+        }
+        if (struct.isSetRulePaths()) {
+          oprot.writeString(struct.rulePaths);
+        }
+        if (struct.isSetSchemaVersion()) {
+          oprot.writeString(struct.schemaVersion);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          oprot.writeI64(struct.deadlineMillis);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, reason_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(4);
+        if (incoming.get(0)) {
+          struct.rdfData = iprot.readBinary();
+          struct.setRdfDataIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.rulePaths = iprot.readString();
+          struct.setRulePathsIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.schemaVersion = iprot.readString();
+          struct.setSchemaVersionIsSet(true);
+        }
+        if (incoming.get(3)) {
+          struct.deadlineMillis = iprot.readI64();
+          struct.setDeadlineMillisIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class reason_result implements org.apache.thrift.TBase<reason_result, reason_result._Fields>, java.io.Serializable, Cloneable, Comparable<reason_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reason_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRUCT, (short)0);
+    private static final org.apache.thrift.protocol.TField UNKNOWN_SCHEMA_FIELD_DESC = new org.apache.thrift.protocol.TField("unknownSchema", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField TIMEOUT_FIELD_DESC = new org.apache.thrift.protocol.TField("timeout", org.apache.thrift.protocol.TType.STRUCT, (short)2);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reason_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reason_resultTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable ReasoningResult success; // required
+    public @org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema; // required
+    public @org.apache.thrift.annotation.Nullable ReasoningTimeout timeout; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success"),
+      UNKNOWN_SCHEMA((short)1, "unknownSchema"),
+      TIMEOUT((short)2, "timeout");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // UNKNOWN_SCHEMA
+            return UNKNOWN_SCHEMA;
+          case 2: // TIMEOUT
+            return TIMEOUT;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningResult.class)));
+      tmpMap.put(_Fields.UNKNOWN_SCHEMA, new org.apache.thrift.meta_data.FieldMetaData("unknownSchema", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, UnknownSchema.class)));
+      tmpMap.put(_Fields.TIMEOUT, new org.apache.thrift.meta_data.FieldMetaData("timeout", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningTimeout.class)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reason_result.class, metaDataMap);
+    }
+
+    public reason_result() {
+    }
+
+    public reason_result(
+      ReasoningResult success,
+      UnknownSchema unknownSchema,
+      ReasoningTimeout timeout)
+    {
+      this();
+      this.success = success;
+      this.unknownSchema = unknownSchema;
+      this.timeout = timeout;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public reason_result(reason_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ReasoningResult(other.success);
+      }
+      if (other.isSetUnknownSchema()) {
+        this.unknownSchema = new UnknownSchema(other.unknownSchema);
+      }
+      if (other.isSetTimeout()) {
+        this.timeout = new ReasoningTimeout(other.timeout);
+      }
+    }
+
+    public reason_result deepCopy() {
+      return new reason_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+      this.unknownSchema = null;
+      this.timeout = null;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningResult getSuccess() {
+      return this.success;
+    }
+
+    public reason_result setSuccess(@org.apache.thrift.annotation.Nullable ReasoningResult success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public UnknownSchema getUnknownSchema() {
+      return this.unknownSchema;
+    }
+
+    public reason_result setUnknownSchema(@org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema) {
+      this.unknownSchema = unknownSchema;
+      return this;
+    }
+
+    public void unsetUnknownSchema() {
+      this.unknownSchema = null;
+    }
+
+    /** Returns true if field unknownSchema is set (has been assigned a value) and false otherwise */
+    public boolean isSetUnknownSchema() {
+      return this.unknownSchema != null;
+    }
+
+    public void setUnknownSchemaIsSet(boolean value) {
+      if (!value) {
+        this.unknownSchema = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningTimeout getTimeout() {
+      return this.timeout;
+    }
+
+    public reason_result setTimeout(@org.apache.thrift.annotation.Nullable ReasoningTimeout timeout) {
+      this.timeout = timeout;
+      return this;
+    }
+
+    public void unsetTimeout() {
+      this.timeout = null;
+    }
+
+    /** Returns true if field timeout is set (has been assigned a value) and false otherwise */
+    public boolean isSetTimeout() {
+      return this.timeout != null;
+    }
+
+    public void setTimeoutIsSet(boolean value) {
+      if (!value) {
+        this.timeout = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ReasoningResult)value);
+        }
+        break;
+
+      case UNKNOWN_SCHEMA:
+        if (value == null) {
+          unsetUnknownSchema();
+        } else {
+          setUnknownSchema((UnknownSchema)value);
+        }
+        break;
+
+      case TIMEOUT:
+        if (value == null) {
+          unsetTimeout();
+        } else {
+          setTimeout((ReasoningTimeout)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case UNKNOWN_SCHEMA:
+        return getUnknownSchema();
+
+      case TIMEOUT:
+        return getTimeout();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case UNKNOWN_SCHEMA:
+        return isSetUnknownSchema();
+      case TIMEOUT:
+        return isSetTimeout();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof reason_result)
+        return this.equals((reason_result)that);
+      return false;
+    }
+
+    public boolean equals(reason_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_unknownSchema = true && this.isSetUnknownSchema();
+      boolean that_present_unknownSchema = true && that.isSetUnknownSchema();
+      if (this_present_unknownSchema || that_present_unknownSchema) {
+        if (!(this_present_unknownSchema && that_present_unknownSchema))
+          return false;
+        if (!this.unknownSchema.equals(that.unknownSchema))
+          return false;
+      }
+
+      boolean this_present_timeout = true && this.isSetTimeout();
+      boolean that_present_timeout = true && that.isSetTimeout();
+      if (this_present_timeout || that_present_timeout) {
+        if (!(this_present_timeout && that_present_timeout))
+          return false;
+        if (!this.timeout.equals(that.timeout))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetUnknownSchema()) ? 131071 : 524287);
+      if (isSetUnknownSchema())
+        hashCode = hashCode * 8191 + unknownSchema.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetTimeout()) ? 131071 : 524287);
+      if (isSetTimeout())
+        hashCode = hashCode * 8191 + timeout.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(reason_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetSuccess(), other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetUnknownSchema(), other.isSetUnknownSchema());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetUnknownSchema()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.unknownSchema, other.unknownSchema);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetTimeout(), other.isSetTimeout());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetTimeout()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.timeout, other.timeout);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reason_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("unknownSchema:");
+      if (this.unknownSchema == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.unknownSchema);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("timeout:");
+      if (this.timeout == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.timeout);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+      if (success != null) {
+        success.validate();
+      }
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class reason_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reason_resultStandardScheme getScheme() {
+        return new reason_resultStandardScheme();
+      }
+    }
+
+    private static class reason_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<reason_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reason_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.success = new ReasoningResult();
+                struct.success.read(iprot);
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // UNKNOWN_SCHEMA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.unknownSchema = new UnknownSchema();
+                struct.unknownSchema.read(iprot);
+                struct.setUnknownSchemaIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // TIMEOUT
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.timeout = new ReasoningTimeout();
+                struct.timeout.read(iprot);
+                struct.setTimeoutIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reason_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          struct.success.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.unknownSchema != null) {
+          oprot.writeFieldBegin(UNKNOWN_SCHEMA_FIELD_DESC);
+          struct.unknownSchema.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.timeout != null) {
+          oprot.writeFieldBegin(TIMEOUT_FIELD_DESC);
+          struct.timeout.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class reason_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reason_resultTupleScheme getScheme() {
+        return new reason_resultTupleScheme();
+      }
+    }
+
+    private static class reason_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<reason_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, reason_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetUnknownSchema()) {
+          optionals.set(1);
+        }
+        if (struct.isSetTimeout()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSuccess()) {
+          struct.success.write(oprot);
+        }
+        if (struct.isSetUnknownSchema()) {
+          struct.unknownSchema.write(oprot);
+        }
+        if (struct.isSetTimeout()) {
+          struct.timeout.write(oprot);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, reason_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          struct.success = new ReasoningResult();
+          struct.success.read(iprot);
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.unknownSchema = new UnknownSchema();
+          struct.unknownSchema.read(iprot);
+          struct.setUnknownSchemaIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.timeout = new ReasoningTimeout();
+          struct.timeout.read(iprot);
+          struct.setTimeoutIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class loadSchema_args implements org.apache.thrift.TBase<loadSchema_args, loadSchema_args._Fields>, java.io.Serializable, Cloneable, Comparable<loadSchema_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("loadSchema_args");
+
+    private static final org.apache.thrift.protocol.TField SCHEMA_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("schemaData", org.apache.thrift.protocol.TType.STRING, (short)1);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new loadSchema_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new loadSchema_argsTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer schemaData; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SCHEMA_DATA((short)1, "schemaData");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // SCHEMA_DATA
+            return SCHEMA_DATA;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SCHEMA_DATA, new org.apache.thrift.meta_data.FieldMetaData("schemaData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(loadSchema_args.class, metaDataMap);
+    }
+
+    public loadSchema_args() {
+    }
+
+    public loadSchema_args(
+      java.nio.ByteBuffer schemaData)
+    {
+      this();
+      this.schemaData = org.apache.thrift.TBaseHelper.copyBinary(schemaData);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public loadSchema_args(loadSchema_args other) {
+      if (other.isSetSchemaData()) {
+        this.schemaData = org.apache.thrift.TBaseHelper.copyBinary(other.schemaData);
+      }
+    }
+
+    public loadSchema_args deepCopy() {
+      return new loadSchema_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.schemaData = null;
+    }
+
+    public byte[] getSchemaData() {
+      setSchemaData(org.apache.thrift.TBaseHelper.rightSize(schemaData));
+      return schemaData == null ? null : schemaData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForSchemaData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(schemaData);
+    }
+
+    public loadSchema_args setSchemaData(byte[] schemaData) {
+      this.schemaData = schemaData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(schemaData.clone());
+      return this;
+    }
+
+    public loadSchema_args setSchemaData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer schemaData) {
+      this.schemaData = org.apache.thrift.TBaseHelper.copyBinary(schemaData);
+      return this;
+    }
+
+    public void unsetSchemaData() {
+      this.schemaData = null;
+    }
+
+    /** Returns true if field schemaData is set (has been assigned a value) and false otherwise */
+    public boolean isSetSchemaData() {
+      return this.schemaData != null;
+    }
+
+    public void setSchemaDataIsSet(boolean value) {
+      if (!value) {
+        this.schemaData = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case SCHEMA_DATA:
+        if (value == null) {
+          unsetSchemaData();
+        } else {
+          if (value instanceof byte[]) {
+            setSchemaData((byte[])value);
+          } else {
+            setSchemaData((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SCHEMA_DATA:
+        return getSchemaData();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SCHEMA_DATA:
+        return isSetSchemaData();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof loadSchema_args)
+        return this.equals((loadSchema_args)that);
+      return false;
+    }
+
+    public boolean equals(loadSchema_args that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_schemaData = true && this.isSetSchemaData();
+      boolean that_present_schemaData = true && that.isSetSchemaData();
+      if (this_present_schemaData || that_present_schemaData) {
+        if (!(this_present_schemaData && that_present_schemaData))
+          return false;
+        if (!this.schemaData.equals(that.schemaData))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSchemaData()) ? 131071 : 524287);
+      if (isSetSchemaData())
+        hashCode = hashCode * 8191 + schemaData.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(loadSchema_args other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetSchemaData(), other.isSetSchemaData());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSchemaData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.schemaData, other.schemaData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+    }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("loadSchema_args(");
+      boolean first = true;
+
+      sb.append("schemaData:");
+      if (this.schemaData == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.schemaData, sb);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class loadSchema_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public loadSchema_argsStandardScheme getScheme() {
+        return new loadSchema_argsStandardScheme();
+      }
+    }
+
+    private static class loadSchema_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<loadSchema_args> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, loadSchema_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 1: // SCHEMA_DATA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.schemaData = iprot.readBinary();
+                struct.setSchemaDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, loadSchema_args struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.schemaData != null) {
+          oprot.writeFieldBegin(SCHEMA_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.schemaData);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class loadSchema_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public loadSchema_argsTupleScheme getScheme() {
+        return new loadSchema_argsTupleScheme();
+      }
+    }
+
+    private static class loadSchema_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<loadSchema_args> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, loadSchema_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSchemaData()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSchemaData()) {
+          oprot.writeBinary(struct.schemaData);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, loadSchema_args struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.schemaData = iprot.readBinary();
+          struct.setSchemaDataIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class loadSchema_result implements org.apache.thrift.TBase<loadSchema_result, loadSchema_result._Fields>, java.io.Serializable, Cloneable, Comparable<loadSchema_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("loadSchema_result");
+
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new loadSchema_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new loadSchema_resultTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.lang.String success; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      SUCCESS((short)0, "success");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(loadSchema_result.class, metaDataMap);
+    }
+
+    public loadSchema_result() {
+    }
+
+    public loadSchema_result(
+      java.lang.String success)
+    {
+      this();
+      this.success = success;
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public loadSchema_result(loadSchema_result other) {
+      if (other.isSetSuccess()) {
+        this.success = other.success;
+      }
+    }
+
+    public loadSchema_result deepCopy() {
+      return new loadSchema_result(this);
+    }
+
+    @Override
+    public void clear() {
+      this.success = null;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getSuccess() {
+      return this.success;
+    }
+
+    public loadSchema_result setSuccess(@org.apache.thrift.annotation.Nullable java.lang.String success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((java.lang.String)value);
+        }
+        break;
+
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.Object getFieldValue(_Fields field) {
+      switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+    public boolean isSet(_Fields field) {
+      if (field == null) {
+        throw new java.lang.IllegalArgumentException();
+      }
+
+      switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      }
+      throw new java.lang.IllegalStateException();
+    }
+
+    @Override
+    public boolean equals(java.lang.Object that) {
+      if (that instanceof loadSchema_result)
+        return this.equals((loadSchema_result)that);
+      return false;
+    }
+
+    public boolean equals(loadSchema_result that) {
+      if (that == null)
+        return false;
+      if (this == that)
+        return true;
+
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      return true;
+    }
+
+    @Override
+    public int hashCode() {
+      int hashCode = 1;
+
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      return hashCode;
+    }
+
+    @Override
+    public int compareTo(loadSchema_result other) {
+      if (!getClass().equals(other.getClass())) {
+        return getClass().getName().compareTo(other.getClass().getName());
+      }
+
+      int lastComparison = 0;
+
+      lastComparison = java.lang.Boolean.compare(isSetSuccess(), other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      return 0;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public _Fields fieldForId(int fieldId) {
+      return _Fields.findByThriftId(fieldId);
+    }
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+      scheme(iprot).read(iprot, this);
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+      scheme(oprot).write(oprot, this);
+      }
+
+    @Override
+    public java.lang.String toString() {
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("loadSchema_result(");
+      boolean first = true;
+
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      sb.append(")");
+      return sb.toString();
+    }
+
+    public void validate() throws org.apache.thrift.TException {
+      // check for required fields
+      // check for sub-struct validity
+    }
+
+    private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+      try {
+        write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+      try {
+        read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+      } catch (org.apache.thrift.TException te) {
+        throw new java.io.IOException(te);
+      }
+    }
+
+    private static class loadSchema_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public loadSchema_resultStandardScheme getScheme() {
+        return new loadSchema_resultStandardScheme();
+      }
+    }
+
+    private static class loadSchema_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<loadSchema_result> {
+
+      public void read(org.apache.thrift.protocol.TProtocol iprot, loadSchema_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TField schemeField;
+        iprot.readStructBegin();
+        while (true)
+        {
+          schemeField = iprot.readFieldBegin();
+          if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+            break;
+          }
+          switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readString();
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            default:
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+          }
+          iprot.readFieldEnd();
+        }
+        iprot.readStructEnd();
+
+        // check for required fields of primitive type, which can't be checked in the validate method
+        struct.validate();
+      }
+
+      public void write(org.apache.thrift.protocol.TProtocol oprot, loadSchema_result struct) throws org.apache.thrift.TException {
+        struct.validate();
+
+        oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          oprot.writeString(struct.success);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldStop();
+        oprot.writeStructEnd();
+      }
+
+    }
+
+    private static class loadSchema_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public loadSchema_resultTupleScheme getScheme() {
+        return new loadSchema_resultTupleScheme();
+      }
+    }
+
+    private static class loadSchema_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<loadSchema_result> {
+
+      @Override
+      public void write(org.apache.thrift.protocol.TProtocol prot, loadSchema_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetSuccess()) {
+          oprot.writeString(struct.success);
+        }
+      }
+
+      @Override
+      public void read(org.apache.thrift.protocol.TProtocol prot, loadSchema_result struct) throws org.apache.thrift.TException {
+        org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(1);
+        if (incoming.get(0)) {
+          struct.success = iprot.readString();
+          struct.setSuccessIsSet(true);
+        }
+      }
+    }
+
+    private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+      return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+    }
+  }
+
+  public static class registerAlgorithm_args implements org.apache.thrift.TBase<registerAlgorithm_args, registerAlgorithm_args._Fields>, java.io.Serializable, Cloneable, Comparable<registerAlgorithm_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("registerAlgorithm_args");
+
+    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField RULE_PATHS_FIELD_DESC = new org.apache.thrift.protocol.TField("rulePaths", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField SCHEMA_VERSION_FIELD_DESC = new org.apache.thrift.protocol.TField("schemaVersion", org.apache.thrift.protocol.TType.STRING, (short)3);
+    private static final org.apache.thrift.protocol.TField DEADLINE_MILLIS_FIELD_DESC = new org.apache.thrift.protocol.TField("deadlineMillis", org.apache.thrift.protocol.TType.I64, (short)4);
+
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new registerAlgorithm_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new registerAlgorithm_argsTupleSchemeFactory();
+
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String rulePaths; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String schemaVersion; // required
+    public long deadlineMillis; // required
+
+    /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+    public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+      RDF_DATA((short)1, "rdfData"),
+      RULE_PATHS((short)2, "rulePaths"),
+      SCHEMA_VERSION((short)3, "schemaVersion"),
+      DEADLINE_MILLIS((short)4, "deadlineMillis");
+
+      private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+      static {
+        for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+          byName.put(field.getFieldName(), field);
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByThriftId(int fieldId) {
+        switch(fieldId) {
+          case 1: // RDF_DATA
+            return RDF_DATA;
+          case 2: // RULE_PATHS
+            return RULE_PATHS;
+          case 3: // SCHEMA_VERSION
+            return SCHEMA_VERSION;
+          case 4: // DEADLINE_MILLIS
+            return DEADLINE_MILLIS;
+          default:
+            return null;
+        }
+      }
+
+      /**
+       * Find the _Fields constant that matches fieldId, throwing an exception
+       * if it is not found.
+       */
+      public static _Fields findByThriftIdOrThrow(int fieldId) {
+        _Fields fields = findByThriftId(fieldId);
+        if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+        return fields;
+      }
+
+      /**
+       * Find the _Fields constant that matches name, or null if its not found.
+       */
+      @org.apache.thrift.annotation.Nullable
+      public static _Fields findByName(java.lang.String name) {
+        return byName.get(name);
+      }
+
+      private final short _thriftId;
+      private final java.lang.String _fieldName;
+
+      _Fields(short thriftId, java.lang.String fieldName) {
+        _thriftId = thriftId;
+        _fieldName = fieldName;
+      }
+
+      public short getThriftFieldId() {
+        return _thriftId;
+      }
+
+      public java.lang.String getFieldName() {
+        return _fieldName;
+      }
+    }
+
+    // isset id assignments
+    private static final int __DEADLINEMILLIS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
+    public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+    static {
+      java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.RULE_PATHS, new org.apache.thrift.meta_data.FieldMetaData("rulePaths", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.SCHEMA_VERSION, new org.apache.thrift.meta_data.FieldMetaData("schemaVersion", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.DEADLINE_MILLIS, new org.apache.thrift.meta_data.FieldMetaData("deadlineMillis", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
+      metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(registerAlgorithm_args.class, metaDataMap);
+    }
+
+    public registerAlgorithm_args() {
+    }
+
+    public registerAlgorithm_args(
+      java.nio.ByteBuffer rdfData,
+      java.lang.String rulePaths,
+      java.lang.String schemaVersion,
+      long deadlineMillis)
+    {
+      this();
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      this.rulePaths = rulePaths;
+      this.schemaVersion = schemaVersion;
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+    }
+
+    /**
+     * Performs a deep copy on <i>other</i>.
+     */
+    public registerAlgorithm_args(registerAlgorithm_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      if (other.isSetRdfData()) {
+        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+      }
+      if (other.isSetRulePaths()) {
+        this.rulePaths = other.rulePaths;
+      }
+      if (other.isSetSchemaVersion()) {
+        this.schemaVersion = other.schemaVersion;
+      }
+      this.deadlineMillis = other.deadlineMillis;
+    }
+
+    public registerAlgorithm_args deepCopy() {
+      return new registerAlgorithm_args(this);
+    }
+
+    @Override
+    public void clear() {
+      this.rdfData = null;
+      this.rulePaths = null;
+      this.schemaVersion = null;
+      setDeadlineMillisIsSet(false);
+      this.deadlineMillis = 0;
+    }
+
+    public byte[] getRdfData() {
+      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
+      return rdfData == null ? null : rdfData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForRdfData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    }
+
+    public registerAlgorithm_args setRdfData(byte[] rdfData) {
+      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+      return this;
+    }
+
+    public registerAlgorithm_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      return this;
+    }
+
+    public void unsetRdfData() {
+      this.rdfData = null;
+    }
+
+    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
+    public boolean isSetRdfData() {
+      return this.rdfData != null;
+    }
+
+    public void setRdfDataIsSet(boolean value) {
+      if (!value) {
+        this.rdfData = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getRulePaths() {
+      return this.rulePaths;
+    }
+
+    public registerAlgorithm_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
+      this.rulePaths = rulePaths;
+      return this;
+    }
+
+    public void unsetRulePaths() {
+      this.rulePaths = null;
+    }
+
+    /** Returns true if field rulePaths is set (has been assigned a value) and false otherwise */
+    public boolean isSetRulePaths() {
+      return this.rulePaths != null;
+    }
+
+    public void setRulePathsIsSet(boolean value) {
+      if (!value) {
+        this.rulePaths = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getSchemaVersion() {
+      return this.schemaVersion;
+    }
+
+    public registerAlgorithm_args setSchemaVersion(@org.apache.thrift.annotation.Nullable java.lang.String schemaVersion) {
+      this.schemaVersion = schemaVersion;
+      return this;
+    }
+
+    public void unsetSchemaVersion() {
+      this.schemaVersion = null;
+    }
+
+    /** Returns true if field schemaVersion is set (has been assigned a value) and false otherwise */
+    public boolean isSetSchemaVersion() {
+      return this.schemaVersion != null;
+    }
+
+    public void setSchemaVersionIsSet(boolean value) {
+      if (!value) {
+        this.schemaVersion = null;
+      }
+    }
+
+    public long getDeadlineMillis() {
+      return this.deadlineMillis;
+    }
+
+    public registerAlgorithm_args setDeadlineMillis(long deadlineMillis) {
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+      return this;
+    }
+
+    public void unsetDeadlineMillis() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    /** Returns true if field deadlineMillis is set (has been assigned a value) and false otherwise */
+    public boolean isSetDeadlineMillis() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    public void setDeadlineMillisIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID, value);
     }
 
-    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
-      switch (field) {
+    public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+      switch (field) {
+      case RDF_DATA:
+        if (value == null) {
+          unsetRdfData();
+        } else {
+          if (value instanceof byte[]) {
+            setRdfData((byte[])value);
+          } else {
+            setRdfData((java.nio.ByteBuffer)value);
+          }
+        }
+        break;
+
+      case RULE_PATHS:
+        if (value == null) {
+          unsetRulePaths();
+        } else {
+          setRulePaths((java.lang.String)value);
+        }
+        break;
+
+      case SCHEMA_VERSION:
+        if (value == null) {
+          unsetSchemaVersion();
+        } else {
+          setSchemaVersion((java.lang.String)value);
+        }
+        break;
+
+      case DEADLINE_MILLIS:
+        if (value == null) {
+          unsetDeadlineMillis();
+        } else {
+          setDeadlineMillis((java.lang.Long)value);
+        }
+        break;
+
       }
     }
 
     @org.apache.thrift.annotation.Nullable
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
+      case RDF_DATA:
+        return getRdfData();
+
+      case RULE_PATHS:
+        return getRulePaths();
+
+      case SCHEMA_VERSION:
+        return getSchemaVersion();
+
+      case DEADLINE_MILLIS:
+        return getDeadlineMillis();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -766,23 +6123,67 @@ public class JenaReasoner {
       }
 
       switch (field) {
+      case RDF_DATA:
+        return isSetRdfData();
+      case RULE_PATHS:
+        return isSetRulePaths();
+      case SCHEMA_VERSION:
+        return isSetSchemaVersion();
+      case DEADLINE_MILLIS:
+        return isSetDeadlineMillis();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof ping_args)
-        return this.equals((ping_args)that);
+      if (that instanceof registerAlgorithm_args)
+        return this.equals((registerAlgorithm_args)that);
       return false;
     }
 
-    public boolean equals(ping_args that) {
+    public boolean equals(registerAlgorithm_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
+      boolean this_present_rdfData = true && this.isSetRdfData();
+      boolean that_present_rdfData = true && that.isSetRdfData();
+      if (this_present_rdfData || that_present_rdfData) {
+        if (!(this_present_rdfData && that_present_rdfData))
+          return false;
+        if (!this.rdfData.equals(that.rdfData))
+          return false;
+      }
+
+      boolean this_present_rulePaths = true && this.isSetRulePaths();
+      boolean that_present_rulePaths = true && that.isSetRulePaths();
+      if (this_present_rulePaths || that_present_rulePaths) {
+        if (!(this_present_rulePaths && that_present_rulePaths))
+          return false;
+        if (!this.rulePaths.equals(that.rulePaths))
+          return false;
+      }
+
+      boolean this_present_schemaVersion = true && this.isSetSchemaVersion();
+      boolean that_present_schemaVersion = true && that.isSetSchemaVersion();
+      if (this_present_schemaVersion || that_present_schemaVersion) {
+        if (!(this_present_schemaVersion && that_present_schemaVersion))
+          return false;
+        if (!this.schemaVersion.equals(that.schemaVersion))
+          return false;
+      }
+
+      boolean this_present_deadlineMillis = true;
+      boolean that_present_deadlineMillis = true;
+      if (this_present_deadlineMillis || that_present_deadlineMillis) {
+        if (!(this_present_deadlineMillis && that_present_deadlineMillis))
+          return false;
+        if (this.deadlineMillis != that.deadlineMillis)
+          return false;
+      }
+
       return true;
     }
 
@@ -790,17 +6191,71 @@ public class JenaReasoner {
     public int hashCode() {
       int hashCode = 1;
 
+      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
+      if (isSetRdfData())
+        hashCode = hashCode * 8191 + rdfData.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetRulePaths()) ? 131071 : 524287);
+      if (isSetRulePaths())
+        hashCode = hashCode * 8191 + rulePaths.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetSchemaVersion()) ? 131071 : 524287);
+      if (isSetSchemaVersion())
+        hashCode = hashCode * 8191 + schemaVersion.hashCode();
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(deadlineMillis);
+
       return hashCode;
     }
 
     @Override
-    public int compareTo(ping_args other) {
+    public int compareTo(registerAlgorithm_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
+      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRdfData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetRulePaths(), other.isSetRulePaths());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRulePaths()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rulePaths, other.rulePaths);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetSchemaVersion(), other.isSetSchemaVersion());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSchemaVersion()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.schemaVersion, other.schemaVersion);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetDeadlineMillis(), other.isSetDeadlineMillis());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDeadlineMillis()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.deadlineMillis, other.deadlineMillis);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -819,9 +6274,36 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("ping_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("registerAlgorithm_args(");
       boolean first = true;
 
+      sb.append("rdfData:");
+      if (this.rdfData == null) {
+        sb.append("null");
+      } else {
+        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("rulePaths:");
+      if (this.rulePaths == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.rulePaths);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("schemaVersion:");
+      if (this.schemaVersion == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.schemaVersion);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("deadlineMillis:");
+      sb.append(this.deadlineMillis);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -841,21 +6323,23 @@ public class JenaReasoner {
 
     private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
       try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
         read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
       } catch (org.apache.thrift.TException te) {
         throw new java.io.IOException(te);
       }
     }
 
-    private static class ping_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public ping_argsStandardScheme getScheme() {
-        return new ping_argsStandardScheme();
+    private static class registerAlgorithm_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public registerAlgorithm_argsStandardScheme getScheme() {
+        return new registerAlgorithm_argsStandardScheme();
       }
     }
 
-    private static class ping_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<ping_args> {
+    private static class registerAlgorithm_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<registerAlgorithm_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, ping_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, registerAlgorithm_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -865,6 +6349,38 @@ public class JenaReasoner {
             break;
           }
           switch (schemeField.id) {
+            case 1: // RDF_DATA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rdfData = iprot.readBinary();
+                struct.setRdfDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // RULE_PATHS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rulePaths = iprot.readString();
+                struct.setRulePathsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // SCHEMA_VERSION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.schemaVersion = iprot.readString();
+                struct.setSchemaVersionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // DEADLINE_MILLIS
+              if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+                struct.deadlineMillis = iprot.readI64();
+                struct.setDeadlineMillisIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -876,32 +6392,93 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, ping_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, registerAlgorithm_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.rdfData != null) {
+          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.rdfData);
+          oprot.writeFieldEnd();
+        }
+        if (struct.rulePaths != null) {
+          oprot.writeFieldBegin(RULE_PATHS_FIELD_DESC);
+          oprot.writeString(struct.rulePaths);
+          oprot.writeFieldEnd();
+        }
+        if (struct.schemaVersion != null) {
+          oprot.writeFieldBegin(SCHEMA_VERSION_FIELD_DESC);
+          oprot.writeString(struct.schemaVersion);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(DEADLINE_MILLIS_FIELD_DESC);
+        oprot.writeI64(struct.deadlineMillis);
+        oprot.writeFieldEnd();
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class ping_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public ping_argsTupleScheme getScheme() {
-        return new ping_argsTupleScheme();
+    private static class registerAlgorithm_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public registerAlgorithm_argsTupleScheme getScheme() {
+        return new registerAlgorithm_argsTupleScheme();
       }
     }
 
-    private static class ping_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<ping_args> {
+    private static class registerAlgorithm_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<registerAlgorithm_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, ping_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, registerAlgorithm_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetRdfData()) {
+          optionals.set(0);
+        }
+        if (struct.isSetRulePaths()) {
+          optionals.set(1);
+        }
+        if (struct.isSetSchemaVersion()) {
+          optionals.set(2);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          optionals.set(3);
+        }
+        oprot.writeBitSet(optionals, 4);
+        if (struct.isSetRdfData()) {
+          oprot.writeBinary(struct.rdfData);
+        }
+        if (struct.isSetRulePaths()) {
+          oprot.writeString(struct.rulePaths);
+        }
+        if (struct.isSetSchemaVersion()) {
+          oprot.writeString(struct.schemaVersion);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          oprot.writeI64(struct.deadlineMillis);
+        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, ping_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, registerAlgorithm_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(4);
+        if (incoming.get(0)) {
+          struct.rdfData = iprot.readBinary();
+          struct.setRdfDataIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.rulePaths = iprot.readString();
+          struct.setRulePathsIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.schemaVersion = iprot.readString();
+          struct.setSchemaVersionIsSet(true);
+        }
+        if (incoming.get(3)) {
+          struct.deadlineMillis = iprot.readI64();
+          struct.setDeadlineMillisIsSet(true);
+        }
       }
     }
 
@@ -910,19 +6487,25 @@ public class JenaReasoner {
     }
   }
 
-  public static class ping_result implements org.apache.thrift.TBase<ping_result, ping_result._Fields>, java.io.Serializable, Cloneable, Comparable<ping_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ping_result");
+  public static class registerAlgorithm_result implements org.apache.thrift.TBase<registerAlgorithm_result, registerAlgorithm_result._Fields>, java.io.Serializable, Cloneable, Comparable<registerAlgorithm_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("registerAlgorithm_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.BOOL, (short)0);
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+    private static final org.apache.thrift.protocol.TField UNKNOWN_SCHEMA_FIELD_DESC = new org.apache.thrift.protocol.TField("unknownSchema", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField TIMEOUT_FIELD_DESC = new org.apache.thrift.protocol.TField("timeout", org.apache.thrift.protocol.TType.STRUCT, (short)2);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ping_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ping_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new registerAlgorithm_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new registerAlgorithm_resultTupleSchemeFactory();
 
-    public boolean success; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String success; // required
+    public @org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema; // required
+    public @org.apache.thrift.annotation.Nullable ReasoningTimeout timeout; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      SUCCESS((short)0, "success");
+      SUCCESS((short)0, "success"),
+      UNKNOWN_SCHEMA((short)1, "unknownSchema"),
+      TIMEOUT((short)2, "timeout");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -940,6 +6523,10 @@ public class JenaReasoner {
         switch(fieldId) {
           case 0: // SUCCESS
             return SUCCESS;
+          case 1: // UNKNOWN_SCHEMA
+            return UNKNOWN_SCHEMA;
+          case 2: // TIMEOUT
+            return TIMEOUT;
           default:
             return null;
         }
@@ -981,67 +6568,132 @@ public class JenaReasoner {
     }
 
     // isset id assignments
-    private static final int __SUCCESS_ISSET_ID = 0;
-    private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.BOOL)));
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.UNKNOWN_SCHEMA, new org.apache.thrift.meta_data.FieldMetaData("unknownSchema", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, UnknownSchema.class)));
+      tmpMap.put(_Fields.TIMEOUT, new org.apache.thrift.meta_data.FieldMetaData("timeout", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningTimeout.class)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ping_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(registerAlgorithm_result.class, metaDataMap);
     }
 
-    public ping_result() {
+    public registerAlgorithm_result() {
     }
 
-    public ping_result(
-      boolean success)
+    public registerAlgorithm_result(
+      java.lang.String success,
+      UnknownSchema unknownSchema,
+      ReasoningTimeout timeout)
     {
       this();
       this.success = success;
-      setSuccessIsSet(true);
+      this.unknownSchema = unknownSchema;
+      this.timeout = timeout;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public ping_result(ping_result other) {
-      __isset_bitfield = other.__isset_bitfield;
-      this.success = other.success;
+    public registerAlgorithm_result(registerAlgorithm_result other) {
+      if (other.isSetSuccess()) {
+        this.success = other.success;
+      }
+      if (other.isSetUnknownSchema()) {
+        this.unknownSchema = new UnknownSchema(other.unknownSchema);
+      }
+      if (other.isSetTimeout()) {
+        this.timeout = new ReasoningTimeout(other.timeout);
+      }
     }
 
-    public ping_result deepCopy() {
-      return new ping_result(this);
+    public registerAlgorithm_result deepCopy() {
+      return new registerAlgorithm_result(this);
     }
 
     @Override
     public void clear() {
-      setSuccessIsSet(false);
-      this.success = false;
+      this.success = null;
+      this.unknownSchema = null;
+      this.timeout = null;
     }
 
-    public boolean isSuccess() {
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getSuccess() {
       return this.success;
     }
 
-    public ping_result setSuccess(boolean success) {
+    public registerAlgorithm_result setSuccess(@org.apache.thrift.annotation.Nullable java.lang.String success) {
       this.success = success;
-      setSuccessIsSet(true);
       return this;
     }
 
     public void unsetSuccess() {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+      this.success = null;
     }
 
     /** Returns true if field success is set (has been assigned a value) and false otherwise */
     public boolean isSetSuccess() {
-      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __SUCCESS_ISSET_ID);
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public UnknownSchema getUnknownSchema() {
+      return this.unknownSchema;
+    }
+
+    public registerAlgorithm_result setUnknownSchema(@org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema) {
+      this.unknownSchema = unknownSchema;
+      return this;
+    }
+
+    public void unsetUnknownSchema() {
+      this.unknownSchema = null;
+    }
+
+    /** Returns true if field unknownSchema is set (has been assigned a value) and false otherwise */
+    public boolean isSetUnknownSchema() {
+      return this.unknownSchema != null;
+    }
+
+    public void setUnknownSchemaIsSet(boolean value) {
+      if (!value) {
+        this.unknownSchema = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningTimeout getTimeout() {
+      return this.timeout;
+    }
+
+    public registerAlgorithm_result setTimeout(@org.apache.thrift.annotation.Nullable ReasoningTimeout timeout) {
+      this.timeout = timeout;
+      return this;
+    }
+
+    public void unsetTimeout() {
+      this.timeout = null;
+    }
+
+    /** Returns true if field timeout is set (has been assigned a value) and false otherwise */
+    public boolean isSetTimeout() {
+      return this.timeout != null;
     }
 
-    public void setSuccessIsSet(boolean value) {
-      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __SUCCESS_ISSET_ID, value);
+    public void setTimeoutIsSet(boolean value) {
+      if (!value) {
+        this.timeout = null;
+      }
     }
 
     public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
@@ -1050,7 +6702,23 @@ public class JenaReasoner {
         if (value == null) {
           unsetSuccess();
         } else {
-          setSuccess((java.lang.Boolean)value);
+          setSuccess((java.lang.String)value);
+        }
+        break;
+
+      case UNKNOWN_SCHEMA:
+        if (value == null) {
+          unsetUnknownSchema();
+        } else {
+          setUnknownSchema((UnknownSchema)value);
+        }
+        break;
+
+      case TIMEOUT:
+        if (value == null) {
+          unsetTimeout();
+        } else {
+          setTimeout((ReasoningTimeout)value);
         }
         break;
 
@@ -1061,7 +6729,13 @@ public class JenaReasoner {
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
       case SUCCESS:
-        return isSuccess();
+        return getSuccess();
+
+      case UNKNOWN_SCHEMA:
+        return getUnknownSchema();
+
+      case TIMEOUT:
+        return getTimeout();
 
       }
       throw new java.lang.IllegalStateException();
@@ -1076,29 +6750,51 @@ public class JenaReasoner {
       switch (field) {
       case SUCCESS:
         return isSetSuccess();
+      case UNKNOWN_SCHEMA:
+        return isSetUnknownSchema();
+      case TIMEOUT:
+        return isSetTimeout();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof ping_result)
-        return this.equals((ping_result)that);
+      if (that instanceof registerAlgorithm_result)
+        return this.equals((registerAlgorithm_result)that);
       return false;
     }
 
-    public boolean equals(ping_result that) {
+    public boolean equals(registerAlgorithm_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_success = true;
-      boolean that_present_success = true;
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
       if (this_present_success || that_present_success) {
         if (!(this_present_success && that_present_success))
           return false;
-        if (this.success != that.success)
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_unknownSchema = true && this.isSetUnknownSchema();
+      boolean that_present_unknownSchema = true && that.isSetUnknownSchema();
+      if (this_present_unknownSchema || that_present_unknownSchema) {
+        if (!(this_present_unknownSchema && that_present_unknownSchema))
+          return false;
+        if (!this.unknownSchema.equals(that.unknownSchema))
+          return false;
+      }
+
+      boolean this_present_timeout = true && this.isSetTimeout();
+      boolean that_present_timeout = true && that.isSetTimeout();
+      if (this_present_timeout || that_present_timeout) {
+        if (!(this_present_timeout && that_present_timeout))
+          return false;
+        if (!this.timeout.equals(that.timeout))
           return false;
       }
 
@@ -1109,13 +6805,23 @@ public class JenaReasoner {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((success) ? 131071 : 524287);
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetUnknownSchema()) ? 131071 : 524287);
+      if (isSetUnknownSchema())
+        hashCode = hashCode * 8191 + unknownSchema.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetTimeout()) ? 131071 : 524287);
+      if (isSetTimeout())
+        hashCode = hashCode * 8191 + timeout.hashCode();
 
       return hashCode;
     }
 
     @Override
-    public int compareTo(ping_result other) {
+    public int compareTo(registerAlgorithm_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -1132,6 +6838,26 @@ public class JenaReasoner {
           return lastComparison;
         }
       }
+      lastComparison = java.lang.Boolean.compare(isSetUnknownSchema(), other.isSetUnknownSchema());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetUnknownSchema()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.unknownSchema, other.unknownSchema);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetTimeout(), other.isSetTimeout());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetTimeout()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.timeout, other.timeout);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -1150,11 +6876,31 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("ping_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("registerAlgorithm_result(");
       boolean first = true;
 
       sb.append("success:");
-      sb.append(this.success);
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("unknownSchema:");
+      if (this.unknownSchema == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.unknownSchema);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("timeout:");
+      if (this.timeout == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.timeout);
+      }
       first = false;
       sb.append(")");
       return sb.toString();
@@ -1175,23 +6921,21 @@ public class JenaReasoner {
 
     private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
       try {
-        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
-        __isset_bitfield = 0;
         read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
       } catch (org.apache.thrift.TException te) {
         throw new java.io.IOException(te);
       }
     }
 
-    private static class ping_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public ping_resultStandardScheme getScheme() {
-        return new ping_resultStandardScheme();
+    private static class registerAlgorithm_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public registerAlgorithm_resultStandardScheme getScheme() {
+        return new registerAlgorithm_resultStandardScheme();
       }
     }
 
-    private static class ping_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<ping_result> {
+    private static class registerAlgorithm_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<registerAlgorithm_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, ping_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, registerAlgorithm_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -1202,13 +6946,31 @@ public class JenaReasoner {
           }
           switch (schemeField.id) {
             case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.BOOL) {
-                struct.success = iprot.readBool();
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.success = iprot.readString();
                 struct.setSuccessIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
+            case 1: // UNKNOWN_SCHEMA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.unknownSchema = new UnknownSchema();
+                struct.unknownSchema.read(iprot);
+                struct.setUnknownSchemaIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // TIMEOUT
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.timeout = new ReasoningTimeout();
+                struct.timeout.read(iprot);
+                struct.setTimeoutIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -1220,13 +6982,23 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, ping_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, registerAlgorithm_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.isSetSuccess()) {
+        if (struct.success != null) {
           oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          oprot.writeBool(struct.success);
+          oprot.writeString(struct.success);
+          oprot.writeFieldEnd();
+        }
+        if (struct.unknownSchema != null) {
+          oprot.writeFieldBegin(UNKNOWN_SCHEMA_FIELD_DESC);
+          struct.unknownSchema.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.timeout != null) {
+          oprot.writeFieldBegin(TIMEOUT_FIELD_DESC);
+          struct.timeout.write(oprot);
           oprot.writeFieldEnd();
         }
         oprot.writeFieldStop();
@@ -1235,35 +7007,57 @@ public class JenaReasoner {
 
     }
 
-    private static class ping_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public ping_resultTupleScheme getScheme() {
-        return new ping_resultTupleScheme();
+    private static class registerAlgorithm_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public registerAlgorithm_resultTupleScheme getScheme() {
+        return new registerAlgorithm_resultTupleScheme();
       }
     }
 
-    private static class ping_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<ping_result> {
+    private static class registerAlgorithm_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<registerAlgorithm_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, ping_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, registerAlgorithm_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
         if (struct.isSetSuccess()) {
           optionals.set(0);
         }
-        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetUnknownSchema()) {
+          optionals.set(1);
+        }
+        if (struct.isSetTimeout()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
         if (struct.isSetSuccess()) {
-          oprot.writeBool(struct.success);
+          oprot.writeString(struct.success);
+        }
+        if (struct.isSetUnknownSchema()) {
+          struct.unknownSchema.write(oprot);
+        }
+        if (struct.isSetTimeout()) {
+          struct.timeout.write(oprot);
         }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, ping_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, registerAlgorithm_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(1);
+        java.util.BitSet incoming = iprot.readBitSet(3);
         if (incoming.get(0)) {
-          struct.success = iprot.readBool();
+          struct.success = iprot.readString();
           struct.setSuccessIsSet(true);
         }
+        if (incoming.get(1)) {
+          struct.unknownSchema = new UnknownSchema();
+          struct.unknownSchema.read(iprot);
+          struct.setUnknownSchemaIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.timeout = new ReasoningTimeout();
+          struct.timeout.read(iprot);
+          struct.setTimeoutIsSet(true);
+        }
       }
     }
 
@@ -1272,22 +7066,28 @@ public class JenaReasoner {
     }
   }
 
-  public static class saveRdf_args implements org.apache.thrift.TBase<saveRdf_args, saveRdf_args._Fields>, java.io.Serializable, Cloneable, Comparable<saveRdf_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("saveRdf_args");
+  public static class reasonTrace_args implements org.apache.thrift.TBase<reasonTrace_args, reasonTrace_args._Fields>, java.io.Serializable, Cloneable, Comparable<reasonTrace_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reasonTrace_args");
 
-    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
-    private static final org.apache.thrift.protocol.TField FILENAME_FIELD_DESC = new org.apache.thrift.protocol.TField("filename", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField ALGORITHM_HANDLE_FIELD_DESC = new org.apache.thrift.protocol.TField("algorithmHandle", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField TRACE_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("traceData", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField RULE_PATHS_FIELD_DESC = new org.apache.thrift.protocol.TField("rulePaths", org.apache.thrift.protocol.TType.STRING, (short)3);
+    private static final org.apache.thrift.protocol.TField DEADLINE_MILLIS_FIELD_DESC = new org.apache.thrift.protocol.TField("deadlineMillis", org.apache.thrift.protocol.TType.I64, (short)4);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new saveRdf_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new saveRdf_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reasonTrace_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reasonTrace_argsTupleSchemeFactory();
 
-    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
-    public @org.apache.thrift.annotation.Nullable java.lang.String filename; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String algorithmHandle; // required
+    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer traceData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String rulePaths; // required
+    public long deadlineMillis; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      RDF_DATA((short)1, "rdfData"),
-      FILENAME((short)2, "filename");
+      ALGORITHM_HANDLE((short)1, "algorithmHandle"),
+      TRACE_DATA((short)2, "traceData"),
+      RULE_PATHS((short)3, "rulePaths"),
+      DEADLINE_MILLIS((short)4, "deadlineMillis");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -1303,10 +7103,14 @@ public class JenaReasoner {
       @org.apache.thrift.annotation.Nullable
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 1: // RDF_DATA
-            return RDF_DATA;
-          case 2: // FILENAME
-            return FILENAME;
+          case 1: // ALGORITHM_HANDLE
+            return ALGORITHM_HANDLE;
+          case 2: // TRACE_DATA
+            return TRACE_DATA;
+          case 3: // RULE_PATHS
+            return RULE_PATHS;
+          case 4: // DEADLINE_MILLIS
+            return DEADLINE_MILLIS;
           default:
             return null;
         }
@@ -1348,129 +7152,212 @@ public class JenaReasoner {
     }
 
     // isset id assignments
+    private static final int __DEADLINEMILLIS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+      tmpMap.put(_Fields.ALGORITHM_HANDLE, new org.apache.thrift.meta_data.FieldMetaData("algorithmHandle", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.TRACE_DATA, new org.apache.thrift.meta_data.FieldMetaData("traceData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
-      tmpMap.put(_Fields.FILENAME, new org.apache.thrift.meta_data.FieldMetaData("filename", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+      tmpMap.put(_Fields.RULE_PATHS, new org.apache.thrift.meta_data.FieldMetaData("rulePaths", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.DEADLINE_MILLIS, new org.apache.thrift.meta_data.FieldMetaData("deadlineMillis", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(saveRdf_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reasonTrace_args.class, metaDataMap);
     }
 
-    public saveRdf_args() {
+    public reasonTrace_args() {
     }
 
-    public saveRdf_args(
-      java.nio.ByteBuffer rdfData,
-      java.lang.String filename)
+    public reasonTrace_args(
+      java.lang.String algorithmHandle,
+      java.nio.ByteBuffer traceData,
+      java.lang.String rulePaths,
+      long deadlineMillis)
     {
       this();
-      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
-      this.filename = filename;
+      this.algorithmHandle = algorithmHandle;
+      this.traceData = org.apache.thrift.TBaseHelper.copyBinary(traceData);
+      this.rulePaths = rulePaths;
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public saveRdf_args(saveRdf_args other) {
-      if (other.isSetRdfData()) {
-        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+    public reasonTrace_args(reasonTrace_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      if (other.isSetAlgorithmHandle()) {
+        this.algorithmHandle = other.algorithmHandle;
       }
-      if (other.isSetFilename()) {
-        this.filename = other.filename;
+      if (other.isSetTraceData()) {
+        this.traceData = org.apache.thrift.TBaseHelper.copyBinary(other.traceData);
       }
+      if (other.isSetRulePaths()) {
+        this.rulePaths = other.rulePaths;
+      }
+      this.deadlineMillis = other.deadlineMillis;
     }
 
-    public saveRdf_args deepCopy() {
-      return new saveRdf_args(this);
+    public reasonTrace_args deepCopy() {
+      return new reasonTrace_args(this);
     }
 
     @Override
     public void clear() {
-      this.rdfData = null;
-      this.filename = null;
+      this.algorithmHandle = null;
+      this.traceData = null;
+      this.rulePaths = null;
+      setDeadlineMillisIsSet(false);
+      this.deadlineMillis = 0;
     }
 
-    public byte[] getRdfData() {
-      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
-      return rdfData == null ? null : rdfData.array();
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getAlgorithmHandle() {
+      return this.algorithmHandle;
     }
 
-    public java.nio.ByteBuffer bufferForRdfData() {
-      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    public reasonTrace_args setAlgorithmHandle(@org.apache.thrift.annotation.Nullable java.lang.String algorithmHandle) {
+      this.algorithmHandle = algorithmHandle;
+      return this;
     }
 
-    public saveRdf_args setRdfData(byte[] rdfData) {
-      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+    public void unsetAlgorithmHandle() {
+      this.algorithmHandle = null;
+    }
+
+    /** Returns true if field algorithmHandle is set (has been assigned a value) and false otherwise */
+    public boolean isSetAlgorithmHandle() {
+      return this.algorithmHandle != null;
+    }
+
+    public void setAlgorithmHandleIsSet(boolean value) {
+      if (!value) {
+        this.algorithmHandle = null;
+      }
+    }
+
+    public byte[] getTraceData() {
+      setTraceData(org.apache.thrift.TBaseHelper.rightSize(traceData));
+      return traceData == null ? null : traceData.array();
+    }
+
+    public java.nio.ByteBuffer bufferForTraceData() {
+      return org.apache.thrift.TBaseHelper.copyBinary(traceData);
+    }
+
+    public reasonTrace_args setTraceData(byte[] traceData) {
+      this.traceData = traceData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(traceData.clone());
       return this;
     }
 
-    public saveRdf_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
-      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    public reasonTrace_args setTraceData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer traceData) {
+      this.traceData = org.apache.thrift.TBaseHelper.copyBinary(traceData);
       return this;
     }
 
-    public void unsetRdfData() {
-      this.rdfData = null;
+    public void unsetTraceData() {
+      this.traceData = null;
     }
 
-    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
-    public boolean isSetRdfData() {
-      return this.rdfData != null;
+    /** Returns true if field traceData is set (has been assigned a value) and false otherwise */
+    public boolean isSetTraceData() {
+      return this.traceData != null;
     }
 
-    public void setRdfDataIsSet(boolean value) {
+    public void setTraceDataIsSet(boolean value) {
       if (!value) {
-        this.rdfData = null;
+        this.traceData = null;
       }
     }
 
     @org.apache.thrift.annotation.Nullable
-    public java.lang.String getFilename() {
-      return this.filename;
+    public java.lang.String getRulePaths() {
+      return this.rulePaths;
     }
 
-    public saveRdf_args setFilename(@org.apache.thrift.annotation.Nullable java.lang.String filename) {
-      this.filename = filename;
+    public reasonTrace_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
+      this.rulePaths = rulePaths;
       return this;
     }
 
-    public void unsetFilename() {
-      this.filename = null;
+    public void unsetRulePaths() {
+      this.rulePaths = null;
     }
 
-    /** Returns true if field filename is set (has been assigned a value) and false otherwise */
-    public boolean isSetFilename() {
-      return this.filename != null;
+    /** Returns true if field rulePaths is set (has been assigned a value) and false otherwise */
+    public boolean isSetRulePaths() {
+      return this.rulePaths != null;
     }
 
-    public void setFilenameIsSet(boolean value) {
+    public void setRulePathsIsSet(boolean value) {
       if (!value) {
-        this.filename = null;
+        this.rulePaths = null;
       }
     }
 
+    public long getDeadlineMillis() {
+      return this.deadlineMillis;
+    }
+
+    public reasonTrace_args setDeadlineMillis(long deadlineMillis) {
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+      return this;
+    }
+
+    public void unsetDeadlineMillis() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    /** Returns true if field deadlineMillis is set (has been assigned a value) and false otherwise */
+    public boolean isSetDeadlineMillis() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    public void setDeadlineMillisIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID, value);
+    }
+
     public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
       switch (field) {
-      case RDF_DATA:
+      case ALGORITHM_HANDLE:
         if (value == null) {
-          unsetRdfData();
+          unsetAlgorithmHandle();
+        } else {
+          setAlgorithmHandle((java.lang.String)value);
+        }
+        break;
+
+      case TRACE_DATA:
+        if (value == null) {
+          unsetTraceData();
         } else {
           if (value instanceof byte[]) {
-            setRdfData((byte[])value);
+            setTraceData((byte[])value);
           } else {
-            setRdfData((java.nio.ByteBuffer)value);
+            setTraceData((java.nio.ByteBuffer)value);
           }
         }
         break;
 
-      case FILENAME:
+      case RULE_PATHS:
         if (value == null) {
-          unsetFilename();
+          unsetRulePaths();
         } else {
-          setFilename((java.lang.String)value);
+          setRulePaths((java.lang.String)value);
+        }
+        break;
+
+      case DEADLINE_MILLIS:
+        if (value == null) {
+          unsetDeadlineMillis();
+        } else {
+          setDeadlineMillis((java.lang.Long)value);
         }
         break;
 
@@ -1480,11 +7367,17 @@ public class JenaReasoner {
     @org.apache.thrift.annotation.Nullable
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case RDF_DATA:
-        return getRdfData();
+      case ALGORITHM_HANDLE:
+        return getAlgorithmHandle();
 
-      case FILENAME:
-        return getFilename();
+      case TRACE_DATA:
+        return getTraceData();
+
+      case RULE_PATHS:
+        return getRulePaths();
+
+      case DEADLINE_MILLIS:
+        return getDeadlineMillis();
 
       }
       throw new java.lang.IllegalStateException();
@@ -1497,42 +7390,64 @@ public class JenaReasoner {
       }
 
       switch (field) {
-      case RDF_DATA:
-        return isSetRdfData();
-      case FILENAME:
-        return isSetFilename();
+      case ALGORITHM_HANDLE:
+        return isSetAlgorithmHandle();
+      case TRACE_DATA:
+        return isSetTraceData();
+      case RULE_PATHS:
+        return isSetRulePaths();
+      case DEADLINE_MILLIS:
+        return isSetDeadlineMillis();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof saveRdf_args)
-        return this.equals((saveRdf_args)that);
+      if (that instanceof reasonTrace_args)
+        return this.equals((reasonTrace_args)that);
       return false;
     }
 
-    public boolean equals(saveRdf_args that) {
+    public boolean equals(reasonTrace_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_rdfData = true && this.isSetRdfData();
-      boolean that_present_rdfData = true && that.isSetRdfData();
-      if (this_present_rdfData || that_present_rdfData) {
-        if (!(this_present_rdfData && that_present_rdfData))
+      boolean this_present_algorithmHandle = true && this.isSetAlgorithmHandle();
+      boolean that_present_algorithmHandle = true && that.isSetAlgorithmHandle();
+      if (this_present_algorithmHandle || that_present_algorithmHandle) {
+        if (!(this_present_algorithmHandle && that_present_algorithmHandle))
           return false;
-        if (!this.rdfData.equals(that.rdfData))
+        if (!this.algorithmHandle.equals(that.algorithmHandle))
           return false;
       }
 
-      boolean this_present_filename = true && this.isSetFilename();
-      boolean that_present_filename = true && that.isSetFilename();
-      if (this_present_filename || that_present_filename) {
-        if (!(this_present_filename && that_present_filename))
+      boolean this_present_traceData = true && this.isSetTraceData();
+      boolean that_present_traceData = true && that.isSetTraceData();
+      if (this_present_traceData || that_present_traceData) {
+        if (!(this_present_traceData && that_present_traceData))
           return false;
-        if (!this.filename.equals(that.filename))
+        if (!this.traceData.equals(that.traceData))
+          return false;
+      }
+
+      boolean this_present_rulePaths = true && this.isSetRulePaths();
+      boolean that_present_rulePaths = true && that.isSetRulePaths();
+      if (this_present_rulePaths || that_present_rulePaths) {
+        if (!(this_present_rulePaths && that_present_rulePaths))
+          return false;
+        if (!this.rulePaths.equals(that.rulePaths))
+          return false;
+      }
+
+      boolean this_present_deadlineMillis = true;
+      boolean that_present_deadlineMillis = true;
+      if (this_present_deadlineMillis || that_present_deadlineMillis) {
+        if (!(this_present_deadlineMillis && that_present_deadlineMillis))
+          return false;
+        if (this.deadlineMillis != that.deadlineMillis)
           return false;
       }
 
@@ -1543,41 +7458,67 @@ public class JenaReasoner {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
-      if (isSetRdfData())
-        hashCode = hashCode * 8191 + rdfData.hashCode();
+      hashCode = hashCode * 8191 + ((isSetAlgorithmHandle()) ? 131071 : 524287);
+      if (isSetAlgorithmHandle())
+        hashCode = hashCode * 8191 + algorithmHandle.hashCode();
 
-      hashCode = hashCode * 8191 + ((isSetFilename()) ? 131071 : 524287);
-      if (isSetFilename())
-        hashCode = hashCode * 8191 + filename.hashCode();
+      hashCode = hashCode * 8191 + ((isSetTraceData()) ? 131071 : 524287);
+      if (isSetTraceData())
+        hashCode = hashCode * 8191 + traceData.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetRulePaths()) ? 131071 : 524287);
+      if (isSetRulePaths())
+        hashCode = hashCode * 8191 + rulePaths.hashCode();
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(deadlineMillis);
 
       return hashCode;
     }
 
     @Override
-    public int compareTo(saveRdf_args other) {
+    public int compareTo(reasonTrace_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      lastComparison = java.lang.Boolean.compare(isSetAlgorithmHandle(), other.isSetAlgorithmHandle());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetRdfData()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+      if (isSetAlgorithmHandle()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.algorithmHandle, other.algorithmHandle);
         if (lastComparison != 0) {
           return lastComparison;
         }
       }
-      lastComparison = java.lang.Boolean.compare(isSetFilename(), other.isSetFilename());
+      lastComparison = java.lang.Boolean.compare(isSetTraceData(), other.isSetTraceData());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetFilename()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.filename, other.filename);
+      if (isSetTraceData()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.traceData, other.traceData);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetRulePaths(), other.isSetRulePaths());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetRulePaths()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rulePaths, other.rulePaths);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetDeadlineMillis(), other.isSetDeadlineMillis());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDeadlineMillis()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.deadlineMillis, other.deadlineMillis);
         if (lastComparison != 0) {
           return lastComparison;
         }
@@ -1600,24 +7541,36 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("saveRdf_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reasonTrace_args(");
       boolean first = true;
 
-      sb.append("rdfData:");
-      if (this.rdfData == null) {
+      sb.append("algorithmHandle:");
+      if (this.algorithmHandle == null) {
         sb.append("null");
       } else {
-        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+        sb.append(this.algorithmHandle);
       }
       first = false;
       if (!first) sb.append(", ");
-      sb.append("filename:");
-      if (this.filename == null) {
+      sb.append("traceData:");
+      if (this.traceData == null) {
         sb.append("null");
       } else {
-        sb.append(this.filename);
+        org.apache.thrift.TBaseHelper.toString(this.traceData, sb);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("rulePaths:");
+      if (this.rulePaths == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.rulePaths);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("deadlineMillis:");
+      sb.append(this.deadlineMillis);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -1637,21 +7590,23 @@ public class JenaReasoner {
 
     private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
       try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
         read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
       } catch (org.apache.thrift.TException te) {
         throw new java.io.IOException(te);
       }
     }
 
-    private static class saveRdf_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public saveRdf_argsStandardScheme getScheme() {
-        return new saveRdf_argsStandardScheme();
+    private static class reasonTrace_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonTrace_argsStandardScheme getScheme() {
+        return new reasonTrace_argsStandardScheme();
       }
     }
 
-    private static class saveRdf_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<saveRdf_args> {
+    private static class reasonTrace_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<reasonTrace_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, saveRdf_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reasonTrace_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -1661,18 +7616,34 @@ public class JenaReasoner {
             break;
           }
           switch (schemeField.id) {
-            case 1: // RDF_DATA
+            case 1: // ALGORITHM_HANDLE
               if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.rdfData = iprot.readBinary();
-                struct.setRdfDataIsSet(true);
+                struct.algorithmHandle = iprot.readString();
+                struct.setAlgorithmHandleIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
-            case 2: // FILENAME
+            case 2: // TRACE_DATA
               if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.filename = iprot.readString();
-                struct.setFilenameIsSet(true);
+                struct.traceData = iprot.readBinary();
+                struct.setTraceDataIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 3: // RULE_PATHS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.rulePaths = iprot.readString();
+                struct.setRulePathsIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // DEADLINE_MILLIS
+              if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+                struct.deadlineMillis = iprot.readI64();
+                struct.setDeadlineMillisIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
@@ -1688,64 +7659,92 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, saveRdf_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reasonTrace_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.rdfData != null) {
-          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
-          oprot.writeBinary(struct.rdfData);
+        if (struct.algorithmHandle != null) {
+          oprot.writeFieldBegin(ALGORITHM_HANDLE_FIELD_DESC);
+          oprot.writeString(struct.algorithmHandle);
           oprot.writeFieldEnd();
         }
-        if (struct.filename != null) {
-          oprot.writeFieldBegin(FILENAME_FIELD_DESC);
-          oprot.writeString(struct.filename);
+        if (struct.traceData != null) {
+          oprot.writeFieldBegin(TRACE_DATA_FIELD_DESC);
+          oprot.writeBinary(struct.traceData);
+          oprot.writeFieldEnd();
+        }
+        if (struct.rulePaths != null) {
+          oprot.writeFieldBegin(RULE_PATHS_FIELD_DESC);
+          oprot.writeString(struct.rulePaths);
           oprot.writeFieldEnd();
         }
+        oprot.writeFieldBegin(DEADLINE_MILLIS_FIELD_DESC);
+        oprot.writeI64(struct.deadlineMillis);
+        oprot.writeFieldEnd();
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class saveRdf_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public saveRdf_argsTupleScheme getScheme() {
-        return new saveRdf_argsTupleScheme();
+    private static class reasonTrace_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonTrace_argsTupleScheme getScheme() {
+        return new reasonTrace_argsTupleScheme();
       }
     }
 
-    private static class saveRdf_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<saveRdf_args> {
+    private static class reasonTrace_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<reasonTrace_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, saveRdf_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reasonTrace_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
-        if (struct.isSetRdfData()) {
+        if (struct.isSetAlgorithmHandle()) {
           optionals.set(0);
         }
-        if (struct.isSetFilename()) {
+        if (struct.isSetTraceData()) {
           optionals.set(1);
         }
-        oprot.writeBitSet(optionals, 2);
-        if (struct.isSetRdfData()) {
-          oprot.writeBinary(struct.rdfData);
+        if (struct.isSetRulePaths()) {
+          optionals.set(2);
         }
-        if (struct.isSetFilename()) {
-          oprot.writeString(struct.filename);
+        if (struct.isSetDeadlineMillis()) {
+          optionals.set(3);
+        }
+        oprot.writeBitSet(optionals, 4);
+        if (struct.isSetAlgorithmHandle()) {
+          oprot.writeString(struct.algorithmHandle);
+        }
+        if (struct.isSetTraceData()) {
+          oprot.writeBinary(struct.traceData);
+        }
+        if (struct.isSetRulePaths()) {
+          oprot.writeString(struct.rulePaths);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          oprot.writeI64(struct.deadlineMillis);
         }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, saveRdf_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reasonTrace_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(2);
+        java.util.BitSet incoming = iprot.readBitSet(4);
         if (incoming.get(0)) {
-          struct.rdfData = iprot.readBinary();
-          struct.setRdfDataIsSet(true);
+          struct.algorithmHandle = iprot.readString();
+          struct.setAlgorithmHandleIsSet(true);
         }
         if (incoming.get(1)) {
-          struct.filename = iprot.readString();
-          struct.setFilenameIsSet(true);
+          struct.traceData = iprot.readBinary();
+          struct.setTraceDataIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.rulePaths = iprot.readString();
+          struct.setRulePathsIsSet(true);
+        }
+        if (incoming.get(3)) {
+          struct.deadlineMillis = iprot.readI64();
+          struct.setDeadlineMillisIsSet(true);
         }
       }
     }
@@ -1755,17 +7754,25 @@ public class JenaReasoner {
     }
   }
 
-  public static class saveRdf_result implements org.apache.thrift.TBase<saveRdf_result, saveRdf_result._Fields>, java.io.Serializable, Cloneable, Comparable<saveRdf_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("saveRdf_result");
+  public static class reasonTrace_result implements org.apache.thrift.TBase<reasonTrace_result, reasonTrace_result._Fields>, java.io.Serializable, Cloneable, Comparable<reasonTrace_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reasonTrace_result");
 
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRUCT, (short)0);
+    private static final org.apache.thrift.protocol.TField UNKNOWN_FIELD_DESC = new org.apache.thrift.protocol.TField("unknown", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField TIMEOUT_FIELD_DESC = new org.apache.thrift.protocol.TField("timeout", org.apache.thrift.protocol.TType.STRUCT, (short)2);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new saveRdf_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new saveRdf_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reasonTrace_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reasonTrace_resultTupleSchemeFactory();
 
+    public @org.apache.thrift.annotation.Nullable ReasoningResult success; // required
+    public @org.apache.thrift.annotation.Nullable UnknownAlgorithm unknown; // required
+    public @org.apache.thrift.annotation.Nullable ReasoningTimeout timeout; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-;
+      SUCCESS((short)0, "success"),
+      UNKNOWN((short)1, "unknown"),
+      TIMEOUT((short)2, "timeout");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -1781,6 +7788,12 @@ public class JenaReasoner {
       @org.apache.thrift.annotation.Nullable
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
+          case 0: // SUCCESS
+            return SUCCESS;
+          case 1: // UNKNOWN
+            return UNKNOWN;
+          case 2: // TIMEOUT
+            return TIMEOUT;
           default:
             return null;
         }
@@ -1820,38 +7833,177 @@ public class JenaReasoner {
         return _fieldName;
       }
     }
+
+    // isset id assignments
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+      tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningResult.class)));
+      tmpMap.put(_Fields.UNKNOWN, new org.apache.thrift.meta_data.FieldMetaData("unknown", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, UnknownAlgorithm.class)));
+      tmpMap.put(_Fields.TIMEOUT, new org.apache.thrift.meta_data.FieldMetaData("timeout", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningTimeout.class)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(saveRdf_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reasonTrace_result.class, metaDataMap);
     }
 
-    public saveRdf_result() {
+    public reasonTrace_result() {
+    }
+
+    public reasonTrace_result(
+      ReasoningResult success,
+      UnknownAlgorithm unknown,
+      ReasoningTimeout timeout)
+    {
+      this();
+      this.success = success;
+      this.unknown = unknown;
+      this.timeout = timeout;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public saveRdf_result(saveRdf_result other) {
+    public reasonTrace_result(reasonTrace_result other) {
+      if (other.isSetSuccess()) {
+        this.success = new ReasoningResult(other.success);
+      }
+      if (other.isSetUnknown()) {
+        this.unknown = new UnknownAlgorithm(other.unknown);
+      }
+      if (other.isSetTimeout()) {
+        this.timeout = new ReasoningTimeout(other.timeout);
+      }
     }
 
-    public saveRdf_result deepCopy() {
-      return new saveRdf_result(this);
+    public reasonTrace_result deepCopy() {
+      return new reasonTrace_result(this);
     }
 
     @Override
     public void clear() {
+      this.success = null;
+      this.unknown = null;
+      this.timeout = null;
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningResult getSuccess() {
+      return this.success;
+    }
+
+    public reasonTrace_result setSuccess(@org.apache.thrift.annotation.Nullable ReasoningResult success) {
+      this.success = success;
+      return this;
+    }
+
+    public void unsetSuccess() {
+      this.success = null;
+    }
+
+    /** Returns true if field success is set (has been assigned a value) and false otherwise */
+    public boolean isSetSuccess() {
+      return this.success != null;
+    }
+
+    public void setSuccessIsSet(boolean value) {
+      if (!value) {
+        this.success = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public UnknownAlgorithm getUnknown() {
+      return this.unknown;
+    }
+
+    public reasonTrace_result setUnknown(@org.apache.thrift.annotation.Nullable UnknownAlgorithm unknown) {
+      this.unknown = unknown;
+      return this;
+    }
+
+    public void unsetUnknown() {
+      this.unknown = null;
+    }
+
+    /** Returns true if field unknown is set (has been assigned a value) and false otherwise */
+    public boolean isSetUnknown() {
+      return this.unknown != null;
+    }
+
+    public void setUnknownIsSet(boolean value) {
+      if (!value) {
+        this.unknown = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningTimeout getTimeout() {
+      return this.timeout;
+    }
+
+    public reasonTrace_result setTimeout(@org.apache.thrift.annotation.Nullable ReasoningTimeout timeout) {
+      this.timeout = timeout;
+      return this;
+    }
+
+    public void unsetTimeout() {
+      this.timeout = null;
+    }
+
+    /** Returns true if field timeout is set (has been assigned a value) and false otherwise */
+    public boolean isSetTimeout() {
+      return this.timeout != null;
+    }
+
+    public void setTimeoutIsSet(boolean value) {
+      if (!value) {
+        this.timeout = null;
+      }
     }
 
     public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
       switch (field) {
+      case SUCCESS:
+        if (value == null) {
+          unsetSuccess();
+        } else {
+          setSuccess((ReasoningResult)value);
+        }
+        break;
+
+      case UNKNOWN:
+        if (value == null) {
+          unsetUnknown();
+        } else {
+          setUnknown((UnknownAlgorithm)value);
+        }
+        break;
+
+      case TIMEOUT:
+        if (value == null) {
+          unsetTimeout();
+        } else {
+          setTimeout((ReasoningTimeout)value);
+        }
+        break;
+
       }
     }
 
     @org.apache.thrift.annotation.Nullable
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
+      case SUCCESS:
+        return getSuccess();
+
+      case UNKNOWN:
+        return getUnknown();
+
+      case TIMEOUT:
+        return getTimeout();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -1863,23 +8015,56 @@ public class JenaReasoner {
       }
 
       switch (field) {
+      case SUCCESS:
+        return isSetSuccess();
+      case UNKNOWN:
+        return isSetUnknown();
+      case TIMEOUT:
+        return isSetTimeout();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof saveRdf_result)
-        return this.equals((saveRdf_result)that);
+      if (that instanceof reasonTrace_result)
+        return this.equals((reasonTrace_result)that);
       return false;
     }
 
-    public boolean equals(saveRdf_result that) {
+    public boolean equals(reasonTrace_result that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
+      boolean this_present_success = true && this.isSetSuccess();
+      boolean that_present_success = true && that.isSetSuccess();
+      if (this_present_success || that_present_success) {
+        if (!(this_present_success && that_present_success))
+          return false;
+        if (!this.success.equals(that.success))
+          return false;
+      }
+
+      boolean this_present_unknown = true && this.isSetUnknown();
+      boolean that_present_unknown = true && that.isSetUnknown();
+      if (this_present_unknown || that_present_unknown) {
+        if (!(this_present_unknown && that_present_unknown))
+          return false;
+        if (!this.unknown.equals(that.unknown))
+          return false;
+      }
+
+      boolean this_present_timeout = true && this.isSetTimeout();
+      boolean that_present_timeout = true && that.isSetTimeout();
+      if (this_present_timeout || that_present_timeout) {
+        if (!(this_present_timeout && that_present_timeout))
+          return false;
+        if (!this.timeout.equals(that.timeout))
+          return false;
+      }
+
       return true;
     }
 
@@ -1887,17 +8072,59 @@ public class JenaReasoner {
     public int hashCode() {
       int hashCode = 1;
 
+      hashCode = hashCode * 8191 + ((isSetSuccess()) ? 131071 : 524287);
+      if (isSetSuccess())
+        hashCode = hashCode * 8191 + success.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetUnknown()) ? 131071 : 524287);
+      if (isSetUnknown())
+        hashCode = hashCode * 8191 + unknown.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetTimeout()) ? 131071 : 524287);
+      if (isSetTimeout())
+        hashCode = hashCode * 8191 + timeout.hashCode();
+
       return hashCode;
     }
 
     @Override
-    public int compareTo(saveRdf_result other) {
+    public int compareTo(reasonTrace_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
+      lastComparison = java.lang.Boolean.compare(isSetSuccess(), other.isSetSuccess());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSuccess()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.success, other.success);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetUnknown(), other.isSetUnknown());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetUnknown()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.unknown, other.unknown);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetTimeout(), other.isSetTimeout());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetTimeout()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.timeout, other.timeout);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -1916,9 +8143,32 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("saveRdf_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reasonTrace_result(");
       boolean first = true;
 
+      sb.append("success:");
+      if (this.success == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("unknown:");
+      if (this.unknown == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.unknown);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("timeout:");
+      if (this.timeout == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.timeout);
+      }
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -1926,6 +8176,9 @@ public class JenaReasoner {
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
       // check for sub-struct validity
+      if (success != null) {
+        success.validate();
+      }
     }
 
     private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
@@ -1944,15 +8197,15 @@ public class JenaReasoner {
       }
     }
 
-    private static class saveRdf_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public saveRdf_resultStandardScheme getScheme() {
-        return new saveRdf_resultStandardScheme();
+    private static class reasonTrace_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonTrace_resultStandardScheme getScheme() {
+        return new reasonTrace_resultStandardScheme();
       }
     }
 
-    private static class saveRdf_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<saveRdf_result> {
+    private static class reasonTrace_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<reasonTrace_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, saveRdf_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reasonTrace_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -1962,6 +8215,33 @@ public class JenaReasoner {
             break;
           }
           switch (schemeField.id) {
+            case 0: // SUCCESS
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.success = new ReasoningResult();
+                struct.success.read(iprot);
+                struct.setSuccessIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 1: // UNKNOWN
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.unknown = new UnknownAlgorithm();
+                struct.unknown.read(iprot);
+                struct.setUnknownIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // TIMEOUT
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.timeout = new ReasoningTimeout();
+                struct.timeout.read(iprot);
+                struct.setTimeoutIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -1973,32 +8253,83 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, saveRdf_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reasonTrace_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
+        if (struct.success != null) {
+          oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
+          struct.success.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.unknown != null) {
+          oprot.writeFieldBegin(UNKNOWN_FIELD_DESC);
+          struct.unknown.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.timeout != null) {
+          oprot.writeFieldBegin(TIMEOUT_FIELD_DESC);
+          struct.timeout.write(oprot);
+          oprot.writeFieldEnd();
+        }
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class saveRdf_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public saveRdf_resultTupleScheme getScheme() {
-        return new saveRdf_resultTupleScheme();
+    private static class reasonTrace_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonTrace_resultTupleScheme getScheme() {
+        return new reasonTrace_resultTupleScheme();
       }
     }
 
-    private static class saveRdf_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<saveRdf_result> {
+    private static class reasonTrace_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<reasonTrace_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, saveRdf_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reasonTrace_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet optionals = new java.util.BitSet();
+        if (struct.isSetSuccess()) {
+          optionals.set(0);
+        }
+        if (struct.isSetUnknown()) {
+          optionals.set(1);
+        }
+        if (struct.isSetTimeout()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
+        if (struct.isSetSuccess()) {
+          struct.success.write(oprot);
+        }
+        if (struct.isSetUnknown()) {
+          struct.unknown.write(oprot);
+        }
+        if (struct.isSetTimeout()) {
+          struct.timeout.write(oprot);
+        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, saveRdf_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reasonTrace_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+        java.util.BitSet incoming = iprot.readBitSet(3);
+        if (incoming.get(0)) {
+          struct.success = new ReasoningResult();
+          struct.success.read(iprot);
+          struct.setSuccessIsSet(true);
+        }
+        if (incoming.get(1)) {
+          struct.unknown = new UnknownAlgorithm();
+          struct.unknown.read(iprot);
+          struct.setUnknownIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.timeout = new ReasoningTimeout();
+          struct.timeout.read(iprot);
+          struct.setTimeoutIsSet(true);
+        }
       }
     }
 
@@ -2007,22 +8338,31 @@ public class JenaReasoner {
     }
   }
 
-  public static class runReasoner_args implements org.apache.thrift.TBase<runReasoner_args, runReasoner_args._Fields>, java.io.Serializable, Cloneable, Comparable<runReasoner_args>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("runReasoner_args");
+  public static class reasonFile_args implements org.apache.thrift.TBase<reasonFile_args, reasonFile_args._Fields>, java.io.Serializable, Cloneable, Comparable<reasonFile_args>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reasonFile_args");
 
-    private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+    private static final org.apache.thrift.protocol.TField PAYLOAD_PATH_FIELD_DESC = new org.apache.thrift.protocol.TField("payloadPath", org.apache.thrift.protocol.TType.STRING, (short)1);
     private static final org.apache.thrift.protocol.TField RULE_PATHS_FIELD_DESC = new org.apache.thrift.protocol.TField("rulePaths", org.apache.thrift.protocol.TType.STRING, (short)2);
+    private static final org.apache.thrift.protocol.TField SCHEMA_VERSION_FIELD_DESC = new org.apache.thrift.protocol.TField("schemaVersion", org.apache.thrift.protocol.TType.STRING, (short)3);
+    private static final org.apache.thrift.protocol.TField RESULT_PATH_FIELD_DESC = new org.apache.thrift.protocol.TField("resultPath", org.apache.thrift.protocol.TType.STRING, (short)4);
+    private static final org.apache.thrift.protocol.TField DEADLINE_MILLIS_FIELD_DESC = new org.apache.thrift.protocol.TField("deadlineMillis", org.apache.thrift.protocol.TType.I64, (short)5);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new runReasoner_argsStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new runReasoner_argsTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reasonFile_argsStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reasonFile_argsTupleSchemeFactory();
 
-    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String payloadPath; // required
     public @org.apache.thrift.annotation.Nullable java.lang.String rulePaths; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String schemaVersion; // required
+    public @org.apache.thrift.annotation.Nullable java.lang.String resultPath; // required
+    public long deadlineMillis; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      RDF_DATA((short)1, "rdfData"),
-      RULE_PATHS((short)2, "rulePaths");
+      PAYLOAD_PATH((short)1, "payloadPath"),
+      RULE_PATHS((short)2, "rulePaths"),
+      SCHEMA_VERSION((short)3, "schemaVersion"),
+      RESULT_PATH((short)4, "resultPath"),
+      DEADLINE_MILLIS((short)5, "deadlineMillis");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -2038,10 +8378,16 @@ public class JenaReasoner {
       @org.apache.thrift.annotation.Nullable
       public static _Fields findByThriftId(int fieldId) {
         switch(fieldId) {
-          case 1: // RDF_DATA
-            return RDF_DATA;
+          case 1: // PAYLOAD_PATH
+            return PAYLOAD_PATH;
           case 2: // RULE_PATHS
             return RULE_PATHS;
+          case 3: // SCHEMA_VERSION
+            return SCHEMA_VERSION;
+          case 4: // RESULT_PATH
+            return RESULT_PATH;
+          case 5: // DEADLINE_MILLIS
+            return DEADLINE_MILLIS;
           default:
             return null;
         }
@@ -2083,82 +8429,100 @@ public class JenaReasoner {
     }
 
     // isset id assignments
+    private static final int __DEADLINEMILLIS_ISSET_ID = 0;
+    private byte __isset_bitfield = 0;
     public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
-      tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+      tmpMap.put(_Fields.PAYLOAD_PATH, new org.apache.thrift.meta_data.FieldMetaData("payloadPath", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
       tmpMap.put(_Fields.RULE_PATHS, new org.apache.thrift.meta_data.FieldMetaData("rulePaths", org.apache.thrift.TFieldRequirementType.DEFAULT, 
           new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.SCHEMA_VERSION, new org.apache.thrift.meta_data.FieldMetaData("schemaVersion", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.RESULT_PATH, new org.apache.thrift.meta_data.FieldMetaData("resultPath", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+      tmpMap.put(_Fields.DEADLINE_MILLIS, new org.apache.thrift.meta_data.FieldMetaData("deadlineMillis", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.I64)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(runReasoner_args.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reasonFile_args.class, metaDataMap);
     }
 
-    public runReasoner_args() {
+    public reasonFile_args() {
     }
 
-    public runReasoner_args(
-      java.nio.ByteBuffer rdfData,
-      java.lang.String rulePaths)
+    public reasonFile_args(
+      java.lang.String payloadPath,
+      java.lang.String rulePaths,
+      java.lang.String schemaVersion,
+      java.lang.String resultPath,
+      long deadlineMillis)
     {
       this();
-      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+      this.payloadPath = payloadPath;
       this.rulePaths = rulePaths;
+      this.schemaVersion = schemaVersion;
+      this.resultPath = resultPath;
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public runReasoner_args(runReasoner_args other) {
-      if (other.isSetRdfData()) {
-        this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+    public reasonFile_args(reasonFile_args other) {
+      __isset_bitfield = other.__isset_bitfield;
+      if (other.isSetPayloadPath()) {
+        this.payloadPath = other.payloadPath;
       }
       if (other.isSetRulePaths()) {
         this.rulePaths = other.rulePaths;
       }
+      if (other.isSetSchemaVersion()) {
+        this.schemaVersion = other.schemaVersion;
+      }
+      if (other.isSetResultPath()) {
+        this.resultPath = other.resultPath;
+      }
+      this.deadlineMillis = other.deadlineMillis;
     }
 
-    public runReasoner_args deepCopy() {
-      return new runReasoner_args(this);
+    public reasonFile_args deepCopy() {
+      return new reasonFile_args(this);
     }
 
     @Override
     public void clear() {
-      this.rdfData = null;
+      this.payloadPath = null;
       this.rulePaths = null;
+      this.schemaVersion = null;
+      this.resultPath = null;
+      setDeadlineMillisIsSet(false);
+      this.deadlineMillis = 0;
     }
 
-    public byte[] getRdfData() {
-      setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
-      return rdfData == null ? null : rdfData.array();
-    }
-
-    public java.nio.ByteBuffer bufferForRdfData() {
-      return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
-    }
-
-    public runReasoner_args setRdfData(byte[] rdfData) {
-      this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
-      return this;
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getPayloadPath() {
+      return this.payloadPath;
     }
 
-    public runReasoner_args setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
-      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    public reasonFile_args setPayloadPath(@org.apache.thrift.annotation.Nullable java.lang.String payloadPath) {
+      this.payloadPath = payloadPath;
       return this;
     }
 
-    public void unsetRdfData() {
-      this.rdfData = null;
+    public void unsetPayloadPath() {
+      this.payloadPath = null;
     }
 
-    /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
-    public boolean isSetRdfData() {
-      return this.rdfData != null;
+    /** Returns true if field payloadPath is set (has been assigned a value) and false otherwise */
+    public boolean isSetPayloadPath() {
+      return this.payloadPath != null;
     }
 
-    public void setRdfDataIsSet(boolean value) {
+    public void setPayloadPathIsSet(boolean value) {
       if (!value) {
-        this.rdfData = null;
+        this.payloadPath = null;
       }
     }
 
@@ -2167,7 +8531,7 @@ public class JenaReasoner {
       return this.rulePaths;
     }
 
-    public runReasoner_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
+    public reasonFile_args setRulePaths(@org.apache.thrift.annotation.Nullable java.lang.String rulePaths) {
       this.rulePaths = rulePaths;
       return this;
     }
@@ -2187,17 +8551,86 @@ public class JenaReasoner {
       }
     }
 
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getSchemaVersion() {
+      return this.schemaVersion;
+    }
+
+    public reasonFile_args setSchemaVersion(@org.apache.thrift.annotation.Nullable java.lang.String schemaVersion) {
+      this.schemaVersion = schemaVersion;
+      return this;
+    }
+
+    public void unsetSchemaVersion() {
+      this.schemaVersion = null;
+    }
+
+    /** Returns true if field schemaVersion is set (has been assigned a value) and false otherwise */
+    public boolean isSetSchemaVersion() {
+      return this.schemaVersion != null;
+    }
+
+    public void setSchemaVersionIsSet(boolean value) {
+      if (!value) {
+        this.schemaVersion = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public java.lang.String getResultPath() {
+      return this.resultPath;
+    }
+
+    public reasonFile_args setResultPath(@org.apache.thrift.annotation.Nullable java.lang.String resultPath) {
+      this.resultPath = resultPath;
+      return this;
+    }
+
+    public void unsetResultPath() {
+      this.resultPath = null;
+    }
+
+    /** Returns true if field resultPath is set (has been assigned a value) and false otherwise */
+    public boolean isSetResultPath() {
+      return this.resultPath != null;
+    }
+
+    public void setResultPathIsSet(boolean value) {
+      if (!value) {
+        this.resultPath = null;
+      }
+    }
+
+    public long getDeadlineMillis() {
+      return this.deadlineMillis;
+    }
+
+    public reasonFile_args setDeadlineMillis(long deadlineMillis) {
+      this.deadlineMillis = deadlineMillis;
+      setDeadlineMillisIsSet(true);
+      return this;
+    }
+
+    public void unsetDeadlineMillis() {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.clearBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    /** Returns true if field deadlineMillis is set (has been assigned a value) and false otherwise */
+    public boolean isSetDeadlineMillis() {
+      return org.apache.thrift.EncodingUtils.testBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID);
+    }
+
+    public void setDeadlineMillisIsSet(boolean value) {
+      __isset_bitfield = org.apache.thrift.EncodingUtils.setBit(__isset_bitfield, __DEADLINEMILLIS_ISSET_ID, value);
+    }
+
     public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
       switch (field) {
-      case RDF_DATA:
+      case PAYLOAD_PATH:
         if (value == null) {
-          unsetRdfData();
+          unsetPayloadPath();
         } else {
-          if (value instanceof byte[]) {
-            setRdfData((byte[])value);
-          } else {
-            setRdfData((java.nio.ByteBuffer)value);
-          }
+          setPayloadPath((java.lang.String)value);
         }
         break;
 
@@ -2209,18 +8642,51 @@ public class JenaReasoner {
         }
         break;
 
+      case SCHEMA_VERSION:
+        if (value == null) {
+          unsetSchemaVersion();
+        } else {
+          setSchemaVersion((java.lang.String)value);
+        }
+        break;
+
+      case RESULT_PATH:
+        if (value == null) {
+          unsetResultPath();
+        } else {
+          setResultPath((java.lang.String)value);
+        }
+        break;
+
+      case DEADLINE_MILLIS:
+        if (value == null) {
+          unsetDeadlineMillis();
+        } else {
+          setDeadlineMillis((java.lang.Long)value);
+        }
+        break;
+
       }
     }
 
     @org.apache.thrift.annotation.Nullable
     public java.lang.Object getFieldValue(_Fields field) {
       switch (field) {
-      case RDF_DATA:
-        return getRdfData();
+      case PAYLOAD_PATH:
+        return getPayloadPath();
 
       case RULE_PATHS:
         return getRulePaths();
 
+      case SCHEMA_VERSION:
+        return getSchemaVersion();
+
+      case RESULT_PATH:
+        return getResultPath();
+
+      case DEADLINE_MILLIS:
+        return getDeadlineMillis();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -2232,33 +8698,39 @@ public class JenaReasoner {
       }
 
       switch (field) {
-      case RDF_DATA:
-        return isSetRdfData();
+      case PAYLOAD_PATH:
+        return isSetPayloadPath();
       case RULE_PATHS:
         return isSetRulePaths();
+      case SCHEMA_VERSION:
+        return isSetSchemaVersion();
+      case RESULT_PATH:
+        return isSetResultPath();
+      case DEADLINE_MILLIS:
+        return isSetDeadlineMillis();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof runReasoner_args)
-        return this.equals((runReasoner_args)that);
+      if (that instanceof reasonFile_args)
+        return this.equals((reasonFile_args)that);
       return false;
     }
 
-    public boolean equals(runReasoner_args that) {
+    public boolean equals(reasonFile_args that) {
       if (that == null)
         return false;
       if (this == that)
         return true;
 
-      boolean this_present_rdfData = true && this.isSetRdfData();
-      boolean that_present_rdfData = true && that.isSetRdfData();
-      if (this_present_rdfData || that_present_rdfData) {
-        if (!(this_present_rdfData && that_present_rdfData))
+      boolean this_present_payloadPath = true && this.isSetPayloadPath();
+      boolean that_present_payloadPath = true && that.isSetPayloadPath();
+      if (this_present_payloadPath || that_present_payloadPath) {
+        if (!(this_present_payloadPath && that_present_payloadPath))
           return false;
-        if (!this.rdfData.equals(that.rdfData))
+        if (!this.payloadPath.equals(that.payloadPath))
           return false;
       }
 
@@ -2271,6 +8743,33 @@ public class JenaReasoner {
           return false;
       }
 
+      boolean this_present_schemaVersion = true && this.isSetSchemaVersion();
+      boolean that_present_schemaVersion = true && that.isSetSchemaVersion();
+      if (this_present_schemaVersion || that_present_schemaVersion) {
+        if (!(this_present_schemaVersion && that_present_schemaVersion))
+          return false;
+        if (!this.schemaVersion.equals(that.schemaVersion))
+          return false;
+      }
+
+      boolean this_present_resultPath = true && this.isSetResultPath();
+      boolean that_present_resultPath = true && that.isSetResultPath();
+      if (this_present_resultPath || that_present_resultPath) {
+        if (!(this_present_resultPath && that_present_resultPath))
+          return false;
+        if (!this.resultPath.equals(that.resultPath))
+          return false;
+      }
+
+      boolean this_present_deadlineMillis = true;
+      boolean that_present_deadlineMillis = true;
+      if (this_present_deadlineMillis || that_present_deadlineMillis) {
+        if (!(this_present_deadlineMillis && that_present_deadlineMillis))
+          return false;
+        if (this.deadlineMillis != that.deadlineMillis)
+          return false;
+      }
+
       return true;
     }
 
@@ -2278,31 +8777,41 @@ public class JenaReasoner {
     public int hashCode() {
       int hashCode = 1;
 
-      hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
-      if (isSetRdfData())
-        hashCode = hashCode * 8191 + rdfData.hashCode();
+      hashCode = hashCode * 8191 + ((isSetPayloadPath()) ? 131071 : 524287);
+      if (isSetPayloadPath())
+        hashCode = hashCode * 8191 + payloadPath.hashCode();
 
       hashCode = hashCode * 8191 + ((isSetRulePaths()) ? 131071 : 524287);
       if (isSetRulePaths())
         hashCode = hashCode * 8191 + rulePaths.hashCode();
 
+      hashCode = hashCode * 8191 + ((isSetSchemaVersion()) ? 131071 : 524287);
+      if (isSetSchemaVersion())
+        hashCode = hashCode * 8191 + schemaVersion.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetResultPath()) ? 131071 : 524287);
+      if (isSetResultPath())
+        hashCode = hashCode * 8191 + resultPath.hashCode();
+
+      hashCode = hashCode * 8191 + org.apache.thrift.TBaseHelper.hashCode(deadlineMillis);
+
       return hashCode;
     }
 
     @Override
-    public int compareTo(runReasoner_args other) {
+    public int compareTo(reasonFile_args other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
 
       int lastComparison = 0;
 
-      lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+      lastComparison = java.lang.Boolean.compare(isSetPayloadPath(), other.isSetPayloadPath());
       if (lastComparison != 0) {
         return lastComparison;
       }
-      if (isSetRdfData()) {
-        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+      if (isSetPayloadPath()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.payloadPath, other.payloadPath);
         if (lastComparison != 0) {
           return lastComparison;
         }
@@ -2317,6 +8826,36 @@ public class JenaReasoner {
           return lastComparison;
         }
       }
+      lastComparison = java.lang.Boolean.compare(isSetSchemaVersion(), other.isSetSchemaVersion());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetSchemaVersion()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.schemaVersion, other.schemaVersion);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetResultPath(), other.isSetResultPath());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetResultPath()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.resultPath, other.resultPath);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetDeadlineMillis(), other.isSetDeadlineMillis());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetDeadlineMillis()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.deadlineMillis, other.deadlineMillis);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -2335,14 +8874,14 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("runReasoner_args(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reasonFile_args(");
       boolean first = true;
 
-      sb.append("rdfData:");
-      if (this.rdfData == null) {
+      sb.append("payloadPath:");
+      if (this.payloadPath == null) {
         sb.append("null");
       } else {
-        org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+        sb.append(this.payloadPath);
       }
       first = false;
       if (!first) sb.append(", ");
@@ -2353,6 +8892,26 @@ public class JenaReasoner {
         sb.append(this.rulePaths);
       }
       first = false;
+      if (!first) sb.append(", ");
+      sb.append("schemaVersion:");
+      if (this.schemaVersion == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.schemaVersion);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("resultPath:");
+      if (this.resultPath == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.resultPath);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("deadlineMillis:");
+      sb.append(this.deadlineMillis);
+      first = false;
       sb.append(")");
       return sb.toString();
     }
@@ -2372,21 +8931,23 @@ public class JenaReasoner {
 
     private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
       try {
+        // it doesn't seem like you should have to do this, but java serialization is wacky, and doesn't call the default constructor.
+        __isset_bitfield = 0;
         read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
       } catch (org.apache.thrift.TException te) {
         throw new java.io.IOException(te);
       }
     }
 
-    private static class runReasoner_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public runReasoner_argsStandardScheme getScheme() {
-        return new runReasoner_argsStandardScheme();
+    private static class reasonFile_argsStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonFile_argsStandardScheme getScheme() {
+        return new reasonFile_argsStandardScheme();
       }
     }
 
-    private static class runReasoner_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<runReasoner_args> {
+    private static class reasonFile_argsStandardScheme extends org.apache.thrift.scheme.StandardScheme<reasonFile_args> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, runReasoner_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reasonFile_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -2396,10 +8957,10 @@ public class JenaReasoner {
             break;
           }
           switch (schemeField.id) {
-            case 1: // RDF_DATA
+            case 1: // PAYLOAD_PATH
               if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.rdfData = iprot.readBinary();
-                struct.setRdfDataIsSet(true);
+                struct.payloadPath = iprot.readString();
+                struct.setPayloadPathIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
@@ -2412,6 +8973,30 @@ public class JenaReasoner {
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
+            case 3: // SCHEMA_VERSION
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.schemaVersion = iprot.readString();
+                struct.setSchemaVersionIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 4: // RESULT_PATH
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+                struct.resultPath = iprot.readString();
+                struct.setResultPathIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 5: // DEADLINE_MILLIS
+              if (schemeField.type == org.apache.thrift.protocol.TType.I64) {
+                struct.deadlineMillis = iprot.readI64();
+                struct.setDeadlineMillisIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -2423,13 +9008,13 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, runReasoner_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reasonFile_args struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
-        if (struct.rdfData != null) {
-          oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
-          oprot.writeBinary(struct.rdfData);
+        if (struct.payloadPath != null) {
+          oprot.writeFieldBegin(PAYLOAD_PATH_FIELD_DESC);
+          oprot.writeString(struct.payloadPath);
           oprot.writeFieldEnd();
         }
         if (struct.rulePaths != null) {
@@ -2437,51 +9022,94 @@ public class JenaReasoner {
           oprot.writeString(struct.rulePaths);
           oprot.writeFieldEnd();
         }
+        if (struct.schemaVersion != null) {
+          oprot.writeFieldBegin(SCHEMA_VERSION_FIELD_DESC);
+          oprot.writeString(struct.schemaVersion);
+          oprot.writeFieldEnd();
+        }
+        if (struct.resultPath != null) {
+          oprot.writeFieldBegin(RESULT_PATH_FIELD_DESC);
+          oprot.writeString(struct.resultPath);
+          oprot.writeFieldEnd();
+        }
+        oprot.writeFieldBegin(DEADLINE_MILLIS_FIELD_DESC);
+        oprot.writeI64(struct.deadlineMillis);
+        oprot.writeFieldEnd();
         oprot.writeFieldStop();
         oprot.writeStructEnd();
       }
 
     }
 
-    private static class runReasoner_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public runReasoner_argsTupleScheme getScheme() {
-        return new runReasoner_argsTupleScheme();
+    private static class reasonFile_argsTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonFile_argsTupleScheme getScheme() {
+        return new reasonFile_argsTupleScheme();
       }
     }
 
-    private static class runReasoner_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<runReasoner_args> {
+    private static class reasonFile_argsTupleScheme extends org.apache.thrift.scheme.TupleScheme<reasonFile_args> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, runReasoner_args struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reasonFile_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
-        if (struct.isSetRdfData()) {
+        if (struct.isSetPayloadPath()) {
           optionals.set(0);
         }
         if (struct.isSetRulePaths()) {
           optionals.set(1);
         }
-        oprot.writeBitSet(optionals, 2);
-        if (struct.isSetRdfData()) {
-          oprot.writeBinary(struct.rdfData);
+        if (struct.isSetSchemaVersion()) {
+          optionals.set(2);
+        }
+        if (struct.isSetResultPath()) {
+          optionals.set(3);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          optionals.set(4);
+        }
+        oprot.writeBitSet(optionals, 5);
+        if (struct.isSetPayloadPath()) {
+          oprot.writeString(struct.payloadPath);
         }
         if (struct.isSetRulePaths()) {
           oprot.writeString(struct.rulePaths);
         }
+        if (struct.isSetSchemaVersion()) {
+          oprot.writeString(struct.schemaVersion);
+        }
+        if (struct.isSetResultPath()) {
+          oprot.writeString(struct.resultPath);
+        }
+        if (struct.isSetDeadlineMillis()) {
+          oprot.writeI64(struct.deadlineMillis);
+        }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, runReasoner_args struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reasonFile_args struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(2);
+        java.util.BitSet incoming = iprot.readBitSet(5);
         if (incoming.get(0)) {
-          struct.rdfData = iprot.readBinary();
-          struct.setRdfDataIsSet(true);
+          struct.payloadPath = iprot.readString();
+          struct.setPayloadPathIsSet(true);
         }
         if (incoming.get(1)) {
           struct.rulePaths = iprot.readString();
           struct.setRulePathsIsSet(true);
         }
+        if (incoming.get(2)) {
+          struct.schemaVersion = iprot.readString();
+          struct.setSchemaVersionIsSet(true);
+        }
+        if (incoming.get(3)) {
+          struct.resultPath = iprot.readString();
+          struct.setResultPathIsSet(true);
+        }
+        if (incoming.get(4)) {
+          struct.deadlineMillis = iprot.readI64();
+          struct.setDeadlineMillisIsSet(true);
+        }
       }
     }
 
@@ -2490,19 +9118,25 @@ public class JenaReasoner {
     }
   }
 
-  public static class runReasoner_result implements org.apache.thrift.TBase<runReasoner_result, runReasoner_result._Fields>, java.io.Serializable, Cloneable, Comparable<runReasoner_result>   {
-    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("runReasoner_result");
+  public static class reasonFile_result implements org.apache.thrift.TBase<reasonFile_result, reasonFile_result._Fields>, java.io.Serializable, Cloneable, Comparable<reasonFile_result>   {
+    private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("reasonFile_result");
 
-    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRING, (short)0);
+    private static final org.apache.thrift.protocol.TField SUCCESS_FIELD_DESC = new org.apache.thrift.protocol.TField("success", org.apache.thrift.protocol.TType.STRUCT, (short)0);
+    private static final org.apache.thrift.protocol.TField UNKNOWN_SCHEMA_FIELD_DESC = new org.apache.thrift.protocol.TField("unknownSchema", org.apache.thrift.protocol.TType.STRUCT, (short)1);
+    private static final org.apache.thrift.protocol.TField TIMEOUT_FIELD_DESC = new org.apache.thrift.protocol.TField("timeout", org.apache.thrift.protocol.TType.STRUCT, (short)2);
 
-    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new runReasoner_resultStandardSchemeFactory();
-    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new runReasoner_resultTupleSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new reasonFile_resultStandardSchemeFactory();
+    private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new reasonFile_resultTupleSchemeFactory();
 
-    public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer success; // required
+    public @org.apache.thrift.annotation.Nullable ReasoningResult success; // required
+    public @org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema; // required
+    public @org.apache.thrift.annotation.Nullable ReasoningTimeout timeout; // required
 
     /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
     public enum _Fields implements org.apache.thrift.TFieldIdEnum {
-      SUCCESS((short)0, "success");
+      SUCCESS((short)0, "success"),
+      UNKNOWN_SCHEMA((short)1, "unknownSchema"),
+      TIMEOUT((short)2, "timeout");
 
       private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
 
@@ -2520,6 +9154,10 @@ public class JenaReasoner {
         switch(fieldId) {
           case 0: // SUCCESS
             return SUCCESS;
+          case 1: // UNKNOWN_SCHEMA
+            return UNKNOWN_SCHEMA;
+          case 2: // TIMEOUT
+            return TIMEOUT;
           default:
             return null;
         }
@@ -2565,55 +9203,62 @@ public class JenaReasoner {
     static {
       java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
       tmpMap.put(_Fields.SUCCESS, new org.apache.thrift.meta_data.FieldMetaData("success", org.apache.thrift.TFieldRequirementType.DEFAULT, 
-          new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningResult.class)));
+      tmpMap.put(_Fields.UNKNOWN_SCHEMA, new org.apache.thrift.meta_data.FieldMetaData("unknownSchema", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, UnknownSchema.class)));
+      tmpMap.put(_Fields.TIMEOUT, new org.apache.thrift.meta_data.FieldMetaData("timeout", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+          new org.apache.thrift.meta_data.StructMetaData(org.apache.thrift.protocol.TType.STRUCT, ReasoningTimeout.class)));
       metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
-      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(runReasoner_result.class, metaDataMap);
+      org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(reasonFile_result.class, metaDataMap);
     }
 
-    public runReasoner_result() {
+    public reasonFile_result() {
     }
 
-    public runReasoner_result(
-      java.nio.ByteBuffer success)
+    public reasonFile_result(
+      ReasoningResult success,
+      UnknownSchema unknownSchema,
+      ReasoningTimeout timeout)
     {
       this();
-      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+      this.success = success;
+      this.unknownSchema = unknownSchema;
+      this.timeout = timeout;
     }
 
     /**
      * Performs a deep copy on <i>other</i>.
      */
-    public runReasoner_result(runReasoner_result other) {
+    public reasonFile_result(reasonFile_result other) {
       if (other.isSetSuccess()) {
-        this.success = org.apache.thrift.TBaseHelper.copyBinary(other.success);
+        this.success = new ReasoningResult(other.success);
+      }
+      if (other.isSetUnknownSchema()) {
+        this.unknownSchema = new UnknownSchema(other.unknownSchema);
+      }
+      if (other.isSetTimeout()) {
+        this.timeout = new ReasoningTimeout(other.timeout);
       }
     }
 
-    public runReasoner_result deepCopy() {
-      return new runReasoner_result(this);
+    public reasonFile_result deepCopy() {
+      return new reasonFile_result(this);
     }
 
     @Override
     public void clear() {
       this.success = null;
+      this.unknownSchema = null;
+      this.timeout = null;
     }
 
-    public byte[] getSuccess() {
-      setSuccess(org.apache.thrift.TBaseHelper.rightSize(success));
-      return success == null ? null : success.array();
-    }
-
-    public java.nio.ByteBuffer bufferForSuccess() {
-      return org.apache.thrift.TBaseHelper.copyBinary(success);
-    }
-
-    public runReasoner_result setSuccess(byte[] success) {
-      this.success = success == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(success.clone());
-      return this;
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningResult getSuccess() {
+      return this.success;
     }
 
-    public runReasoner_result setSuccess(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer success) {
-      this.success = org.apache.thrift.TBaseHelper.copyBinary(success);
+    public reasonFile_result setSuccess(@org.apache.thrift.annotation.Nullable ReasoningResult success) {
+      this.success = success;
       return this;
     }
 
@@ -2632,17 +9277,79 @@ public class JenaReasoner {
       }
     }
 
+    @org.apache.thrift.annotation.Nullable
+    public UnknownSchema getUnknownSchema() {
+      return this.unknownSchema;
+    }
+
+    public reasonFile_result setUnknownSchema(@org.apache.thrift.annotation.Nullable UnknownSchema unknownSchema) {
+      this.unknownSchema = unknownSchema;
+      return this;
+    }
+
+    public void unsetUnknownSchema() {
+      this.unknownSchema = null;
+    }
+
+    /** Returns true if field unknownSchema is set (has been assigned a value) and false otherwise */
+    public boolean isSetUnknownSchema() {
+      return this.unknownSchema != null;
+    }
+
+    public void setUnknownSchemaIsSet(boolean value) {
+      if (!value) {
+        this.unknownSchema = null;
+      }
+    }
+
+    @org.apache.thrift.annotation.Nullable
+    public ReasoningTimeout getTimeout() {
+      return this.timeout;
+    }
+
+    public reasonFile_result setTimeout(@org.apache.thrift.annotation.Nullable ReasoningTimeout timeout) {
+      this.timeout = timeout;
+      return this;
+    }
+
+    public void unsetTimeout() {
+      this.timeout = null;
+    }
+
+    /** Returns true if field timeout is set (has been assigned a value) and false otherwise */
+    public boolean isSetTimeout() {
+      return this.timeout != null;
+    }
+
+    public void setTimeoutIsSet(boolean value) {
+      if (!value) {
+        this.timeout = null;
+      }
+    }
+
     public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
       switch (field) {
       case SUCCESS:
         if (value == null) {
           unsetSuccess();
         } else {
-          if (value instanceof byte[]) {
-            setSuccess((byte[])value);
-          } else {
-            setSuccess((java.nio.ByteBuffer)value);
-          }
+          setSuccess((ReasoningResult)value);
+        }
+        break;
+
+      case UNKNOWN_SCHEMA:
+        if (value == null) {
+          unsetUnknownSchema();
+        } else {
+          setUnknownSchema((UnknownSchema)value);
+        }
+        break;
+
+      case TIMEOUT:
+        if (value == null) {
+          unsetTimeout();
+        } else {
+          setTimeout((ReasoningTimeout)value);
         }
         break;
 
@@ -2655,6 +9362,12 @@ public class JenaReasoner {
       case SUCCESS:
         return getSuccess();
 
+      case UNKNOWN_SCHEMA:
+        return getUnknownSchema();
+
+      case TIMEOUT:
+        return getTimeout();
+
       }
       throw new java.lang.IllegalStateException();
     }
@@ -2668,18 +9381,22 @@ public class JenaReasoner {
       switch (field) {
       case SUCCESS:
         return isSetSuccess();
+      case UNKNOWN_SCHEMA:
+        return isSetUnknownSchema();
+      case TIMEOUT:
+        return isSetTimeout();
       }
       throw new java.lang.IllegalStateException();
     }
 
     @Override
     public boolean equals(java.lang.Object that) {
-      if (that instanceof runReasoner_result)
-        return this.equals((runReasoner_result)that);
+      if (that instanceof reasonFile_result)
+        return this.equals((reasonFile_result)that);
       return false;
     }
 
-    public boolean equals(runReasoner_result that) {
+    public boolean equals(reasonFile_result that) {
       if (that == null)
         return false;
       if (this == that)
@@ -2694,6 +9411,24 @@ public class JenaReasoner {
           return false;
       }
 
+      boolean this_present_unknownSchema = true && this.isSetUnknownSchema();
+      boolean that_present_unknownSchema = true && that.isSetUnknownSchema();
+      if (this_present_unknownSchema || that_present_unknownSchema) {
+        if (!(this_present_unknownSchema && that_present_unknownSchema))
+          return false;
+        if (!this.unknownSchema.equals(that.unknownSchema))
+          return false;
+      }
+
+      boolean this_present_timeout = true && this.isSetTimeout();
+      boolean that_present_timeout = true && that.isSetTimeout();
+      if (this_present_timeout || that_present_timeout) {
+        if (!(this_present_timeout && that_present_timeout))
+          return false;
+        if (!this.timeout.equals(that.timeout))
+          return false;
+      }
+
       return true;
     }
 
@@ -2705,11 +9440,19 @@ public class JenaReasoner {
       if (isSetSuccess())
         hashCode = hashCode * 8191 + success.hashCode();
 
+      hashCode = hashCode * 8191 + ((isSetUnknownSchema()) ? 131071 : 524287);
+      if (isSetUnknownSchema())
+        hashCode = hashCode * 8191 + unknownSchema.hashCode();
+
+      hashCode = hashCode * 8191 + ((isSetTimeout()) ? 131071 : 524287);
+      if (isSetTimeout())
+        hashCode = hashCode * 8191 + timeout.hashCode();
+
       return hashCode;
     }
 
     @Override
-    public int compareTo(runReasoner_result other) {
+    public int compareTo(reasonFile_result other) {
       if (!getClass().equals(other.getClass())) {
         return getClass().getName().compareTo(other.getClass().getName());
       }
@@ -2726,6 +9469,26 @@ public class JenaReasoner {
           return lastComparison;
         }
       }
+      lastComparison = java.lang.Boolean.compare(isSetUnknownSchema(), other.isSetUnknownSchema());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetUnknownSchema()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.unknownSchema, other.unknownSchema);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
+      lastComparison = java.lang.Boolean.compare(isSetTimeout(), other.isSetTimeout());
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+      if (isSetTimeout()) {
+        lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.timeout, other.timeout);
+        if (lastComparison != 0) {
+          return lastComparison;
+        }
+      }
       return 0;
     }
 
@@ -2744,14 +9507,30 @@ public class JenaReasoner {
 
     @Override
     public java.lang.String toString() {
-      java.lang.StringBuilder sb = new java.lang.StringBuilder("runReasoner_result(");
+      java.lang.StringBuilder sb = new java.lang.StringBuilder("reasonFile_result(");
       boolean first = true;
 
       sb.append("success:");
       if (this.success == null) {
         sb.append("null");
       } else {
-        org.apache.thrift.TBaseHelper.toString(this.success, sb);
+        sb.append(this.success);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("unknownSchema:");
+      if (this.unknownSchema == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.unknownSchema);
+      }
+      first = false;
+      if (!first) sb.append(", ");
+      sb.append("timeout:");
+      if (this.timeout == null) {
+        sb.append("null");
+      } else {
+        sb.append(this.timeout);
       }
       first = false;
       sb.append(")");
@@ -2761,6 +9540,9 @@ public class JenaReasoner {
     public void validate() throws org.apache.thrift.TException {
       // check for required fields
       // check for sub-struct validity
+      if (success != null) {
+        success.validate();
+      }
     }
 
     private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
@@ -2779,15 +9561,15 @@ public class JenaReasoner {
       }
     }
 
-    private static class runReasoner_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public runReasoner_resultStandardScheme getScheme() {
-        return new runReasoner_resultStandardScheme();
+    private static class reasonFile_resultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonFile_resultStandardScheme getScheme() {
+        return new reasonFile_resultStandardScheme();
       }
     }
 
-    private static class runReasoner_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<runReasoner_result> {
+    private static class reasonFile_resultStandardScheme extends org.apache.thrift.scheme.StandardScheme<reasonFile_result> {
 
-      public void read(org.apache.thrift.protocol.TProtocol iprot, runReasoner_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol iprot, reasonFile_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TField schemeField;
         iprot.readStructBegin();
         while (true)
@@ -2798,13 +9580,32 @@ public class JenaReasoner {
           }
           switch (schemeField.id) {
             case 0: // SUCCESS
-              if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
-                struct.success = iprot.readBinary();
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.success = new ReasoningResult();
+                struct.success.read(iprot);
                 struct.setSuccessIsSet(true);
               } else { 
                 org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
               }
               break;
+            case 1: // UNKNOWN_SCHEMA
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.unknownSchema = new UnknownSchema();
+                struct.unknownSchema.read(iprot);
+                struct.setUnknownSchemaIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
+            case 2: // TIMEOUT
+              if (schemeField.type == org.apache.thrift.protocol.TType.STRUCT) {
+                struct.timeout = new ReasoningTimeout();
+                struct.timeout.read(iprot);
+                struct.setTimeoutIsSet(true);
+              } else { 
+                org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+              }
+              break;
             default:
               org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
           }
@@ -2816,13 +9617,23 @@ public class JenaReasoner {
         struct.validate();
       }
 
-      public void write(org.apache.thrift.protocol.TProtocol oprot, runReasoner_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol oprot, reasonFile_result struct) throws org.apache.thrift.TException {
         struct.validate();
 
         oprot.writeStructBegin(STRUCT_DESC);
         if (struct.success != null) {
           oprot.writeFieldBegin(SUCCESS_FIELD_DESC);
-          oprot.writeBinary(struct.success);
+          struct.success.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.unknownSchema != null) {
+          oprot.writeFieldBegin(UNKNOWN_SCHEMA_FIELD_DESC);
+          struct.unknownSchema.write(oprot);
+          oprot.writeFieldEnd();
+        }
+        if (struct.timeout != null) {
+          oprot.writeFieldBegin(TIMEOUT_FIELD_DESC);
+          struct.timeout.write(oprot);
           oprot.writeFieldEnd();
         }
         oprot.writeFieldStop();
@@ -2831,35 +9642,58 @@ public class JenaReasoner {
 
     }
 
-    private static class runReasoner_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
-      public runReasoner_resultTupleScheme getScheme() {
-        return new runReasoner_resultTupleScheme();
+    private static class reasonFile_resultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+      public reasonFile_resultTupleScheme getScheme() {
+        return new reasonFile_resultTupleScheme();
       }
     }
 
-    private static class runReasoner_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<runReasoner_result> {
+    private static class reasonFile_resultTupleScheme extends org.apache.thrift.scheme.TupleScheme<reasonFile_result> {
 
       @Override
-      public void write(org.apache.thrift.protocol.TProtocol prot, runReasoner_result struct) throws org.apache.thrift.TException {
+      public void write(org.apache.thrift.protocol.TProtocol prot, reasonFile_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
         java.util.BitSet optionals = new java.util.BitSet();
         if (struct.isSetSuccess()) {
           optionals.set(0);
         }
-        oprot.writeBitSet(optionals, 1);
+        if (struct.isSetUnknownSchema()) {
+          optionals.set(1);
+        }
+        if (struct.isSetTimeout()) {
+          optionals.set(2);
+        }
+        oprot.writeBitSet(optionals, 3);
         if (struct.isSetSuccess()) {
-          oprot.writeBinary(struct.success);
+          struct.success.write(oprot);
+        }
+        if (struct.isSetUnknownSchema()) {
+          struct.unknownSchema.write(oprot);
+        }
+        if (struct.isSetTimeout()) {
+          struct.timeout.write(oprot);
         }
       }
 
       @Override
-      public void read(org.apache.thrift.protocol.TProtocol prot, runReasoner_result struct) throws org.apache.thrift.TException {
+      public void read(org.apache.thrift.protocol.TProtocol prot, reasonFile_result struct) throws org.apache.thrift.TException {
         org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
-        java.util.BitSet incoming = iprot.readBitSet(1);
+        java.util.BitSet incoming = iprot.readBitSet(3);
         if (incoming.get(0)) {
-          struct.success = iprot.readBinary();
+          struct.success = new ReasoningResult();
+          struct.success.read(iprot);
           struct.setSuccessIsSet(true);
         }
+        if (incoming.get(1)) {
+          struct.unknownSchema = new UnknownSchema();
+          struct.unknownSchema.read(iprot);
+          struct.setUnknownSchemaIsSet(true);
+        }
+        if (incoming.get(2)) {
+          struct.timeout = new ReasoningTimeout();
+          struct.timeout.read(iprot);
+          struct.setTimeoutIsSet(true);
+        }
       }
     }
 
@@ -0,0 +1,572 @@
+/**
+ * Autogenerated by Thrift Compiler (0.14.2)
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ *  @generated
+ *
+ * (Written by hand after jenaService.thrift while the compiler was not at hand:
+ *  build.sh regenerates this file with Thrift Compiler 0.14.2.)
+ */
+package ru.vstu.thrift_gen_server;
+
+/**
+ * Result of reasoning: the complemented RDF graph with timings of server-side stages.
+ */
+@SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.14.2)", date = "2022-04-08")
+public class ReasoningResult implements org.apache.thrift.TBase<ReasoningResult, ReasoningResult._Fields>, java.io.Serializable, Cloneable, Comparable<ReasoningResult> {
+  private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("ReasoningResult");
+
+  private static final org.apache.thrift.protocol.TField RDF_DATA_FIELD_DESC = new org.apache.thrift.protocol.TField("rdfData", org.apache.thrift.protocol.TType.STRING, (short)1);
+  private static final org.apache.thrift.protocol.TField TIMINGS_FIELD_DESC = new org.apache.thrift.protocol.TField("timings", org.apache.thrift.protocol.TType.MAP, (short)2);
+
+  private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new ReasoningResultStandardSchemeFactory();
+  private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new ReasoningResultTupleSchemeFactory();
+
+  /**
+   * The complemented RDF graph (N-Triples).
+   */
+  public @org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData; // required
+  /**
+   * Server-side duration of each processing stage, in seconds.
+   */
+  public @org.apache.thrift.annotation.Nullable java.util.Map<java.lang.String,java.lang.Double> timings; // required
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+    /**
+     * The complemented RDF graph (N-Triples).
+     */
+    RDF_DATA((short)1, "rdfData"),
+    /**
+     * Server-side duration of each processing stage, in seconds.
+     */
+    TIMINGS((short)2, "timings");
+
+    private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+    static {
+      for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    @org.apache.thrift.annotation.Nullable
+    public static _Fields findByThriftId(int fieldId) {
+      switch(fieldId) {
+        case 1: // RDF_DATA
+          return RDF_DATA;
+        case 2: // TIMINGS
+          return TIMINGS;
+        default:
+          return null;
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    @org.apache.thrift.annotation.Nullable
+    public static _Fields findByName(java.lang.String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final java.lang.String _fieldName;
+
+    _Fields(short thriftId, java.lang.String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public java.lang.String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+  static {
+    java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+    tmpMap.put(_Fields.RDF_DATA, new org.apache.thrift.meta_data.FieldMetaData("rdfData", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING          , true)));
+    tmpMap.put(_Fields.TIMINGS, new org.apache.thrift.meta_data.FieldMetaData("timings", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+        new org.apache.thrift.meta_data.MapMetaData(org.apache.thrift.protocol.TType.MAP, 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING), 
+              new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.DOUBLE))));
+    metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+    org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(ReasoningResult.class, metaDataMap);
+  }
+
+  public ReasoningResult() {
+  }
+
+  public ReasoningResult(
+    java.nio.ByteBuffer rdfData,
+    java.util.Map<java.lang.String,java.lang.Double> timings)
+  {
+    this();
+    this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    this.timings = timings;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public ReasoningResult(ReasoningResult other) {
+    if (other.isSetRdfData()) {
+      this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(other.rdfData);
+    }
+    if (other.isSetTimings()) {
+      java.util.Map<java.lang.String,java.lang.Double> __this__timings = new java.util.HashMap<java.lang.String,java.lang.Double>(other.timings);
+      this.timings = __this__timings;
+    }
+  }
+
+  public ReasoningResult deepCopy() {
+    return new ReasoningResult(this);
+  }
+
+  @Override
+  public void clear() {
+    this.rdfData = null;
+    this.timings = null;
+  }
+
+  public byte[] getRdfData() {
+    setRdfData(org.apache.thrift.TBaseHelper.rightSize(rdfData));
+    return rdfData == null ? null : rdfData.array();
+  }
+
+  public java.nio.ByteBuffer bufferForRdfData() {
+    return org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+  }
+
+  /**
+   * The complemented RDF graph (N-Triples).
+   */
+  public ReasoningResult setRdfData(byte[] rdfData) {
+    this.rdfData = rdfData == null ? (java.nio.ByteBuffer)null     : java.nio.ByteBuffer.wrap(rdfData.clone());
+    return this;
+  }
+
+  public ReasoningResult setRdfData(@org.apache.thrift.annotation.Nullable java.nio.ByteBuffer rdfData) {
+    this.rdfData = org.apache.thrift.TBaseHelper.copyBinary(rdfData);
+    return this;
+  }
+
+  public void unsetRdfData() {
+    this.rdfData = null;
+  }
+
+  /** Returns true if field rdfData is set (has been assigned a value) and false otherwise */
+  public boolean isSetRdfData() {
+    return this.rdfData != null;
+  }
+
+  public void setRdfDataIsSet(boolean value) {
+    if (!value) {
+      this.rdfData = null;
+    }
+  }
+
+  public int getTimingsSize() {
+    return (this.timings == null) ? 0 : this.timings.size();
+  }
+
+  public void putToTimings(java.lang.String key, double val) {
+    if (this.timings == null) {
+      this.timings = new java.util.HashMap<java.lang.String,java.lang.Double>();
+    }
+    this.timings.put(key, val);
+  }
+
+  /**
+   * Server-side duration of each processing stage, in seconds.
+   */
+  @org.apache.thrift.annotation.Nullable
+  public java.util.Map<java.lang.String,java.lang.Double> getTimings() {
+    return this.timings;
+  }
+
+  /**
+   * Server-side duration of each processing stage, in seconds.
+   */
+  public ReasoningResult setTimings(@org.apache.thrift.annotation.Nullable java.util.Map<java.lang.String,java.lang.Double> timings) {
+    this.timings = timings;
+    return this;
+  }
+
+  public void unsetTimings() {
+    this.timings = null;
+  }
+
+  /** Returns true if field timings is set (has been assigned a value) and false otherwise */
+  public boolean isSetTimings() {
+    return this.timings != null;
+  }
+
+  public void setTimingsIsSet(boolean value) {
+    if (!value) {
+      this.timings = null;
+    }
+  }
+
+  public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+    switch (field) {
+    case RDF_DATA:
+      if (value == null) {
+        unsetRdfData();
+      } else {
+        if (value instanceof byte[]) {
+          setRdfData((byte[])value);
+        } else {
+          setRdfData((java.nio.ByteBuffer)value);
+        }
+      }
+      break;
+
+    case TIMINGS:
+      if (value == null) {
+        unsetTimings();
+      } else {
+        setTimings((java.util.Map<java.lang.String,java.lang.Double>)value);
+      }
+      break;
+
+    }
+  }
+
+  @org.apache.thrift.annotation.Nullable
+  public java.lang.Object getFieldValue(_Fields field) {
+    switch (field) {
+    case RDF_DATA:
+      return getRdfData();
+
+    case TIMINGS:
+      return getTimings();
+
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    if (field == null) {
+      throw new java.lang.IllegalArgumentException();
+    }
+
+    switch (field) {
+    case RDF_DATA:
+      return isSetRdfData();
+    case TIMINGS:
+      return isSetTimings();
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  @Override
+  public boolean equals(java.lang.Object that) {
+    if (that instanceof ReasoningResult)
+      return this.equals((ReasoningResult)that);
+    return false;
+  }
+
+  public boolean equals(ReasoningResult that) {
+    if (that == null)
+      return false;
+    if (this == that)
+      return true;
+
+    boolean this_present_rdfData = true && this.isSetRdfData();
+    boolean that_present_rdfData = true && that.isSetRdfData();
+    if (this_present_rdfData || that_present_rdfData) {
+      if (!(this_present_rdfData && that_present_rdfData))
+        return false;
+      if (!this.rdfData.equals(that.rdfData))
+        return false;
+    }
+
+    boolean this_present_timings = true && this.isSetTimings();
+    boolean that_present_timings = true && that.isSetTimings();
+    if (this_present_timings || that_present_timings) {
+      if (!(this_present_timings && that_present_timings))
+        return false;
+      if (!this.timings.equals(that.timings))
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    int hashCode = 1;
+
+    hashCode = hashCode * 8191 + ((isSetRdfData()) ? 131071 : 524287);
+    if (isSetRdfData())
+      hashCode = hashCode * 8191 + rdfData.hashCode();
+
+    hashCode = hashCode * 8191 + ((isSetTimings()) ? 131071 : 524287);
+    if (isSetTimings())
+      hashCode = hashCode * 8191 + timings.hashCode();
+
+    return hashCode;
+  }
+
+  @Override
+  public int compareTo(ReasoningResult other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+
+    lastComparison = java.lang.Boolean.compare(isSetRdfData(), other.isSetRdfData());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetRdfData()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.rdfData, other.rdfData);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    lastComparison = java.lang.Boolean.compare(isSetTimings(), other.isSetTimings());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetTimings()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.timings, other.timings);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    return 0;
+  }
+
+  @org.apache.thrift.annotation.Nullable
+  public _Fields fieldForId(int fieldId) {
+    return _Fields.findByThriftId(fieldId);
+  }
+
+  public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+    scheme(iprot).read(iprot, this);
+  }
+
+  public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+    scheme(oprot).write(oprot, this);
+  }
+
+  @Override
+  public java.lang.String toString() {
+    java.lang.StringBuilder sb = new java.lang.StringBuilder("ReasoningResult(");
+    boolean first = true;
+
+    sb.append("rdfData:");
+    if (this.rdfData == null) {
+      sb.append("null");
+    } else {
+      org.apache.thrift.TBaseHelper.toString(this.rdfData, sb);
+    }
+    first = false;
+    if (!first) sb.append(", ");
+    sb.append("timings:");
+    if (this.timings == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.timings);
+    }
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws org.apache.thrift.TException {
+    // check for required fields
+    // check for sub-struct validity
+  }
+
+  private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+    try {
+      write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+    try {
+      read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private static class ReasoningResultStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public ReasoningResultStandardScheme getScheme() {
+      return new ReasoningResultStandardScheme();
+    }
+  }
+
+  private static class ReasoningResultStandardScheme extends org.apache.thrift.scheme.StandardScheme<ReasoningResult> {
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot, ReasoningResult struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TField schemeField;
+      iprot.readStructBegin();
+      while (true)
+      {
+        schemeField = iprot.readFieldBegin();
+        if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+          break;
+        }
+        switch (schemeField.id) {
+          case 1: // RDF_DATA
+            if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+              struct.rdfData = iprot.readBinary();
+              struct.setRdfDataIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          case 2: // TIMINGS
+            if (schemeField.type == org.apache.thrift.protocol.TType.MAP) {
+              {
+                org.apache.thrift.protocol.TMap _map0 = iprot.readMapBegin();
+                struct.timings = new java.util.HashMap<java.lang.String,java.lang.Double>(2*_map0.size);
+                @org.apache.thrift.annotation.Nullable java.lang.String _key1;
+                double _val2;
+                for (int _i3 = 0; _i3 < _map0.size; ++_i3)
+                {
+                  _key1 = iprot.readString();
+                  _val2 = iprot.readDouble();
+                  struct.timings.put(_key1, _val2);
+                }
+                iprot.readMapEnd();
+              }
+              struct.setTimingsIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          default:
+            org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      struct.validate();
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot, ReasoningResult struct) throws org.apache.thrift.TException {
+      struct.validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (struct.rdfData != null) {
+        oprot.writeFieldBegin(RDF_DATA_FIELD_DESC);
+        oprot.writeBinary(struct.rdfData);
+        oprot.writeFieldEnd();
+      }
+      if (struct.timings != null) {
+        oprot.writeFieldBegin(TIMINGS_FIELD_DESC);
+        {
+          oprot.writeMapBegin(new org.apache.thrift.protocol.TMap(org.apache.thrift.protocol.TType.STRING, org.apache.thrift.protocol.TType.DOUBLE, struct.timings.size()));
+          for (java.util.Map.Entry<java.lang.String, java.lang.Double> _iter4 : struct.timings.entrySet())
+          {
+            oprot.writeString(_iter4.getKey());
+            oprot.writeDouble(_iter4.getValue());
+          }
+          oprot.writeMapEnd();
+        }
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+  }
+
+  private static class ReasoningResultTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public ReasoningResultTupleScheme getScheme() {
+      return new ReasoningResultTupleScheme();
+    }
+  }
+
+  private static class ReasoningResultTupleScheme extends org.apache.thrift.scheme.TupleScheme<ReasoningResult> {
+
+    @Override
+    public void write(org.apache.thrift.protocol.TProtocol prot, ReasoningResult struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      java.util.BitSet optionals = new java.util.BitSet();
+      if (struct.isSetRdfData()) {
+        optionals.set(0);
+      }
+      if (struct.isSetTimings()) {
+        optionals.set(1);
+      }
+      oprot.writeBitSet(optionals, 2);
+      if (struct.isSetRdfData()) {
+        oprot.writeBinary(struct.rdfData);
+      }
+      if (struct.isSetTimings()) {
+        {
+          oprot.writeI32(struct.timings.size());
+          for (java.util.Map.Entry<java.lang.String, java.lang.Double> _iter5 : struct.timings.entrySet())
+          {
+            oprot.writeString(_iter5.getKey());
+            oprot.writeDouble(_iter5.getValue());
+          }
+        }
+      }
+    }
+
+    @Override
+    public void read(org.apache.thrift.protocol.TProtocol prot, ReasoningResult struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      java.util.BitSet incoming = iprot.readBitSet(2);
+      if (incoming.get(0)) {
+        struct.rdfData = iprot.readBinary();
+        struct.setRdfDataIsSet(true);
+      }
+      if (incoming.get(1)) {
+        {
+          org.apache.thrift.protocol.TMap _map6 = iprot.readMapBegin(org.apache.thrift.protocol.TType.STRING, org.apache.thrift.protocol.TType.DOUBLE); 
+          struct.timings = new java.util.HashMap<java.lang.String,java.lang.Double>(2*_map6.size);
+          @org.apache.thrift.annotation.Nullable java.lang.String _key7;
+          double _val8;
+          for (int _i9 = 0; _i9 < _map6.size; ++_i9)
+          {
+            _key7 = iprot.readString();
+            _val8 = iprot.readDouble();
+            struct.timings.put(_key7, _val8);
+          }
+        }
+        struct.setTimingsIsSet(true);
+      }
+    }
+  }
+
+  private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+    return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+  }
+}
+
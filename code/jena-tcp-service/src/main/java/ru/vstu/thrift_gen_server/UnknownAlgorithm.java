@@ -0,0 +1,381 @@
+/**
+ * Autogenerated by Thrift Compiler (0.14.2)
+ *
+ * DO NOT EDIT UNLESS YOU ARE SURE THAT YOU KNOW WHAT YOU ARE DOING
+ *  @generated
+ *
+ * (Written by hand after jenaService.thrift while the compiler was not at hand:
+ *  build.sh regenerates this file with Thrift Compiler 0.14.2.)
+ */
+package ru.vstu.thrift_gen_server;
+
+/**
+ * The algorithm handle is not known to the server (never registered, evicted or the server restarted): register the algorithm again.
+ */
+@SuppressWarnings({"cast", "rawtypes", "serial", "unchecked", "unused"})
+@javax.annotation.Generated(value = "Autogenerated by Thrift Compiler (0.14.2)", date = "2022-04-08")
+public class UnknownAlgorithm extends org.apache.thrift.TException implements org.apache.thrift.TBase<UnknownAlgorithm, UnknownAlgorithm._Fields>, java.io.Serializable, Cloneable, Comparable<UnknownAlgorithm> {
+  private static final org.apache.thrift.protocol.TStruct STRUCT_DESC = new org.apache.thrift.protocol.TStruct("UnknownAlgorithm");
+
+  private static final org.apache.thrift.protocol.TField HANDLE_FIELD_DESC = new org.apache.thrift.protocol.TField("handle", org.apache.thrift.protocol.TType.STRING, (short)1);
+
+  private static final org.apache.thrift.scheme.SchemeFactory STANDARD_SCHEME_FACTORY = new UnknownAlgorithmStandardSchemeFactory();
+  private static final org.apache.thrift.scheme.SchemeFactory TUPLE_SCHEME_FACTORY = new UnknownAlgorithmTupleSchemeFactory();
+
+  public @org.apache.thrift.annotation.Nullable java.lang.String handle; // required
+
+  /** The set of fields this struct contains, along with convenience methods for finding and manipulating them. */
+  public enum _Fields implements org.apache.thrift.TFieldIdEnum {
+    HANDLE((short)1, "handle");
+
+    private static final java.util.Map<java.lang.String, _Fields> byName = new java.util.HashMap<java.lang.String, _Fields>();
+
+    static {
+      for (_Fields field : java.util.EnumSet.allOf(_Fields.class)) {
+        byName.put(field.getFieldName(), field);
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, or null if its not found.
+     */
+    @org.apache.thrift.annotation.Nullable
+    public static _Fields findByThriftId(int fieldId) {
+      switch(fieldId) {
+        case 1: // HANDLE
+          return HANDLE;
+        default:
+          return null;
+      }
+    }
+
+    /**
+     * Find the _Fields constant that matches fieldId, throwing an exception
+     * if it is not found.
+     */
+    public static _Fields findByThriftIdOrThrow(int fieldId) {
+      _Fields fields = findByThriftId(fieldId);
+      if (fields == null) throw new java.lang.IllegalArgumentException("Field " + fieldId + " doesn't exist!");
+      return fields;
+    }
+
+    /**
+     * Find the _Fields constant that matches name, or null if its not found.
+     */
+    @org.apache.thrift.annotation.Nullable
+    public static _Fields findByName(java.lang.String name) {
+      return byName.get(name);
+    }
+
+    private final short _thriftId;
+    private final java.lang.String _fieldName;
+
+    _Fields(short thriftId, java.lang.String fieldName) {
+      _thriftId = thriftId;
+      _fieldName = fieldName;
+    }
+
+    public short getThriftFieldId() {
+      return _thriftId;
+    }
+
+    public java.lang.String getFieldName() {
+      return _fieldName;
+    }
+  }
+
+  // isset id assignments
+  public static final java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> metaDataMap;
+  static {
+    java.util.Map<_Fields, org.apache.thrift.meta_data.FieldMetaData> tmpMap = new java.util.EnumMap<_Fields, org.apache.thrift.meta_data.FieldMetaData>(_Fields.class);
+    tmpMap.put(_Fields.HANDLE, new org.apache.thrift.meta_data.FieldMetaData("handle", org.apache.thrift.TFieldRequirementType.DEFAULT, 
+        new org.apache.thrift.meta_data.FieldValueMetaData(org.apache.thrift.protocol.TType.STRING)));
+    metaDataMap = java.util.Collections.unmodifiableMap(tmpMap);
+    org.apache.thrift.meta_data.FieldMetaData.addStructMetaDataMap(UnknownAlgorithm.class, metaDataMap);
+  }
+
+  public UnknownAlgorithm() {
+  }
+
+  public UnknownAlgorithm(
+    java.lang.String handle)
+  {
+    this();
+    this.handle = handle;
+  }
+
+  /**
+   * Performs a deep copy on <i>other</i>.
+   */
+  public UnknownAlgorithm(UnknownAlgorithm other) {
+    if (other.isSetHandle()) {
+      this.handle = other.handle;
+    }
+  }
+
+  public UnknownAlgorithm deepCopy() {
+    return new UnknownAlgorithm(this);
+  }
+
+  @Override
+  public void clear() {
+    this.handle = null;
+  }
+
+  @org.apache.thrift.annotation.Nullable
+  public java.lang.String getHandle() {
+    return this.handle;
+  }
+
+  public UnknownAlgorithm setHandle(@org.apache.thrift.annotation.Nullable java.lang.String handle) {
+    this.handle = handle;
+    return this;
+  }
+
+  public void unsetHandle() {
+    this.handle = null;
+  }
+
+  /** Returns true if field handle is set (has been assigned a value) and false otherwise */
+  public boolean isSetHandle() {
+    return this.handle != null;
+  }
+
+  public void setHandleIsSet(boolean value) {
+    if (!value) {
+      this.handle = null;
+    }
+  }
+
+  public void setFieldValue(_Fields field, @org.apache.thrift.annotation.Nullable java.lang.Object value) {
+    switch (field) {
+    case HANDLE:
+      if (value == null) {
+        unsetHandle();
+      } else {
+        setHandle((java.lang.String)value);
+      }
+      break;
+
+    }
+  }
+
+  @org.apache.thrift.annotation.Nullable
+  public java.lang.Object getFieldValue(_Fields field) {
+    switch (field) {
+    case HANDLE:
+      return getHandle();
+
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  /** Returns true if field corresponding to fieldID is set (has been assigned a value) and false otherwise */
+  public boolean isSet(_Fields field) {
+    if (field == null) {
+      throw new java.lang.IllegalArgumentException();
+    }
+
+    switch (field) {
+    case HANDLE:
+      return isSetHandle();
+    }
+    throw new java.lang.IllegalStateException();
+  }
+
+  @Override
+  public boolean equals(java.lang.Object that) {
+    if (that instanceof UnknownAlgorithm)
+      return this.equals((UnknownAlgorithm)that);
+    return false;
+  }
+
+  public boolean equals(UnknownAlgorithm that) {
+    if (that == null)
+      return false;
+    if (this == that)
+      return true;
+
+    boolean this_present_handle = true && this.isSetHandle();
+    boolean that_present_handle = true && that.isSetHandle();
+    if (this_present_handle || that_present_handle) {
+      if (!(this_present_handle && that_present_handle))
+        return false;
+      if (!this.handle.equals(that.handle))
+        return false;
+    }
+
+    return true;
+  }
+
+  @Override
+  public int hashCode() {
+    int hashCode = 1;
+
+    hashCode = hashCode * 8191 + ((isSetHandle()) ? 131071 : 524287);
+    if (isSetHandle())
+      hashCode = hashCode * 8191 + handle.hashCode();
+
+    return hashCode;
+  }
+
+  @Override
+  public int compareTo(UnknownAlgorithm other) {
+    if (!getClass().equals(other.getClass())) {
+      return getClass().getName().compareTo(other.getClass().getName());
+    }
+
+    int lastComparison = 0;
+
+    lastComparison = java.lang.Boolean.compare(isSetHandle(), other.isSetHandle());
+    if (lastComparison != 0) {
+      return lastComparison;
+    }
+    if (isSetHandle()) {
+      lastComparison = org.apache.thrift.TBaseHelper.compareTo(this.handle, other.handle);
+      if (lastComparison != 0) {
+        return lastComparison;
+      }
+    }
+    return 0;
+  }
+
+  @org.apache.thrift.annotation.Nullable
+  public _Fields fieldForId(int fieldId) {
+    return _Fields.findByThriftId(fieldId);
+  }
+
+  public void read(org.apache.thrift.protocol.TProtocol iprot) throws org.apache.thrift.TException {
+    scheme(iprot).read(iprot, this);
+  }
+
+  public void write(org.apache.thrift.protocol.TProtocol oprot) throws org.apache.thrift.TException {
+    scheme(oprot).write(oprot, this);
+  }
+
+  @Override
+  public java.lang.String toString() {
+    java.lang.StringBuilder sb = new java.lang.StringBuilder("UnknownAlgorithm(");
+    boolean first = true;
+
+    sb.append("handle:");
+    if (this.handle == null) {
+      sb.append("null");
+    } else {
+      sb.append(this.handle);
+    }
+    first = false;
+    sb.append(")");
+    return sb.toString();
+  }
+
+  public void validate() throws org.apache.thrift.TException {
+    // check for required fields
+    // check for sub-struct validity
+  }
+
+  private void writeObject(java.io.ObjectOutputStream out) throws java.io.IOException {
+    try {
+      write(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(out)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private void readObject(java.io.ObjectInputStream in) throws java.io.IOException, java.lang.ClassNotFoundException {
+    try {
+      read(new org.apache.thrift.protocol.TCompactProtocol(new org.apache.thrift.transport.TIOStreamTransport(in)));
+    } catch (org.apache.thrift.TException te) {
+      throw new java.io.IOException(te);
+    }
+  }
+
+  private static class UnknownAlgorithmStandardSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public UnknownAlgorithmStandardScheme getScheme() {
+      return new UnknownAlgorithmStandardScheme();
+    }
+  }
+
+  private static class UnknownAlgorithmStandardScheme extends org.apache.thrift.scheme.StandardScheme<UnknownAlgorithm> {
+
+    public void read(org.apache.thrift.protocol.TProtocol iprot, UnknownAlgorithm struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TField schemeField;
+      iprot.readStructBegin();
+      while (true)
+      {
+        schemeField = iprot.readFieldBegin();
+        if (schemeField.type == org.apache.thrift.protocol.TType.STOP) { 
+          break;
+        }
+        switch (schemeField.id) {
+          case 1: // HANDLE
+            if (schemeField.type == org.apache.thrift.protocol.TType.STRING) {
+              struct.handle = iprot.readString();
+              struct.setHandleIsSet(true);
+            } else { 
+              org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+            }
+            break;
+          default:
+            org.apache.thrift.protocol.TProtocolUtil.skip(iprot, schemeField.type);
+        }
+        iprot.readFieldEnd();
+      }
+      iprot.readStructEnd();
+
+      // check for required fields of primitive type, which can't be checked in the validate method
+      struct.validate();
+    }
+
+    public void write(org.apache.thrift.protocol.TProtocol oprot, UnknownAlgorithm struct) throws org.apache.thrift.TException {
+      struct.validate();
+
+      oprot.writeStructBegin(STRUCT_DESC);
+      if (struct.handle != null) {
+        oprot.writeFieldBegin(HANDLE_FIELD_DESC);
+        oprot.writeString(struct.handle);
+        oprot.writeFieldEnd();
+      }
+      oprot.writeFieldStop();
+      oprot.writeStructEnd();
+    }
+
+  }
+
+  private static class UnknownAlgorithmTupleSchemeFactory implements org.apache.thrift.scheme.SchemeFactory {
+    public UnknownAlgorithmTupleScheme getScheme() {
+      return new UnknownAlgorithmTupleScheme();
+    }
+  }
+
+  private static class UnknownAlgorithmTupleScheme extends org.apache.thrift.scheme.TupleScheme<UnknownAlgorithm> {
+
+    @Override
+    public void write(org.apache.thrift.protocol.TProtocol prot, UnknownAlgorithm struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol oprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      java.util.BitSet optionals = new java.util.BitSet();
+      if (struct.isSetHandle()) {
+        optionals.set(0);
+      }
+      oprot.writeBitSet(optionals, 1);
+      if (struct.isSetHandle()) {
+        oprot.writeString(struct.handle);
+      }
+    }
+
+    @Override
+    public void read(org.apache.thrift.protocol.TProtocol prot, UnknownAlgorithm struct) throws org.apache.thrift.TException {
+      org.apache.thrift.protocol.TTupleProtocol iprot = (org.apache.thrift.protocol.TTupleProtocol) prot;
+      java.util.BitSet incoming = iprot.readBitSet(1);
+      if (incoming.get(0)) {
+        struct.handle = iprot.readString();
+        struct.setHandleIsSet(true);
+      }
+    }
+  }
+
+  private static <S extends org.apache.thrift.scheme.IScheme> S scheme(org.apache.thrift.protocol.TProtocol proto) {
+    return (org.apache.thrift.scheme.StandardScheme.class.equals(proto.getScheme()) ? STANDARD_SCHEME_FACTORY : TUPLE_SCHEME_FACTORY).getScheme();
+  }
+}
+
@@ -0,0 +1,63 @@
+package ru.vstu.util;
+
+import ru.vstu.thrift_gen_server.ReasoningTimeout;
+
+/**
+ * Point in time a request must be answered by (given as milliseconds from the request start).
+ */
+public class Deadline {
+
+    /** Thrown out of a reasoning step by poll() (see DeadlineGraph). */
+    public static class Expired extends RuntimeException {
+        public Expired() {
+            super("deadline expired", null, false, false);  // (no stack trace: thrown to unwind only)
+        }
+    }
+
+    /** No deadline: never expires. */
+    public static final Deadline NONE = new Deadline(0);
+
+    private final long expiresAt;  // System.nanoTime() value, 0 if none
+    private final long millis;
+
+    private Deadline(long millis) {
+        this.millis = millis;
+        this.expiresAt = millis > 0 ? System.nanoTime() + millis * 1_000_000 : 0;
+    }
+
+    /** Deadline after given milliseconds (none if not positive). */
+    public static Deadline afterMillis(long millis) {
+        return millis > 0 ? new Deadline(millis) : NONE;
+    }
+
+    public boolean isNone() {
+        return expiresAt == 0;
+    }
+
+    public long remainingNanos() {
+        return isNone() ? Long.MAX_VALUE : Math.max(0, expiresAt - System.nanoTime());
+    }
+
+    public boolean expired() {
+        return !isNone() && remainingNanos() == 0;
+    }
+
+    public ReasoningTimeout timeout(String stage) {
+        return new ReasoningTimeout("Deadline of " + millis + " ms expired at: " + stage);
+    }
+
+    /** Throw Expired (unchecked) if the deadline has expired. */
+    public void poll() {
+        if (expired()) {
+            throw new Expired();
+        }
+    }
+
+    /** Throw ReasoningTimeout if the deadline has expired. */
+    public void check(String stage) throws ReasoningTimeout {
+        if (expired()) {
+            System.out.println("Deadline of " + millis + " ms expired at: " + stage);
+            throw timeout(stage);
+        }
+    }
+}
@@ -0,0 +1,52 @@
+package ru.vstu.util;
+
+import org.apache.jena.graph.Graph;
+import org.apache.jena.graph.Node;
+import org.apache.jena.graph.Triple;
+import org.apache.jena.graph.impl.WrappedGraph;
+import org.apache.jena.util.iterator.ExtendedIterator;
+
+/**
+ * Data graph of a reasoning step that stops the step when the deadline expires.
+ * Jena rule engines do not check thread interruption, but they query the data graph all the time
+ * (initial scan, matching of backward goals, checks of fired conclusions), so each query and each triple
+ * read checks the deadline and throws Deadline.Expired once it has passed.
+ */
+public class DeadlineGraph extends WrappedGraph {
+
+    private final Deadline deadline;
+
+    public DeadlineGraph(Graph base, Deadline deadline) {
+        super(base);
+        this.deadline = deadline;
+    }
+
+    @Override
+    public ExtendedIterator<Triple> find(Triple m) {
+        deadline.poll();
+        return base.find(m).filterKeep(this::inTime);
+    }
+
+    @Override
+    public ExtendedIterator<Triple> find(Node s, Node p, Node o) {
+        deadline.poll();
+        return base.find(s, p, o).filterKeep(this::inTime);
+    }
+
+    @Override
+    public boolean contains(Triple t) {
+        deadline.poll();
+        return base.contains(t);
+    }
+
+    @Override
+    public boolean contains(Node s, Node p, Node o) {
+        deadline.poll();
+        return base.contains(s, p, o);
+    }
+
+    private boolean inTime(Triple t) {
+        deadline.poll();
+        return true;
+    }
+}
@@ -0,0 +1,89 @@
+package ru.vstu.util;
+
+import org.apache.thrift.transport.TIOStreamTransport;
+import org.apache.thrift.transport.TServerTransport;
+import org.apache.thrift.transport.TTransport;
+import org.apache.thrift.transport.TTransportException;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.IOException;
+import java.net.ProtocolFamily;
+import java.net.SocketAddress;
+import java.net.StandardProtocolFamily;
+import java.nio.channels.Channels;
+import java.nio.channels.ClosedChannelException;
+import java.nio.channels.ServerSocketChannel;
+import java.nio.channels.SocketChannel;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+
+/**
+ * Server transport listening on a Unix domain socket (a file path) instead of a TCP port.
+ * Unix domain socket channels appeared in Java 16, so they are reached by reflection
+ * to keep the project building for Java 14; listen() fails on older runtimes.
+ * A socket file left by a killed service is replaced; the file is deleted on close.
+ */
+public class TUnixServerSocket extends TServerTransport {
+
+    private static final int BUFFER_SIZE = 64 * 1024;
+
+    private final Path path;
+    private ServerSocketChannel serverChannel;
+
+    public TUnixServerSocket(String path) {
+        this.path = Paths.get(path);
+    }
+
+    @Override
+    public void listen() throws TTransportException {
+        try {
+            ProtocolFamily unix = StandardProtocolFamily.valueOf("UNIX");
+            SocketAddress address = (SocketAddress) Class.forName("java.net.UnixDomainSocketAddress")
+                    .getMethod("of", Path.class)
+                    .invoke(null, path);
+            Files.deleteIfExists(path);
+            serverChannel = (ServerSocketChannel) ServerSocketChannel.class
+                    .getMethod("open", ProtocolFamily.class)
+                    .invoke(null, unix);
+            serverChannel.bind(address);
+        } catch (IllegalArgumentException | ReflectiveOperationException e) {
+            throw new TTransportException(TTransportException.NOT_OPEN,
+                    "Unix domain sockets require Java 16 or newer", e);
+        } catch (IOException e) {
+            throw new TTransportException(TTransportException.NOT_OPEN, "Could not listen on " + path, e);
+        }
+    }
+
+    @Override
+    public TTransport accept() throws TTransportException {
+        if (serverChannel == null) {
+            throw new TTransportException(TTransportException.NOT_OPEN, "No underlying server socket.");
+        }
+        try {
+            SocketChannel channel = serverChannel.accept();
+            // (requests & responses do not overlap on a connection, so blocking streams of one channel are fine)
+            return new TIOStreamTransport(
+                    new BufferedInputStream(Channels.newInputStream(channel), BUFFER_SIZE),
+                    new BufferedOutputStream(Channels.newOutputStream(channel), BUFFER_SIZE));
+        } catch (ClosedChannelException e) {
+            throw new TTransportException(TTransportException.END_OF_FILE, "Server socket is closed", e);
+        } catch (IOException e) {
+            throw new TTransportException(e);
+        }
+    }
+
+    @Override
+    public void close() {
+        if (serverChannel != null) {
+            try {
+                serverChannel.close();
+                Files.deleteIfExists(path);
+            } catch (IOException e) {
+                e.printStackTrace();
+            }
+            serverChannel = null;
+        }
+    }
+}
@@ -49,7 +49,7 @@ thrift -r --gen py jenaService.thrift
  * target languages.
  */
 
-namespace java   jenaService
+namespace java   ru.vstu.thrift_gen_server
 namespace python jenaService
 
 
@@ -82,6 +82,37 @@ namespace python jenaService
 #1: list<BinaryRDF.RDF_StreamRow> graph
 #}
 
+/**
+ * Result of reasoning: the complemented RDF graph with timings of server-side stages.
+ */
+struct ReasoningResult {
+  /** The complemented RDF graph (N-Triples). */
+  1: binary rdfData,
+  /** Server-side duration of each processing stage, in seconds. */
+  2: map<string,double> timings
+}
+
+/**
+ * The algorithm handle is not known to the server (never registered, evicted or the server restarted): register the algorithm again.
+ */
+exception UnknownAlgorithm {
+  1: string handle
+}
+
+/**
+ * The schema version is not known to the server (never loaded or the server restarted): load the schema again.
+ */
+exception UnknownSchema {
+  1: string version
+}
+
+/**
+ * The deadline of the request expired before the reasoning was done; the rest of the reasoning is abandoned.
+ */
+exception ReasoningTimeout {
+  1: string message
+}
+
 
 
 /**
@@ -106,6 +137,45 @@ service JenaReasoner {
    */
    binary runReasoner(1:binary rdfData, 2:string rulePaths) /* throws (1:InvalidOperation ouch) */ ,
 
+
+  /**
+   * Do the reasoning and return the complemented RDF graph along with timings of server-side stages.
+   * If schemaVersion is given, the data is reasoned about together with that schema (see loadSchema).
+   * If deadlineMillis > 0, the reasoning is abandoned after that many milliseconds (ReasoningTimeout);
+   * the same for the other reasoning methods below.
+   */
+   ReasoningResult reason(1:binary rdfData, 2:string rulePaths, 3:string schemaVersion, 4:i64 deadlineMillis) throws (1:UnknownSchema unknownSchema, 2:ReasoningTimeout timeout),
+
+
+  /**
+   * Keep a schema (TBox: RDF/XML or N-Triples) to be used with data sent without it.
+   * Returns the version of the schema: SHA-256 of the data, hex.
+   */
+   string loadSchema(1:binary schemaData),
+
+
+  /**
+   * Reason about an algorithm (N-Triples; with schema included unless schemaVersion is given)
+   * with the algorithm-only rules and keep the result.
+   * Returns a handle of the pre-reasoned algorithm graph (the same for the same data, rules and schema).
+   */
+   string registerAlgorithm(1:binary rdfData, 2:string rulePaths, 3:string schemaVersion, 4:i64 deadlineMillis) throws (1:UnknownSchema unknownSchema, 2:ReasoningTimeout timeout),
+
+
+  /**
+   * Do the reasoning over the union of a registered algorithm graph and trace triples (N-Triples)
+   * and return the complemented RDF graph along with timings of server-side stages.
+   */
+   ReasoningResult reasonTrace(1:string algorithmHandle, 2:binary traceData, 3:string rulePaths, 4:i64 deadlineMillis) throws (1:UnknownAlgorithm unknown, 2:ReasoningTimeout timeout),
+
+
+  /**
+   * Same as reason() for big data passed through files (e.g. in shared memory, /dev/shm) instead of the connection:
+   * the data (RDF/XML or N-Triples) is read from payloadPath and the result (N-Triples) is written to resultPath;
+   * rdfData of the returned result is empty.
+   */
+   ReasoningResult reasonFile(1:string payloadPath, 2:string rulePaths, 3:string schemaVersion, 4:string resultPath, 5:i64 deadlineMillis) throws (1:UnknownSchema unknownSchema, 2:ReasoningTimeout timeout),
+
    /**
     * Stop the server.
     */
@@ -0,0 +1,161 @@
+# admission.py
+
+""" Admission control of calls to the Jena service: priority lanes with bounded queues.
+
+Interactive clicks and bulk jobs (`run_tests`, grading) share one Jena service (`external_run`),
+so a big batch could keep the clicks waiting. Each call to the service is admitted in the lane
+of the calling code (interactive by default):
+
+    with admission.lane(admission.BATCH):
+        run_tests(...)  # the Jena calls made here wait in the batch lane
+
+A call runs at once if a slot is free (`ADMISSION_SLOTS` calls at a time in total) and its lane
+has not reached its own limit; otherwise it waits in the queue of its lane, and a freed slot goes
+to the interactive lane first. A call that finds the queue of its lane full is not queued:
+`Busy` is raised at once (load shedding). A call waiting past its deadline gets `ReasoningTimeout`.
+
+Queue depth, running calls and outcomes by lane are rendered by `ADMISSION.to_prometheus()`;
+waiting times are observed as `admission.wait.<lane>` stages of `METRICS`.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Condition
+
+from jena.jenaClient import ReasoningTimeout
+from metrics import METRICS
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+ADMISSION_SLOTS = 8  # calls to the service at a time (of all lanes)
+# lanes in order of priority: (name, max calls at a time (None: all slots), max calls waiting)
+LANES = (
+    (INTERACTIVE, None, 64),
+    (BATCH, 4, 256),  # the other slots are left to interactive calls
+)
+
+GAUGES = (
+    ('ctrlflow_admission_queue_depth', 'Calls to the Jena service waiting for a slot, by lane.', 'queue_depth'),
+    ('ctrlflow_admission_running', 'Calls to the Jena service in progress, by lane.', 'running'),
+)
+COUNTER_NAME = 'ctrlflow_admission_requests_total'
+
+_current_lane = ContextVar("admission_lane", default=INTERACTIVE)
+
+
+class Busy(Exception):
+    """The queue of the lane is full: the call is rejected without waiting"""
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+@contextmanager
+def lane(name: str):
+    """Admit the calls to the service made in the `with` block in given lane"""
+    token = _current_lane.set(name)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_lane() -> str:
+    return _current_lane.get()
+
+
+class Lane:
+    __slots__ = ('name', 'priority', 'limit', 'queue_size', 'running', 'waiting', 'outcomes')
+
+    def __init__(self, name, priority, limit, queue_size):
+        self.name = name
+        self.priority = priority
+        self.limit = limit
+        self.queue_size = queue_size
+        self.running = 0
+        self.waiting = []  # tickets of waiting calls, in order of arrival
+        self.outcomes = {"admitted": 0, "shed": 0, "expired": 0}
+
+
+class AdmissionController:
+    """Slots of the Jena service shared by the lanes: strict priority, FIFO within a lane"""
+    def __init__(self, slots=ADMISSION_SLOTS, lanes=LANES):
+        self.slots = slots
+        self.lanes = {name: Lane(name, priority, limit, queue_size)
+                      for priority, (name, limit, queue_size) in enumerate(lanes)}
+        self.running = 0
+        self._cond = Condition()
+
+    def _has_slot(self, lane: Lane) -> bool:
+        return self.running < self.slots and (lane.limit is None or lane.running < lane.limit)
+
+    def _may_start(self, lane: Lane, ticket) -> bool:
+        """The call is the first one of its lane, a slot is free for it and no lane of higher priority waits for it"""
+        if lane.waiting[0] is not ticket or not self._has_slot(lane):
+            return False
+        return not any(other.waiting and self._has_slot(other)
+                       for other in self.lanes.values() if other.priority < lane.priority)
+
+    @contextmanager
+    def admit(self, lane_name: str = None, deadline: float = None):
+        """Wait for a slot of the lane (the current one by default) and hold it for the `with` block.
+        Raises `Busy` if the queue of the lane is full, `ReasoningTimeout` if `deadline`
+        (`time.monotonic()` time) passes while waiting."""
+        lane = self.lanes[lane_name or current_lane()]
+        start = time.monotonic()
+        with self._cond:
+            if len(lane.waiting) >= lane.queue_size:
+                lane.outcomes["shed"] += 1
+                raise Busy("The service is busy: %d calls are waiting in the %s lane" % (len(lane.waiting), lane.name))
+            ticket = object()
+            lane.waiting.append(ticket)
+            try:
+                while not self._may_start(lane, ticket):
+                    timeout = None
+                    if deadline is not None:
+                        timeout = deadline - time.monotonic()
+                        if timeout <= 0:
+                            lane.outcomes["expired"] += 1
+                            raise ReasoningTimeout("Deadline expired while waiting in the %s lane" % lane.name)
+                    self._cond.wait(timeout)
+            finally:
+                lane.waiting.remove(ticket)
+                self._cond.notify_all()  # (the next call may start or give way now)
+            lane.running += 1
+            self.running += 1
+            lane.outcomes["admitted"] += 1
+        METRICS.observe("admission.wait." + lane.name, time.monotonic() - start)
+        try:
+            yield
+        finally:
+            with self._cond:
+                lane.running -= 1
+                self.running -= 1
+                self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """lane -> {queue_depth, running, admitted, shed, expired}"""
+        with self._cond:
+            return {name: dict(lane.outcomes, queue_depth=len(lane.waiting), running=lane.running)
+                    for name, lane in self.lanes.items()}
+
+    def to_prometheus(self) -> str:
+        stats = self.stats()
+        lines = []
+        for metric, help_text, key in GAUGES:
+            lines += ['# HELP %s %s' % (metric, help_text), '# TYPE %s gauge' % metric]
+            lines += ['%s{lane="%s"} %d' % (metric, name, s[key]) for name, s in stats.items()]
+        lines += [
+            '# HELP %s Calls to the Jena service by lane and outcome of admission.' % COUNTER_NAME,
+            '# TYPE %s counter' % COUNTER_NAME,
+        ]
+        for name, s in stats.items():
+            for outcome in ("admitted", "shed", "expired"):
+                lines.append('%s{lane="%s",outcome="%s"} %d' % (COUNTER_NAME, name, outcome, s[outcome]))
+        return '\n'.join(lines) + '\n'
+
+
+# the admission of `external_run`
+ADMISSION = AdmissionController()
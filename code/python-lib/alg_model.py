@@ -0,0 +1,193 @@
+# alg_model.py
+
+""" Compact internal model of an algorithm and a trace.
+
+The algorithm JSON (nested dicts received from the GUI, possibly with JSON-cloned subtrees
+like `entry_point` or `id2obj`) is walked once and turned into a table of `AlgNode`s
+indexed by integer id, each knowing its parent, children and siblings.
+Trace acts become `Act` records with the fields already normalized.
+
+    model = AlgorithmModel.of(alg_dict)  # cached for the same dict object
+    node = model.node("12")              # str or int id
+    node.parent.type, node.next_sibling, node.data  # data: the original dict
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from threading import Lock
+
+MODEL_CACHE_SIZE = 64
+
+# dict keys that never contain own children of a node
+_NOT_CHILD_KEYS = {"id2obj"}
+# keys of algorithm root where actual data is stored
+_ROOT_KEYS = ("global_code", "functions")
+
+
+class AlgNode:
+    """An element of algorithm (statement, expression, sequence, ...)"""
+    __slots__ = ('id', 'type', 'name', 'data', 'parent', 'role', 'index', 'children',
+                 'prev_sibling', 'next_sibling', 'links', 'iri')
+
+    def __init__(self, data: dict, parent=None, role=None, index=None):
+        self.id = int(data["id"])
+        self.type = data.get("type")
+        self.name = data.get("name", None) or data.get("stmt_name", "")
+        self.data = data
+        self.parent = parent
+        self.role = role     # key of parent's dict this node is stored by
+        self.index = index   # position in parent's list (None if the node is a single value)
+        self.children = []
+        self.prev_sibling = None
+        self.next_sibling = None
+        # (key, node) or (key, [nodes], is_ordered) for each reference to other nodes, in the order of keys
+        self.links = []
+        self.iri = None  # name of the individual in the ontology (when written there)
+
+    def __repr__(self):
+        return "AlgNode(%d, %s, %r)" % (self.id, self.type, self.name)
+
+
+class AlgorithmModel:
+    """Table of algorithm nodes built once from algorithm JSON"""
+    _cache = OrderedDict()
+    _cache_lock = Lock()
+
+    def __init__(self, alg_dict: dict):
+        self.data = alg_dict
+        self.nodes = {}  # id -> AlgNode, in pre-order
+        self.root = self._walk(alg_dict)
+        if self.root is None:
+            # algorithm without an id: nodes are in global code & functions
+            for key in _ROOT_KEYS:
+                self._walk_value(alg_dict.get(key), None, key)
+        entry = alg_dict.get("entry_point") or alg_dict.get("global_code")
+        self.entry = entry and self.nodes.get(int(entry["id"]))
+        self.expr_values = alg_dict.get("expr_values", {})
+
+        self._resolve_links()
+
+    @classmethod
+    def of(cls, alg_dict: dict) -> 'AlgorithmModel':
+        """Get the model for given algorithm dict, building it on first request.
+        Note: the dict is expected not to be restructured after that."""
+        key = id(alg_dict)
+        with cls._cache_lock:
+            item = cls._cache.get(key)
+            if item and item.data is alg_dict:
+                cls._cache.move_to_end(key)
+                return item
+        model = cls(alg_dict)
+        with cls._cache_lock:
+            cls._cache[key] = model  # (the model keeps the dict alive so its id can't be reused)
+            while len(cls._cache) > MODEL_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return model
+
+    def _walk(self, d: dict, parent=None, role=None, index=None):
+        if "id" not in d:
+            return None
+        id_ = int(d["id"])
+        if id_ in self.nodes:
+            return None  # a clone or another reference to known node
+        node = AlgNode(d, parent, role, index)
+        self.nodes[id_] = node
+        items = d.items()
+        if parent is None:
+            # prefer the nodes within global code & functions to their possible clones (e.g. `entry_point`)
+            items = sorted(items, key=lambda kv: kv[0] not in _ROOT_KEYS)
+        for key, v in items:
+            if key not in _NOT_CHILD_KEYS:
+                self._walk_value(v, node, key)
+        return node
+
+    def _walk_value(self, v, parent, key):
+        if isinstance(v, dict):
+            child = self._walk(v, parent, key)
+            if child and parent:
+                parent.children.append(child)
+        elif isinstance(v, (list, tuple, set)):
+            prev = None
+            for i, item in enumerate(v):
+                if not isinstance(item, dict):
+                    continue
+                child = self._walk(item, parent, key, i if isinstance(v, list) else None)
+                if not child:
+                    continue
+                if parent:
+                    parent.children.append(child)
+                if prev and isinstance(v, list):
+                    prev.next_sibling, child.prev_sibling = child, prev
+                prev = child
+
+    def _resolve_links(self):
+        """References of each node to other nodes (by id, so clones are resolved to the original nodes)"""
+        for node in self.nodes.values():
+            for key, v in node.data.items():
+                if key in _NOT_CHILD_KEYS:
+                    continue
+                if isinstance(v, dict) and "id" in v:
+                    node.links.append((key, self.nodes[int(v["id"])]))
+                elif isinstance(v, (list, set)):
+                    items = [self.nodes[int(item["id"])] for item in v if isinstance(item, dict) and "id" in item]
+                    if items:
+                        node.links.append((key, items, isinstance(v, list)))
+        if self.root and self.entry and "entry_point" not in self.data:
+            # entry point defaults to global code
+            self.root.links.append(("entry_point", self.entry))
+
+    def node(self, id_) -> AlgNode:
+        """Node by int or str id (None if not found)"""
+        try:
+            return self.nodes.get(int(id_))
+        except (TypeError, ValueError):
+            return None
+
+    def __contains__(self, id_):
+        return self.node(id_) is not None
+
+    def __iter__(self):
+        return iter(self.nodes.values())
+
+    def id2obj(self) -> dict:
+        """id -> original dict of the node (except the root)"""
+        return {id_: node.data for id_, node in self.nodes.items() if node is not self.root}
+
+    def max_id(self) -> int:
+        return max(self.nodes) if self.nodes else 0
+
+
+def algorithm_digest(alg_dict: dict) -> str:
+    """Hash of algorithm content (the same algorithm arrives as a new dict with each request).
+    The `id2obj` index (a JSON clone of the nodes) is not taken into account."""
+    data = {k: v for k, v in alg_dict.items() if k not in _NOT_CHILD_KEYS}
+    data = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+class Act:
+    """An act of a trace with normalized fields"""
+    __slots__ = ('id', 'executes', 'phase', 'n', 'iteration_n', 'name', 'text_line', 'value', 'is_valid', 'data')
+
+    def __init__(self, d: dict):
+        self.id = d.get("id")
+        self.id = self.id and int(self.id)
+        self.executes = d.get("executes")
+        self.executes = self.executes and int(self.executes)
+        self.phase = d.get("phase")  # (started|finished|performed)
+        n = d.get("n", None) or d.get("n_", None)
+        self.n = n and int(n)  # convert if not None (n cannot be 0)
+        self.iteration_n = d.get("iteration_n", None)
+        self.name = d.get("name", None) or d.get("action", None)  # !  name <- action
+        self.text_line = d.get("text_line", None)
+        self.value = d.get("value", None)
+        self.is_valid = d.get("is_valid", None)
+        self.data = d
+
+    def __repr__(self):
+        return "Act(%s, executes=%s, %s, n=%s)" % (self.id, self.executes, self.phase, self.n)
+
+
+def acts_from_json(trace) -> list:
+    return [Act(d) for d in trace or ()]
@@ -0,0 +1,10 @@
+# bench/__init__.py
+
+""" Benchmark suite: synthetic algorithms & traces of controllable size and shape,
+stage-by-stage measurement of the reasoning pipeline and comparison of results between commits.
+
+Run from `code/python-lib` directory:
+
+    python -m bench.pipeline --loops 3 --depth 2 --repeat 5 --out bench_results.json
+    python -m bench.pipeline --loops 3 --depth 2 --repeat 5 --compare bench_results.json
+"""
@@ -0,0 +1,111 @@
+# explanations.py
+
+""" Benchmark of formatting mistake explanations: a corpus of synthetic mistakes (every explanation template
+of every language, with field values like `named_fields_param_provider()` makes) is formatted
+with compiled message templates (`explanations.COMPILED_MESSAGES`) on and off.
+Also reports the cost of loading the catalogs (paid on first use or by `locale.preload()`).
+
+    python -m bench.explanations --mistakes 20000 --repeat 5
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+
+import explanations
+from explanations import LocalizationProvider, PROPERTIES_LOCALIZATION_FILES, format_by_spec, replaceLocaleMarks
+
+# values to quote (some with locale marks, as for names of implicit statements)
+WORDS = ("i", "sum", "found", "x_is_positive", "list_not_empty", "print_result", "!{locale:text.global_scope}")
+PHASES = ("", "begin of ", "end of ")
+
+
+def explanation_templates(locale) -> list:
+    """(lang, format string) for each mistake explanation (keys of mistake classes have no dots)"""
+    return [(lang, format_str)
+            for lang in sorted(locale.loaded)
+            for key, format_str in sorted(locale.loaded[lang].items())
+            if '.' not in key and key != 'order_question_prompt']
+
+
+def template_fields(format_str) -> list:
+    return sorted({field for _, field, _, _ in string.Formatter().parse(format_str) if field})
+
+
+def make_corpus(templates, size, rng) -> list:
+    """List of (lang, format string, raw field values) for `size` mistakes"""
+    corpus = []
+    for _ in range(size):
+        lang, format_str = rng.choice(templates)
+        raw = {field: [(rng.choice(PHASES), rng.choice(WORDS)) for _ in range(rng.choice((1, 1, 1, 2)))]
+               for field in template_fields(format_str)}
+        corpus.append((lang, format_str, raw))
+    return corpus
+
+
+def make_placeholders(corpus) -> list:
+    """Field values of each explanation, the way `named_fields_param_provider()` joins them"""
+    return [
+        (format_str, {
+            field: ", ".join("«" + prefix + replaceLocaleMarks(value, lang) + "»" for prefix, value in values)
+            for field, values in raw.items()
+        })
+        for lang, format_str, raw in corpus
+    ]
+
+
+def format_all(formats_params) -> list:
+    return [format_by_spec(format_str, **params) for format_str, params in formats_params]
+
+
+def best_time(func, repeat, *args):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of explanation formatting.")
+    parser.add_argument("--mistakes", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    locale = LocalizationProvider(PROPERTIES_LOCALIZATION_FILES)
+    locale.preload()
+    print("Catalogs loaded & compiled in %.1f ms" % ((time.perf_counter() - start) * 1000))
+    explanations.locale.preload()
+
+    templates = explanation_templates(locale)
+    corpus = make_corpus(templates, args.mistakes, random.Random(args.seed))
+    print("%d mistakes of %d explanation templates" % (len(corpus), len(templates)))
+
+    elapsed, formats_params = best_time(make_placeholders, args.repeat, corpus)
+    print("Placeholders made in %.1f ms" % (elapsed * 1000))
+
+    timings, results = [], []
+    for compiled in (False, True):
+        explanations.COMPILED_MESSAGES = compiled
+        elapsed, result = best_time(format_all, args.repeat, formats_params)
+        timings.append(elapsed)
+        results.append(result)
+    explanations.COMPILED_MESSAGES = True
+    assert results[0] == results[1], "compiled templates give different explanations!"
+
+    plain, compiled = timings
+    print("%-12s %12s %16s" % ("formatting", "total, ms", "per mistake, us"))
+    print("%-12s %12.1f %16.2f" % ("plain", plain * 1000, plain / len(corpus) * 1e6))
+    print("%-12s %12.1f %16.2f" % ("compiled", compiled * 1000, compiled / len(corpus) * 1e6))
+    print("speedup: %.2fx" % (plain / compiled))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
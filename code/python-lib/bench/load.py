@@ -0,0 +1,310 @@
+# load.py
+
+""" Load generator imitating interactive sessions: a student builds a trace one act at a time,
+each act is made with `make_act_json()` and then checked with `process_algorithm_and_trace_from_json()`
+(as the GUI does). Several users work concurrently; overall request rate can be limited.
+
+Against the real service (`jena/Jena.jar` is started automatically):
+
+    python -m bench.load --users 4 --duration 60 --rate 2
+
+Against the stand-in Thrift service started in-process (no Java required):
+
+    python -m bench.load --users 8 --duration 60 --standin-latency 0.3 --standin-jitter 0.1
+
+With `--batch-users N`, N grading jobs check whole traces at the same time, in the batch lane
+(see `admission.py`), to see how the interactive requests fare beside them:
+
+    python -m bench.load --users 4 --batch-users 8 --standin-latency 0.3 --mistake-rate 0.5 --jena-slots 4
+
+With `--batch-traces N`, each request of a grading job has N traces (2 and more are passed to the service
+through files in shared memory, see `ctrlstrct_run.SHARED_MEMORY_HANDOFF`).
+With `--timeout S`, each request is given a deadline of S seconds (requests past it fail with `ReasoningTimeout`).
+
+`--transport` and `--protocol` choose the Thrift pair to talk to the service with (see `external_run`),
+`--unix-socket` makes it a Unix domain socket instead of the TCP port,
+e.g. to check a new build of the real service with each pair (`jena-tcp-service/build.sh check`):
+
+    python -m bench.load --users 2 --batch-users 1 --duration 20 --transport framed --protocol compact --fail-on-errors
+
+Reports throughput, latency percentiles of each kind of request and error rates
+(with `--fail-on-errors`, the exit status is 1 if any request failed).
+"""
+
+import argparse
+import atexit
+import json
+import random
+import sys
+import time
+from threading import Lock, Thread
+
+import admission
+import external_run
+from admission import ADMISSION
+from bench.synthetic import generate_algorithm
+from ctrlstrct_run import make_trace_for_algorithm, process_algtraces, release_ontology
+from ctrlstrct_test import make_act_json, process_algorithm_and_trace_from_json
+from jena.jenaClient import PROTOCOLS, TRANSPORTS
+from metrics import METRICS, MetricsRegistry
+
+SHAPE_KEYS = ("depth", "loops", "alternatives", "functions", "stmts", "iterations")
+
+
+class Pacer:
+    """Spreads requests of all users evenly in time so that overall rate does not exceed `rate` per second"""
+    def __init__(self, rate=0.0):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time)
+            self._next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class LoadStats:
+    """Latencies (in a private registry) and counts of requests & errors by kind of request"""
+    def __init__(self):
+        self.latency = MetricsRegistry()
+        self._lock = Lock()
+        self.requests = {}
+        self.errors = {}  # kind -> {error description -> count}
+        self.sessions = 0
+        self.aborted_sessions = 0
+
+    def record(self, kind, seconds, error=None):
+        self.latency.observe(kind, seconds)
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+            if error:
+                errors = self.errors.setdefault(kind, {})
+                errors[error] = errors.get(error, 0) + 1
+
+    def session_done(self, aborted=False):
+        with self._lock:
+            self.sessions += 1
+            self.aborted_sessions += aborted
+
+    def report(self, elapsed) -> dict:
+        latency = self.latency.summary()
+        kinds = {}
+        for kind, count in sorted(self.requests.items()):
+            errors = sum(self.errors.get(kind, {}).values())
+            kinds[kind] = dict(latency[kind], requests=count, errors=errors, error_rate=errors / count,
+                               throughput=count / elapsed)
+        return {
+            "elapsed": elapsed,
+            "sessions": self.sessions,
+            "aborted_sessions": self.aborted_sessions,
+            "session_latency": latency.get("session"),
+            "requests": kinds,
+            "errors": self.errors,
+            "pipeline_stages": METRICS.summary(),
+        }
+
+
+def timed(stats, kind, func, *args, **kw):
+    """Call `func` recording its latency as `kind`; returns (result, error description or None)"""
+    start = time.perf_counter()
+    result, error = None, None
+    try:
+        result = func(*args, **kw)
+        if isinstance(result, str):
+            error = result.split("\n")[0]  # make_act_json() answers errors as strings
+    except Exception as e:
+        error = "%s: %s" % (type(e).__name__, str(e)[:100])
+    stats.record(kind, time.perf_counter() - start, error)
+    return result, error
+
+
+def request_deadline(params):
+    """Deadline of a request starting now (`time.monotonic()` time), or None if requests have no timeout"""
+    return time.monotonic() + params["timeout"] if params["timeout"] else None
+
+
+def pick_wrong_act(algorithm, rng):
+    elem = rng.choice(list(algorithm["id2obj"].values()))
+    if elem["type"] in ("stmt", "expr", "break", "continue", "return"):
+        return elem["id"], "performed"
+    return elem["id"], rng.choice(("started", "finished"))
+
+
+def run_session(params, stats, pacer, rng, n):
+    """One student builds the whole trace of a new algorithm act by act (the session is aborted on first error)"""
+    shape = {k: params[k] for k in SHAPE_KEYS}
+    algorithm = generate_algorithm("load_%d" % n, seed=rng.random(), **shape)
+    correct_trace = make_trace_for_algorithm(algorithm)  # (also fills algorithm["id2obj"])
+    trace = []
+    # "program started" act is added by make_act_json() automatically
+    for step in correct_trace[1:]:
+        while True:
+            mistaken = rng.random() < params["mistake_rate"]
+            if mistaken:
+                elem_id, phase = pick_wrong_act(algorithm, rng)
+            else:
+                elem_id, phase = step["executes"], step["phase"]
+
+            pacer.wait()
+            new_trace, error = timed(stats, "make_act", make_act_json, algorithm, elem_id, phase, trace)
+            if error:
+                stats.session_done(aborted=True)
+                return
+            pacer.wait()
+            feedback, error = timed(stats, "check", process_algorithm_and_trace_from_json, {
+                "trace_name": "load_trace_%d" % n,
+                "algorithm_name": algorithm["name"],
+                "trace": new_trace,
+                "algorithm": algorithm,
+                "header_boolean_chain": None,
+            }, deadline=request_deadline(params))
+            if error:
+                stats.session_done(aborted=True)
+                return
+
+            is_valid = not feedback.get("mistakes")
+            for act in new_trace:
+                if act["is_valid"] is None:
+                    act["is_valid"] = is_valid
+            trace = new_trace
+
+            if params["think"]:
+                time.sleep(rng.uniform(0, 2 * params["think"]))
+            if is_valid or not mistaken:
+                break  # else: the student corrects the mistake on next try
+    stats.session_done()
+
+
+def user_loop(params, stats, pacer, seed, deadline, first_session):
+    rng = random.Random(seed)
+    n = first_session
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        run_session(params, stats, pacer, rng, n)
+        stats.latency.observe("session", time.perf_counter() - start)
+        n += params["users"]
+
+
+def batch_loop(params, stats, seed, deadline):
+    """A grading job: reasoning about whole traces of new algorithms, one after another
+    (`batch_traces` of them in each request)"""
+    rng = random.Random(seed)
+    shape = {k: params[k] for k in SHAPE_KEYS}
+    with admission.lane(admission.BATCH):
+        while time.monotonic() < deadline:
+            alg_trs = []
+            for i in range(params["batch_traces"]):
+                algorithm = generate_algorithm("batch_%d_%d" % (seed, i), seed=rng.random(), **shape)
+                alg_trs.append({"trace_name": "batch_trace_%d_%d" % (seed, i), "algorithm_name": algorithm["name"],
+                                "algorithm": algorithm, "trace": make_trace_for_algorithm(algorithm),
+                                "header_boolean_chain": None})
+            result, error = timed(stats, "batch", process_algtraces, alg_trs, verbose=0,
+                                  deadline=request_deadline(params))
+            if result is not None:
+                release_ontology(result[0])  # (onto, mistakes)
+
+
+def run_load(params) -> dict:
+    external_run.JENA_TRANSPORT = params["transport"]
+    external_run.JENA_PROTOCOL = params["protocol"]
+    external_run.JENA_UNIX_SOCKET = params["unix_socket"]
+    if params["standin"]:
+        from bench.standin import serve_standin
+        serve_standin(external_run.JENA_SERVICE_PORT, workers=max(10, (params["users"] + params["batch_users"]) * 2),
+                      transport=params["transport"], protocol=params["protocol"],
+                      unix_socket=external_run.jena_socket_path(),
+                      latency=params["standin_latency"], jitter=params["standin_jitter"],
+                      error_rate=params["standin_error_rate"], seed=params["seed"])
+        external_run.SPAWN_SERVICE = False
+
+    stats = LoadStats()
+    pacer = Pacer(params["rate"])
+    METRICS.reset()
+    ADMISSION.slots = params["jena_slots"]
+    start = time.monotonic()
+    deadline = start + params["duration"]
+    threads = [Thread(target=user_loop, args=(params, stats, pacer, params["seed"] + i, deadline, i), daemon=True)
+               for i in range(params["users"])]
+    threads += [Thread(target=batch_loop, args=(params, stats, params["seed"] + 1000 + i, deadline), daemon=True)
+                for i in range(params["batch_users"])]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    report = stats.report(time.monotonic() - start)
+    report["params"] = params
+    report["admission"] = ADMISSION.stats()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test of interactive trace construction.")
+    parser.add_argument("--users", type=int, default=4, help="concurrent sessions")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to start new sessions for")
+    parser.add_argument("--rate", type=float, default=0.0, help="max requests per second of all users (0: unlimited)")
+    parser.add_argument("--think", type=float, default=0.0, help="mean pause of a student between acts, in seconds")
+    parser.add_argument("--batch-users", type=int, default=0, help="concurrent grading jobs (in the batch lane)")
+    parser.add_argument("--batch-traces", type=int, default=1,
+                        help="traces in each request of a grading job (several are passed through shared memory)")
+    parser.add_argument("--jena-slots", type=int, default=ADMISSION.slots, help="calls to the service at a time")
+    parser.add_argument("--timeout", type=float, default=0.0, help="deadline of each request, in seconds (0: none)")
+    parser.add_argument("--mistake-rate", type=float, default=0.1, help="probability to add a wrong act")
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--loops", type=int, default=1)
+    parser.add_argument("--alternatives", type=int, default=1)
+    parser.add_argument("--functions", type=int, default=0)
+    parser.add_argument("--stmts", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default=external_run.JENA_TRANSPORT)
+    parser.add_argument("--protocol", choices=sorted(PROTOCOLS), default=external_run.JENA_PROTOCOL)
+    parser.add_argument("--unix-socket", action="store_true", help="connect over a Unix domain socket, not TCP")
+    parser.add_argument("--standin", action="store_true", help="use in-process stand-in instead of Jena.jar")
+    parser.add_argument("--standin-latency", type=float, default=None, help="delay of stand-in (implies --standin)")
+    parser.add_argument("--standin-jitter", type=float, default=0.0)
+    parser.add_argument("--standin-error-rate", type=float, default=0.0)
+    parser.add_argument("--out", help="JSON file to save the report to")
+    parser.add_argument("--fail-on-errors", action="store_true", help="exit with status 1 if any request failed")
+    args = parser.parse_args(argv)
+
+    params = vars(args).copy()
+    del params["out"], params["fail_on_errors"]
+    params["standin"] = args.standin or args.standin_latency is not None
+    params["standin_latency"] = args.standin_latency or 0.0
+
+    # try to close the external process if it will still be running on Python program end
+    atexit.register(external_run.stop_jena_reasoning_service)
+
+    report = run_load(params)
+
+    print()
+    print("%d sessions (%d aborted) in %.1f s" % (report["sessions"], report["aborted_sessions"], report["elapsed"]))
+    print("%-10s %9s %8s %8s %8s %8s %8s" % ("request", "count", "rps", "errors", "p50", "p95", "p99"))
+    for kind, r in report["requests"].items():
+        print("%-10s %9d %8.2f %7.1f%% %8.3f %8.3f %8.3f" % (
+            kind, r["requests"], r["throughput"], r["error_rate"] * 100, r["p50"], r["p95"], r["p99"]))
+    for kind, errors in report["errors"].items():
+        for error, count in sorted(errors.items(), key=lambda e: -e[1])[:5]:
+            print("  %s: %d x %s" % (kind, count, error))
+    for lane, s in report["admission"].items():
+        wait = METRICS.percentiles("admission.wait." + lane) or {"p50": 0.0, "p95": 0.0}
+        print("lane %-12s admitted %6d, shed %4d, expired %4d; wait p50 %.3f, p95 %.3f" % (
+            lane, s["admitted"], s["shed"], s["expired"], wait["p50"], wait["p95"]))
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print("Saved report to", args.out)
+    if args.fail_on_errors and report["errors"]:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# parse.py
+
+""" Benchmark of parsing algorithm JSON (the short form: `{"algorithm": [...]}` with `{"while": ..., "body": [...]}`
+and so on) into `JsonNode` trees, with the dispatch of node types by signature (`json2alg2tr.TYPE_DISPATCH`)
+on and off.
+
+    python -m bench.parse --depth 4 --width 4 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import trace_gen.json2alg2tr as json2alg2tr
+from trace_gen.json2alg2tr import GenericAlgorithmJsonNode
+
+
+def make_stmts(rng, depth, width, names) -> list:
+    """Random statements (nested up to `depth`), `width` on each level"""
+    def name(prefix):
+        names[0] += 1
+        return "%s_%d" % (prefix, names[0])
+
+    def body():
+        return make_stmts(rng, depth - 1, width, names)
+
+    stmts = []
+    for _ in range(width):
+        kind = rng.choice(("stmt", "stmt", "while", "do while", "for", "foreach", "alternative", "sequence")
+                          if depth > 0 else ("stmt",))
+        if kind == "stmt":
+            stmts.append(name("action"))
+        elif kind in ("while", "do while"):
+            node = {kind: name("cond"), "body": body()}
+            if rng.random() < 0.5:
+                node["name"] = name("loop")
+            stmts.append(node)
+        elif kind == "for":
+            stmts.append({"for": name("i"), "from": "1", "to": str(rng.randint(2, 9)), "body": body()})
+        elif kind == "foreach":
+            stmts.append({"foreach": name("x"), "in": name("list"), "body": body()})
+        elif kind == "alternative":
+            branches = [{"if": name("cond"), "then": body()}]
+            branches += [{"else if": name("cond"), "then": body()} for _ in range(rng.randint(0, 2))]
+            if rng.random() < 0.5:
+                branches.append({"else": body()})
+            stmts.append({rng.choice(("alternative", "alt")): name("alt"), "branches": branches})
+        else:
+            stmts.append({"sequence": body(), "name": name("seq")})
+    return stmts
+
+
+def make_algorithm(seed, depth, width, functions) -> (dict, int):
+    """Algorithm JSON and the number of JSON nodes (dicts & strings) in it"""
+    rng = random.Random(seed)
+    names = [0]
+    algorithm = [{"func": "main", "is_entry": "true", "body": make_stmts(rng, depth, width, names)}]
+    algorithm += [{"func": "func_%d" % i, "body": make_stmts(rng, depth, width, names)} for i in range(functions)]
+    return {"algorithm": algorithm}, count_nodes(algorithm)
+
+
+def count_nodes(value) -> int:
+    if isinstance(value, dict):
+        return 1 + sum(count_nodes(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(count_nodes(v) for v in value)
+    return 1
+
+
+def time_parse(alg_json, repeat) -> (float, dict):
+    """Best time of parsing, in seconds, and the parsed tree as dict"""
+    best, tree = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tree = GenericAlgorithmJsonNode.parse(alg_json)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, tree.to_dict()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of parsing algorithm JSON into JsonNode trees.")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--functions", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    alg_json, nodes = make_algorithm(args.seed, args.depth, args.width, args.functions)
+    print("Algorithm of %d JSON nodes" % nodes)
+
+    timings, trees = [], []
+    for use_dispatch in (False, True):
+        json2alg2tr.TYPE_DISPATCH = use_dispatch
+        elapsed, tree = time_parse(alg_json, args.repeat)
+        timings.append(elapsed)
+        trees.append(tree)
+    json2alg2tr.TYPE_DISPATCH = True
+    assert trees[0] == trees[1], "dispatch by signature gives a different tree!"
+
+    print("%-10s %10s %16s" % ("parsing", "total, ms", "nodes per second"))
+    for title, elapsed in zip(("scan", "dispatch"), timings):
+        print("%-10s %10.1f %16.0f" % (title, elapsed * 1000, nodes / elapsed))
+    print("speedup: %.2fx" % (timings[0] / timings[1]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
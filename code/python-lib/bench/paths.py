@@ -0,0 +1,96 @@
+# paths.py
+
+""" Check that the ways of sending data to the Jena service find the same mistakes:
+the whole ontology each time (the reference), the ABox with the schema kept on the service
+(`ctrlstrct_run.RESIDENT_SCHEMA`) and the trace with the algorithm registered on the service
+(`ctrlstrct_run.REGISTER_ALGORITHMS`: the algorithm rules see the algorithm graph only).
+
+    python -m bench.paths --requests 50 --mistakes 1
+
+Each request (a synthetic algorithm & a trace with mistakes) is processed in every way and the mistakes
+are compared with the reference ones. Meant for the real service (`jena/Jena.jar` is started automatically):
+the stand-in does no reasoning. The exit status is 1 if any request differs.
+"""
+
+import argparse
+import atexit
+import copy
+import json
+import random
+import sys
+
+import ctrlstrct_run
+import external_run
+from bench.synthetic import generate_algorithm, make_alg_trace, MUTATIONS
+from ctrlstrct_run import process_algtraces, release_ontology
+
+SHAPE_KEYS = ("depth", "loops", "alternatives", "functions", "stmts", "iterations")
+# way -> (RESIDENT_SCHEMA, REGISTER_ALGORITHMS)
+WAYS = {
+    "whole": (False, False),
+    "schema": (True, False),
+    "registered": (True, True),
+}
+REFERENCE = "whole"
+
+
+def find_mistakes(alg_tr: dict, way: str) -> list:
+    """Mistakes found in a copy of the request, sent to the service in given way (as sorted JSON strings)"""
+    ctrlstrct_run.RESIDENT_SCHEMA, ctrlstrct_run.REGISTER_ALGORITHMS = WAYS[way]
+    onto, mistakes = process_algtraces([copy.deepcopy(alg_tr)], verbose=0)
+    release_ontology(onto)
+    return sorted(json.dumps(m, sort_keys=True, ensure_ascii=False, default=str) for m in mistakes)
+
+
+def compare_ways(params) -> list:
+    """Run the requests, return [(request number, way, reference mistakes, mistakes)] of those that differ"""
+    rng = random.Random(params["seed"])
+    shape = {k: params[k] for k in SHAPE_KEYS}
+    settings = ctrlstrct_run.RESIDENT_SCHEMA, ctrlstrct_run.REGISTER_ALGORITHMS
+    differences = []
+    try:
+        for i in range(params["requests"]):
+            algorithm = generate_algorithm("paths_%d" % i, seed=rng.random(), **shape)
+            alg_tr = make_alg_trace(algorithm, "paths_trace_%d" % i, params["mistakes"], params["kinds"], rng)
+            reference = find_mistakes(alg_tr, REFERENCE)
+            for way in WAYS:
+                if way == REFERENCE:
+                    continue
+                mistakes = find_mistakes(alg_tr, way)
+                if mistakes != reference:
+                    differences.append((i, way, reference, mistakes))
+            print("request %d: %d mistakes" % (i + 1, len(reference)))
+    finally:
+        ctrlstrct_run.RESIDENT_SCHEMA, ctrlstrct_run.REGISTER_ALGORITHMS = settings
+    return differences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare mistakes found by the ways of sending data to Jena service.")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--mistakes", type=int, default=1, help="mutations applied to each correct trace")
+    parser.add_argument("--kinds", nargs="*", choices=sorted(MUTATIONS), default=None, help="allowed mutations")
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--loops", type=int, default=2)
+    parser.add_argument("--alternatives", type=int, default=2)
+    parser.add_argument("--functions", type=int, default=0)
+    parser.add_argument("--stmts", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # try to close the external process if it will still be running on Python program end
+    atexit.register(external_run.stop_jena_reasoning_service)
+
+    differences = compare_ways(vars(args))
+    print()
+    for i, way, reference, mistakes in differences:
+        print("request %d, %s: %d mistakes instead of %d" % (i + 1, way, len(mistakes), len(reference)))
+        for m in sorted(set(reference) ^ set(mistakes)):
+            print("  %s %s" % ("-" if m in reference else "+", m))
+    print("%d of %d requests differ" % (len({i for i, *_ in differences}), args.requests))
+    return 1 if differences else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# pipeline.py
+
+""" Measure each stage of the reasoning pipeline on synthetic algorithms & traces
+and store the results as JSON to compare them between commits.
+
+Stages are those recorded by `process_algtraces()` into `metrics.METRICS`
+(tbox, alg_injection, act_candidates, trace_injection, serialization, jena_roundtrip, jena.*, reload, mistakes, total)
+plus the benchmark's own `bench.generate` and `bench.correct_trace`.
+
+    python -m bench.pipeline --depth 3 --loops 4 --iterations 5 --repeat 10 --out before.json
+    (switch to another commit)
+    python -m bench.pipeline --depth 3 --loops 4 --iterations 5 --repeat 10 --out after.json --compare before.json
+"""
+
+import argparse
+import atexit
+import copy
+import json
+import random
+import subprocess
+import sys
+import time
+
+import external_run
+from bench.synthetic import generate_algorithm, make_alg_trace, count_nodes, MUTATIONS
+from ctrlstrct_run import process_algtraces, release_ontology
+from metrics import METRICS
+
+SHAPE_KEYS = ("depth", "loops", "alternatives", "functions", "stmts", "iterations")
+COMPARED_QUANTILES = ("p50", "p95")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_workload(params: dict, rng) -> list:
+    """List of `algorithm - trace` pairs to be processed by one request"""
+    shape = {k: params[k] for k in SHAPE_KEYS}
+    alg_trs = []
+    for i in range(params["traces"]):
+        with METRICS.timer("bench.generate"):
+            alg = generate_algorithm("synthetic_%d" % i, seed=rng.random(), **shape)
+        with METRICS.timer("bench.correct_trace"):
+            alg_tr = make_alg_trace(alg, "synthetic_trace_%d" % i, params["mistakes"], params["kinds"], rng)
+        alg_trs.append(alg_tr)
+    return alg_trs
+
+
+def run_benchmark(params: dict) -> dict:
+    rng = random.Random(params["seed"])
+    METRICS.reset()
+
+    mistakes_found = []
+    workload = None
+    for i in range(params["warmup"] + params["repeat"]):
+        if i == params["warmup"]:
+            METRICS.reset()  # forget warm-up observations
+        workload = make_workload(params, rng)
+        # process_algtraces modifies the dicts, keep the workload intact for the report
+        onto, mistakes = process_algtraces(copy.deepcopy(workload), verbose=0)
+        release_ontology(onto)
+        mistakes_found.append(len(mistakes))
+        print("run %d: %d mistakes found" % (i + 1, len(mistakes)))
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": params,
+        "size": {
+            "algorithm_nodes": count_nodes(workload[0]["algorithm"]),
+            "trace_acts": sum(len(alg_tr["trace"]) for alg_tr in workload),
+        },
+        "mistakes_found": mistakes_found[params["warmup"]:],
+        "stages": METRICS.summary(),
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold=0.2) -> list:
+    """Print a table of stage timings and return the list of stages became slower by more than `threshold` (relative)"""
+    if baseline["params"] != current["params"]:
+        print("Warning: benchmark parameters differ from the baseline ones!")
+    print("%-24s %12s %12s %8s" % ("stage", "baseline", "current", "change"))
+    regressions = []
+    for stage in sorted(set(baseline["stages"]) | set(current["stages"])):
+        base, cur = baseline["stages"].get(stage), current["stages"].get(stage)
+        if not base or not cur:
+            print("%-24s %12s %12s" % (stage, base and "%.4f" % base["p50"], cur and "%.4f" % cur["p50"]))
+            continue
+        for q in COMPARED_QUANTILES:
+            change = (cur[q] - base[q]) / base[q] if base[q] else 0.0
+            mark = ""
+            if change > threshold:
+                mark = "  <-- slower"
+                regressions.append((stage, q))
+            print("%-24s %12.4f %12.4f %+7.1f%%%s" % ("%s %s" % (stage, q), base[q], cur[q], change * 100, mark))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the reasoning pipeline on synthetic algorithms & traces.")
+    parser.add_argument("--depth", type=int, default=2, help="max nesting level of control structures")
+    parser.add_argument("--loops", type=int, default=2)
+    parser.add_argument("--alternatives", type=int, default=2)
+    parser.add_argument("--functions", type=int, default=0)
+    parser.add_argument("--stmts", type=int, default=2, help="plain statements in each block")
+    parser.add_argument("--iterations", type=int, default=3, help="iterations of each loop")
+    parser.add_argument("--traces", type=int, default=1, help="algorithm/trace pairs per request")
+    parser.add_argument("--mistakes", type=int, default=1, help="mutations applied to each correct trace")
+    parser.add_argument("--kinds", nargs="*", choices=sorted(MUTATIONS), default=None, help="allowed mutations")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="JSON file to save results to")
+    parser.add_argument("--compare", help="JSON file with baseline results")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown treated as a regression")
+    args = parser.parse_args(argv)
+
+    params = {k: getattr(args, k) for k in SHAPE_KEYS + ("traces", "mistakes", "kinds", "repeat", "warmup", "seed")}
+
+    # try to close the external process if it will still be running on Python program end
+    atexit.register(external_run.stop_jena_reasoning_service)
+
+    results = run_benchmark(params)
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+        print("Saved results to", args.out)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print("Comparing with commit", baseline.get("commit"), "->", results["commit"])
+        if compare_results(baseline, results, args.threshold):
+            return 1
+    else:
+        for stage, snap in results["stages"].items():
+            print("%-24s p50=%.4f p95=%.4f max=%.4f (n=%d)" % (stage, snap["p50"], snap["p95"], snap["max"], snap["count"]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
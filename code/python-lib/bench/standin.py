@@ -0,0 +1,177 @@
+# standin.py
+
+""" A stand-in for `jena/Jena.jar service`: Thrift server implementing `JenaReasoner.Iface`
+that answers the input RDF graph as is after a configurable delay (and fails at a configurable rate).
+A delay longer than the request's deadline ends with `ReasoningTimeout` at the deadline, as the service does.
+Loaded schemas and registered algorithms are kept as is and answered together with the data sent without them
+(the result is N-Triples then).
+Lets load tests run without Java and isolates Python-side costs from the reasoning itself.
+
+    python -m bench.standin --latency 0.5 --jitter 0.2 --workers 16
+
+Note: each worker thread serves one client connection for as long as the connection lives,
+so `workers` must not be less than the number of concurrent clients (as with the Java TThreadPoolServer).
+"""
+
+import argparse
+import hashlib
+import io
+import random
+import time
+from threading import Event, Lock, Thread
+
+from thrift.protocol import TBinaryProtocol, TCompactProtocol
+from thrift.server import TServer
+from thrift.transport import TSocket
+from thrift.transport import TTransport
+
+from external_run import JENA_SERVICE_PORT
+from jena.jenaService import JenaReasoner
+from jena.jenaService.ttypes import ReasoningResult, ReasoningTimeout, UnknownAlgorithm, UnknownSchema
+from onto_helpers import get_isolated_ontology, delete_ontology
+
+
+class StandInReasoner(JenaReasoner.Iface):
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self._lock = Lock()
+        self.requests = 0
+        self.algorithms = {}  # handle -> N-Triples (clear it to simulate a restart of the service)
+        self.schemas = {}  # version -> N-Triples (the same)
+        self.stopped = Event()
+
+    def ping(self):
+        return True
+
+    def saveRdf(self, rdfData, filename):
+        with open(filename, 'wb') as f:
+            f.write(rdfData)
+
+    def runReasoner(self, rdfData, rulePaths):
+        return self.reason(rdfData, rulePaths).rdfData
+
+    def loadSchema(self, schemaData):
+        version = hashlib.sha256(schemaData).hexdigest()
+        with self._lock:
+            self.schemas[version] = to_ntriples(schemaData)
+        return version
+
+    def registerAlgorithm(self, rdfData, rulePaths, schemaVersion=None, deadlineMillis=0):
+        handle = hashlib.sha256(rdfData + ("%s;%s" % (rulePaths, schemaVersion)).encode()).hexdigest()
+        rdfData = self._with_schema(rdfData, schemaVersion)
+        with self._lock:
+            self.algorithms[handle] = rdfData
+        return handle
+
+    def _with_schema(self, rdfData, schemaVersion):
+        if not schemaVersion:
+            return rdfData
+        with self._lock:
+            schema = self.schemas.get(schemaVersion)
+        if schema is None:
+            raise UnknownSchema(schemaVersion)
+        return schema + to_ntriples(rdfData)
+
+    def reasonTrace(self, algorithmHandle, traceData, rulePaths, deadlineMillis=0):
+        with self._lock:
+            algorithm = self.algorithms.get(algorithmHandle)
+        if algorithm is None:
+            raise UnknownAlgorithm(algorithmHandle)
+        return self.reason(algorithm + traceData, rulePaths, deadlineMillis=deadlineMillis)
+
+    def reasonFile(self, payloadPath, rulePaths, schemaVersion=None, resultPath=None, deadlineMillis=0):
+        with open(payloadPath, 'rb') as f:
+            result = self.reason(f.read(), rulePaths, schemaVersion, deadlineMillis)
+        with open(resultPath, 'wb') as f:
+            f.write(result.rdfData)
+        return ReasoningResult(b"", result.timings)
+
+    def reason(self, rdfData, rulePaths, schemaVersion=None, deadlineMillis=0):
+        rdfData = self._with_schema(rdfData, schemaVersion)
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            fail = self.rng.random() < self.error_rate
+        if deadlineMillis and delay > deadlineMillis / 1000:
+            time.sleep(deadlineMillis / 1000)
+            raise ReasoningTimeout("reasoning did not finish in %d ms" % deadlineMillis)
+        time.sleep(delay)
+        if fail:
+            # the processor reports it to client as TApplicationException
+            raise RuntimeError("stand-in: simulated reasoning failure")
+        return ReasoningResult(rdfData, {"reasoning": delay, "total": delay})
+
+    def stop(self):
+        self.stopped.set()
+
+
+def to_ntriples(rdfData: bytes) -> bytes:
+    """N-Triples of RDF/XML data (N-Triples are returned as is), to join graphs by concatenation"""
+    if not rdfData.lstrip().startswith((b"<?", b"<rdf:")):
+        return rdfData
+    onto = get_isolated_ontology("http://example.org/standin")
+    try:
+        onto = onto.load(fileobj=io.BytesIO(rdfData), only_local=True)
+        stream = io.BytesIO()
+        # (without the declaration of the stand-in's own ontology)
+        onto.save(file=stream, format='ntriples', filter=lambda graph, s, p, o, d=None: s != onto.storid)
+        return stream.getvalue()
+    finally:
+        delete_ontology(onto)
+
+
+# the same names as `jena.jenaClient.TRANSPORTS` & `PROTOCOLS`
+TRANSPORT_FACTORIES = {
+    'buffered': TTransport.TBufferedTransportFactory,
+    'framed': TTransport.TFramedTransportFactory,
+}
+PROTOCOL_FACTORIES = {
+    'binary': TBinaryProtocol.TBinaryProtocolFactory,
+    'compact': TCompactProtocol.TCompactProtocolFactory,
+}
+
+
+def serve_standin(port=JENA_SERVICE_PORT, host='localhost', workers=10, transport='buffered', protocol='binary',
+                  unix_socket=None, **reasoner_kw) -> StandInReasoner:
+    """Run stand-in service from a daemon thread; returns the handler (see `StandInReasoner` for keywords).
+    `unix_socket`: path of Unix domain socket to listen on instead of `host` & `port`."""
+    handler = StandInReasoner(**reasoner_kw)
+    server = TServer.TThreadPoolServer(
+        JenaReasoner.Processor(handler),
+        TSocket.TServerSocket(host=host, port=port, unix_socket=unix_socket),
+        TRANSPORT_FACTORIES[transport](),
+        PROTOCOL_FACTORIES[protocol](),
+        daemon=True)
+    server.setNumThreads(workers)
+    Thread(target=server.serve, daemon=True).start()
+    print("Stand-in Jena service is listening on %s" % (unix_socket or "%s:%d" % (host, port)))
+    return handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in for Jena reasoning service.")
+    parser.add_argument("--port", type=int, default=JENA_SERVICE_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="mean delay of reasoning, in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="max deviation from the mean delay, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests to fail")
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--transport", choices=sorted(TRANSPORT_FACTORIES), default='buffered')
+    parser.add_argument("--protocol", choices=sorted(PROTOCOL_FACTORIES), default='binary')
+    parser.add_argument("--socket", help="path of Unix domain socket to listen on instead of the port")
+    args = parser.parse_args(argv)
+
+    handler = serve_standin(args.port, workers=args.workers, transport=args.transport, protocol=args.protocol,
+                            unix_socket=args.socket,
+                            latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+    try:
+        handler.stopped.wait()  # until stop() is called by a client
+    except KeyboardInterrupt:
+        pass
+    print("Stand-in served %d requests." % handler.requests)
+
+
+if __name__ == '__main__':
+    main()
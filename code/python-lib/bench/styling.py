@@ -0,0 +1,121 @@
+# styling.py
+
+""" Benchmark of making trace lines: `act_line_for_alg_element()` alone and the whole `add_styling_to_trace()`
+on long synthetic traces, in both languages, with act line templates (`json2alg2tr.ACT_LINE_TEMPLATES`) on and off.
+Then syntax highlighting of the act lines (and of very long lines made of them)
+with the single-pass highlighter (`styling.SINGLE_PASS_HIGHLIGHTER`) on and off.
+
+    python -m bench.styling --iterations 20 --repeat 5
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+import trace_gen.json2alg2tr as json2alg2tr
+import trace_gen.styling as styling
+from bench.synthetic import generate_algorithm
+from ctrlstrct_run import make_trace_for_algorithm
+from ctrlstrct_test import add_styling_to_trace
+from trace_gen.json2alg2tr import act_line_for_alg_element
+
+
+def time_act_lines(algorithm, trace, lang, repeat) -> float:
+    """Best time of making text lines for all acts of the trace, in seconds"""
+    id2obj = algorithm["id2obj"]
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for act in trace:
+            elem = id2obj[act["executes"]]
+            act_line_for_alg_element(elem, act["phase"], act.get("value"), act["n"], lang=lang)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_styling(algorithm, trace, lang, repeat) -> float:
+    """Best time of styling the whole trace, in seconds"""
+    best = None
+    for _ in range(repeat):
+        trace_copy = copy.deepcopy(trace)
+        start = time.perf_counter()
+        result = add_styling_to_trace(algorithm, trace_copy, user_language=lang)
+        elapsed = time.perf_counter() - start
+        assert not isinstance(result, str), result
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_highlighting(lines, repeat) -> (float, list):
+    """Best time of making HTML of all the lines, in seconds, and the HTML"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [styling.line_to_html(line) for line in lines]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def compare_highlighters(algorithm, trace, repeat, long_line_acts):
+    print()
+    print("%-20s %12s %12s %8s" % ("lang", "lexer, ms", "1-pass, ms", "speedup"))
+    for lang in ("en", "ru"):
+        lines = [act["as_string"] for act in add_styling_to_trace(algorithm, copy.deepcopy(trace), user_language=lang)]
+        long_lines = ["  ".join(lines[i:i + long_line_acts]) for i in range(0, len(lines), long_line_acts)]
+        for title, texts in (("act lines", lines), ("long lines", long_lines)):
+            timings, results = [], []
+            for single_pass in (False, True):
+                styling.SINGLE_PASS_HIGHLIGHTER = single_pass
+                elapsed, result = time_highlighting(texts, repeat)
+                timings.append(elapsed)
+                results.append(result)
+            styling.SINGLE_PASS_HIGHLIGHTER = True
+            assert results[0] == results[1], "single-pass highlighter gives different HTML!"
+            lexer, single = timings
+            print("%-20s %12.1f %12.1f %7.1fx" % ("%s: %s" % (lang, title), lexer * 1000, single * 1000, lexer / single))
+
+        timings = []
+        for single_pass in (False, True):
+            styling.SINGLE_PASS_HIGHLIGHTER = single_pass
+            timings.append(time_styling(algorithm, trace, lang, repeat))
+        styling.SINGLE_PASS_HIGHLIGHTER = True
+        lexer, single = timings
+        print("%-20s %12.1f %12.1f %7.1fx" % ("%s: %s" % (lang, "styling"), lexer * 1000, single * 1000, lexer / single))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of trace styling.")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--loops", type=int, default=4)
+    parser.add_argument("--alternatives", type=int, default=3)
+    parser.add_argument("--stmts", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--long-line-acts", type=int, default=50, help="act lines joined into a long line")
+    args = parser.parse_args(argv)
+
+    algorithm = generate_algorithm("styling", seed=0, depth=args.depth, loops=args.loops,
+                                   alternatives=args.alternatives, stmts=args.stmts, iterations=args.iterations)
+    trace = make_trace_for_algorithm(algorithm)
+    print("Trace of %d acts" % len(trace))
+
+    print("%-20s %12s %12s %8s" % ("lang", "full, ms", "template, ms", "speedup"))
+    for lang in ("en", "ru"):
+        for title, func in (("act lines", time_act_lines), ("styling", time_styling)):
+            timings = []
+            for use_templates in (False, True):
+                json2alg2tr.ACT_LINE_TEMPLATES = use_templates
+                timings.append(func(algorithm, trace, lang, args.repeat))
+            json2alg2tr.ACT_LINE_TEMPLATES = True
+            full, templ = timings
+            print("%-20s %12.1f %12.1f %7.1fx" % ("%s: %s" % (lang, title), full * 1000, templ * 1000, full / templ))
+
+    compare_highlighters(algorithm, trace, args.repeat, args.long_line_acts)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
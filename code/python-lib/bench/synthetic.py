@@ -0,0 +1,207 @@
+# synthetic.py
+
+""" Generator of synthetic algorithms (in the same dict form as the ones received from the GUI),
+their correct traces and erroneous student traces derived from them.
+
+Shape of an algorithm is controlled by:
+ - `depth`: max nesting level of control structures;
+ - `loops`, `alternatives`: total number of loops and alternatives;
+ - `functions`: number of extra functions (they are written to the ontology but never called
+   as there is no call statement in the algorithm model);
+ - `stmts`: number of plain statements in each block;
+ - `iterations`: number of iterations each loop makes (per entering the loop), set via `expr_values`.
+"""
+
+import copy
+import random
+
+from ctrlstrct_run import make_trace_for_algorithm
+
+LOOP_TYPES = ("while_loop", "do_while_loop", "for_loop")
+
+
+class AlgorithmBuilder:
+    """Builds one algorithm dict; ids are unique integers starting from 1."""
+    def __init__(self, depth=2, loops=2, alternatives=2, functions=0, stmts=2, iterations=3, rng=None):
+        self.depth = depth
+        self.stmts = stmts
+        self.iterations = iterations
+        self.functions = functions
+        self.rng = rng or random.Random()
+        self._maxID = 0
+        self.expr_values = {}
+        self.id2obj = {}
+        # compound statements to be placed into the algorithm
+        self.pool = ["loop"] * loops + ["alternative"] * alternatives
+        self.rng.shuffle(self.pool)
+        self.counters = {}
+
+    def new_node(self, type_, name, **fields) -> dict:
+        self._maxID += 1
+        d = {"id": self._maxID, "type": type_, "name": name}
+        d.update(fields)
+        self.id2obj[d["id"]] = d
+        return d
+
+    def new_name(self, prefix):
+        n = self.counters[prefix] = self.counters.get(prefix, 0) + 1
+        return "%s_%d" % (prefix, n)
+
+    def make_expr(self, values) -> dict:
+        name = self.new_name("cond")
+        self.expr_values[name] = values
+        return self.new_node("expr", name)
+
+    def make_block(self, level) -> list:
+        """Plain statements with (possibly) one nested compound statement among them"""
+        body = [self.new_node("stmt", self.new_name("stmt")) for _ in range(self.stmts)]
+        if self.pool and level < self.depth:
+            body.insert(len(body) // 2, self.make_compound(self.pool.pop(), level + 1))
+        return body
+
+    def make_compound(self, kind, level) -> dict:
+        if kind == "loop":
+            return self.make_loop(level)
+        return self.make_alternative(level)
+
+    def make_loop(self, level) -> dict:
+        type_ = LOOP_TYPES[self.counters.get("loop", 0) % len(LOOP_TYPES)]
+        name = self.new_name("loop")
+        if type_ == "do_while_loop":
+            # condition is checked after each iteration
+            values = [True] * (self.iterations - 1) + [False]
+        else:
+            values = [True] * self.iterations + [False]
+        fields = {}
+        if type_ == "for_loop":
+            fields["init"] = self.new_node("stmt", name + "_init")
+        fields["cond"] = self.make_expr(["("] + values + [")"])  # repeated each time the loop is entered
+        if type_ == "for_loop":
+            fields["update"] = self.new_node("stmt", name + "_update")
+        fields["body"] = self.new_node("sequence", name + "_loop_body", body=self.make_block(level))
+        return self.new_node(type_, name, **fields)
+
+    def make_alternative(self, level) -> dict:
+        name = self.new_name("alt")
+        # branches are taken by turns: if, else-if, else, if, ...
+        branches = [
+            self.new_node("if", name + "_if", cond=self.make_expr(["(", True, False, False, ")"]),
+                          body=self.make_block(level)),
+            self.new_node("else-if", name + "_elseif", cond=self.make_expr(["(", True, False, ")"]),
+                          body=self.make_block(level)),
+            self.new_node("else", name + "_else", body=self.make_block(level)),
+        ]
+        return self.new_node("alternative", name, branches=branches)
+
+    def build(self, name="synthetic") -> dict:
+        root = self.new_node("algorithm", name)
+        body = self.make_block(0)
+        while self.pool:
+            # the rest of compound statements goes to the top level
+            body.append(self.make_compound(self.pool.pop(), 1))
+            body.append(self.new_node("stmt", self.new_name("stmt")))
+        global_code = self.new_node("sequence", "global_code", body=body)
+
+        functions = []
+        for _ in range(self.functions):
+            func_name = self.new_name("func")
+            func_body = self.new_node("sequence", func_name + "_body", body=self.make_block(self.depth))
+            functions.append(self.new_node("func", func_name, body=func_body, is_entry=False, param_list=[]))
+
+        root.update({
+            "global_code": global_code,
+            "functions": functions,
+            "entry_point": global_code,
+            "expr_values": self.expr_values,
+        })
+        return root
+
+
+def generate_algorithm(name="synthetic", seed=None, **shape) -> dict:
+    """Make an algorithm dict; see `AlgorithmBuilder` for `shape` keywords."""
+    return AlgorithmBuilder(rng=random.Random(seed), **shape).build(name)
+
+
+def count_nodes(alg_dict) -> int:
+    """Number of algorithm elements having an id (including the root)"""
+    return len({d["id"] for d in alg_dict["id2obj"].values()} | {alg_dict["id"]})
+
+
+# Mutations making a correct trace erroneous.
+# Each takes a trace (list of acts) and a random generator and changes the trace in-place.
+# The first act ("program started") is never touched.
+
+def _drop_act(trace, rng):
+    del trace[rng.randrange(1, len(trace))]
+
+
+def _swap_acts(trace, rng):
+    i = rng.randrange(1, len(trace) - 1)
+    trace[i], trace[i + 1] = trace[i + 1], trace[i]
+
+
+def _duplicate_act(trace, rng):
+    i = rng.randrange(1, len(trace))
+    trace.insert(i + 1, copy.deepcopy(trace[i]))
+
+
+def _flip_value(trace, rng):
+    exprs = [act for act in trace if "value" in act]
+    if exprs:
+        act = rng.choice(exprs)
+        act["value"] = not act["value"]
+    else:
+        _swap_acts(trace, rng)
+
+
+MUTATIONS = {
+    "drop": _drop_act,
+    "swap": _swap_acts,
+    "duplicate": _duplicate_act,
+    "flip_value": _flip_value,
+}
+
+
+def renumber_acts(trace):
+    """Assign unique ids and recalculate execution numbers ("n") as the GUI does when a student adds acts"""
+    max_id = max(act["id"] for act in trace)
+    seen_ids = set()
+    exec_counts = {}
+    for act in trace:
+        if act["id"] in seen_ids:
+            max_id += 1
+            act["id"] = max_id
+        seen_ids.add(act["id"])
+        key = (act["executes"], act["phase"])
+        act["n"] = exec_counts[key] = exec_counts.get(key, 0) + 1
+    return trace
+
+
+def mutate_trace(correct_trace, mistakes=1, kinds=None, rng=None) -> list:
+    """Return erroneous copy of the correct trace having `mistakes` mutations of `kinds` applied"""
+    rng = rng or random.Random()
+    kinds = kinds or sorted(MUTATIONS)
+    trace = copy.deepcopy(correct_trace)
+    for _ in range(mistakes):
+        if len(trace) < 3:
+            break
+        MUTATIONS[rng.choice(kinds)](trace, rng)
+    return renumber_acts(trace)
+
+
+def make_alg_trace(alg_dict, trace_name="synthetic_trace", mistakes=1, kinds=None, rng=None) -> dict:
+    """Make `algorithm - trace` pair in the form `process_algtraces()` accepts.
+    The student trace is the correct one with `mistakes` errors (0 => a correct trace)."""
+    correct_trace = make_trace_for_algorithm(alg_dict)
+    if isinstance(correct_trace, str):
+        raise ValueError("Cannot make correct trace for synthetic algorithm: " + correct_trace)
+    trace = mutate_trace(correct_trace, mistakes, kinds, rng) if mistakes else copy.deepcopy(correct_trace)
+    for act in trace:
+        act["is_valid"] = None
+    return {
+        "trace_name": trace_name,
+        "algorithm_name": alg_dict["name"],
+        "trace": trace,
+        "algorithm": alg_dict,
+        "header_boolean_chain": None,
+    }
@@ -0,0 +1,108 @@
+# transport.py
+
+""" Benchmark of large-payload throughput of Thrift transport & protocol pairs (`jena.jenaClient.TRANSPORTS`
+and `PROTOCOLS`): `reason` calls with RDF payloads of several sizes to the stand-in service (`bench/standin.py`,
+which answers the data back), each pair on its own port (and on a Unix domain socket with `--unix`).
+
+    python -m bench.transport --sizes 0.25,1,4,12 --repeat 5 --unix
+
+The payload is the ontology (N-Triples) of a synthetic algorithm & trace, its lines repeated up to the size.
+Both ends are Python here, so the figures show the client-side costs and the relative cost of the pairs;
+frames are limited to 16 MB (`TTransport.DEFAULT_MAX_FRAME_SIZE`, as in the Java service).
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from bench.standin import serve_standin
+from bench.synthetic import generate_algorithm
+from ctrlstrct_run import TraceTester, create_ontology_tbox, make_trace_for_algorithm
+from jena.jenaClient import JenaClient, PROTOCOLS, TRANSPORTS
+from onto_helpers import delete_ontology
+
+MB = 1024 * 1024
+
+
+def make_payload(size: int, iterations=3) -> bytes:
+    """N-Triples of about `size` bytes (one ontology at least)"""
+    algorithm = generate_algorithm("transport", seed=0, depth=2, loops=2, alternatives=2, iterations=iterations)
+    trace = make_trace_for_algorithm(algorithm)
+    onto = create_ontology_tbox()
+    try:
+        TraceTester({"algorithm_name": algorithm["name"], "trace_name": "transport", "algorithm": algorithm,
+                     "trace": trace, "header_boolean_chain": None}).inject_to_ontology(onto)
+        stream = io.BytesIO()
+        onto.save(file=stream, format='ntriples')
+    finally:
+        delete_ontology(onto)
+    lines = stream.getvalue().splitlines(keepends=True)
+    payload, total = [], 0
+    while total < size or not payload:
+        line = lines[len(payload) % len(lines)]
+        payload.append(line)
+        total += len(line)
+    return b"".join(payload)
+
+
+def connect(port, transport, protocol, unix_socket=None, attempts=50) -> JenaClient:
+    """Client of a stand-in that has just been started (waiting for it to listen)"""
+    for _ in range(attempts):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            client = JenaClient(port=port, transport=transport, protocol=protocol, unix_socket=unix_socket)
+        if client.transport.isOpen():
+            return client
+        time.sleep(0.05)
+    raise RuntimeError("stand-in on port %d does not answer" % port)
+
+
+def time_round_trips(client, payload, repeat) -> float:
+    """Best time of a `reason` call, in seconds"""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):  # (the client prints each call)
+            start = time.perf_counter()
+            result = client.reason(payload, "")
+            elapsed = time.perf_counter() - start
+        assert result is not None and len(result.rdfData) == len(payload), "the call failed"
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of Thrift transports & protocols on large payloads.")
+    parser.add_argument("--sizes", default="0.25,1,4,12", help="payload sizes, MB (comma-separated)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--port", type=int, default=20350, help="the first port of stand-in services")
+    parser.add_argument("--unix", action="store_true", help="also run the pairs over Unix domain sockets")
+    args = parser.parse_args(argv)
+
+    sizes = [int(float(s) * MB) for s in args.sizes.split(",")]
+    payloads = [make_payload(size) for size in sizes]
+
+    pairs = [(transport, protocol) for transport in TRANSPORTS for protocol in PROTOCOLS]
+    print("%-25s" % "transport/protocol" + "".join("%12s" % ("%.2f MB" % (len(p) / MB)) for p in payloads))
+    for unix in ((False, True) if args.unix else (False,)):
+        for i, (transport, protocol) in enumerate(pairs):
+            port = args.port + i
+            unix_socket = os.path.join(tempfile.gettempdir(), "bench-transport-%d.sock" % port) if unix else None
+            serve_standin(port, workers=1, transport=transport, protocol=protocol, unix_socket=unix_socket)
+            client = connect(port, transport, protocol, unix_socket)
+            cells = []
+            for payload in payloads:
+                elapsed = time_round_trips(client, payload, args.repeat)
+                cells.append("%7.0f MB/s" % (2 * len(payload) / MB / elapsed))  # there & back
+            client.transport.close()
+            if unix_socket:
+                os.remove(unix_socket)
+            title = "%s/%s (%s)" % (transport, protocol, "unix" if unix else "tcp")
+            print("%-25s" % title + "".join("%12s" % c for c in cells))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
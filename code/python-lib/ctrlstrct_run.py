@@ -7,12 +7,19 @@ adding rules defined in text files,
 running reasoning with Jena reasoner (bundled in an external service running on localhost).
 """
 
+import hashlib
 import io
+import os
+from collections import OrderedDict
+from threading import Lock
+from weakref import WeakKeyDictionary
 from transliterate import slugify
 
-from common_helpers import Checkpointer
-from explanations import format_explanation, get_leaf_classes
-from external_run import invoke_jena_reasoning_service
+from alg_model import AlgorithmModel, Act, acts_from_json, algorithm_digest
+from metrics import StageCheckpointer
+from explanations import FieldIndex, format_explanation, get_leaf_classes
+from external_run import invoke_jena_reasoning_service, invoke_jena_reasoning_with_algorithm, register_algorithm, \
+    load_schema, handoff_files, invoke_jena_reasoning_with_files, UnknownAlgorithm, UnknownSchema
 from onto_helpers import *
 from trace_gen.dict_helpers import get_ith_expr_value, find_by_key_in, find_by_keyval_in
 
@@ -27,6 +34,27 @@ WRITE_PRINCIPAL_VIOLATION = False
 WRITE_SKOS_CONCEPT = False
 WRITE_CONCEPT_FLAG_LABEL = False
 
+# reuse worlds with ontologies between requests (see `OntologyPool`)
+USE_ONTOLOGY_POOL = True
+ONTOLOGY_POOL_SIZE = 4
+
+# send an algorithm to Jena service once, to be reasoned about and kept there; then send trace triples only
+# (for a single trace; see `_reason_with_registered_algorithm()`).
+# Off by default: the algorithm rules then see the algorithm graph only, and the other rules see it together
+# with the trace, while otherwise the whole chain runs on all the data; turn it on once the results of both ways
+# have been compared on the real rule set (`python -m bench.paths`)
+REGISTER_ALGORITHMS = False
+ALGORITHM_HANDLES_SIZE = 256
+
+# keep the static definitions (TBox) loaded on Jena service and send the data without them
+# (see `_resident_schema()`); set False to send the whole ontology each time (e.g. to compare)
+RESIDENT_SCHEMA = True
+
+# pass the data of batches to Jena service and back through files in shared memory, not through the connection
+# (see `_reason_with_files()`); set False if the service runs on another host
+SHARED_MEMORY_HANDOFF = True
+SHARED_MEMORY_MIN_TRACES = 2  # (interactive requests have one trace)
+
 
 def prepare_name(s):
     """Transliterate given word (to latin chars) if needed"""
@@ -72,12 +100,14 @@ class TraceTester():
         """
         self.data = trace_data
 
-        # index of all objects of the ALGORITHM for quick search by id
-        self.id2obj = self.data["algorithm"].get("id2obj", {})
-
         self.initial_repair_data()
 
+        # student's acts
+        self.acts = acts_from_json(self.data.get("trace"))
+
         self.act_iris = []
+        # (act class, executed stmt id, exec_time) -> act individual, see prepare_act_candidates()
+        self._act_index = {}
 
         self._maxID = 1
 
@@ -89,28 +119,20 @@ class TraceTester():
         for d in find_by_key_in(k, self.data):
             if isinstance(d[k], str):
                 d[k] = int(d[k])
-        # repair dicts keys that are str, not int
-        for k in list(self.id2obj.keys()):
-            if isinstance(k, str):
-                self.id2obj[int(k)] = self.id2obj[k]
-                del self.id2obj[k]
 
         data = self.data["algorithm"]  # data to repair
 
         if "functions" not in data:
             data["functions"] = ()
 
-        roots = data["global_code"], data["functions"]  # where actual data to be stored
+        # the model refers to the nodes within global_code & functions, not to their clones
+        self.model = AlgorithmModel.of(data)
 
-        k = 'id'
-        for d in find_by_keyval_in(k, data["entry_point"][k], roots):
-            data["entry_point"] = d  # reassign the appropriate node from roots (global_code or main function)
-            break
+        if self.model.entry and "entry_point" in data:
+            data["entry_point"] = self.model.entry.data  # reassign the appropriate node (global_code or main function)
 
-        for ID in list(self.id2obj.keys()):
-            for d in find_by_keyval_in(k, ID, roots):
-                self.id2obj[ID] = d  # reassign the appropriate node from roots
-                break
+        # index of all objects of the ALGORITHM for quick search by id
+        self.id2obj = self.model.id2obj()
 
     def newID(self, what=None):
         """Increment and return new unused integer ID"""
@@ -148,7 +170,7 @@ class TraceTester():
         self.last_cond_tuple = (-1, False)
         self.consequent_mode = "normal"  # other values: "return", "break", "continue"
 
-        self._maxID = max(self._maxID, max(map(int, self.id2obj.keys())) + 10)
+        self._maxID = max(self._maxID, self.model.max_id() + 10)
 
         # decide where to read expr values from
         self.values_source = None
@@ -210,6 +232,14 @@ class TraceTester():
             self.last_cond_tuple = (i + 1, v)
             return v
 
+        # number of acts made so far for each (name, phase)
+        exec_counts = {("program", "started"): 1}
+
+        def next_exec_n(name, phase):
+            """Exec time of the act being appended to the trace"""
+            n = exec_counts[(name, phase)] = exec_counts.get((name, phase), 0) + 1
+            return n
+
         # long recursive function
         def make_correct_trace_for_alg_node(node):
             # copy reference
@@ -218,7 +248,7 @@ class TraceTester():
             if node["type"] in {"func"}:
 
                 phase = "started"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -237,7 +267,7 @@ class TraceTester():
                     self.consequent_mode = "normal"
 
                 phase = "finished"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -253,7 +283,7 @@ class TraceTester():
                 # do not wrap 'global_code'
                 if node["name"] != 'global_code':
                     phase = "started"
-                    ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                    ith = next_exec_n(node["name"], phase)
                     result.append({
                         "id": self.newID(),
                         "name": node["name"],
@@ -272,7 +302,7 @@ class TraceTester():
                 # do not wrap 'global_code'
                 if node["name"] != 'global_code':
                     phase = "finished"
-                    ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                    ith = next_exec_n(node["name"], phase)
                     result.append({
                         "id": self.newID(),
                         "name": node["name"],
@@ -286,7 +316,7 @@ class TraceTester():
             if node["type"] in {"alternative"}:
 
                 phase = "started"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -305,7 +335,7 @@ class TraceTester():
                         break
 
                 phase = "finished"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -321,7 +351,7 @@ class TraceTester():
                 _, cond_v = self.last_cond_tuple
                 if cond_v:
                     phase = "started"
-                    ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                    ith = next_exec_n(node["name"], phase)
                     result.append({
                         "id": self.newID(),
                         "name": node["name"],
@@ -338,7 +368,7 @@ class TraceTester():
                             break
 
                     phase = "finished"
-                    ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                    ith = next_exec_n(node["name"], phase)
                     result.append({
                         "id": self.newID(),
                         "name": node["name"],
@@ -351,7 +381,7 @@ class TraceTester():
 
             if node["type"] in {"expr"}:
                 phase = "performed"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 value = next_cond_value(node["name"], node["id"], ith)
                 self.expr_id2values[node["id"]] = self.expr_id2values.get(node["id"], []) + [value]
                 result.append({
@@ -367,7 +397,7 @@ class TraceTester():
 
             if node["type"] in {"stmt", "break", "continue", "return"}:
                 phase = "performed"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -386,7 +416,7 @@ class TraceTester():
                                 "infinite_loop", }:
 
                 phase = "started"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -441,7 +471,7 @@ class TraceTester():
                 _loop_context()  # make a loop
 
                 phase = "finished"
-                ith = 1 + len([x for x in find_by_keyval_in("name", node["name"], result) if x["phase"] == phase])
+                ith = next_exec_n(node["name"], phase)
                 result.append({
                     "id": self.newID(),
                     "name": node["name"],
@@ -478,30 +508,31 @@ class TraceTester():
         })
 
 
-    def inject_to_ontology(self, onto):
+    def inject_to_ontology(self, onto, ch=None):
+        """ `ch`: optional StageCheckpointer to account injection stages to """
 
         self.inject_algorithm_to_ontology(onto)
+        if ch: ch.hit(stage="alg_injection")
 
+        self.inject_acts_to_ontology(onto, ch)
+
+    def inject_acts_to_ontology(self, onto, ch=None):
+        """ Write the trace (the algorithm must be in the ontology already) """
         self.make_correct_trace(noop=True)
         self.prepare_act_candidates(onto)
-        self.inject_trace_to_ontology(onto, self.data["trace"], (), "student_next")
+        if ch: ch.hit(stage="act_candidates")
+
+        self.inject_trace_to_ontology(onto, self.acts, (), "student_next")
+        if ch: ch.hit(stage="trace_injection")
 
 
     def prepare_id2obj(self):
-        """Fill `self.id2obj` with direct references to algorithm objects """
-        alg_objects = list(find_by_type(self.data["algorithm"]))
-        if not self.id2obj:
-            # fill it once
-            for d in alg_objects:
-                if "id" in d:
-                    self.id2obj[d["id"]] = d
-            # store to original algorithm dict
-            self.data["algorithm"]["id2obj"] = self.id2obj
+        """Store `self.id2obj` (direct references to algorithm objects) to original algorithm dict """
+        self.data["algorithm"]["id2obj"] = self.id2obj
 
 
-    def inject_algorithm_to_ontology(self, onto):
-        """Prepares self.id2obj and writes algorithm to ontology if it isn't there."""
-
+    def prepare_algorithm(self):
+        """Add the keys the processing relies on (`entry_point`, `id2obj`) to original algorithm dict """
         if "entry_point" not in self.data["algorithm"]:
             alg_node = self.data["algorithm"]["global_code"]
             # polyfill entry_point to be global_code
@@ -509,34 +540,25 @@ class TraceTester():
 
         self.prepare_id2obj()
 
+
+    def inject_algorithm_to_ontology(self, onto):
+        """Prepares self.id2obj and writes algorithm to ontology if it isn't there."""
+
+        self.prepare_algorithm()
+
         with onto:
             if onto.algorithm_name and self.data["algorithm_name"] in [s for _, s in
                                                                        onto.algorithm_name.get_relations()]:
                 # do nothing as the algorithm is in the ontology
                 return
 
-            alg_objects = list(find_by_type(self.data["algorithm"]))
-
-            written_ids = set()
-
             # make algorithm classes and individuals
-            for d in alg_objects:
-                if "id" not in d:
-                    continue
-                id_ = d.get("id")
-
-                # (once more) protection from objects cloned via JSON serialization
-                if id_ in written_ids:
-                    continue
-                else:
-                    written_ids.add(id_)
-
-                type_ = d.get("type")
-                name = d.get("name", None) or d.get("stmt_name", "")
+            for node in self.model:
+                type_ = node.type
+                name = node.name
 
-                assert type_, "Error: No 'type' in algorithm object: " + str(d)
+                assert type_, "Error: No 'type' in algorithm object: " + str(node.data)
 
-                id_ = int(id_)
                 clean_name = prepare_name(name)
 
                 class_ = onto[type_]
@@ -545,16 +567,16 @@ class TraceTester():
                     class_ = types.new_class(type_, (Thing,))
 
                 # make the name of individual (instance) in the ontology
-                iri = "{}_{}".format(id_, clean_name)
+                iri = "{}_{}".format(node.id, clean_name)
 
                 iri = uniqualize_iri(onto, iri)
 
-                # save back to our dict (to bind to acts later)
-                d["iri"] = iri
+                # save to the model (to bind to acts later)
+                node.iri = iri
                 # make an instance
                 obj = class_(iri)
                 # bind id
-                make_triple(obj, onto.id, id_)
+                make_triple(obj, onto.id, node.id)
                 # bind name
                 make_triple(obj, onto.stmt_name, name)
 
@@ -574,47 +596,42 @@ class TraceTester():
                         make_triple(bound, onto[prop_name], obj)
 
             # link the instances: repeat the structure completely
-            for d in alg_objects:
-                if "id" not in d:
-                    continue
-                for k in d:  # look through dict keys
-                    v = d[k]
-                    if isinstance(v, dict) and "id" in v and "iri" in v:
+            for node in self.model:
+                iri = node.iri
+                for link in node.links:
+                    if len(link) == 2:
                         # connect all the properties of the instance
-                        link_objects(onto, d["iri"], k, v["iri"], (Thing >> Thing, onto.parent_of,))
-                    elif isinstance(v, (list, set)):
-                        # make an ordered linked_list for list, unordered for set
-                        # make a list if it contains normal "our" objects
-                        subobject_iri_list = [subv["iri"] for subv in v if
-                                              isinstance(subv, dict) and "id" in subv and "iri" in subv]
-                        if not subobject_iri_list:
-                            continue
-
-                        iri = d["iri"]
-
-                        # Any list (actions, branches, ...) must be formatted as linked_list.
-                        if k == "body" and isinstance(v, list):
-                            # make the object a sequence (needed for loop bodies, branches, functions)
-                            onto[iri].is_a.append(onto.linked_list)
-
-                        subelem__prop_name = k + "_item"
-                        for i, subiri in enumerate(subobject_iri_list):
-                            # main relation
-                            link_objects(onto, iri, subelem__prop_name, subiri, (Thing >> Thing, onto.parent_of,))
-                            if isinstance(v, list):  # for list only
-                                # sequence
-                                if i >= 1:
-                                    prev_iri = subobject_iri_list[i - 1]
-                                    link_objects(onto, prev_iri, "next", subiri)
-                                # set the index of elem in the list
-                                onto[subiri].item_index = i
-                                # first / last
-                                if i == 0:
-                                    # mark as first elem of the list
-                                    onto[subiri].is_a.append(onto.first_item)
-                                if i == len(subobject_iri_list) - 1:
-                                    # mark as last act of the list
-                                    onto[subiri].is_a.append(onto.last_item)
+                        k, subnode = link
+                        link_objects(onto, iri, k, subnode.iri, (Thing >> Thing, onto.parent_of,))
+                        continue
+
+                    # make an ordered linked_list for list, unordered for set
+                    k, subnodes, is_list = link
+                    subobject_iri_list = [subnode.iri for subnode in subnodes]
+
+                    # Any list (actions, branches, ...) must be formatted as linked_list.
+                    if k == "body" and is_list:
+                        # make the object a sequence (needed for loop bodies, branches, functions)
+                        onto[iri].is_a.append(onto.linked_list)
+
+                    subelem__prop_name = k + "_item"
+                    for i, subiri in enumerate(subobject_iri_list):
+                        # main relation
+                        link_objects(onto, iri, subelem__prop_name, subiri, (Thing >> Thing, onto.parent_of,))
+                        if is_list:  # for list only
+                            # sequence
+                            if i >= 1:
+                                prev_iri = subobject_iri_list[i - 1]
+                                link_objects(onto, prev_iri, "next", subiri)
+                            # set the index of elem in the list
+                            onto[subiri].item_index = i
+                            # first / last
+                            if i == 0:
+                                # mark as first elem of the list
+                                onto[subiri].is_a.append(onto.first_item)
+                            if i == len(subobject_iri_list) - 1:
+                                # mark as last act of the list
+                                onto[subiri].is_a.append(onto.last_item)
 
     def prepare_act_candidates(self, onto):
         """Create all required acts for each statement. """
@@ -626,11 +643,10 @@ class TraceTester():
             alg_id2max_exec_n[executed_id] = exec_n  # assume "n"s appear consequently in the trace
 
         # ensure that student's acts exist
-        for act in self.data["trace"]:
-            executed_id = act["executes"]
-            exec_n = act.get("n", "1")
+        for act in self.acts:
+            executed_id = act.executes
             alg_id2max_exec_n[executed_id] = max(
-                int(exec_n),  # assume "n"s appear consequently in the trace
+                act.n or 1,  # assume "n"s appear consequently in the trace
                 int(alg_id2max_exec_n[executed_id]))
 
         entry_stmt_id = self.alg_entry()["id"]
@@ -654,7 +670,7 @@ class TraceTester():
         trace_obj = onto.trace(iri)
         self.trace_obj = trace_obj  # remember for trace injection
         trace_obj.is_a.append(onto.correct_act)
-        make_triple(trace_obj, onto.executes, onto[self.data["algorithm"]["iri"]])
+        make_triple(trace_obj, onto.executes, onto[self.model.root.iri])
         set_id(trace_obj)
         make_triple(trace_obj, onto.index, 0)
         make_triple(trace_obj, onto.student_index, 0)
@@ -664,12 +680,12 @@ class TraceTester():
 
         for st_id, max_n in alg_id2max_exec_n.items():
 
-            alg_elem = self.id2obj[st_id]
-            if alg_elem["type"] in {"algorithm"}:
+            alg_node = self.model.node(st_id)
+            if alg_node.type in {"algorithm"}:
                 continue
 
             # prepare data
-            name = alg_elem.get("name", "unkn")
+            name = alg_node.data.get("name", "unkn")
             clean_name = prepare_name(name)
 
             mark2act_obj = {}  # executed stmt id to list of act iri's can be consequently used in trace
@@ -687,18 +703,19 @@ class TraceTester():
 
                     obj = class_(iri)
 
-                    boundary = get_relation_subject(boundary_prop, onto[alg_elem["iri"]])
+                    boundary = get_relation_subject(boundary_prop, onto[alg_node.iri])
                     make_triple(obj, onto.executes, boundary)
 
                     set_id(obj)
                     make_triple(obj, onto.exec_time, exec_n)
                     make_triple(obj, onto.in_trace, trace_obj)
+                    self._act_index[(class_, st_id, exec_n)] = obj
 
                     # keep current value for next iteration
                     mark2act_obj[mark] = obj
 
                     # attach expr value: for act_end only!
-                    if mark == "e" and alg_elem["type"] in ("expr",):
+                    if mark == "e" and alg_node.type in ("expr",):
                         values = self.expr_id2values[st_id] if st_id in self.expr_id2values else []
                         # if len(values) <= exec_n:
                         if exec_n <= len(values):
@@ -710,7 +727,7 @@ class TraceTester():
 
 
     def inject_trace_to_ontology(self, onto, trace, act_classnames=("act",), next_propertyname=None):
-        "Writes specified trace to ontology assigning properties to pre-created acts."
+        "Writes specified trace (list of `Act`s or dicts) to ontology assigning properties to pre-created acts."
 
         additional_classes = [onto[nm] for nm in act_classnames]
         assert all(additional_classes), f"additional_classes={additional_classes}, {act_classnames}, {onto}"
@@ -732,6 +749,11 @@ class TraceTester():
                 make_triple(obj, onto.student_index, num)
 
         def find_act(class_, executes: int, exec_time: int, **fields: dict):
+            if exec_time is not None and not fields:
+                # the acts created by prepare_act_candidates()
+                obj = self._act_index.get((class_, executes, exec_time))
+                if obj:
+                    return obj
             for obj in class_.instances():
                 if ((
                         # an act executes a boundary while trace executes algorithm itself
@@ -748,29 +770,25 @@ class TraceTester():
         with onto:
             i = 0
             trace_acts_list = []
-            trace_acts_list.append(find_act(onto.trace, self.data["algorithm"]["id"], 0))
-            for d in trace:
+            trace_acts_list.append(find_act(onto.trace, self.model.root.id, 0))
+            for act in trace:
                 i += 1
-                if "id" in d:
-                    id_ = d.get("id")
-                    executes = d.get("executes")
+                if not isinstance(act, Act):
+                    act = Act(act)
+                if act.id is not None:
+                    id_ = act.id
+                    executes = act.executes
+                    n = act.n
+                    iteration_n = act.iteration_n
+                    name = act.name
+                    text_line = act.text_line
+                    expr_value = act.value
+
                     # phase: (started|finished|performed)
-                    phase = d.get("phase")  # , "performed"
-                    n = d.get("n", None) or d.get("n_", None)
-                    iteration_n = d.get("iteration_n", None)
-                    name = d.get("name", None) or d.get("action", None)  # !  name <- action
-                    text_line = d.get("text_line", None)
-                    expr_value = d.get("value", None)
-
-                    id_ = int(id_)
-                    # clean_name = prepare_name(name)
-                    phase_mark = {"started": "b", "finished": "e", "performed": "p", }[phase]
-                    n = n and int(n)  # convert if not None (n cannot be 0)
-                    # number_mark = "" if not n else ("_n%d" % n)
+                    phase_mark = {"started": "b", "finished": "e", "performed": "p", }[act.phase]
 
                     # find related algorithm element
-                    assert executes in self.id2obj, (self.id2obj, d)
-                    alg_elem = self.id2obj[executes]
+                    assert executes in self.model, (executes, act.data)
 
                     if phase_mark in ("b", "p"):
                         # act begin
@@ -819,15 +837,9 @@ def make_trace_for_algorithm(alg_dict):
             "header_boolean_chain": None,
         }
         tt = TraceTester(trace_data)
-        tt.prepare_id2obj()
+        tt.prepare_id2obj()  # (the root i.e. alg_dict itself is not included)
         tt.make_correct_trace()
 
-        # Clear alg_dict["id2obj"] dictionary from recursive reference to alg_dict itself
-        for key in alg_dict["id2obj"]:
-            if alg_dict["id2obj"][key] is alg_dict:
-                del alg_dict["id2obj"][key]
-                break
-
         return tt.data["correct_trace"]
     except Exception as e:
         print("Error !")
@@ -1584,6 +1596,7 @@ def extact_mistakes(onto, as_objects=False, group_by=("text_line",), filter_by_l
         categories = [onto.Erroneous]
 
     mistakes = {}
+    fields = FieldIndex(onto)  # field_* facts for explanations
 
     for error_class in categories:
         # The .instances() class method can be used to iterate through all Instances of a Class (including its subclasses). It returns a generator.
@@ -1613,7 +1626,7 @@ def extact_mistakes(onto, as_objects=False, group_by=("text_line",), filter_by_l
 
             classes = get_leaf_classes((set(inst.is_a) | set(d.get("classes", {}))) & error_classes)
             d["classes"] = [class_.name for class_ in classes]
-            expanded_explanations = format_explanation(onto, inst)
+            expanded_explanations = format_explanation(onto, inst, fields=fields)
             explanations = [d["explanation"] for d in expanded_explanations]
             d["explanations"] = sorted(set(d.get("explanations", []) + explanations))
             d["mistakes"] = expanded_explanations
@@ -1636,18 +1649,83 @@ def create_ontology_tbox() -> "ontology":
     return onto
 
 
+def _create_empty_ontology():
+    return get_isolated_ontology(ONTOLOGY_IRI)
+
+
+# ontologies with static definitions only (to write algorithms & traces to)
+_tbox_pool = OntologyPool(create_ontology_tbox, ONTOLOGY_POOL_SIZE)
+# empty ontologies (to load reasoned data to)
+_result_pool = OntologyPool(_create_empty_ontology, ONTOLOGY_POOL_SIZE)
+
+
+def prepare_ontology_pools(count=None):
+    """Make pooled ontologies in advance (e.g. when a long-running server starts)"""
+    _tbox_pool.prefill(count)
+    _result_pool.prefill(count)
+
+
+def release_ontology(onto):
+    """Call when the ontology returned by `process_algtraces()` is not needed anymore"""
+    _result_pool.release(onto)
+
+
 def process_algtraces(trace_data_list, debug_rdf_fpath=None, verbose=1,
                       mistakes_as_objects=False, filter_by_level=False,
-                      _eval_max_traces=None) -> "onto, mistakes_list":
+                      _eval_max_traces=None, deadline=None) -> "onto, mistakes_list":
     """Write number of `algorithm - trace` pair to an ontology,
         perform extended reasoning and then extract and return the mistakes found.
+        `deadline`: `time.monotonic()` time to be done with the reasoning by, or `ReasoningTimeout` is raised.
     """
 
-    if verbose: ch = Checkpointer()
+    ch = StageCheckpointer(verbose=verbose)
+
+    onto = _tbox_pool.acquire() if USE_ONTOLOGY_POOL else create_ontology_tbox()
+
+    ch.hit("create ontology tbox", stage="tbox")
+
+    try:
+        result_rdf_bytes = _reason_about_algtraces(onto, trace_data_list, ch, debug_rdf_fpath, verbose, _eval_max_traces,
+                                                   deadline)
+    finally:
+        # Clear current ontology data
+        _tbox_pool.release(onto)
+
+    # read from byte stream
+    # use isolated worlds (keep concurrent threads in mind)
+    onto = _result_pool.acquire() if USE_ONTOLOGY_POOL else _create_empty_ontology()
+    # (a file in shared memory, or bytes)
+    result_file = result_rdf_bytes if hasattr(result_rdf_bytes, "read") else io.BytesIO(result_rdf_bytes)
+    try:
+        try:
+            onto = onto.load(
+                fileobj=result_file,
+                reload=True, only_local=True)
+        finally:
+            result_file.close()
+
+        ch.hit("reload reasoned ontology", stage="reload")
+
+        if debug_rdf_fpath:
+            onto.save(file=debug_rdf_fpath + "_ext.rdf", format='rdfxml')
+            print(f"Saved RDF file: {debug_rdf_fpath}_ext.rdf !")
 
-    onto = create_ontology_tbox()
+        ch.hit()
+        mistakes = extact_mistakes(onto, as_objects=mistakes_as_objects, filter_by_level=filter_by_level)
+        ch.hit("mistakes extracted", stage="mistakes")
+    except Exception:
+        release_ontology(onto)
+        raise
 
-    if verbose: ch.hit("create ontology tbox")
+    ch.commit()
+
+    return onto, list(mistakes.values())
+
+
+def _reason_about_algtraces(onto, trace_data_list, ch, debug_rdf_fpath, verbose, _eval_max_traces,
+                            deadline=None) -> bytes:
+    """Write algorithms & traces to the ontology (containing static definitions) and run Jena reasoning on it.
+    Returns reasoned RDF data (bytes or a file open for reading)."""
 
     # наполняем онтологию с нуля сущностями с теми именами, которые найдём в загруженных json-словарях
 
@@ -1663,43 +1741,208 @@ def process_algtraces(trace_data_list, debug_rdf_fpath=None, verbose=1,
                 if len(trace_data_list) == _eval_max_traces:
                     break
 
-    for tr_data in trace_data_list:
-        tt = TraceTester(tr_data)
-        tt.inject_to_ontology(onto)
-        if verbose: print(end=".")
+    # (taken before anything is written to the ontology)
+    schema = _resident_schema(onto) if RESIDENT_SCHEMA and not debug_rdf_fpath else None
 
-    if verbose: ch.hit("fill ontology data")
+    if REGISTER_ALGORITHMS and len(trace_data_list) == 1 and not debug_rdf_fpath:
+        result_rdf_bytes = _reason_with_registered_algorithm(onto, trace_data_list[0], ch, schema, deadline)
+        if result_rdf_bytes is not None:
+            return result_rdf_bytes
+        # else: send the whole ontology (it is filled already)
+    else:
+        ch.hit()
+        for tr_data in trace_data_list:
+            tt = TraceTester(tr_data)
+            tt.inject_to_ontology(onto, ch)
+            if verbose: print(end=".")
+
+        if verbose: print()  # end the line of dots
 
     if debug_rdf_fpath:
         onto.save(file=debug_rdf_fpath, format='rdfxml')
         print("Saved RDF file: {} !".format(debug_rdf_fpath))
 
+    if SHARED_MEMORY_HANDOFF and len(trace_data_list) >= SHARED_MEMORY_MIN_TRACES:
+        handoff = handoff_files()
+        if handoff:
+            return _reason_with_files(onto, schema, ch, *handoff, deadline=deadline)
+
     # invoke through jenaService:
     # save ontology to buffer in memory
     # TODO: check if NTRIPLES will be processed faster!
+    ch.hit()
     stream = io.BytesIO()
-    onto.save(file=stream, format='rdfxml')
-    result_rdf_bytes = invoke_jena_reasoning_service(rdfData=stream.getvalue())
+    _save_data(onto, stream, schema)
+    ch.hit("serialize ontology", stage="serialization")
 
-    # Clear current ontology data
-    delete_ontology(onto)
+    jena_timings = {}
+    result_rdf_bytes = _with_schema(schema, ch, lambda version: invoke_jena_reasoning_service(
+        rdfData=stream.getvalue(), timings=jena_timings, schema_version=version, deadline=deadline))
+    _account_jena_timings(ch, jena_timings)
 
-    # read from byte stream
-    # use isolated worlds (keep concurrent threads in mind)
-    onto = get_isolated_ontology(ONTOLOGY_IRI).load(
-        fileobj=io.BytesIO(result_rdf_bytes),
-        reload=True, only_local=True)
+    return result_rdf_bytes
 
-    if debug_rdf_fpath:
-        onto.save(file=debug_rdf_fpath + "_ext.rdf", format='rdfxml')
-        print(f"Saved RDF file: {debug_rdf_fpath}_ext.rdf !")
 
-    if verbose: ch.hit("reasoning completed")
+def _save_data(onto, file, schema=None):
+    """Save the ontology as RDF/XML, without static definitions if `schema` (loaded to the service) is given"""
+    if schema is None:
+        onto.save(file=file, format='rdfxml')
+    else:
+        onto.save(file=file, format='rdfxml', filter=lambda graph, *triple: triple not in schema.triples)
 
-    mistakes = extact_mistakes(onto, as_objects=mistakes_as_objects, filter_by_level=filter_by_level)
-    if verbose: ch.hit("mistakes extracted")
 
-    return onto, list(mistakes.values())
+def _reason_with_files(onto, schema, ch, payload_path, result_path, deadline=None):
+    """Run Jena reasoning on the ontology passed through a file in shared memory,
+    the service writes reasoned data to another file there: no copies of the data in the connection & buffers.
+    Returns the result file open for reading (removed already: the data is freed when the file is closed)."""
+    try:
+        ch.hit()
+        with open(payload_path, 'wb') as file:
+            _save_data(onto, file, schema)
+        ch.hit("serialize ontology", stage="serialization")
+
+        jena_timings = {}
+        done = _with_schema(schema, ch, lambda version: invoke_jena_reasoning_with_files(
+            payload_path, result_path, timings=jena_timings, schema_version=version, deadline=deadline))
+        _account_jena_timings(ch, jena_timings)
+        return open(result_path, 'rb') if done else None
+    finally:
+        for path in (payload_path, result_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _account_jena_timings(ch, jena_timings: dict):
+    roundtrip = ch.hit("jena round trip", stage="jena_roundtrip")
+    if jena_timings:
+        for stage, seconds in jena_timings.items():
+            ch.add("jena." + stage, seconds)
+        if "total" in jena_timings:
+            # time spent on transport & (de)serialization of thrift messages
+            ch.add("jena.transport", max(0.0, roundtrip - jena_timings["total"]))
+
+
+class _Schema:
+    """Static definitions of an ontology's world, as triples (storids are world-specific) and as N-Triples"""
+    __slots__ = ('triples', 'data', 'version')
+
+    def __init__(self, onto):
+        self.triples = set(onto.graph._iter_triples())
+        stream = io.BytesIO()
+        onto.save(file=stream, format='ntriples')
+        self.data = stream.getvalue()
+        # (the version Jena service gives to the schema)
+        self.version = hashlib.sha256(self.data).hexdigest()
+
+
+_schemas = WeakKeyDictionary()  # ontology with static definitions only -> _Schema
+_loaded_schema_versions = set()  # loaded to Jena service
+_schemas_lock = Lock()
+
+
+def _resident_schema(onto) -> _Schema:
+    """Static definitions of the ontology (that must contain nothing else) to keep on Jena service,
+    or None if the service cannot keep them (the data of the request is then sent along with them)"""
+    with _schemas_lock:
+        schema = _schemas.get(onto)
+    if schema is None:
+        schema = _Schema(onto)
+        with _schemas_lock:
+            _schemas[onto] = schema
+    with _schemas_lock:
+        if schema.version in _loaded_schema_versions:
+            return schema
+    version = load_schema(schema.data)
+    if version is None:
+        return None  # (the service is not available; the error is reported already)
+    if version != schema.version:
+        print("Jena service gives unexpected schema version %s instead of %s, the schema is sent with the data."
+              % (version, schema.version))
+        return None
+    with _schemas_lock:
+        _loaded_schema_versions.add(version)
+    return schema
+
+
+def _with_schema(schema, ch, func):
+    """`func(schema version)`, loading the schema again if Jena service has forgotten it (e.g. restarted)"""
+    if schema is None:
+        return func(None)
+    try:
+        return func(schema.version)
+    except UnknownSchema:
+        with _schemas_lock:
+            _loaded_schema_versions.discard(schema.version)
+        ch.hit()
+        load_schema(schema.data)
+        with _schemas_lock:
+            _loaded_schema_versions.add(schema.version)
+        ch.hit("load schema", stage="jena_registration")
+        return func(schema.version)
+
+
+# (digest of algorithm JSON, algorithm name, schema version) -> handle of the algorithm registered on Jena service
+# (the name is written to the algorithm triples); least recently used first
+_algorithm_handles = OrderedDict()
+_algorithm_handles_lock = Lock()
+
+
+def _reason_with_registered_algorithm(onto, tr_data, ch, schema=None, deadline=None) -> bytes:
+    """Write the algorithm & the trace to the ontology (containing static definitions) and run Jena reasoning
+    on the trace triples only, together with the algorithm registered on the service (registering it if required).
+    The algorithm is registered without static definitions if `schema` (loaded to the service) is given.
+    Returns reasoned RDF data, or None if the algorithm cannot be registered."""
+    digest = (algorithm_digest(tr_data["algorithm"]), tr_data["algorithm_name"], schema and schema.version)
+
+    ch.hit()
+    tt = TraceTester(tr_data)
+    tt.inject_algorithm_to_ontology(onto)
+    ch.hit(stage="alg_injection")
+    # (schema & algorithm)
+    algorithm_triples = set(onto.graph._iter_triples())
+    tt.inject_acts_to_ontology(onto, ch)
+
+    ch.hit()
+    stream = io.BytesIO()
+    onto.save(file=stream, format='ntriples', filter=lambda graph, *triple: triple not in algorithm_triples)
+    trace_data = stream.getvalue()
+    ch.hit("serialize trace", stage="serialization")
+
+    for _ in range(2):  # loop to register again if the service has forgotten the algorithm
+        with _algorithm_handles_lock:
+            handle = _algorithm_handles.get(digest)
+            if handle is not None:
+                _algorithm_handles.move_to_end(digest)
+        if handle is None:
+            stream = io.BytesIO()
+            if schema is None:
+                onto.save(file=stream, format='ntriples', filter=lambda graph, *triple: triple in algorithm_triples)
+            else:
+                onto.save(file=stream, format='ntriples', filter=lambda graph, *triple:
+                          triple in algorithm_triples and triple not in schema.triples)
+            ch.hit("serialize algorithm", stage="serialization")
+            handle = _with_schema(schema, ch, lambda version: register_algorithm(
+                stream.getvalue(), schema_version=version, deadline=deadline))
+            ch.hit("register algorithm", stage="jena_registration")
+            if handle is None:
+                return None
+            with _algorithm_handles_lock:
+                _algorithm_handles[digest] = handle
+                while len(_algorithm_handles) > ALGORITHM_HANDLES_SIZE:
+                    _algorithm_handles.popitem(last=False)
+
+        jena_timings = {}
+        try:
+            result_rdf_bytes = invoke_jena_reasoning_with_algorithm(handle, trace_data, timings=jena_timings,
+                                                                    deadline=deadline)
+        except UnknownAlgorithm:
+            with _algorithm_handles_lock:
+                _algorithm_handles.pop(digest, None)
+            continue
+        _account_jena_timings(ch, jena_timings)
+        return result_rdf_bytes
+
+    return None
 
 
 def clear_ontology(onto, keep_tbox=False):
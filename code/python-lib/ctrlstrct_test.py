@@ -8,23 +8,41 @@ during step-by-step construction of given algorithm's execution trace.
 """
 
 import atexit
+import copy
+import hashlib
 import json
 import os
+import time
+from concurrent.futures import Future, TimeoutError
 from glob import glob
 from pathlib import Path
+from threading import Lock
 
+import admission
 import external_run
 import trace_gen.styling
-from ctrlstrct_run import process_algtraces
-from onto_helpers import delete_ontology
-from trace_gen.json2alg2tr import act_line_for_alg_element
+from alg_model import AlgorithmModel, algorithm_digest
+from ctrlstrct_run import process_algtraces, release_ontology
+from external_run import ReasoningTimeout
+from metrics import METRICS
+from trace_automaton import TraceAutomaton
+from trace_gen.json2alg2tr import act_line_for_alg_element, render_context
 from trace_gen.dict_helpers import get_ith_expr_value, find_by_keyval_in
 
 
-def process_algorithm_and_trace_from_json(alg_tr: dict):
+TRACE_AUTOMATON_FAST_PATH = True  # set False to check every trace with the rules (e.g. to compare)
+# set False to reason about identical concurrent requests separately (e.g. to compare)
+COALESCE_IDENTICAL_REQUESTS = True
+
+_in_flight = {}  # (lane, request digest) -> Future of (result, traces) of the request being processed
+_in_flight_lock = Lock()
+
+
+def process_algorithm_and_trace_from_json(alg_tr: dict, deadline=None):
     """
     Demonstration entry point.
     :param alg_tr: a dict with at least keys "trace", "algorithm"
+    :param deadline: `time.monotonic()` time to give up reasoning at (raises `ReasoningTimeout`)
     :return: feedback{"messages": [...], "mistakes": [...]}
     """
     feedback = {"messages": []}
@@ -67,7 +85,7 @@ def process_algorithm_and_trace_from_json(alg_tr: dict):
         return feedback
 
     # call it
-    mistakes, err_msg = process_algorithms_and_traces(alg_trs)
+    mistakes, err_msg = process_algorithms_and_traces(alg_trs, deadline=deadline)
 
     if err_msg:
         feedback["messages"] += [err_msg]
@@ -78,10 +96,37 @@ def process_algorithm_and_trace_from_json(alg_tr: dict):
     return feedback
 
 
+def evaluate_act(alg_tr: dict, algorithm_element_id: int, act_type: str, user_language=None, deadline=None):
+    """
+    A click in GUI: add the act to the trace (as `make_act_json()` does) and check the new trace.
+    :param alg_tr: a dict with keys "trace_name", "algorithm_name", "algorithm" and "trace" (existing acts),
+        optionally "header_boolean_chain"
+    :param deadline: `time.monotonic()` time to give up reasoning at (raises `ReasoningTimeout`)
+    :return: feedback{"messages": [...], "mistakes": [...], "trace": [...]}, acts marked as valid or not
+        (string with error description if the act cannot be made)
+    """
+    new_trace = make_act_json(alg_tr["algorithm"], algorithm_element_id, act_type, alg_tr["trace"],
+                              user_language=user_language)
+    if isinstance(new_trace, str):
+        return new_trace
+
+    feedback = {"messages": []}
+    alg_tr = dict({"header_boolean_chain": None, **alg_tr}, trace=new_trace)
+    mistakes, err_msg = process_algorithms_and_traces([alg_tr], write_mistakes_to_acts=True, deadline=deadline)
+    if err_msg:
+        feedback["messages"] += [err_msg]
+    else:
+        feedback["messages"] += ["Processing of algorithm & trace finished OK."]
+        feedback["mistakes"] = mistakes
+    feedback["trace"] = new_trace
+    return feedback
+
+
 def make_act_json(algorithm_json, algorithm_element_id: int, act_type: str, existing_trace_json,
-                  user_language=None) -> list:
+                  user_language=None, context=None) -> list:
     """
     `act_type`: 'started' or 'finished' for complex, 'performed' for simple statements.
+    `context`: RenderContext of act lines (a new one is made for `user_language` if not given).
     Returns full supplemented trace: list of dicts, each dict represents act object.
     (Returns string with error description if an exception occurred)
     """
@@ -90,29 +135,30 @@ def make_act_json(algorithm_json, algorithm_element_id: int, act_type: str, exis
     existing_trace_list = [act for act in existing_trace_json if act["is_valid"] == True]
 
     try:
-        elem = algorithm_json["id2obj"].get(algorithm_element_id,
-                                            algorithm_json["id2obj"].get(str(algorithm_element_id)))
+        context = render_context(context, user_language)
+        model = AlgorithmModel.of(algorithm_json)
+        node = model.node(algorithm_element_id)
 
-        assert elem, f"No element with id={algorithm_element_id} in given algorithm."
+        assert node, f"No element with id={algorithm_element_id} in given algorithm."
+        elem = node.data
 
         max_id = max(a['id'] for a in existing_trace_list) if existing_trace_list else 100 - 1
 
         result_acts = []
         # make line "program began" first
-        if len(existing_trace_list) == 0 and elem['id'] != algorithm_json["entry_point"]['id']:
+        if len(existing_trace_list) == 0 and node is not model.entry:
             # создать строку "program began"
             act_text = act_line_for_alg_element(algorithm_json, phase='started',
-                                                lang=user_language, )  # передаём сам корень алгоритма, так как его type=='algorithm',
+                                                context=context, )  # передаём сам корень алгоритма, так как его type=='algorithm',
             max_id += 1
-            html_tags = trace_gen.styling.prepare_tags_for_line(act_text)
             result_acts.append({
-                'executes': algorithm_json["entry_point"]['id'],
+                'executes': model.entry.id,
                 # ! а привязываем к глобальному коду (или функции main)
-                'name': algorithm_json["entry_point"]['name'],
+                'name': model.entry.name,
                 'phase': 'started',
                 'as_string': act_text,
                 # 'as_tags': html_tags,
-                'as_html': trace_gen.styling.to_html(html_tags),
+                'as_html': trace_gen.styling.line_to_html(act_text),
                 'id': max_id,
                 'n': 1,
                 'is_valid': True  # в начале трассы акт всегда такой
@@ -138,19 +184,18 @@ def make_act_json(algorithm_json, algorithm_element_id: int, act_type: str, exis
         act_text = act_line_for_alg_element(
             elem,
             phase=act_type,
-            lang=user_language,
+            context=context,
             expr_value=expr_value,
             use_exec_time=exec_time,
         )
         max_id += 1
-        html_tags = trace_gen.styling.prepare_tags_for_line(act_text)
         act_json = {
             'executes': elem['id'],
             'name': elem['name'],
             'phase': act_type,
             'as_string': act_text,
             # 'as_tags': html_tags,
-            'as_html': trace_gen.styling.to_html(html_tags),
+            'as_html': trace_gen.styling.line_to_html(act_text),
             'id': max_id,
             'n': exec_time,
             'is_valid': None,  # пока нет информации о корректности такого акта
@@ -167,47 +212,61 @@ def make_act_json(algorithm_json, algorithm_element_id: int, act_type: str, exis
         return f"Server error in make_act_json() - {type(e).__name__}:\n\t{str(e)}"
 
 
-def add_styling_to_trace(algorithm_json, trace_json, user_language=None, comment_style=None, add_tags=False) -> list:
+def add_styling_to_trace(algorithm_json, trace_json, user_language=None, comment_style=None, add_tags=False,
+                         context=None) -> list:
     """Adds text line, tags and html form for each act in given trace and returns the same reference to the trace list.
     `comment_style`: {None | 'use' | 'highlight'}
+    `context`: RenderContext of act lines (a new one is made for `user_language` if not given).
     """
     try:
         assert isinstance(trace_json, (list, tuple)), "The trace was not correctly constructed: " + str(trace_json)
+        context = render_context(context, user_language)
+
+        model = AlgorithmModel.of(algorithm_json)
 
         for act_dict in trace_json:
 
             algorithm_element_id = act_dict['executes']
-            elem = algorithm_json["id2obj"].get(algorithm_element_id,
-                                                algorithm_json["id2obj"].get(str(algorithm_element_id), None))
+            node = model.node(algorithm_element_id)
 
-            assert elem, f"No element with id={algorithm_element_id} in given algorithm."
+            assert node, f"No element with id={algorithm_element_id} in given algorithm."
 
-            if elem['id'] == algorithm_json["entry_point"]['id']:
+            if node is model.entry:
                 # to make "program began" line: pass the root
                 elem = algorithm_json
+            else:
+                elem = node.data
 
             act_text = act_line_for_alg_element(
                 elem,
                 phase=act_dict['phase'],
-                lang=user_language,
+                context=context,
                 expr_value=act_dict.get('value', None),
                 use_exec_time=int(act_dict['n']),
             )
             if 'comment' in act_dict and act_dict['comment'] and comment_style is not None:
                 act_text += "    // " + act_dict['comment']
 
-            html_tags = trace_gen.styling.prepare_tags_for_line(act_text)
+            highlight = 'comment' in act_dict and act_dict['comment'] and comment_style == 'highlight'
 
-            if 'comment' in act_dict and act_dict['comment'] and comment_style == 'highlight':
-                html_tags = {
-                    "tag": "span",
-                    "attributes": {"class": ["warning"]},
-                    "content": html_tags
-                }
+            if add_tags:
+                # html as tags is made on request only
+                html_tags = trace_gen.styling.prepare_tags_for_line(act_text)
+                if highlight:
+                    html_tags = {
+                        "tag": "span",
+                        "attributes": {"class": ["warning"]},
+                        "content": html_tags
+                    }
+                as_html = trace_gen.styling.to_html(html_tags)
+            else:
+                as_html = trace_gen.styling.line_to_html(act_text)
+                if highlight:
+                    as_html = '<span class="warning">%s</span>' % as_html
 
             add_json = {
                 'as_string': act_text,
-                'as_html': trace_gen.styling.to_html(html_tags),
+                'as_html': as_html,
             }
             act_dict.update(add_json)
             if add_tags:
@@ -222,11 +281,132 @@ def add_styling_to_trace(algorithm_json, trace_json, user_language=None, comment
         return f"Server error in add_styling_to_trace() - {type(e).__name__}:\n\t{str(e)}"
 
 
-def process_algorithms_and_traces(alg_trs_list: list, write_mistakes_to_acts=False) -> (
+def close_trace(algorithm: dict, mutable_trace: list, algorithm_element_id: int):
+    """Append the "program ended" act (end of the given element) to the trace, in-place"""
+    appended_trace = make_act_json(algorithm_json=algorithm, algorithm_element_id=algorithm_element_id,
+                                  act_type="finished", existing_trace_json=mutable_trace[:],
+                                  user_language=None)
+
+    assert len(appended_trace) >= 2, appended_trace
+    new_last_line = appended_trace[-1]
+
+    # создать строку "program ended"
+    act_text = act_line_for_alg_element(algorithm, phase='finished',
+                                        lang=None, )  # передаём сам корень алгоритма, так как его type=='algorithm',
+    # обновить в строке трассы, т.к. по умолчанию генерируется 'следование global_code закончилось 1-й раз'
+    new_last_line["as_string"] = act_text
+    new_last_line['as_html'] = trace_gen.styling.line_to_html(act_text)
+
+    mutable_trace.append(new_last_line)
+
+
+def mark_correct_acts(alg_trs_list: list):
+    """Set is_valid = True to acts not marked as mistaken, and is_final = True to the end of the topmost statement"""
+    trace = alg_trs_list[0]['trace']
+
+    # Apply correctness mark to other acts:  act_obj["is_valid"] = True
+    for act_obj in trace:
+        if act_obj["is_valid"] is None:
+            act_obj["is_valid"] = True
+
+    # Признак окончания трассы
+    # set act_obj["is_final"] = True for end of the topmost statement
+    top_stmts = set()
+    for alg_tr in alg_trs_list:
+        top_stmts.add(AlgorithmModel.of(alg_tr["algorithm"]).entry.children[-1].id)
+    assert top_stmts, top_stmts
+
+    for act_obj in trace:
+        if (act_obj["is_valid"] == True
+                and act_obj["phase"] in ('finished', "performed")
+                and act_obj["executes"] in top_stmts):
+            act_obj["is_final"] = True
+
+
+def check_correct_trace(alg_tr: dict) -> bool:
+    """Fast path: if the trace is a correct one (so far), close it when needed and return True;
+    False means the trace is to be checked by the rules"""
+    automaton = TraceAutomaton.of(alg_tr["algorithm"])
+    if automaton is None:
+        return False
+    with METRICS.timer("trace_automaton"):
+        check = automaton.check(alg_tr["trace"])
+    if not check.valid:
+        return False
+    if check.next_act == (automaton.entry_id, "finished"):
+        # the topmost statement has ended => finish the trace.
+        print('correct trace is ending, closing the trace.')
+        close_trace(alg_tr["algorithm"], alg_tr["trace"], automaton.entry_id)
+    return True
+
+
+def process_algorithms_and_traces(alg_trs_list: list, write_mistakes_to_acts=False, deadline=None) -> (
         'mistakes: list[str]', 'error_message: str or None'):
     try:
-        onto, mistakes = process_algtraces(alg_trs_list, verbose=0, mistakes_as_objects=False)
+        if TRACE_AUTOMATON_FAST_PATH and len(alg_trs_list) == 1 and check_correct_trace(alg_trs_list[0]):
+            # no mistakes, nothing to reason about
+            if write_mistakes_to_acts:
+                mark_correct_acts(alg_trs_list)
+            return [], None
+
+        if COALESCE_IDENTICAL_REQUESTS:
+            return _process_coalesced(alg_trs_list, write_mistakes_to_acts, deadline)
+        return _process_with_reasoning(alg_trs_list, write_mistakes_to_acts, deadline)
+    except Exception as e:
+        msg = "Exception occured in process_algorithms_and_traces(): %s: %s" % (str(type(e)), str(e))
+        raise e
+        print(msg)
+        return [], msg
+
 
+def request_digest(alg_trs_list: list, write_mistakes_to_acts=False) -> str:
+    """Hash of the content of a `process_algorithms_and_traces()` request (algorithms by `algorithm_digest()`)"""
+    data = [dict(alg_tr, algorithm=algorithm_digest(alg_tr["algorithm"])) for alg_tr in alg_trs_list]
+    data = json.dumps([data, write_mistakes_to_acts], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _process_coalesced(alg_trs_list: list, write_mistakes_to_acts, deadline):
+    """Single flight: the first of identical concurrent requests (of the same admission lane) is processed,
+    the others wait for it and get copies of its results (the mistakes and the traces, as updated in place)"""
+    # (an interactive request is not to wait for a batch one)
+    key = (admission.current_lane(), request_digest(alg_trs_list, write_mistakes_to_acts))
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+
+    if leader:
+        try:
+            result = _process_with_reasoning(alg_trs_list, write_mistakes_to_acts, deadline)
+            future.set_result((copy.deepcopy(result), copy.deepcopy([alg_tr["trace"] for alg_tr in alg_trs_list])))
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                del _in_flight[key]
+
+    with METRICS.timer("coalesced_wait"):
+        try:
+            result, traces = future.result(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            raise ReasoningTimeout("Deadline expired while waiting for the same request")
+        except (ReasoningTimeout, admission.Busy):
+            # the deadline of the first request has passed (not ours), or it was not admitted: try on our own
+            return _process_with_reasoning(alg_trs_list, write_mistakes_to_acts, deadline)
+    for alg_tr, trace in zip(alg_trs_list, traces):
+        alg_tr["trace"][:] = copy.deepcopy(trace)
+    return copy.deepcopy(result)
+
+
+def _process_with_reasoning(alg_trs_list: list, write_mistakes_to_acts, deadline) -> (
+        'mistakes: list[str]', 'error_message: str or None'):
+    onto, mistakes = process_algtraces(alg_trs_list, verbose=0, mistakes_as_objects=False, deadline=deadline)
+
+    try:
         if not mistakes and len(alg_trs_list) == 1:
             # try to find automatically polyfilled acts & insert them into the trace
             # apply the simplest behaviour: skipped acts will be inserted to the previous-to-the-last position.
@@ -264,8 +444,7 @@ def process_algorithms_and_traces(alg_trs_list: list, write_mistakes_to_acts=Fal
                 print('finish_trace_act found, closing the trace.')
                 act = finish_trace_acts[0]
 
-                algorithm = alg_trs_list[0]["algorithm"]
-                # to be modified in-place (new acts will be inserted to prev. to the last)
+                # to be modified in-place (the new act will be appended)
                 mutable_trace = alg_trs_list[0]["trace"]
 
                 bound = act.executes
@@ -275,90 +454,51 @@ def process_algorithms_and_traces(alg_trs_list: list, write_mistakes_to_acts=Fal
                 st = end_of_trace_bound.boundary_of
                 assert st
 
-                algorithm_element_id = st.id
-                act_type = "finished"
-
-                appended_trace = make_act_json(algorithm_json=algorithm, algorithm_element_id=algorithm_element_id,
-                                              act_type=act_type, existing_trace_json=mutable_trace[:],
-                                              user_language=None)
-
-                assert len(appended_trace) >= 2, appended_trace
-                new_last_line = appended_trace[-1]
-
-                # создать строку "program ended"
-                act_text = act_line_for_alg_element(algorithm, phase='finished',
-                                                    lang=None, )  # передаём сам корень алгоритма, так как его type=='algorithm',
-                # обновить в строке трассы, т.к. по умолчанию генерируется 'следование global_code закончилось 1-й раз'
-                new_last_line["as_string"] = act_text
-                html_tags = trace_gen.styling.prepare_tags_for_line(act_text)
-                new_last_line['as_html'] = trace_gen.styling.to_html(html_tags)
-
-                mutable_trace.append(new_last_line)
-                ### print("+=+ inserted closing act:", new_last_line["as_string"])
-
-        delete_ontology(onto)
-
-        if write_mistakes_to_acts and len(alg_trs_list) != 1:
-            print("** Warning!: write_mistakes_to_acts is inapplicable when traces count =", len(alg_trs_list), "(!=1)")
-        if write_mistakes_to_acts and len(alg_trs_list) == 1:
-            # ошибки нужны, и сейчас не режим тестирования
-            trace = alg_trs_list[0]['trace']
-            for mistake in mistakes:
-                act_id = mistake["id"][0]
-                for act_obj in list(find_by_keyval_in("id", act_id, trace)):
-                    new_explanations = act_obj.get("explanations", []) + mistake["explanations"]
-                    act_obj["explanations"] = sorted(set(new_explanations))
-                    if not act_obj["explanations"]:  # был пустой список - запишем хоть что-то
-                        act_obj["explanations"] = ["Ошибка обнаружена, но вид ошибки не определён."]
-                    act_obj["mistakes"] = mistake
-                    act_obj["is_valid"] = False
-                    if 'value' in act_obj:
-                        print(" ***** Reset expr evaluation value.")
-                        act_obj["value"] = "not evaluated"
-                        # del act_obj["value"]
-                        alg_data = alg_trs_list[0]['algorithm']
-                        # rewrite this act
-                        add_styling_to_trace(alg_data, [act_obj])
-                # break
-
-            # Apply correctness mark to other acts:  act_obj["is_valid"] = True
-            for act_obj in trace:
-                if act_obj["is_valid"] is None:
-                    act_obj["is_valid"] = True
-
-            # Признак окончания трассы
-            # set act_obj["is_final"] = True for end of the topmost statement
-            top_stmts = set()
-            for alg_obj in find_by_keyval_in("type", "algorithm", alg_trs_list):
-                top_stmts.add(alg_obj["entry_point"]["body"][-1]["id"])
-            assert top_stmts, top_stmts
-
-            for act_obj in trace:
-                if (act_obj["is_valid"] == True
-                        and act_obj["phase"] in ('finished', "performed")
-                        and act_obj["executes"] in top_stmts):
-                    act_obj["is_final"] = True
-
-        return mistakes, None
-    except Exception as e:
-        msg = "Exception occured in process_algorithms_and_traces(): %s: %s" % (str(type(e)), str(e))
-        raise e
-        print(msg)
-        return [], msg
+                close_trace(alg_trs_list[0]["algorithm"], mutable_trace, st.id)
+    finally:
+        release_ontology(onto)  # (the pooled world is returned on errors too)
+
+    if write_mistakes_to_acts and len(alg_trs_list) != 1:
+        print("** Warning!: write_mistakes_to_acts is inapplicable when traces count =", len(alg_trs_list), "(!=1)")
+    if write_mistakes_to_acts and len(alg_trs_list) == 1:
+        # ошибки нужны, и сейчас не режим тестирования
+        trace = alg_trs_list[0]['trace']
+        for mistake in mistakes:
+            act_id = mistake["id"][0]
+            for act_obj in list(find_by_keyval_in("id", act_id, trace)):
+                new_explanations = act_obj.get("explanations", []) + mistake["explanations"]
+                act_obj["explanations"] = sorted(set(new_explanations))
+                if not act_obj["explanations"]:  # был пустой список - запишем хоть что-то
+                    act_obj["explanations"] = ["Ошибка обнаружена, но вид ошибки не определён."]
+                act_obj["mistakes"] = mistake
+                act_obj["is_valid"] = False
+                if 'value' in act_obj:
+                    print(" ***** Reset expr evaluation value.")
+                    act_obj["value"] = "not evaluated"
+                    # del act_obj["value"]
+                    alg_data = alg_trs_list[0]['algorithm']
+                    # rewrite this act
+                    add_styling_to_trace(alg_data, [act_obj])
+            # break
+
+        mark_correct_acts(alg_trs_list)
+
+    return mistakes, None
 
 
 def run_tests(input_directory="./data/", output_directory="./results/"):
     test_results = {}
     try:
-        for file in glob(os.path.join(input_directory, '*.json')):
-            path = Path(file)
-            print("processing test:", path.name)
-            with open(path) as f:
-                input_data = json.load(f)
+        with admission.lane(admission.BATCH):  # (interactive calls to the service of this process go first)
+            for file in glob(os.path.join(input_directory, '*.json')):
+                path = Path(file)
+                print("processing test:", path.name)
+                with open(path) as f:
+                    input_data = json.load(f)
 
-            results = process_algorithm_and_trace_from_json(input_data)
+                results = process_algorithm_and_trace_from_json(input_data)
 
-            test_results[path.stem] = results
+                test_results[path.stem] = results
 
     except Exception as e:
         print()
@@ -2,10 +2,12 @@
 
 """Format localized explanations for erroneous acts found classified as such by reasoner"""
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from configparser import ConfigParser, Interpolation
 from pathlib import Path
 import re
+import string
+from threading import Lock
 
 from common_helpers import camelcase_to_snakecase
 
@@ -23,8 +25,12 @@ PROPERTIES_LOCALIZATION_FILES = {
     'ru': r'../locales/control-flow-messages_ru.properties',
 }
 PROPERTIES_COMMON_PREFIX = 'ctrlflow_'
-# LOCALE_KEY_MARK = "!{locale:"
+LOCALE_KEY_MARK = "!{locale:"
 LOCALE_KEY_RE = re.compile("!{locale:(.+?)}")
+FIRST_LETTER_RE = re.compile(r'\w')
+
+COMPILED_MESSAGES = True  # set False to format explanations from plain strings every time (e.g. to compare)
+EXPLANATION_CACHE_SIZE = 4096  # formatted explanations kept between requests (0 to disable)
 
 
 class LocalizationProvider:
@@ -47,8 +53,18 @@ class LocalizationProvider:
         path = self.loc2path[lang]
         data = read_properties_file(path, cut_key_prefix=PROPERTIES_COMMON_PREFIX)
 
+        # compile the messages in advance
+        for format_str in data.values():
+            MessageTemplate.of(format_str)
+
         self.loaded[lang] = data
 
+    def preload(self, langs=None):
+        """Load & compile all (or given) languages now rather than on first use"""
+        for lang in langs or self.loc2path:
+            if lang not in self.loaded:
+                self.load_lang(lang)
+
 
 locale = LocalizationProvider(PROPERTIES_LOCALIZATION_FILES)
 
@@ -84,9 +100,68 @@ def class_name_to_readable(s):
     return res
 
 
-def format_explanation(current_onto, act_instance, _auto_register=True) -> list:
+class ExplanationCache:
+    """LRU cache of formatted explanations: (error class, language, placeholders) -> explanation dict.
+    The same mistakes of the same exercise recur for many students.
+    `size`: max number of explanations kept; by default, `EXPLANATION_CACHE_SIZE` as it is at the time of use."""
+    def __init__(self, size=None):
+        self._size = size
+        self._lock = Lock()
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return EXPLANATION_CACHE_SIZE if self._size is None else self._size
+
+    @staticmethod
+    def make_key(class_name: str, lang: str, params: dict) -> tuple:
+        return class_name, lang, tuple(sorted(params.items()))
+
+    def get(self, key):
+        if self.size <= 0:
+            return None
+        with self._lock:
+            explanation = self._items.get(key)
+            if explanation is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return explanation
+
+    def put(self, key, explanation: dict):
+        size = self.size
+        with self._lock:
+            if size > 0:
+                self._items[key] = explanation
+            while len(self._items) > max(size, 0):
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "size": len(self._items),
+            }
+
+
+EXPLANATIONS = ExplanationCache()
+
+
+def format_explanation(current_onto, act_instance, _auto_register=True, fields: 'FieldIndex' = None) -> list:
     """Format explanations about any error types attached to the act_instance
     by extracting required info from the ontology and filling in the template.
+    `fields`: `FieldIndex(current_onto)`, to be shared by all acts of the ontology.
     """
 
     onto = current_onto
@@ -94,22 +169,29 @@ def format_explanation(current_onto, act_instance, _auto_register=True) -> list:
     error_classes = set(act_instance.is_a) & set(onto.Erroneous.descendants())
     error_classes = get_leaf_classes(error_classes)
     result = []
+    params = None
+    lang = get_target_lang()
 
     for error_class in error_classes:
         class_name = error_class.name
-        format_str = locale.get(class_name, get_target_lang(), None) or locale.get(class_name, "en", '__')
+        format_str = locale.get(class_name, lang, None) or locale.get(class_name, "en", '__')
         if format_str:
-            params = named_fields_param_provider(act_instance)
-            expl = format_by_spec(
-                format_str,
-                **params
-            )
-            class_name_readable = class_name_to_readable(class_name)
-            explanation = {
-                "names": class_name_readable,
-                "explanation": expl,
-            }
-            result.append(explanation)
+            if params is None:
+                params = named_fields_param_provider(act_instance, fields)
+            key = EXPLANATIONS.make_key(class_name, lang, params)
+            explanation = EXPLANATIONS.get(key)
+            if explanation is None:
+                expl = format_by_spec(
+                    format_str,
+                    **params
+                )
+                class_name_readable = class_name_to_readable(class_name)
+                explanation = {
+                    "names": class_name_readable,
+                    "explanation": expl,
+                }
+                EXPLANATIONS.put(key, explanation)
+            result.append(dict(explanation))  # (a copy: the caller may change it)
             ###
             print("++ done: explanation for: ", class_name)
         else:
@@ -121,28 +203,141 @@ def format_explanation(current_onto, act_instance, _auto_register=True) -> list:
 def capitalize_first_letter(s: str) -> str:
     """Bring first letter (skipping leading spaces and punctuation) to upper case"""
     # replace first letter ever if 's' starts with quote ('"')
-    return re.subn(r'\w', lambda m:m[0].upper(), s, count=1)[0]  # take [0] from (str, count_replaced)
+    return FIRST_LETTER_RE.subn(lambda m:m[0].upper(), s, count=1)[0]  # take [0] from (str, count_replaced)
 
 
-def format_by_spec(format_str: str, **params: dict):
-    """Simple replace with `str.format` & add closing dot if needed"""
-    format_str = format_str.format(**params)
-
-    if not format_str.endswith('.') and not format_str.endswith('?'):
-        format_str += '.'
-
-    return capitalize_first_letter(format_str)
+def add_closing_dot(s: str) -> str:
+    if not s.endswith('.') and not s.endswith('?'):
+        s += '.'
+    return s
 
 
-def named_fields_param_provider(a: 'act_instance', **options):
-    """extract ALL field_* facts, no matter what law they belong to."""
+def format_by_spec(format_str: str, **params: dict):
+    """Simple replace with `str.format` & add closing dot if needed"""
+    if COMPILED_MESSAGES:
+        template = MessageTemplate.of(format_str)
+        if template:
+            return template.format(params)
 
-    onto = a.namespace
-    # for lookup
-    begin_of = onto.begin_of
-    end_of   = onto.end_of
-    halt_of  = onto.halt_of
-    atom_action = onto.atom_action
+    format_str = format_str.format(**params)
+    return capitalize_first_letter(add_closing_dot(format_str))
+
+
+class MessageTemplate:
+    """Explanation format string parsed once: made positional, with the first letter capitalized
+    and the closing dot added in advance where it does not depend on values of fields.
+    `format(params)` gives the same as `format_by_spec(format_str, **params)`."""
+    __slots__ = ('positional', 'fields', 'capitalize', 'add_dot')
+
+    _compiled = {}  # format_str -> MessageTemplate or None (if cannot be compiled)
+    _formatter = string.Formatter()
+
+    def __init__(self, format_str: str):
+        self.fields = []
+        literals = ['']  # text before each field and after the last one
+        for literal, field, spec, conversion in self._formatter.parse(format_str):
+            literals[-1] += literal
+            if field is not None:
+                if not field or field.isdigit() or '.' in field or '[' in field or spec or conversion:
+                    raise ValueError("Unsupported field: {%s}" % field)
+                self.fields.append(field)
+                literals.append('')
+
+        # the first letter is in leading text (before fields) or in the first field value
+        self.capitalize = not FIRST_LETTER_RE.search(literals[0])
+        if not self.capitalize:
+            literals[0] = capitalize_first_letter(literals[0])
+        # the end is trailing text or the last field value
+        self.add_dot = not literals[-1]
+        if not self.add_dot:
+            literals[-1] = add_closing_dot(literals[-1])
+
+        escaped = [literal.replace('{', '{{').replace('}', '}}') for literal in literals]
+        self.positional = ''.join(text + ('{%d}' % i if i < len(self.fields) else '') for i, text in enumerate(escaped))
+
+    @classmethod
+    def of(cls, format_str: str) -> 'MessageTemplate':
+        """Compiled template for the string (None if the string has format features not supported here)"""
+        try:
+            return cls._compiled[format_str]
+        except KeyError:
+            pass
+        try:
+            template = cls(format_str)
+        except ValueError:
+            template = None
+        cls._compiled[format_str] = template
+        return template
+
+    def format(self, params: dict) -> str:
+        s = self.positional.format(*[params[field] for field in self.fields])
+        if self.add_dot:
+            s = add_closing_dot(s)
+        if self.capitalize:
+            s = capitalize_first_letter(s)
+        return s
+
+
+class FieldIndex:
+    """`field_*` properties of a reasoned ontology (which acts have them) and facts about the boundaries
+    that `*_bound` fields refer to, gathered once for all erroneous acts of the ontology."""
+    def __init__(self, onto):
+        self.onto = onto
+        self._fields_of_act = defaultdict(list)  # act -> [(property, field name, is bound)]
+        for prop in onto.world.properties():
+            verb = prop.python_name
+            if not verb.startswith("field_"):  # признак того, что это специальное свойство [act >> str] или [act >> bound]
+                continue
+            field = (prop, verb[len("field_"):], verb.endswith("_bound"))
+            for act in {s for s, _ in prop.get_relations()}:
+                self._fields_of_act[act].append(field)
+
+        # boundaries of complex actions that have the phase
+        self._begins = self._subjects(onto.begin_of)
+        self._ends = self._subjects(onto.end_of) | self._subjects(onto.halt_of)
+        self._bounds = {}  # bound -> (statement name, phase key or None)
+        self._atomic = {}  # action -> bool
+
+    @staticmethod
+    def _subjects(prop) -> set:
+        return {s for s, _ in prop.get_relations()} if prop else set()
+
+    def fields_of(self, act) -> list:
+        return self._fields_of_act.get(act, ())
+
+    def bound_info(self, bound) -> tuple:
+        """(name of the statement, locale key of the phase to prepend to the name or None)"""
+        try:
+            return self._bounds[bound]
+        except KeyError:
+            pass
+        action = bound.boundary_of
+        phase = None
+        if not self.is_atomic(action):
+            # complex action, determine phase
+            if bound in self._begins:
+                phase = "phase.begin_of"
+            elif bound in self._ends:
+                phase = "phase.end_of"
+        info = self._bounds[bound] = (action.stmt_name, phase)
+        return info
+
+    def is_atomic(self, action) -> bool:
+        """action class has 'atom_action' annotation = true"""
+        try:
+            return self._atomic[action]
+        except KeyError:
+            atom_action = self.onto.atom_action
+            atomic = self._atomic[action] = any(atom_action[cls] for cls in action.is_a)
+            return atomic
+
+
+def named_fields_param_provider(a: 'act_instance', fields: FieldIndex = None, **options):
+    """extract ALL field_* facts, no matter what law they belong to.
+    `fields`: index of the ontology of `a` (made here if not given)."""
+
+    if fields is None:
+        fields = FieldIndex(a.namespace)
 
     lang = options.get("lang", None)
 
@@ -155,42 +350,25 @@ def named_fields_param_provider(a: 'act_instance', **options):
         if old_prefix is None or prefix > old_prefix:    ### replace and
             placeholders[fieldName][to_quote] = prefix
 
-    for prop in a.get_properties():
-        verb = prop.python_name
-        if verb.startswith("field_"):  # признак того, что это специальное свойство [act >> str] или [act >> bound]
-            to_quote = None
-            prefix = ''
-            fieldName = verb.replace("field_", "")
-            if fieldName.endswith("_bound"):
-                # process bound instances ...
-                # if 'phase' not in options:
-                #   continue
-                fieldName = fieldName[:-len("_bound")]
-                for bound in prop[a]:
-                    # extract phase to prepend to action name
-                    phase_str = ''
-                    # action class has 'atom_action' annotation = true
-                    if not any(atom_action[cls] for cls in bound.boundary_of.is_a):
-                    # if not (atom_action[action_class] or all(atom_action[action_class])):
-                        # complex action, determine phase_str
-                        if begin_of[bound]:
-                            phase_str = tr("phase.begin_of", lang=lang) + " "
-                        elif end_of[bound] or halt_of[bound]:
-                            phase_str = tr("phase.end_of", lang=lang) + " "
-
-                    name = bound.boundary_of.stmt_name
-                    # add2placeholders(fieldName, to_quote=name, prefix=phase_str, replace=False)
-                    # add 'phased-' version of placeholder
-                    add2placeholders('phased-' + fieldName, to_quote=name, prefix=phase_str)
-            else:
-                # process literals ...
-                for value in prop[a]:
-                    # convert to str
-                    value = {
-                        True: 'true',
-                        False: 'false',
-                    }.get(value, str(value))
-                    add2placeholders(fieldName, to_quote=value, prefix='')
+    for prop, fieldName, is_bound in fields.fields_of(a):
+        if is_bound:
+            # process bound instances ...
+            fieldName = fieldName[:-len("_bound")]
+            for bound in prop[a]:
+                # extract phase to prepend to action name
+                name, phase = fields.bound_info(bound)
+                phase_str = tr(phase, lang=lang) + " " if phase else ''
+                # add 'phased-' version of placeholder
+                add2placeholders('phased-' + fieldName, to_quote=name, prefix=phase_str)
+        else:
+            # process literals ...
+            for value in prop[a]:
+                # convert to str
+                value = {
+                    True: 'true',
+                    False: 'false',
+                }.get(value, str(value))
+                add2placeholders(fieldName, to_quote=value, prefix='')
 
 
     # convert sub-dicts to normal strings
@@ -204,6 +382,8 @@ def named_fields_param_provider(a: 'act_instance', **options):
 
 def replaceLocaleMarks(s, lang):
     """Replace all "!{locale:SOMEKEY}" fragments with result of passing 'SOMEKEY' into `tr` for given language """
+    if LOCALE_KEY_MARK not in s:
+        return s
     replace_lambda = lambda m: tr(m[1], lang, m[1])
     return LOCALE_KEY_RE.sub(replace_lambda, s)
 
@@ -4,9 +4,12 @@ import os
 # $ pip install psutil
 import psutil
 import sys
+import tempfile
 
+from admission import ADMISSION
 from jena.client_manager import ClientManager
-from jena.jenaClient import JenaClient, ThriftConnectionException
+from jena.jenaClient import JenaClient, ThriftConnectionException, ReasoningTimeout, UnknownAlgorithm, \
+	UnknownSchema
 
 try:
 	from options import JAVA_PATH  # comment out this import if loading the script from a foreign directory
@@ -14,29 +17,156 @@ except ImportError:
 	pass
 
 
+# (the errors are re-exported: the functions below raise them)
+__all__ = [
+	'invoke_jena_reasoning_service', 'handoff_files', 'invoke_jena_reasoning_with_files', 'load_schema',
+	'register_algorithm', 'invoke_jena_reasoning_with_algorithm', 'start_jena_reasoning_service',
+	'jena_socket_path', 'stop_jena_reasoning_service',
+	'ReasoningTimeout', 'ThriftConnectionException', 'UnknownAlgorithm', 'UnknownSchema',
+]
+
+
 _DIR_PATH = os.path.dirname(os.path.realpath(__file__))  # dir of current .py file
 
 
 # Jena service daemon process
 JENA_SERVICE_PORT = 20299
-JENA_RULE_PATHS = "jena/alg_rules.ttl;jena/relink_acts.ttl;jena/unskip_acts.ttl;jena/trace_rules.ttl"
+SPAWN_SERVICE = True  # set to False to connect to a service started elsewhere (e.g. `bench/standin.py`)
+JENA_TRANSPORT = "buffered"  # or "framed" (see `jena.jenaClient.TRANSPORTS`)
+JENA_PROTOCOL = "binary"  # or "compact" (see `jena.jenaClient.PROTOCOLS`)
+# set True to talk to the service over a Unix domain socket instead of TCP port (not on Windows; the service needs Java 16+)
+JENA_UNIX_SOCKET = False
+# path of the socket; {pid} of this process makes the path unique for each worker process spawning its own service
+JENA_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "jena-service-{pid}.sock")
+# directory of files to pass big data to the service and back (see `handoff_files()`):
+# shared memory if the system has it; the service must see the same files (it runs on the same host)
+HANDOFF_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+JENA_ALGORITHM_RULE_PATHS = "jena/alg_rules.ttl"  # rules about algorithm only (see `register_algorithm()`)
+JENA_TRACE_RULE_PATHS = "jena/relink_acts.ttl;jena/unskip_acts.ttl;jena/trace_rules.ttl"
+JENA_RULE_PATHS = JENA_ALGORITHM_RULE_PATHS + ";" + JENA_TRACE_RULE_PATHS
+# set False to call the service without admission in priority lanes (see `admission.py`; e.g. to compare)
+ADMISSION_CONTROL = True
 	# tip: jena/rdfs4core.rules;jena/loop_names.ttl; <- these shouldn't be used separately
 _service_Process = None
 _client_Manager = None
 
 
-def invoke_jena_reasoning_service(rdfData: bytes, rules_path=JENA_RULE_PATHS):
+def invoke_jena_reasoning_service(rdfData: bytes, rules_path=JENA_RULE_PATHS, timings: dict=None,
+								  schema_version: str=None, deadline: float=None):
 	"""Start service process (`jena/Jena.jar`) if not running yet and
-	perform `runReasoner` on it with given `rdfData`"""
+	perform `reason` on it with given `rdfData`.
+	If `timings` dict is given, durations of server-side stages are added to it.
+	If `schema_version` is given, `rdfData` is reasoned about together with the schema loaded by `load_schema()`
+	(raises `UnknownSchema` if the service does not know it, e.g. it has been restarted).
+	If `deadline` (`time.monotonic()` time) is given, raises `ReasoningTimeout` if not done by then
+	(the same for other functions that do reasoning).
+	The call is admitted in the lane of the caller (see `admission.lane()`); raises `admission.Busy`
+	if the queue of the lane is full."""
 	# java -jar Jena.jar jena "test_data/test_make_trace_output.rdf" "jena/all.rules" "test_data/jena_output.rdf"
 
-	global _service_Process, _client_Manager
-	need_create_process = False
+	return _run_on_service(lambda jc: _reason(jc, rdfData, rules_path, timings, schema_version=schema_version,
+											  deadline=deadline), deadline)
+
+
+def handoff_files() -> (str, str):
+	"""New paths of a payload file and a result file for `invoke_jena_reasoning_with_files()`
+	(the caller removes them), or None if there is no shared memory"""
+	if not HANDOFF_DIR:
+		return None
+	fd, payload_path = tempfile.mkstemp(prefix="jena-payload-", suffix=".rdf", dir=HANDOFF_DIR)
+	os.close(fd)
+	return payload_path, payload_path[:-len(".rdf")] + ".result.nt"
+
+
+def invoke_jena_reasoning_with_files(payload_path: str, result_path: str, rules_path=JENA_RULE_PATHS,
+									 timings: dict=None, schema_version: str=None, deadline: float=None) -> bool:
+	"""Same as `invoke_jena_reasoning_service()` for the data in `payload_path`:
+	the service writes the reasoned data (N-Triples) to `result_path` instead of sending it.
+	Returns False if the call failed."""
+	def _reason_file(jc):
+		result = jc.reasonFile(payload_path, rules_path, schemaVersion=schema_version, resultPath=result_path,
+							   deadline=deadline)
+		if result is None:
+			return False
+		if timings is not None and result.timings:
+			timings.update(result.timings)
+		return True
+
+	return _run_on_service(_reason_file, deadline)
+
+
+def load_schema(schemaData: bytes) -> str:
+	"""Let the service keep the schema (TBox: RDF/XML or N-Triples).
+	Returns the version of the schema (SHA-256 of `schemaData`, hex) to pass along with data sent without schema."""
+	return _run_on_service(lambda jc: jc.loadSchema(schemaData))
+
+
+def register_algorithm(rdfData: bytes, rules_path=JENA_ALGORITHM_RULE_PATHS, schema_version: str=None,
+					   deadline: float=None) -> str:
+	"""Let the service reason about algorithm data (N-Triples; schema included unless `schema_version` is given)
+	once and keep the result.
+	Returns the handle to pass to `invoke_jena_reasoning_with_algorithm()`."""
+	return _run_on_service(lambda jc: jc.registerAlgorithm(rdfData, rulePaths=rules_path, schemaVersion=schema_version,
+														   deadline=deadline), deadline)
+
+
+def invoke_jena_reasoning_with_algorithm(algorithm_handle: str, traceData: bytes, rules_path=JENA_TRACE_RULE_PATHS,
+										 timings: dict=None, deadline: float=None):
+	"""Perform `reason` on the union of a registered algorithm and given trace data (N-Triples).
+	Raises `UnknownAlgorithm` if the service does not know the algorithm (e.g. it has been restarted)."""
+	return _run_on_service(lambda jc: _reason(jc, traceData, rules_path, timings, algorithm_handle, deadline=deadline),
+						   deadline)
+
+
+def _reason(jc, rdfData, rules_path, timings, algorithm_handle=None, schema_version=None, deadline=None):
+	if algorithm_handle is None:
+		result = jc.reason(rdfData, rulePaths=rules_path, schemaVersion=schema_version, deadline=deadline)
+	else:
+		result = jc.reasonTrace(algorithm_handle, rdfData, rulePaths=rules_path, deadline=deadline)
+	if result is None:
+		return None
+	if timings is not None and result.timings:
+		timings.update(result.timings)
+	return result.rdfData
+
+
+def start_jena_reasoning_service():
+	"""Start service process (`jena/Jena.jar`) if not running yet and wait until it answers a ping
+	(to pay the start-up costs in advance, e.g. when a long-running server starts)"""
+	return _run_on_service(lambda jc: jc.ping(), admit=False)
+
+
+def jena_socket_path() -> str:
+	"""Path of the Unix domain socket of the service (see `JENA_UNIX_SOCKET`), or None if TCP is used"""
+	if not JENA_UNIX_SOCKET:
+		return None
+	return JENA_SOCKET_PATH.format(pid=os.getpid())
+
+
+def _need_create_process() -> bool:
+	if not SPAWN_SERVICE:
+		return False  # the service is run by someone else
 	if not _service_Process or not _service_Process.is_running():
-		need_create_process = True
-	elif _service_Process.status() == psutil.STATUS_ZOMBIE:
+		return True
+	if _service_Process.status() == psutil.STATUS_ZOMBIE:
 		_service_Process.wait()
-		need_create_process = True
+		return True
+	return False
+
+
+def _run_on_service(lambda_on_client, deadline=None, admit=True):
+	"""Run given function on a free client of the service once the call is admitted (see `ADMISSION_CONTROL`)"""
+	if not (admit and ADMISSION_CONTROL):
+		return _call_service(lambda_on_client)
+	with ADMISSION.admit(deadline=deadline):
+		return _call_service(lambda_on_client)
+
+
+def _call_service(lambda_on_client):
+	"""Run given function on a free client of the service, (re)starting the service process if required"""
+	global _service_Process, _client_Manager
+	need_create_process = _need_create_process()
+	socket_path = jena_socket_path()
 
 	exception = None
 	for _ in range(2):  # loop to retry
@@ -44,7 +174,9 @@ def invoke_jena_reasoning_service(rdfData: bytes, rules_path=JENA_RULE_PATHS):
 
 		if need_create_process:
 			# invoke separate java process in non-blocking fasion, with shared stdout
-			cmd = f'{JAVA_PATH} -jar {cur_dir}jena/Jena.jar service --port {JENA_SERVICE_PORT}'.split()
+			address = f'--socket {socket_path}' if socket_path else f'--port {JENA_SERVICE_PORT}'
+			cmd = (f'{JAVA_PATH} -jar {cur_dir}jena/Jena.jar service {address}'
+				   f' --transport {JENA_TRANSPORT} --protocol {JENA_PROTOCOL}').split()
 			print("Starting java background service ...")
 			print("  command:  ", cmd)
 			_service_Process = psutil.Popen(cmd, stdout=sys.stderr, cwd=_DIR_PATH)
@@ -52,12 +184,13 @@ def invoke_jena_reasoning_service(rdfData: bytes, rules_path=JENA_RULE_PATHS):
 		try:
 			if not _client_Manager:
 				_client_Manager = ClientManager(
-					lambda: JenaClient(port=JENA_SERVICE_PORT)
+					lambda: JenaClient(port=JENA_SERVICE_PORT, transport=JENA_TRANSPORT, protocol=JENA_PROTOCOL,
+									   unix_socket=socket_path)
 				)
 				_client_Manager.run(lambda jc: jc.ping())
 
 			# do the work!
-			return _client_Manager.run(lambda jc: jc.runReasoner(rdfData, rulePaths=rules_path))
+			return _client_Manager.run(lambda_on_client)
 
 		except ThriftConnectionException as ex:
 			exception = ex
@@ -83,3 +216,7 @@ def stop_jena_reasoning_service():
 		_service_Process.wait()
 		_service_Process = None
 
+		socket_path = jena_socket_path()
+		if socket_path and os.path.exists(socket_path):
+			os.remove(socket_path)  # (the killed service cannot remove it)
+
@@ -1,17 +1,31 @@
 # jenaClient.py
 
-from time import sleep
+from time import monotonic, sleep
 
 from jena.jenaService import JenaReasoner
+from jena.jenaService.ttypes import ReasoningResult, ReasoningTimeout, UnknownAlgorithm, UnknownSchema
 # from jenaService.ttypes import RDF_Graph
 
 from thrift import Thrift
 from thrift.transport import TSocket
 from thrift.transport import TTransport
 from thrift.protocol import TBinaryProtocol
+from thrift.protocol import TCompactProtocol
 
 
 RETRY_DELAY = 0.3  # seconds
+DEADLINE_GRACE = 2.0  # seconds to wait for an answer after the deadline (the server gives up by the deadline)
+
+# transport & protocol pairs, must be the same as the service's (`java -jar Jena.jar service --transport framed ...`)
+# ("framed" lets the service run a non-blocking server)
+TRANSPORTS = {
+    'buffered': TTransport.TBufferedTransport,
+    'framed': TTransport.TFramedTransport,
+}
+PROTOCOLS = {
+    'binary': TBinaryProtocol.TBinaryProtocol,
+    'compact': TCompactProtocol.TCompactProtocol,
+}
 
 # make special exception type
 class ThriftConnectionException(RuntimeError):
@@ -26,16 +40,18 @@ def handle_thrift_exception(tx):
 
 
 class JenaClient:
-    def __init__(self, host='localhost', port=20299):
+    def __init__(self, host='localhost', port=20299, transport='buffered', protocol='binary', unix_socket=None):
+        """ `unix_socket`: path of Unix domain socket to connect to instead of `host` & `port` """
         try:
             # Make socket
-            self.transport = TSocket.TSocket(host, port)
+            self.socket = self.transport = TSocket.TSocket(host, port, unix_socket=unix_socket)
 
             # Buffering is critical. Raw sockets are very slow
-            self.transport = TTransport.TBufferedTransport(self.transport)
+            # (framed transport is buffered too)
+            self.transport = TRANSPORTS[transport](self.transport)
 
             # Wrap in a protocol
-            protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
+            protocol = PROTOCOLS[protocol](self.transport)
 
             # Create a client to use the protocol encoder
             self.client = JenaReasoner.Client(protocol)
@@ -91,6 +107,93 @@ class JenaClient:
         # result = self.client.ping()
         # print('ping():', result)
 
+    def _call(self, title:str, call, deadline:float=None, passed=()):
+        """ Run `call(deadline_millis)` on the server, reconnecting (up to 3 times) if the connection is lost.
+        `deadline`: `time.monotonic()` time to get the answer by; the server gives up on it and `ReasoningTimeout`
+        is raised (the connection stays usable). Exceptions of `passed` types are raised as is,
+        other Thrift errors are reported and None is returned. """
+        for retry_count in range(4):
+            deadline_millis = 0
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise ReasoningTimeout("Deadline expired before " + title)
+                deadline_millis = max(1, int(remaining * 1000))
+                # the server answers by the deadline; wait a bit longer for a late answer (e.g. of a hung server)
+                self.socket.setTimeout((remaining + DEADLINE_GRACE) * 1000)
+            try:
+                print(title, '...')
+                return call(deadline_millis)
+
+            except (ReasoningTimeout,) + tuple(passed):
+                raise
+            except TTransport.TTransportException as tx:
+                if tx.type == TTransport.TTransportException.TIMED_OUT and deadline is not None:
+                    # the answer is not read: the connection cannot be used for next calls
+                    self.reconnect()
+                    raise ReasoningTimeout("No answer by the deadline of " + title)
+                if retry_count >= 3:
+                    # stop trying
+                    print(f"Trift connection: cannot reconnect after {retry_count} times!")
+                    raise ThriftConnectionException(tx.message)
+                sleep(RETRY_DELAY)
+                print("Trift connection: trying to reconnect ...")
+                self.reconnect()
+                # run again
+            except Thrift.TException as tx:
+                handle_thrift_exception(tx)
+                return None
+            finally:
+                if deadline is not None:
+                    self.socket.setTimeout(None)
+
+    def reason(self, rdfData:bytes, rulePaths:str, schemaVersion:str=None, deadline:float=None) -> 'ReasoningResult':
+        """ Same as runReasoner() but also returns timings of server-side stages:
+        `ReasoningResult(rdfData: bytes, timings: dict)`.
+        If `schemaVersion` is given, the data is reasoned about together with that schema (see loadSchema());
+        raises `UnknownSchema` if the server does not know the version.
+        Raises `ReasoningTimeout` if not done by `deadline` (see _call()). """
+        result = self._call('reason(%d bytes of binary data)' % len(rdfData),
+                            lambda deadline_millis: self.client.reason(rdfData, rulePaths, schemaVersion, deadline_millis),
+                            deadline, passed=(UnknownSchema,))
+        if result is not None:
+            print('Received %d bytes' % len(result.rdfData))
+        return result
+
+    def reasonFile(self, payloadPath:str, rulePaths:str, schemaVersion:str=None, resultPath:str=None,
+                   deadline:float=None) -> 'ReasoningResult':
+        """ Same as reason() for data passed through files: the server reads `payloadPath`
+        and writes the result (N-Triples) to `resultPath`; `rdfData` of the result is empty """
+        return self._call('reasonFile(%s)' % payloadPath,
+                          lambda deadline_millis: self.client.reasonFile(
+                              payloadPath, rulePaths, schemaVersion, resultPath, deadline_millis),
+                          deadline, passed=(UnknownSchema,))
+
+    def loadSchema(self, schemaData:bytes) -> str:
+        """ Keep the schema (TBox) on the server; returns the version of the schema (SHA-256 of the data, hex) """
+        return self._call('loadSchema(%d bytes of binary data)' % len(schemaData),
+                          lambda _: self.client.loadSchema(schemaData))
+
+    def registerAlgorithm(self, rdfData:bytes, rulePaths:str, schemaVersion:str=None, deadline:float=None) -> str:
+        """ Pre-reason algorithm data (N-Triples) on the server; returns the handle of the algorithm.
+        Raises `UnknownSchema` if the server does not know `schemaVersion`. """
+        return self._call('registerAlgorithm(%d bytes of binary data)' % len(rdfData),
+                          lambda deadline_millis: self.client.registerAlgorithm(
+                              rdfData, rulePaths, schemaVersion, deadline_millis),
+                          deadline, passed=(UnknownSchema,))
+
+    def reasonTrace(self, algorithmHandle:str, traceData:bytes, rulePaths:str,
+                    deadline:float=None) -> 'ReasoningResult':
+        """ Same as reason() but for trace triples (N-Triples) of a registered algorithm.
+        Raises `UnknownAlgorithm` if the server does not know the handle. """
+        result = self._call('reasonTrace(%d bytes of binary data)' % len(traceData),
+                            lambda deadline_millis: self.client.reasonTrace(
+                                algorithmHandle, traceData, rulePaths, deadline_millis),
+                            deadline, passed=(UnknownAlgorithm,))
+        if result is not None:
+            print('Received %d bytes' % len(result.rdfData))
+        return result
+
 
     def stop(self):
         try:
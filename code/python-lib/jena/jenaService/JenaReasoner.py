@@ -5,6 +5,9 @@
 #
 #  options string: py
 #
+# (Extended by hand after jenaService.thrift while the compiler was not at hand:
+#  jena-tcp-service/build.sh regenerates this file with Thrift Compiler 0.14.2.)
+#
 
 from thrift.Thrift import TType, TMessageType, TFrozenDict, TException, TApplicationException
 from thrift.protocol.TProtocol import TProtocolException
@@ -52,6 +55,69 @@ class Iface(object):
         """
         pass
 
+    def reason(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        """
+        Do the reasoning and return the complemented RDF graph along with timings of server-side stages. If schemaVersion is given, the data is reasoned about together with that schema (see loadSchema). If deadlineMillis > 0, the reasoning is abandoned after that many milliseconds (ReasoningTimeout).
+
+        Parameters:
+         - rdfData
+         - rulePaths
+         - schemaVersion
+         - deadlineMillis
+
+        """
+        pass
+
+    def loadSchema(self, schemaData):
+        """
+        Keep a schema (TBox: RDF/XML or N-Triples) to be used with data sent without it. Returns the version of the schema: SHA-256 of the data, hex.
+
+        Parameters:
+         - schemaData
+
+        """
+        pass
+
+    def registerAlgorithm(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        """
+        Reason about an algorithm (N-Triples; with schema included unless schemaVersion is given) with the algorithm-only rules and keep the result. Returns a handle of the pre-reasoned algorithm graph (the same for the same data, rules and schema).
+
+        Parameters:
+         - rdfData
+         - rulePaths
+         - schemaVersion
+         - deadlineMillis
+
+        """
+        pass
+
+    def reasonTrace(self, algorithmHandle, traceData, rulePaths, deadlineMillis):
+        """
+        Do the reasoning over the union of a registered algorithm graph and trace triples (N-Triples) and return the complemented RDF graph along with timings of server-side stages.
+
+        Parameters:
+         - algorithmHandle
+         - traceData
+         - rulePaths
+         - deadlineMillis
+
+        """
+        pass
+
+    def reasonFile(self, payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis):
+        """
+        Same as reason() for big data passed through files (e.g. in shared memory, /dev/shm) instead of the connection: the data (RDF/XML or N-Triples) is read from payloadPath and the result (N-Triples) is written to resultPath; rdfData of the returned result is empty.
+
+        Parameters:
+         - payloadPath
+         - rulePaths
+         - schemaVersion
+         - resultPath
+         - deadlineMillis
+
+        """
+        pass
+
     def stop(self):
         """
         Stop the server.
@@ -171,6 +237,218 @@ class Client(Iface):
             return result.success
         raise TApplicationException(TApplicationException.MISSING_RESULT, "runReasoner failed: unknown result")
 
+    def reason(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        """
+        Do the reasoning and return the complemented RDF graph along with timings of server-side stages. If schemaVersion is given, the data is reasoned about together with that schema (see loadSchema). If deadlineMillis > 0, the reasoning is abandoned after that many milliseconds (ReasoningTimeout).
+
+        Parameters:
+         - rdfData
+         - rulePaths
+         - schemaVersion
+         - deadlineMillis
+
+        """
+        self.send_reason(rdfData, rulePaths, schemaVersion, deadlineMillis)
+        return self.recv_reason()
+
+    def send_reason(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        self._oprot.writeMessageBegin('reason', TMessageType.CALL, self._seqid)
+        args = reason_args()
+        args.rdfData = rdfData
+        args.rulePaths = rulePaths
+        args.schemaVersion = schemaVersion
+        args.deadlineMillis = deadlineMillis
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reason(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reason_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.unknownSchema is not None:
+            raise result.unknownSchema
+        if result.timeout is not None:
+            raise result.timeout
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "reason failed: unknown result")
+
+    def loadSchema(self, schemaData):
+        """
+        Keep a schema (TBox: RDF/XML or N-Triples) to be used with data sent without it. Returns the version of the schema: SHA-256 of the data, hex.
+
+        Parameters:
+         - schemaData
+
+        """
+        self.send_loadSchema(schemaData)
+        return self.recv_loadSchema()
+
+    def send_loadSchema(self, schemaData):
+        self._oprot.writeMessageBegin('loadSchema', TMessageType.CALL, self._seqid)
+        args = loadSchema_args()
+        args.schemaData = schemaData
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_loadSchema(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = loadSchema_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "loadSchema failed: unknown result")
+
+    def registerAlgorithm(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        """
+        Reason about an algorithm (N-Triples; with schema included unless schemaVersion is given) with the algorithm-only rules and keep the result. Returns a handle of the pre-reasoned algorithm graph (the same for the same data, rules and schema).
+
+        Parameters:
+         - rdfData
+         - rulePaths
+         - schemaVersion
+         - deadlineMillis
+
+        """
+        self.send_registerAlgorithm(rdfData, rulePaths, schemaVersion, deadlineMillis)
+        return self.recv_registerAlgorithm()
+
+    def send_registerAlgorithm(self, rdfData, rulePaths, schemaVersion, deadlineMillis):
+        self._oprot.writeMessageBegin('registerAlgorithm', TMessageType.CALL, self._seqid)
+        args = registerAlgorithm_args()
+        args.rdfData = rdfData
+        args.rulePaths = rulePaths
+        args.schemaVersion = schemaVersion
+        args.deadlineMillis = deadlineMillis
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_registerAlgorithm(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = registerAlgorithm_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.unknownSchema is not None:
+            raise result.unknownSchema
+        if result.timeout is not None:
+            raise result.timeout
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "registerAlgorithm failed: unknown result")
+
+    def reasonTrace(self, algorithmHandle, traceData, rulePaths, deadlineMillis):
+        """
+        Do the reasoning over the union of a registered algorithm graph and trace triples (N-Triples) and return the complemented RDF graph along with timings of server-side stages.
+
+        Parameters:
+         - algorithmHandle
+         - traceData
+         - rulePaths
+         - deadlineMillis
+
+        """
+        self.send_reasonTrace(algorithmHandle, traceData, rulePaths, deadlineMillis)
+        return self.recv_reasonTrace()
+
+    def send_reasonTrace(self, algorithmHandle, traceData, rulePaths, deadlineMillis):
+        self._oprot.writeMessageBegin('reasonTrace', TMessageType.CALL, self._seqid)
+        args = reasonTrace_args()
+        args.algorithmHandle = algorithmHandle
+        args.traceData = traceData
+        args.rulePaths = rulePaths
+        args.deadlineMillis = deadlineMillis
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reasonTrace(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reasonTrace_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.unknown is not None:
+            raise result.unknown
+        if result.timeout is not None:
+            raise result.timeout
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "reasonTrace failed: unknown result")
+
+    def reasonFile(self, payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis):
+        """
+        Same as reason() for big data passed through files (e.g. in shared memory, /dev/shm) instead of the connection: the data (RDF/XML or N-Triples) is read from payloadPath and the result (N-Triples) is written to resultPath; rdfData of the returned result is empty.
+
+        Parameters:
+         - payloadPath
+         - rulePaths
+         - schemaVersion
+         - resultPath
+         - deadlineMillis
+
+        """
+        self.send_reasonFile(payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis)
+        return self.recv_reasonFile()
+
+    def send_reasonFile(self, payloadPath, rulePaths, schemaVersion, resultPath, deadlineMillis):
+        self._oprot.writeMessageBegin('reasonFile', TMessageType.CALL, self._seqid)
+        args = reasonFile_args()
+        args.payloadPath = payloadPath
+        args.rulePaths = rulePaths
+        args.schemaVersion = schemaVersion
+        args.resultPath = resultPath
+        args.deadlineMillis = deadlineMillis
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_reasonFile(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = reasonFile_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        if result.unknownSchema is not None:
+            raise result.unknownSchema
+        if result.timeout is not None:
+            raise result.timeout
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "reasonFile failed: unknown result")
+
     def stop(self):
         """
         Stop the server.
@@ -193,6 +471,11 @@ class Processor(Iface, TProcessor):
         self._processMap["ping"] = Processor.process_ping
         self._processMap["saveRdf"] = Processor.process_saveRdf
         self._processMap["runReasoner"] = Processor.process_runReasoner
+        self._processMap["reason"] = Processor.process_reason
+        self._processMap["loadSchema"] = Processor.process_loadSchema
+        self._processMap["registerAlgorithm"] = Processor.process_registerAlgorithm
+        self._processMap["reasonTrace"] = Processor.process_reasonTrace
+        self._processMap["reasonFile"] = Processor.process_reasonFile
         self._processMap["stop"] = Processor.process_stop
         self._on_message_begin = None
 
@@ -285,22 +568,711 @@ class Processor(Iface, TProcessor):
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_stop(self, seqid, iprot, oprot):
-        args = stop_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        try:
-            self._handler.stop()
-        except TTransport.TTransportException:
-            raise
-        except Exception:
-            logging.exception('Exception in oneway handler')
+    def process_reason(self, seqid, iprot, oprot):
+        args = reason_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reason_result()
+        try:
+            result.success = self._handler.reason(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except UnknownSchema as unknownSchema:
+            msg_type = TMessageType.REPLY
+            result.unknownSchema = unknownSchema
+        except ReasoningTimeout as timeout:
+            msg_type = TMessageType.REPLY
+            result.timeout = timeout
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("reason", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_loadSchema(self, seqid, iprot, oprot):
+        args = loadSchema_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = loadSchema_result()
+        try:
+            result.success = self._handler.loadSchema(args.schemaData)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("loadSchema", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_registerAlgorithm(self, seqid, iprot, oprot):
+        args = registerAlgorithm_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = registerAlgorithm_result()
+        try:
+            result.success = self._handler.registerAlgorithm(args.rdfData, args.rulePaths, args.schemaVersion, args.deadlineMillis)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except UnknownSchema as unknownSchema:
+            msg_type = TMessageType.REPLY
+            result.unknownSchema = unknownSchema
+        except ReasoningTimeout as timeout:
+            msg_type = TMessageType.REPLY
+            result.timeout = timeout
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("registerAlgorithm", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reasonTrace(self, seqid, iprot, oprot):
+        args = reasonTrace_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reasonTrace_result()
+        try:
+            result.success = self._handler.reasonTrace(args.algorithmHandle, args.traceData, args.rulePaths, args.deadlineMillis)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except UnknownAlgorithm as unknown:
+            msg_type = TMessageType.REPLY
+            result.unknown = unknown
+        except ReasoningTimeout as timeout:
+            msg_type = TMessageType.REPLY
+            result.timeout = timeout
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("reasonTrace", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reasonFile(self, seqid, iprot, oprot):
+        args = reasonFile_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reasonFile_result()
+        try:
+            result.success = self._handler.reasonFile(args.payloadPath, args.rulePaths, args.schemaVersion, args.resultPath, args.deadlineMillis)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except UnknownSchema as unknownSchema:
+            msg_type = TMessageType.REPLY
+            result.unknownSchema = unknownSchema
+        except ReasoningTimeout as timeout:
+            msg_type = TMessageType.REPLY
+            result.timeout = timeout
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("reasonFile", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_stop(self, seqid, iprot, oprot):
+        args = stop_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        try:
+            self._handler.stop()
+        except TTransport.TTransportException:
+            raise
+        except Exception:
+            logging.exception('Exception in oneway handler')
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class ping_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ping_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ping_args)
+ping_args.thrift_spec = (
+)
+
+
+class ping_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('ping_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(ping_result)
+ping_result.thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ),  # 0
+)
+
+
+class saveRdf_args(object):
+    """
+    Attributes:
+     - rdfData
+     - filename
+
+    """
+
+
+    def __init__(self, rdfData=None, filename=None,):
+        self.rdfData = rdfData
+        self.filename = filename
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.rdfData = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('saveRdf_args')
+        if self.rdfData is not None:
+            oprot.writeFieldBegin('rdfData', TType.STRING, 1)
+            oprot.writeBinary(self.rdfData)
+            oprot.writeFieldEnd()
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 2)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(saveRdf_args)
+saveRdf_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'rdfData', 'BINARY', None, ),  # 1
+    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+)
+
+
+class saveRdf_result(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('saveRdf_result')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(saveRdf_result)
+saveRdf_result.thrift_spec = (
+)
+
+
+class runReasoner_args(object):
+    """
+    Attributes:
+     - rdfData
+     - rulePaths
+
+    """
+
+
+    def __init__(self, rdfData=None, rulePaths=None,):
+        self.rdfData = rdfData
+        self.rulePaths = rulePaths
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.rdfData = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.rulePaths = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('runReasoner_args')
+        if self.rdfData is not None:
+            oprot.writeFieldBegin('rdfData', TType.STRING, 1)
+            oprot.writeBinary(self.rdfData)
+            oprot.writeFieldEnd()
+        if self.rulePaths is not None:
+            oprot.writeFieldBegin('rulePaths', TType.STRING, 2)
+            oprot.writeString(self.rulePaths.encode('utf-8') if sys.version_info[0] == 2 else self.rulePaths)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(runReasoner_args)
+runReasoner_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'rdfData', 'BINARY', None, ),  # 1
+    (2, TType.STRING, 'rulePaths', 'UTF8', None, ),  # 2
+)
+
+
+class runReasoner_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('runReasoner_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeBinary(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(runReasoner_result)
+runReasoner_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
+)
+
+
+class reason_args(object):
+    """
+    Attributes:
+     - rdfData
+     - rulePaths
+     - schemaVersion
+     - deadlineMillis
+
+    """
+
+
+    def __init__(self, rdfData=None, rulePaths=None, schemaVersion=None, deadlineMillis=None,):
+        self.rdfData = rdfData
+        self.rulePaths = rulePaths
+        self.schemaVersion = schemaVersion
+        self.deadlineMillis = deadlineMillis
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.rdfData = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.rulePaths = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.schemaVersion = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.deadlineMillis = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reason_args')
+        if self.rdfData is not None:
+            oprot.writeFieldBegin('rdfData', TType.STRING, 1)
+            oprot.writeBinary(self.rdfData)
+            oprot.writeFieldEnd()
+        if self.rulePaths is not None:
+            oprot.writeFieldBegin('rulePaths', TType.STRING, 2)
+            oprot.writeString(self.rulePaths.encode('utf-8') if sys.version_info[0] == 2 else self.rulePaths)
+            oprot.writeFieldEnd()
+        if self.schemaVersion is not None:
+            oprot.writeFieldBegin('schemaVersion', TType.STRING, 3)
+            oprot.writeString(self.schemaVersion.encode('utf-8') if sys.version_info[0] == 2 else self.schemaVersion)
+            oprot.writeFieldEnd()
+        if self.deadlineMillis is not None:
+            oprot.writeFieldBegin('deadlineMillis', TType.I64, 4)
+            oprot.writeI64(self.deadlineMillis)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reason_args)
+reason_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'rdfData', 'BINARY', None, ),  # 1
+    (2, TType.STRING, 'rulePaths', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'schemaVersion', 'UTF8', None, ),  # 3
+    (4, TType.I64, 'deadlineMillis', None, None, ),  # 4
+)
+
+
+class reason_result(object):
+    """
+    Attributes:
+     - success
+     - unknownSchema
+     - timeout
+
+    """
+
+
+    def __init__(self, success=None, unknownSchema=None, timeout=None,):
+        self.success = success
+        self.unknownSchema = unknownSchema
+        self.timeout = timeout
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = ReasoningResult()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.unknownSchema = UnknownSchema()
+                    self.unknownSchema.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.timeout = ReasoningTimeout()
+                    self.timeout.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reason_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.unknownSchema is not None:
+            oprot.writeFieldBegin('unknownSchema', TType.STRUCT, 1)
+            self.unknownSchema.write(oprot)
+            oprot.writeFieldEnd()
+        if self.timeout is not None:
+            oprot.writeFieldBegin('timeout', TType.STRUCT, 2)
+            self.timeout.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reason_result)
+reason_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [ReasoningResult, None], None, ),  # 0
+    (1, TType.STRUCT, 'unknownSchema', [UnknownSchema, None], None, ),  # 1
+    (2, TType.STRUCT, 'timeout', [ReasoningTimeout, None], None, ),  # 2
+)
 
-# HELPER FUNCTIONS AND STRUCTURES
 
+class loadSchema_args(object):
+    """
+    Attributes:
+     - schemaData
+
+    """
 
-class ping_args(object):
 
+    def __init__(self, schemaData=None,):
+        self.schemaData = schemaData
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -311,6 +1283,11 @@ class ping_args(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.schemaData = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -320,7 +1297,11 @@ class ping_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ping_args')
+        oprot.writeStructBegin('loadSchema_args')
+        if self.schemaData is not None:
+            oprot.writeFieldBegin('schemaData', TType.STRING, 1)
+            oprot.writeBinary(self.schemaData)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -337,12 +1318,14 @@ class ping_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(ping_args)
-ping_args.thrift_spec = (
+all_structs.append(loadSchema_args)
+loadSchema_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'schemaData', 'BINARY', None, ),  # 1
 )
 
 
-class ping_result(object):
+class loadSchema_result(object):
     """
     Attributes:
      - success
@@ -363,8 +1346,8 @@ class ping_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.BOOL:
-                    self.success = iprot.readBool()
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             else:
@@ -376,10 +1359,10 @@ class ping_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('ping_result')
+        oprot.writeStructBegin('loadSchema_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.BOOL, 0)
-            oprot.writeBool(self.success)
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -397,24 +1380,28 @@ class ping_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(ping_result)
-ping_result.thrift_spec = (
-    (0, TType.BOOL, 'success', None, None, ),  # 0
+all_structs.append(loadSchema_result)
+loadSchema_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
 )
 
 
-class saveRdf_args(object):
+class registerAlgorithm_args(object):
     """
     Attributes:
      - rdfData
-     - filename
+     - rulePaths
+     - schemaVersion
+     - deadlineMillis
 
     """
 
 
-    def __init__(self, rdfData=None, filename=None,):
+    def __init__(self, rdfData=None, rulePaths=None, schemaVersion=None, deadlineMillis=None,):
         self.rdfData = rdfData
-        self.filename = filename
+        self.rulePaths = rulePaths
+        self.schemaVersion = schemaVersion
+        self.deadlineMillis = deadlineMillis
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -432,7 +1419,17 @@ class saveRdf_args(object):
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.STRING:
-                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                    self.rulePaths = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.schemaVersion = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.deadlineMillis = iprot.readI64()
                 else:
                     iprot.skip(ftype)
             else:
@@ -444,14 +1441,22 @@ class saveRdf_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('saveRdf_args')
+        oprot.writeStructBegin('registerAlgorithm_args')
         if self.rdfData is not None:
             oprot.writeFieldBegin('rdfData', TType.STRING, 1)
             oprot.writeBinary(self.rdfData)
             oprot.writeFieldEnd()
-        if self.filename is not None:
-            oprot.writeFieldBegin('filename', TType.STRING, 2)
-            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+        if self.rulePaths is not None:
+            oprot.writeFieldBegin('rulePaths', TType.STRING, 2)
+            oprot.writeString(self.rulePaths.encode('utf-8') if sys.version_info[0] == 2 else self.rulePaths)
+            oprot.writeFieldEnd()
+        if self.schemaVersion is not None:
+            oprot.writeFieldBegin('schemaVersion', TType.STRING, 3)
+            oprot.writeString(self.schemaVersion.encode('utf-8') if sys.version_info[0] == 2 else self.schemaVersion)
+            oprot.writeFieldEnd()
+        if self.deadlineMillis is not None:
+            oprot.writeFieldBegin('deadlineMillis', TType.I64, 4)
+            oprot.writeI64(self.deadlineMillis)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -469,17 +1474,31 @@ class saveRdf_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(saveRdf_args)
-saveRdf_args.thrift_spec = (
+all_structs.append(registerAlgorithm_args)
+registerAlgorithm_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'rdfData', 'BINARY', None, ),  # 1
-    (2, TType.STRING, 'filename', 'UTF8', None, ),  # 2
+    (2, TType.STRING, 'rulePaths', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'schemaVersion', 'UTF8', None, ),  # 3
+    (4, TType.I64, 'deadlineMillis', None, None, ),  # 4
 )
 
 
-class saveRdf_result(object):
+class registerAlgorithm_result(object):
+    """
+    Attributes:
+     - success
+     - unknownSchema
+     - timeout
+
+    """
 
 
+    def __init__(self, success=None, unknownSchema=None, timeout=None,):
+        self.success = success
+        self.unknownSchema = unknownSchema
+        self.timeout = timeout
+
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
             iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
@@ -489,6 +1508,23 @@ class saveRdf_result(object):
             (fname, ftype, fid) = iprot.readFieldBegin()
             if ftype == TType.STOP:
                 break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.unknownSchema = UnknownSchema()
+                    self.unknownSchema.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.timeout = ReasoningTimeout()
+                    self.timeout.read(iprot)
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -498,7 +1534,19 @@ class saveRdf_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('saveRdf_result')
+        oprot.writeStructBegin('registerAlgorithm_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        if self.unknownSchema is not None:
+            oprot.writeFieldBegin('unknownSchema', TType.STRUCT, 1)
+            self.unknownSchema.write(oprot)
+            oprot.writeFieldEnd()
+        if self.timeout is not None:
+            oprot.writeFieldBegin('timeout', TType.STRUCT, 2)
+            self.timeout.write(oprot)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -515,23 +1563,30 @@ class saveRdf_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(saveRdf_result)
-saveRdf_result.thrift_spec = (
+all_structs.append(registerAlgorithm_result)
+registerAlgorithm_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+    (1, TType.STRUCT, 'unknownSchema', [UnknownSchema, None], None, ),  # 1
+    (2, TType.STRUCT, 'timeout', [ReasoningTimeout, None], None, ),  # 2
 )
 
 
-class runReasoner_args(object):
+class reasonTrace_args(object):
     """
     Attributes:
-     - rdfData
+     - algorithmHandle
+     - traceData
      - rulePaths
+     - deadlineMillis
 
     """
 
 
-    def __init__(self, rdfData=None, rulePaths=None,):
-        self.rdfData = rdfData
+    def __init__(self, algorithmHandle=None, traceData=None, rulePaths=None, deadlineMillis=None,):
+        self.algorithmHandle = algorithmHandle
+        self.traceData = traceData
         self.rulePaths = rulePaths
+        self.deadlineMillis = deadlineMillis
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -544,14 +1599,24 @@ class runReasoner_args(object):
                 break
             if fid == 1:
                 if ftype == TType.STRING:
-                    self.rdfData = iprot.readBinary()
+                    self.algorithmHandle = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
+                if ftype == TType.STRING:
+                    self.traceData = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
                 if ftype == TType.STRING:
                     self.rulePaths = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.deadlineMillis = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -561,15 +1626,220 @@ class runReasoner_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('runReasoner_args')
-        if self.rdfData is not None:
-            oprot.writeFieldBegin('rdfData', TType.STRING, 1)
-            oprot.writeBinary(self.rdfData)
+        oprot.writeStructBegin('reasonTrace_args')
+        if self.algorithmHandle is not None:
+            oprot.writeFieldBegin('algorithmHandle', TType.STRING, 1)
+            oprot.writeString(self.algorithmHandle.encode('utf-8') if sys.version_info[0] == 2 else self.algorithmHandle)
+            oprot.writeFieldEnd()
+        if self.traceData is not None:
+            oprot.writeFieldBegin('traceData', TType.STRING, 2)
+            oprot.writeBinary(self.traceData)
+            oprot.writeFieldEnd()
+        if self.rulePaths is not None:
+            oprot.writeFieldBegin('rulePaths', TType.STRING, 3)
+            oprot.writeString(self.rulePaths.encode('utf-8') if sys.version_info[0] == 2 else self.rulePaths)
+            oprot.writeFieldEnd()
+        if self.deadlineMillis is not None:
+            oprot.writeFieldBegin('deadlineMillis', TType.I64, 4)
+            oprot.writeI64(self.deadlineMillis)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reasonTrace_args)
+reasonTrace_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'algorithmHandle', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'traceData', 'BINARY', None, ),  # 2
+    (3, TType.STRING, 'rulePaths', 'UTF8', None, ),  # 3
+    (4, TType.I64, 'deadlineMillis', None, None, ),  # 4
+)
+
+
+class reasonTrace_result(object):
+    """
+    Attributes:
+     - success
+     - unknown
+     - timeout
+
+    """
+
+
+    def __init__(self, success=None, unknown=None, timeout=None,):
+        self.success = success
+        self.unknown = unknown
+        self.timeout = timeout
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = ReasoningResult()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.unknown = UnknownAlgorithm()
+                    self.unknown.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.timeout = ReasoningTimeout()
+                    self.timeout.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reasonTrace_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.unknown is not None:
+            oprot.writeFieldBegin('unknown', TType.STRUCT, 1)
+            self.unknown.write(oprot)
+            oprot.writeFieldEnd()
+        if self.timeout is not None:
+            oprot.writeFieldBegin('timeout', TType.STRUCT, 2)
+            self.timeout.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reasonTrace_result)
+reasonTrace_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [ReasoningResult, None], None, ),  # 0
+    (1, TType.STRUCT, 'unknown', [UnknownAlgorithm, None], None, ),  # 1
+    (2, TType.STRUCT, 'timeout', [ReasoningTimeout, None], None, ),  # 2
+)
+
+
+class reasonFile_args(object):
+    """
+    Attributes:
+     - payloadPath
+     - rulePaths
+     - schemaVersion
+     - resultPath
+     - deadlineMillis
+
+    """
+
+
+    def __init__(self, payloadPath=None, rulePaths=None, schemaVersion=None, resultPath=None, deadlineMillis=None,):
+        self.payloadPath = payloadPath
+        self.rulePaths = rulePaths
+        self.schemaVersion = schemaVersion
+        self.resultPath = resultPath
+        self.deadlineMillis = deadlineMillis
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.payloadPath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.rulePaths = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.schemaVersion = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.resultPath = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I64:
+                    self.deadlineMillis = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reasonFile_args')
+        if self.payloadPath is not None:
+            oprot.writeFieldBegin('payloadPath', TType.STRING, 1)
+            oprot.writeString(self.payloadPath.encode('utf-8') if sys.version_info[0] == 2 else self.payloadPath)
             oprot.writeFieldEnd()
         if self.rulePaths is not None:
             oprot.writeFieldBegin('rulePaths', TType.STRING, 2)
             oprot.writeString(self.rulePaths.encode('utf-8') if sys.version_info[0] == 2 else self.rulePaths)
             oprot.writeFieldEnd()
+        if self.schemaVersion is not None:
+            oprot.writeFieldBegin('schemaVersion', TType.STRING, 3)
+            oprot.writeString(self.schemaVersion.encode('utf-8') if sys.version_info[0] == 2 else self.schemaVersion)
+            oprot.writeFieldEnd()
+        if self.resultPath is not None:
+            oprot.writeFieldBegin('resultPath', TType.STRING, 4)
+            oprot.writeString(self.resultPath.encode('utf-8') if sys.version_info[0] == 2 else self.resultPath)
+            oprot.writeFieldEnd()
+        if self.deadlineMillis is not None:
+            oprot.writeFieldBegin('deadlineMillis', TType.I64, 5)
+            oprot.writeI64(self.deadlineMillis)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -586,24 +1856,31 @@ class runReasoner_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(runReasoner_args)
-runReasoner_args.thrift_spec = (
+all_structs.append(reasonFile_args)
+reasonFile_args.thrift_spec = (
     None,  # 0
-    (1, TType.STRING, 'rdfData', 'BINARY', None, ),  # 1
+    (1, TType.STRING, 'payloadPath', 'UTF8', None, ),  # 1
     (2, TType.STRING, 'rulePaths', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'schemaVersion', 'UTF8', None, ),  # 3
+    (4, TType.STRING, 'resultPath', 'UTF8', None, ),  # 4
+    (5, TType.I64, 'deadlineMillis', None, None, ),  # 5
 )
 
 
-class runReasoner_result(object):
+class reasonFile_result(object):
     """
     Attributes:
      - success
+     - unknownSchema
+     - timeout
 
     """
 
 
-    def __init__(self, success=None,):
+    def __init__(self, success=None, unknownSchema=None, timeout=None,):
         self.success = success
+        self.unknownSchema = unknownSchema
+        self.timeout = timeout
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -615,8 +1892,21 @@ class runReasoner_result(object):
             if ftype == TType.STOP:
                 break
             if fid == 0:
-                if ftype == TType.STRING:
-                    self.success = iprot.readBinary()
+                if ftype == TType.STRUCT:
+                    self.success = ReasoningResult()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 1:
+                if ftype == TType.STRUCT:
+                    self.unknownSchema = UnknownSchema()
+                    self.unknownSchema.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.timeout = ReasoningTimeout()
+                    self.timeout.read(iprot)
                 else:
                     iprot.skip(ftype)
             else:
@@ -628,10 +1918,18 @@ class runReasoner_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('runReasoner_result')
+        oprot.writeStructBegin('reasonFile_result')
         if self.success is not None:
-            oprot.writeFieldBegin('success', TType.STRING, 0)
-            oprot.writeBinary(self.success)
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        if self.unknownSchema is not None:
+            oprot.writeFieldBegin('unknownSchema', TType.STRUCT, 1)
+            self.unknownSchema.write(oprot)
+            oprot.writeFieldEnd()
+        if self.timeout is not None:
+            oprot.writeFieldBegin('timeout', TType.STRUCT, 2)
+            self.timeout.write(oprot)
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
@@ -649,9 +1947,11 @@ class runReasoner_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(runReasoner_result)
-runReasoner_result.thrift_spec = (
-    (0, TType.STRING, 'success', 'BINARY', None, ),  # 0
+all_structs.append(reasonFile_result)
+reasonFile_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [ReasoningResult, None], None, ),  # 0
+    (1, TType.STRUCT, 'unknownSchema', [UnknownSchema, None], None, ),  # 1
+    (2, TType.STRUCT, 'timeout', [ReasoningTimeout, None], None, ),  # 2
 )
 
 
@@ -0,0 +1,186 @@
+# metrics.py
+
+""" Per-stage latency metrics of reasoning requests.
+
+Every stage of a request (TBox build, injection of algorithm/trace, serialization,
+Jena round trip, reloading, mistake extraction, as well as Jena-side stages)
+is observed once per request; observations are aggregated into histograms
+that report p50/p95/p99 and can be exported in Prometheus text format
+(written to a file or served over HTTP).
+
+Usage:
+
+    from metrics import METRICS, StageCheckpointer
+
+    with METRICS.timer('tbox'):
+        onto = create_ontology_tbox()
+
+    ch = StageCheckpointer(verbose=True)
+    ...
+    ch.hit("fill ontology data", stage='trace_injection')
+    ch.commit()  # store accumulated stage timings to the registry
+
+    print(METRICS.summary())
+    METRICS.write_prometheus('metrics.prom')
+    serve_metrics(port=9464)  # GET /metrics
+"""
+
+import math
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+from common_helpers import Checkpointer
+
+
+METRIC_NAME = 'ctrlflow_stage_duration_seconds'
+QUANTILES = (0.5, 0.95, 0.99)
+WINDOW_SIZE = 4096  # recent observations used to compute quantiles
+
+
+class LatencyHistogram:
+    """Observations of a single stage: total count & sum plus a window of recent values to compute quantiles from."""
+    def __init__(self, window=WINDOW_SIZE):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._recent = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self._recent.append(seconds)
+
+    def quantile(self, q: float) -> float:
+        """Nearest-rank quantile over recent observations (0.0 if nothing observed)"""
+        if not self._recent:
+            return 0.0
+        values = sorted(self._recent)
+        return values[max(0, math.ceil(q * len(values)) - 1)]
+
+    def snapshot(self) -> dict:
+        d = {'count': self.count, 'sum': self.sum, 'max': self.max}
+        for q in QUANTILES:
+            d['p%d' % round(q * 100)] = self.quantile(q)
+        return d
+
+
+class MetricsRegistry:
+    """Thread-safe collection of stage histograms (stage name -> LatencyHistogram)."""
+    def __init__(self):
+        self._lock = Lock()
+        self._stages = {}
+
+    def observe(self, stage: str, seconds: float):
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = self._stages[stage] = LatencyHistogram()
+            hist.observe(seconds)
+
+    def merge(self, timings: dict, prefix=''):
+        """Observe each `stage: seconds` pair of a dict (e.g. timings received from Jena service)"""
+        for stage, seconds in timings.items():
+            self.observe(prefix + stage, seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Context manager observing duration of the `with` block as `stage`"""
+        ch = Checkpointer()
+        try:
+            yield ch
+        finally:
+            self.observe(stage, ch.since_start())
+
+    def stages(self) -> list:
+        with self._lock:
+            return sorted(self._stages)
+
+    def percentiles(self, stage: str) -> dict:
+        with self._lock:
+            hist = self._stages.get(stage)
+            return hist.snapshot() if hist else None
+
+    def summary(self) -> dict:
+        """stage -> {count, sum, max, p50, p95, p99}"""
+        with self._lock:
+            return {stage: hist.snapshot() for stage, hist in sorted(self._stages.items())}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def to_prometheus(self) -> str:
+        """Render all stages as a Prometheus `summary` metric (text exposition format)"""
+        lines = [
+            '# HELP %s Duration of a processing stage of a reasoning request.' % METRIC_NAME,
+            '# TYPE %s summary' % METRIC_NAME,
+        ]
+        for stage, snap in self.summary().items():
+            for q in QUANTILES:
+                lines.append('%s{stage="%s",quantile="%s"} %.6f' % (METRIC_NAME, stage, q, snap['p%d' % round(q * 100)]))
+            lines.append('%s_sum{stage="%s"} %.6f' % (METRIC_NAME, stage, snap['sum']))
+            lines.append('%s_count{stage="%s"} %d' % (METRIC_NAME, stage, snap['count']))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, file_path: str):
+        """Save text exposition to a file (e.g. for node_exporter's textfile collector)"""
+        with open(file_path, 'w') as f:
+            f.write(self.to_prometheus())
+
+
+# the default registry
+METRICS = MetricsRegistry()
+
+
+class StageCheckpointer(Checkpointer):
+    """Checkpointer that accounts time between hits to named stages of a request.
+    Repeated hits of the same stage are summed up; `commit()` stores the totals to a registry,
+    so each stage gets exactly one observation per request.
+    Labels are printed only if `verbose` is set."""
+    def __init__(self, registry=None, verbose=False):
+        super().__init__()
+        self.registry = registry or METRICS
+        self.verbose = verbose
+        self.timings = {}
+
+    def hit(self, label=None, stage=None) -> float:
+        delta = super().hit(label if self.verbose else None)
+        if stage:
+            self.add(stage, delta)
+        return delta
+
+    def add(self, stage, seconds):
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    def commit(self, total_stage='total'):
+        if total_stage:
+            self.add(total_stage, self.since_start())
+        self.registry.merge(self.timings)
+
+
+def serve_metrics(port=9464, host='127.0.0.1', registry=None) -> ThreadingHTTPServer:
+    """Serve Prometheus text exposition at http://host:port/metrics from a daemon thread"""
+    registry = registry or METRICS
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/', '/metrics'):
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass  # keep stdout clean
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    print("Serving metrics at http://%s:%d/metrics" % (host, port))
+    return server
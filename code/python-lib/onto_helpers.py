@@ -2,7 +2,11 @@
 
 """Helpers dealing with Owlready2 ontologies"""
 
+from contextlib import contextmanager
+from threading import Lock
+
 from owlready2 import *
+import owlready2.namespace
 
 
 def get_isolated_ontology(ontology_iri):
@@ -20,6 +24,151 @@ def delete_ontology(onto, close_world=True):
 		onto.world.close()
 
 
+class _WorldMark:
+	"""Initial state of a world (of an ontology) to roll it back to: everything added later
+	has greater row ids & storids. Only additions can be rolled back."""
+	def __init__(self, onto):
+		world = onto.world
+		graph = world.graph
+		self.objs = graph.execute("SELECT max(rowid), count(*) FROM objs").fetchone()
+		self.datas = graph.execute("SELECT max(rowid), count(*) FROM datas").fetchone()
+		self.aliases = graph.execute("SELECT max(rowid) FROM ontology_alias").fetchone()[0] or 0
+		self.max_storid = graph.execute("SELECT max(storid) FROM resources").fetchone()[0] or 0
+		self.store = graph.execute("SELECT current_blank, current_resource FROM store").fetchone()
+		self.numbered_iris = graph.execute("SELECT prefix, i FROM last_numbered_iri").fetchall()
+		self.props = dict(world._props)
+		self.reasoning_props = dict(world._reasoning_props)
+		self.base_iri = onto._base_iri
+		self.loaded = onto.loaded
+
+	def _is_new(self, storid):
+		# (blank nodes have negative storids; some entities are keyed by strings)
+		return isinstance(storid, int) and (storid > self.max_storid or storid < 0)
+
+	def _changed_entities(self, graph) -> set:
+		"""storids of initial entities that got new triples about them"""
+		return {s for (s,) in graph.execute(
+			"SELECT DISTINCT s FROM objs WHERE rowid > ? AND s BETWEEN 0 AND ? "
+			"UNION SELECT DISTINCT s FROM datas WHERE rowid > ? AND s BETWEEN 0 AND ?",
+			(self.objs[0] or 0, self.max_storid, self.datas[0] or 0, self.max_storid))}
+
+	def restore(self, onto) -> bool:
+		"""Drop everything added to the world since the mark was made.
+		Returns False if the initial data was changed so the world cannot be rolled back
+		(new triples about initial entities except the ontology itself count as changes)."""
+		world = onto.world
+		graph = world.graph
+		if onto._base_iri != self.base_iri:
+			return False
+		graph.acquire_write_lock()
+		try:
+			if graph.execute("SELECT count(*) FROM objs WHERE rowid <= ?", (self.objs[0] or 0,)).fetchone()[0] != self.objs[1] \
+					or graph.execute("SELECT count(*) FROM datas WHERE rowid <= ?", (self.datas[0] or 0,)).fetchone()[0] != self.datas[1]:
+				return False  # initial triples were removed
+			changed = self._changed_entities(graph)
+			if changed - {onto.storid}:
+				return False
+
+			graph.execute("DELETE FROM objs WHERE rowid > ?", (self.objs[0] or 0,))
+			graph.execute("DELETE FROM datas WHERE rowid > ?", (self.datas[0] or 0,))
+			graph.execute("DELETE FROM ontology_alias WHERE rowid > ?", (self.aliases,))
+			graph.execute("DELETE FROM resources WHERE storid > ?", (self.max_storid,))
+			graph.execute("UPDATE store SET current_blank = ?, current_resource = ?", self.store)
+			graph.execute("DELETE FROM last_numbered_iri")
+			graph.db.executemany("INSERT INTO last_numbered_iri VALUES (?, ?)", self.numbered_iris)
+		finally:
+			graph.release_write_lock()
+
+		# forget Python objects of the dropped entities
+		changed.update(storid for storid in list(world._entities.keys()) if self._is_new(storid))
+		for storid in changed:
+			world._entities.pop(storid, None)
+		cache = owlready2.namespace._cache
+		for i, entity in enumerate(cache):
+			if entity is not None and entity.namespace.world is world and entity.storid in changed:
+				cache[i] = None
+		for key in list(world._fusion_class_cache):
+			if any(self._is_new(storid) for storid in key):
+				del world._fusion_class_cache[key]
+		world._props.clear()
+		world._props.update(self.props)
+		world._reasoning_props.clear()
+		world._reasoning_props.update(self.reasoning_props)
+		onto.loaded = self.loaded
+		return True
+
+
+class OntologyPool:
+	"""Pool of ontologies, each in its own `World`, made by `factory()` (e.g. filled with static definitions).
+	An ontology is used by one thread at a time; on release, everything added to it is dropped
+	so it returns to the state `factory()` made it in and is reused by next request.
+	At most `size` idle ontologies are kept; if the pool is empty, a new one is made.
+
+		pool = OntologyPool(create_ontology_tbox)
+		with pool.ontology() as onto:
+			...
+	"""
+	def __init__(self, factory, size=4):
+		self.factory = factory
+		self.size = size
+		self._lock = Lock()
+		self._free = []
+		self._marks = {}  # id(onto) -> (onto, _WorldMark)
+
+	def acquire(self):
+		with self._lock:
+			if self._free:
+				return self._free.pop()
+		onto = self.factory()
+		with self._lock:
+			self._marks[id(onto)] = (onto, _WorldMark(onto))
+		return onto
+
+	def release(self, onto):
+		"""Give the ontology back to the pool (an ontology that does not come from the pool is deleted)"""
+		with self._lock:
+			onto_mark = self._marks.get(id(onto))
+		if onto_mark and onto_mark[0] is onto:
+			if onto_mark[1].restore(onto):
+				with self._lock:
+					if len(self._free) < self.size:
+						self._free.append(onto)
+						return
+			with self._lock:
+				del self._marks[id(onto)]
+		delete_ontology(onto)
+
+	def prefill(self, count=None):
+		"""Make idle ontologies in advance, up to `count` (pool size by default); the pool grows if required"""
+		count = count or self.size
+		self.size = max(self.size, count)
+		while True:
+			with self._lock:
+				if len(self._free) >= count:
+					return
+			onto = self.factory()
+			with self._lock:
+				self._marks[id(onto)] = (onto, _WorldMark(onto))
+				self._free.append(onto)
+
+	@contextmanager
+	def ontology(self):
+		onto = self.acquire()
+		try:
+			yield onto
+		finally:
+			self.release(onto)
+
+	def clear(self):
+		"""Delete all idle ontologies"""
+		with self._lock:
+			free, self._free = self._free, []
+			for onto in free:
+				del self._marks[id(onto)]
+		for onto in free:
+			delete_ontology(onto)
+
+
 def make_triple(subj, prop, obj):
 	"""More stable way to add new triples"""
 	try:
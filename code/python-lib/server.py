@@ -0,0 +1,353 @@
+# server.py
+
+""" Long-running local evaluation server: exposes the entry points of `ctrlstrct_test`
+(`process_algorithm_and_trace_from_json`, `make_act_json`, `add_styling_to_trace`, `evaluate_act`) over HTTP/JSON.
+
+Cold-start costs are paid once at start-up: the TBox is built, localization files are loaded
+and the Jena service is started (or connected to). Requests are run on a fixed pool of workers,
+each with a timeout.
+
+    python server.py --port 8765 --workers 4 --timeout 60
+
+Requests (POST, JSON body):
+
+    /<method>  body: params of the method (object: keyword arguments, array: positional ones),
+               answer: the result as JSON.
+    /  or /rpc body: JSON-RPC 2.0 request {"jsonrpc": "2.0", "method": ..., "params": ..., "id": ...}
+               (a batch of requests is not supported).
+
+    GET /health   -> {"status": "ok", ...}
+    GET /metrics  -> stage latencies & request counters in Prometheus text format.
+
+Errors that the entry points answer as strings (e.g. `make_act_json`) are reported as errors too:
+HTTP 422 / JSON-RPC code -32000. A request that runs longer than the timeout gets HTTP 504 / code -32001;
+if it is still waiting for a worker then, it is not run at all. The timeout is passed to the entry points
+as a deadline too (`deadline` parameter, not accepted from clients), so a Jena call gives up in time
+and the worker is freed. Note: entry points without a `deadline` parameter (`make_act_json`,
+`add_styling_to_trace`) are not limited: the worker finishes such a request in the background.
+
+Calls to the Jena service are admitted in priority lanes (see `admission.py`): requests are interactive,
+speculation runs in the batch lane. If the queue of the lane is full, the request is answered at once
+with HTTP 503 / code -32002 (busy).
+
+With `--speculate N`, after answering `evaluate_act` the server evaluates up to N likely next acts of the same
+session in background, while the student thinks (see `speculation.py`); `evaluate_act` accepts
+an extra `session` parameter then.
+"""
+
+import argparse
+import atexit
+import inspect
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+
+import external_run
+from admission import ADMISSION, Busy
+from ctrlstrct_run import prepare_ontology_pools
+from ctrlstrct_test import add_styling_to_trace, evaluate_act, make_act_json, process_algorithm_and_trace_from_json
+from explanations import EXPLANATIONS, locale
+from external_run import ReasoningTimeout
+from jena.jenaClient import PROTOCOLS, TRANSPORTS
+from metrics import METRICS
+from speculation import Speculator, SPECULATION_TTL, SPECULATION_WORKERS
+
+
+DEFAULT_PORT = 8765
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 60.0  # seconds
+
+METHODS = {
+    "process_algorithm_and_trace_from_json": process_algorithm_and_trace_from_json,
+    "make_act_json": make_act_json,
+    "add_styling_to_trace": add_styling_to_trace,
+    "evaluate_act": evaluate_act,
+}
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+CALL_FAILED = -32000  # the entry point answered an error description
+CALL_TIMEOUT = -32001
+CALL_BUSY = -32002  # the reasoning queue is full (load shedding)
+
+_HTTP_STATUS = {
+    PARSE_ERROR: 400,
+    INVALID_REQUEST: 400,
+    METHOD_NOT_FOUND: 404,
+    INVALID_PARAMS: 400,
+    INTERNAL_ERROR: 500,
+    CALL_FAILED: 422,
+    CALL_TIMEOUT: 504,
+    CALL_BUSY: 503,
+}
+
+COUNTER_NAME = 'ctrlflow_server_requests_total'
+CACHE_COUNTER_NAME = 'ctrlflow_explanation_cache_requests_total'
+SPECULATION_COUNTER_NAME = 'ctrlflow_speculation_requests_total'
+
+
+class CallError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class EvaluationService:
+    """Worker pool that runs the entry points with a timeout and counts the outcomes"""
+    def __init__(self, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT, speculator: Speculator = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.speculator = speculator
+        self.methods = dict(METHODS)
+        if speculator is not None:
+            self.methods["evaluate_act"] = speculator.evaluate_act
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="eval")
+        self._lock = Lock()
+        self.counters = {}  # (method, outcome) -> count
+
+    def warm_up(self, languages=None, start_jena=True):
+        """Pay cold-start costs in advance: build the TBox (for each worker), load localizations, start Jena service"""
+        with METRICS.timer("server.warmup.tbox"):
+            prepare_ontology_pools(self.workers + (self.speculator.workers if self.speculator else 0))
+        with METRICS.timer("server.warmup.locales"):
+            locale.preload(languages)
+        if start_jena:
+            with METRICS.timer("server.warmup.jena"):
+                external_run.start_jena_reasoning_service()
+
+    def call(self, method: str, params):
+        """Run the method on a worker and wait for the result; raises `CallError`"""
+        try:
+            result = self._call(method, params)
+        except CallError as e:
+            outcome = {CALL_TIMEOUT: "timeout", CALL_FAILED: "failed", CALL_BUSY: "busy"}.get(e.code, "error")
+            self._count(method if method in self.methods else "unknown", outcome)
+            raise
+        self._count(method, "ok")
+        return result
+
+    def _call(self, method, params):
+        func = self.methods.get(method)
+        if func is None:
+            raise CallError(METHOD_NOT_FOUND, "Unknown method: %s" % method)
+        if isinstance(params, dict):
+            args, kwargs = (), params
+        elif isinstance(params, list):
+            args, kwargs = params, {}
+        elif params is None:
+            args, kwargs = (), {}
+        else:
+            raise CallError(INVALID_PARAMS, "params must be an object or an array")
+        if "deadline" in kwargs:
+            raise CallError(INVALID_PARAMS, "%s: 'deadline' is set by the server" % method)
+        try:
+            inspect.signature(func).bind(*args, **kwargs)
+        except TypeError as e:
+            raise CallError(INVALID_PARAMS, "%s: %s" % (method, e))
+
+        if "deadline" in inspect.signature(func).parameters:
+            # (the time in the queue counts as well)
+            kwargs = dict(kwargs, deadline=time.monotonic() + self.timeout)
+        future = self.pool.submit(self._run, method, func, args, kwargs)
+        try:
+            result = future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()  # (the client is answered: a request still in the queue is not to take a worker)
+            raise CallError(CALL_TIMEOUT, "%s did not finish in %.1f s" % (method, self.timeout))
+        if isinstance(result, str):
+            # an entry point answered an error description
+            raise CallError(CALL_FAILED, result)
+        return result
+
+    @staticmethod
+    def _run(method, func, args, kwargs):
+        with METRICS.timer("server." + method):
+            try:
+                return func(*args, **kwargs)
+            except Busy as e:
+                raise CallError(CALL_BUSY, "%s: %s" % (method, e.message))
+            except ReasoningTimeout as e:
+                raise CallError(CALL_TIMEOUT, "%s: reasoning did not finish in time: %s" % (method, e.message))
+            except Exception as e:
+                raise CallError(INTERNAL_ERROR, "%s: %s" % (type(e).__name__, e))
+
+    def _count(self, method, outcome):
+        with self._lock:
+            key = (method, outcome)
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            counters = sorted(self.counters.items())
+        lines = [
+            '# HELP %s Requests to the evaluation server by method and outcome.' % COUNTER_NAME,
+            '# TYPE %s counter' % COUNTER_NAME,
+        ]
+        for (method, outcome), count in counters:
+            lines.append('%s{method="%s",outcome="%s"} %d' % (COUNTER_NAME, method, outcome, count))
+        cache = EXPLANATIONS.stats()
+        lines += [
+            '# HELP %s Lookups of formatted explanations in the cache.' % CACHE_COUNTER_NAME,
+            '# TYPE %s counter' % CACHE_COUNTER_NAME,
+            '%s{result="hit"} %d' % (CACHE_COUNTER_NAME, cache["hits"]),
+            '%s{result="miss"} %d' % (CACHE_COUNTER_NAME, cache["misses"]),
+        ]
+        if self.speculator is not None:
+            speculation = self.speculator.stats()
+            lines += [
+                '# HELP %s Clicks answered from speculated results (hit) or evaluated on demand (miss).'
+                % SPECULATION_COUNTER_NAME,
+                '# TYPE %s counter' % SPECULATION_COUNTER_NAME,
+                '%s{result="hit"} %d' % (SPECULATION_COUNTER_NAME, speculation["hits"]),
+                '%s{result="miss"} %d' % (SPECULATION_COUNTER_NAME, speculation["misses"]),
+                '# HELP ctrlflow_speculated_acts_total Acts evaluated in background.',
+                '# TYPE ctrlflow_speculated_acts_total counter',
+                'ctrlflow_speculated_acts_total %d' % speculation["speculated"],
+            ]
+        return METRICS.to_prometheus() + '\n'.join(lines) + '\n' + ADMISSION.to_prometheus()
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False)
+        if self.speculator is not None:
+            self.speculator.shutdown()
+
+
+def make_handler(service: EvaluationService):
+
+    class EvaluationHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split('?')[0]
+            if path == '/metrics':
+                self._send(200, service.to_prometheus().encode(), 'text/plain; version=0.0.4')
+            elif path == '/health':
+                self._send_json(200, {"status": "ok", "methods": sorted(service.methods)})
+            else:
+                self.send_error(404)
+
+        def do_POST(self):
+            path = self.path.split('?')[0].strip('/')
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'null')
+            except ValueError as e:
+                self._send_error(CallError(PARSE_ERROR, "Invalid JSON: %s" % e), None, rpc=path in ('', 'rpc'))
+                return
+
+            if path in ('', 'rpc'):
+                self._handle_rpc(body)
+                return
+            try:
+                result = service.call(path, body)
+            except CallError as e:
+                self._send_error(e)
+                return
+            self._send_json(200, result)
+
+        def _handle_rpc(self, request):
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                self._send_error(CallError(INVALID_REQUEST, "Invalid JSON-RPC request"), None, rpc=True)
+                return
+            request_id = request.get("id")
+            try:
+                result = service.call(request["method"], request.get("params"))
+            except CallError as e:
+                self._send_error(e, request_id, rpc=True)
+                return
+            self._send_json(200, {"jsonrpc": "2.0", "result": result, "id": request_id})
+
+        def _send_error(self, error: CallError, request_id=None, rpc=False):
+            if rpc:
+                # JSON-RPC over HTTP: errors are answered with 200 as well
+                self._send_json(200, {"jsonrpc": "2.0", "error": {"code": error.code, "message": error.message},
+                                      "id": request_id})
+            else:
+                self._send_json(_HTTP_STATUS.get(error.code, 500), {"error": error.message, "code": error.code})
+
+        def _send_json(self, status, data):
+            self._send(status, json.dumps(data, ensure_ascii=False).encode(), 'application/json; charset=utf-8')
+
+        def _send(self, status, body: bytes, content_type):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass  # keep stdout clean
+
+    return EvaluationHandler
+
+
+def serve(port=DEFAULT_PORT, host='127.0.0.1', workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+          warm_up=True, start_jena=True, speculator=None) -> (ThreadingHTTPServer, EvaluationService):
+    """Create the server (not started yet: call `serve_forever()` on it)"""
+    service = EvaluationService(workers, timeout, speculator)
+    if warm_up:
+        print("Warming up ...")
+        with METRICS.timer("server.warmup"):
+            service.warm_up(start_jena=start_jena)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    print("Evaluation server is listening on http://%s:%d/ (%d workers, timeout %.1f s)" % (host, port, workers, timeout))
+    return server, service
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP/JSON server of trace evaluation.")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="requests processed simultaneously")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="max seconds to wait for a request")
+    parser.add_argument("--external-jena", action="store_true", help="do not spawn Jena.jar: the service is run by someone else")
+    parser.add_argument("--jena-transport", choices=sorted(TRANSPORTS), default=external_run.JENA_TRANSPORT)
+    parser.add_argument("--jena-protocol", choices=sorted(PROTOCOLS), default=external_run.JENA_PROTOCOL)
+    parser.add_argument("--jena-unix-socket", action="store_true",
+                        help="talk to Jena service over a Unix domain socket (a path per server process) instead of TCP")
+    parser.add_argument("--jena-slots", type=int, default=ADMISSION.slots,
+                        help="calls to Jena service at a time (interactive ones first, see admission.py)")
+    parser.add_argument("--no-warmup", action="store_true")
+    parser.add_argument("--speculate", type=int, default=0, metavar="N",
+                        help="evaluate up to N likely next acts in background after each evaluate_act (0: off)")
+    parser.add_argument("--speculation-workers", type=int, default=SPECULATION_WORKERS)
+    parser.add_argument("--speculation-ttl", type=float, default=SPECULATION_TTL,
+                        help="seconds a speculated result is kept")
+    args = parser.parse_args(argv)
+
+    if args.external_jena:
+        external_run.SPAWN_SERVICE = False
+    external_run.JENA_TRANSPORT = args.jena_transport
+    external_run.JENA_PROTOCOL = args.jena_protocol
+    if args.jena_unix_socket:
+        external_run.JENA_UNIX_SOCKET = True
+    ADMISSION.slots = args.jena_slots
+
+    speculator = None
+    if args.speculate > 0:
+        speculator = Speculator(args.speculation_workers, args.speculate, args.speculation_ttl)
+
+    # try to close the external process if it will still be running on Python program end
+    atexit.register(external_run.stop_jena_reasoning_service)
+
+    server, service = serve(args.port, args.host, args.workers, args.timeout, warm_up=not args.no_warmup,
+                            speculator=speculator)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
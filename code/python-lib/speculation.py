@@ -0,0 +1,237 @@
+# speculation.py
+
+""" Speculative pre-evaluation of the next acts during the student's think time.
+
+After an act is answered, the next click is one of a few candidates: begin / end of a statement,
+performing of an action or a condition. `Speculator` evaluates some of them in background
+(the same `evaluate_act()` as for a real click) and keeps the results for a short time,
+so the next click is likely answered from the cache.
+
+    speculator = Speculator(workers=2, budget=8, ttl=120)
+    feedback = speculator.evaluate_act(alg_tr, element_id, act_type, user_language="en", session="alice")
+
+The correct next act (known from `TraceAutomaton`) is speculated first, then the other acts in the order
+of the algorithm, `budget` acts after each answer. A new click of the same session cancels
+the speculation not started yet; a click that finds its own act still being speculated
+does not wait for it, but is evaluated on demand. Speculated acts are reasoned about in the batch lane
+(see `admission.py`), so real clicks go first.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import admission
+from alg_model import AlgorithmModel, algorithm_digest
+from ctrlstrct_run import TraceTester
+from ctrlstrct_test import evaluate_act
+from metrics import METRICS
+from trace_automaton import TraceAutomaton
+
+SPECULATION_WORKERS = 2
+SPECULATION_BUDGET = 8  # acts speculated after each answer (0: no speculation)
+SPECULATION_TTL = 120.0  # seconds a speculated result is kept
+SPECULATION_CACHE_SIZE = 1024
+
+ATOMIC_TYPES = {"stmt", "expr", "break", "continue", "return"}
+NOT_CLICKABLE_TYPES = {"algorithm", "func", None}
+
+
+def trace_key(trace) -> tuple:
+    """Acts `make_act_json()` takes into account (correct ones only)"""
+    return tuple((a["id"], a["executes"], a["phase"], a["n"], a.get("value"))
+                 for a in trace if a["is_valid"] == True)
+
+
+def candidate_acts(algorithm: dict, trace) -> list:
+    """(element id, act type) the student may add next: the correct one first (if known), then all others"""
+    model = AlgorithmModel.of(algorithm)
+    candidates = []
+    automaton = TraceAutomaton.of(algorithm)
+    if automaton is not None:
+        check = automaton.check([a for a in trace if a["is_valid"] == True])
+        if check.next_act and check.next_act[0] != model.entry.id:
+            candidates.append(check.next_act)
+    for node in model:
+        if node is model.entry or node.type in NOT_CLICKABLE_TYPES:
+            continue
+        for act_type in (("performed",) if node.type in ATOMIC_TYPES else ("started", "finished")):
+            if (node.id, act_type) not in candidates:
+                candidates.append((node.id, act_type))
+    return candidates
+
+
+class SpeculationCache:
+    """Short-lived LRU cache of act evaluations: key -> (expiration time, feedback)"""
+    def __init__(self, size=SPECULATION_CACHE_SIZE, ttl=SPECULATION_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._lock = Lock()
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._items[key]  # expired
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return item[1]
+
+    def __contains__(self, key):
+        """The key has a result not expired (not counted as a lookup)"""
+        with self._lock:
+            item = self._items.get(key)
+            return item is not None and item[0] >= time.monotonic()
+
+    def put(self, key, feedback):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, feedback)
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def evict_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            for key in [k for k, (expires, _) in self._items.items() if expires < now]:
+                del self._items[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "size": len(self._items),
+            }
+
+
+class Speculator:
+    """Answers clicks (`evaluate_act`) and speculates the next ones of each session in a thread pool"""
+    def __init__(self, workers=SPECULATION_WORKERS, budget=SPECULATION_BUDGET, ttl=SPECULATION_TTL,
+                 cache_size=SPECULATION_CACHE_SIZE):
+        self.workers = workers
+        self.budget = budget
+        self.cache = SpeculationCache(cache_size, ttl)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="speculate")
+        self._lock = Lock()
+        self._pending = {}   # key -> Future of an evaluation in progress
+        self._sessions = {}  # session -> Futures of the last speculation round (until they are all done)
+        self.speculated = 0  # evaluations done in background
+
+    @staticmethod
+    def make_key(alg_tr: dict, digest: str, algorithm_element_id, act_type: str, user_language) -> tuple:
+        return (alg_tr.get("algorithm_name"), alg_tr.get("trace_name"), digest,
+                trace_key(alg_tr["trace"]), int(algorithm_element_id), act_type, user_language)
+
+    def evaluate_act(self, alg_tr: dict, algorithm_element_id: int, act_type: str, user_language=None,
+                     session=None, deadline=None):
+        """`ctrlstrct_test.evaluate_act()` answered from the speculated results if possible.
+        `session`: clicks of one student (by default, the trace name); `deadline`: of an evaluation on demand."""
+        session = session if session is not None else alg_tr.get("trace_name")
+        self._cancel_round(session)
+
+        # (the algorithm dict is supplemented while evaluating, so it is hashed & copied before)
+        digest = algorithm_digest(alg_tr["algorithm"])
+        algorithm = copy.deepcopy(alg_tr["algorithm"]) if self.budget > 0 else None
+        key = self.make_key(alg_tr, digest, algorithm_element_id, act_type, user_language)
+        feedback = self.cache.get(key)
+        if feedback is None:
+            with self._lock:
+                future = self._pending.get(key)
+            if future is not None and not future.cancel() and future.done() and future.exception() is None:
+                feedback = future.result()
+            # else: being speculated (in the batch lane) or not at all: the click is not to wait for it
+        if feedback is not None:
+            feedback = copy.deepcopy(feedback)
+        else:
+            with admission.lane(admission.INTERACTIVE):
+                feedback = evaluate_act(alg_tr, algorithm_element_id, act_type, user_language, deadline)
+
+        if isinstance(feedback, dict) and self.budget > 0:
+            # (the answer is sent to the client and may change)
+            self._speculate(session, dict(alg_tr, algorithm=algorithm, trace=copy.deepcopy(feedback["trace"])),
+                            digest, user_language)
+        return feedback
+
+    def _speculate(self, session, alg_tr: dict, digest: str, user_language):
+        """Start evaluating candidate next acts of the new trace.
+        The evaluations share the algorithm dict (and so its model & automaton): the keys evaluation adds to it
+        are added here once, so the evaluations running at the same time only replace their values."""
+        self.cache.evict_expired()
+        TraceTester(alg_tr).prepare_algorithm()
+        futures = []
+        for element_id, act_type in candidate_acts(alg_tr["algorithm"], alg_tr["trace"]):
+            if len(futures) >= self.budget:
+                break
+            key = self.make_key(alg_tr, digest, element_id, act_type, user_language)
+            with self._lock:
+                if key in self._pending:
+                    continue
+            if key in self.cache:
+                continue
+            future = self.pool.submit(self._run, key, alg_tr, element_id, act_type, user_language)
+            with self._lock:
+                self._pending[key] = future
+            # forget it when done or cancelled (called at once if done already)
+            future.add_done_callback(lambda f, key=key: self._forget(key, f))
+            futures.append(future)
+        if not futures:
+            return
+        with self._lock:
+            self._sessions[session] = futures
+        for future in futures:
+            # (a session that has gone quiet is forgotten once its round is over)
+            future.add_done_callback(lambda f: self._end_round(session, futures))
+
+    def _run(self, key, alg_tr, element_id, act_type, user_language):
+        with METRICS.timer("speculation.evaluate"), admission.lane(admission.BATCH):
+            feedback = evaluate_act(dict(alg_tr, trace=copy.deepcopy(alg_tr["trace"])), element_id, act_type,
+                                    user_language)
+        if isinstance(feedback, dict):
+            self.cache.put(key, feedback)
+            with self._lock:
+                self.speculated += 1
+        return feedback
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _end_round(self, session, futures):
+        with self._lock:
+            if self._sessions.get(session) is futures and all(f.done() for f in futures):
+                del self._sessions[session]
+
+    def _cancel_round(self, session):
+        """The student has clicked: evaluations of the previous round that have not started are not needed"""
+        with self._lock:
+            futures = self._sessions.pop(session, ())
+        for future in futures:
+            future.cancel()
+
+    def stats(self) -> dict:
+        stats = self.cache.stats()
+        with self._lock:
+            stats.update(speculated=self.speculated, pending=len(self._pending))
+        return stats
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,9 @@
+# conftest.py
+
+""" Regression checks of python-lib (run from `code/python-lib`: `python -m pytest -q`).
+The checks do not need Java: nothing here calls the Jena service. """
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,103 @@
+# test_admission.py
+
+""" `AdmissionController`: lane limits, priority of the interactive lane, load shedding, deadlines. """
+
+import time
+from threading import Event, Thread
+
+import pytest
+
+from admission import AdmissionController, BATCH, Busy, INTERACTIVE, lane, current_lane
+from jena.jenaClient import ReasoningTimeout
+
+
+def hold(controller, lane_name, started: list, release: Event, name):
+    """A call that holds its slot until `release` is set"""
+    def run():
+        try:
+            with controller.admit(lane_name):
+                started.append(name)
+                release.wait(5)
+        except Busy:
+            started.append(name + ":busy")
+    thread = Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_until(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.005)
+
+
+def test_interactive_lane_goes_first():
+    controller = AdmissionController(slots=1, lanes=((INTERACTIVE, None, 8), (BATCH, None, 8)))
+    started, release = [], Event()
+    first = hold(controller, BATCH, started, release, "b0")
+    wait_until(lambda: started == ["b0"])
+    others = [hold(controller, BATCH, started, release, "b1")]
+    wait_until(lambda: controller.stats()[BATCH]["queue_depth"] == 1)
+    others.append(hold(controller, INTERACTIVE, started, release, "i0"))
+    wait_until(lambda: controller.stats()[INTERACTIVE]["queue_depth"] == 1)
+
+    release.set()  # the only slot is freed: the later interactive call takes it first
+    for thread in [first] + others:
+        thread.join(5)
+    assert started == ["b0", "i0", "b1"]
+
+def test_lane_limit_leaves_slots_to_interactive():
+    controller = AdmissionController(slots=3, lanes=((INTERACTIVE, None, 8), (BATCH, 1, 8)))
+    started, release = [], Event()
+    threads = [hold(controller, BATCH, started, release, "b%d" % i) for i in range(2)]
+    wait_until(lambda: controller.stats()[BATCH]["queue_depth"] == 1)
+    assert controller.stats()[BATCH]["running"] == 1
+
+    with controller.admit(INTERACTIVE), controller.admit(INTERACTIVE):
+        assert controller.stats()[INTERACTIVE]["running"] == 2
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert sorted(started) == ["b0", "b1"]
+
+
+def test_full_queue_is_shed_at_once():
+    controller = AdmissionController(slots=1, lanes=((INTERACTIVE, None, 1), (BATCH, None, 1)))
+    started, release = [], Event()
+    threads = [hold(controller, BATCH, started, release, "b0")]
+    wait_until(lambda: started == ["b0"])
+    threads.append(hold(controller, BATCH, started, release, "b1"))
+    wait_until(lambda: controller.stats()[BATCH]["queue_depth"] == 1)
+
+    start = time.monotonic()
+    with pytest.raises(Busy):
+        with controller.admit(BATCH):
+            pass
+    assert time.monotonic() - start < 0.5
+    assert controller.stats()[BATCH]["shed"] == 1
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    stats = controller.stats()[BATCH]
+    assert (stats["admitted"], stats["queue_depth"], stats["running"]) == (2, 0, 0)
+
+
+def test_deadline_expires_in_the_queue():
+    controller = AdmissionController(slots=1)
+    with controller.admit(INTERACTIVE):
+        start = time.monotonic()
+        with pytest.raises(ReasoningTimeout):
+            with controller.admit(INTERACTIVE, deadline=time.monotonic() + 0.1):
+                pass
+        assert time.monotonic() - start < 1.0
+    stats = controller.stats()[INTERACTIVE]
+    assert (stats["expired"], stats["queue_depth"], stats["running"]) == (1, 0, 0)
+
+
+def test_lane_of_the_caller():
+    assert current_lane() == INTERACTIVE
+    with lane(BATCH):
+        assert current_lane() == BATCH
+    assert current_lane() == INTERACTIVE
@@ -0,0 +1,131 @@
+# test_coalescing.py
+
+""" Single flight of identical concurrent requests in `ctrlstrct_test._process_coalesced()`.
+The processing itself is replaced with a function that waits for a signal (no ontology, no Jena). """
+
+import time
+from threading import Event, Lock, Thread
+
+import pytest
+
+import admission
+import ctrlstrct_test
+from external_run import ReasoningTimeout
+
+
+class FakeProcessing:
+    """Stands for `_process_with_reasoning()`: counts calls, appends an act to the trace, answers a mistake"""
+    def __init__(self, error=None):
+        self.calls = 0
+        self.started = Event()
+        self.release = Event()
+        self.error = error  # raised by the first call
+        self._lock = Lock()
+
+    def __call__(self, alg_trs_list, write_mistakes_to_acts, deadline):
+        with self._lock:
+            self.calls += 1
+            first = self.calls == 1
+        self.started.set()
+        self.release.wait(5)
+        if first and self.error:
+            raise self.error
+        alg_trs_list[0]["trace"].append({"id": 100, "is_valid": True})
+        return [{"id": [1], "explanations": ["wrong"]}], None
+
+
+@pytest.fixture
+def processing(monkeypatch):
+    fake = FakeProcessing()
+    monkeypatch.setattr(ctrlstrct_test, "_process_with_reasoning", fake)
+    return fake
+
+
+def make_request(trace_name="t"):
+    return [{"trace_name": trace_name, "algorithm_name": "a", "algorithm": {"id": 1, "name": "a", "type": "algorithm"},
+             "trace": [{"id": 1, "is_valid": True}], "header_boolean_chain": None}]
+
+
+def run_concurrently(requests, lanes=None, deadlines=None):
+    """Start a call per request (the first one first), return (threads, results)"""
+    results = [None] * len(requests)
+
+    def call(i):
+        try:
+            with admission.lane(lanes[i] if lanes else admission.INTERACTIVE):
+                results[i] = ctrlstrct_test._process_coalesced(requests[i], False, deadlines and deadlines[i])
+        except Exception as e:
+            results[i] = e
+
+    threads = []
+    for i in range(len(requests)):
+        threads.append(Thread(target=call, args=(i,), daemon=True))
+        threads[-1].start()
+        if i == 0:
+            wait_for_leader()
+    return threads, results
+
+
+def wait_for_leader():
+    end = time.monotonic() + 5
+    while not ctrlstrct_test._in_flight:
+        assert time.monotonic() < end
+        time.sleep(0.005)
+
+
+def finish(processing, threads):
+    time.sleep(0.05)  # (let the followers get to waiting)
+    processing.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert not ctrlstrct_test._in_flight
+
+
+def test_identical_requests_are_processed_once(processing):
+    requests = [make_request() for _ in range(4)]
+    threads, results = run_concurrently(requests)
+    finish(processing, threads)
+
+    assert processing.calls == 1
+    assert all(r == results[0] for r in results) and results[0][0][0]["explanations"] == ["wrong"]
+    assert len({id(r[0]) for r in results}) == 4  # each got its own copy
+    for request in requests:
+        assert request[0]["trace"] == [{"id": 1, "is_valid": True}, {"id": 100, "is_valid": True}]
+    assert len({id(request[0]["trace"][-1]) for request in requests}) == 4
+
+
+def test_different_requests_are_not_coalesced(processing):
+    threads, results = run_concurrently([make_request("t1"), make_request("t2")])
+    finish(processing, threads)
+    assert processing.calls == 2
+
+
+def test_lanes_are_not_coalesced(processing):
+    threads, results = run_concurrently([make_request(), make_request()], lanes=[admission.BATCH, admission.INTERACTIVE])
+    finish(processing, threads)
+    assert processing.calls == 2
+
+
+@pytest.mark.parametrize("error", [ReasoningTimeout("leader's deadline"), admission.Busy("queue is full")])
+def test_follower_retries_after_leader_timeout_or_busy(processing, error):
+    processing.error = error
+    threads, results = run_concurrently([make_request(), make_request()])
+    finish(processing, threads)
+    assert results[0] is error
+    assert processing.calls == 2 and results[1][1] is None
+
+
+def test_follower_gets_other_errors_of_leader(processing):
+    processing.error = ValueError("broken trace")
+    threads, results = run_concurrently([make_request(), make_request()])
+    finish(processing, threads)
+    assert processing.calls == 1
+    assert isinstance(results[1], ValueError)
+
+
+def test_follower_deadline(processing):
+    threads, results = run_concurrently([make_request(), make_request()], deadlines=[None, time.monotonic() + 0.1])
+    threads[1].join(5)
+    assert isinstance(results[1], ReasoningTimeout)
+    finish(processing, threads)
+    assert processing.calls == 1 and results[0][1] is None
@@ -0,0 +1,33 @@
+# test_explanation_cache.py
+
+""" `explanations.EXPLANATION_CACHE_SIZE` applies to the cache built at import (`EXPLANATIONS`). """
+
+import pytest
+
+import explanations
+
+
+@pytest.fixture
+def cache():
+    explanations.EXPLANATIONS.clear()
+    yield explanations.EXPLANATIONS
+    explanations.EXPLANATIONS.clear()
+
+
+def test_zero_size_disables_the_cache(cache, monkeypatch):
+    cache.put("k", {"text": "cached"})
+    monkeypatch.setattr(explanations, "EXPLANATION_CACHE_SIZE", 0)
+
+    assert cache.get("k") is None
+    cache.put("k2", {"text": "not cached"})
+    assert cache.stats()["size"] == 0
+
+
+def test_smaller_size_evicts_least_recently_used(cache, monkeypatch):
+    for key in "abc":
+        cache.put(key, {"text": key})
+    cache.get("a")
+    monkeypatch.setattr(explanations, "EXPLANATION_CACHE_SIZE", 2)
+    cache.put("d", {"text": "d"})
+
+    assert [key for key in "abcd" if key in cache._items] == ["a", "d"]
@@ -0,0 +1,72 @@
+# test_ontology_pool.py
+
+""" `OntologyPool` gives back ontologies rolled back to the state `factory()` made them in (`_WorldMark`). """
+
+from owlready2 import Thing
+
+from ctrlstrct_run import TraceTester, create_ontology_tbox, make_trace_for_algorithm
+from bench.synthetic import generate_algorithm
+from onto_helpers import OntologyPool, get_isolated_ontology
+
+IRI = 'http://vstu.ru/poas/pool_test'
+
+
+def make_ontology():
+    onto = get_isolated_ontology(IRI)
+    with onto:
+        class stmt(Thing):
+            pass
+    return onto
+
+
+def count_triples(onto) -> int:
+    return len(list(onto.world.graph._iter_triples()))
+
+
+def test_release_rolls_back_additions():
+    pool = OntologyPool(make_ontology, size=1)
+    onto = pool.acquire()
+    initial = count_triples(onto)
+    with onto:
+        onto.stmt("a1")
+        onto.stmt("a2").label = ["new"]
+    assert count_triples(onto) > initial
+    pool.release(onto)
+
+    again = pool.acquire()
+    assert again is onto  # reused
+    assert count_triples(again) == initial
+    assert again["a1"] is None and again["a2"] is None
+    with again:
+        assert again.stmt("a1").name == "a1"  # the same names can be made again
+    pool.release(again)
+
+
+def test_changed_initial_entity_is_not_reused():
+    pool = OntologyPool(make_ontology, size=1)
+    onto = pool.acquire()
+    onto.stmt.label = ["changed"]  # an initial entity: cannot be rolled back
+    pool.release(onto)
+
+    other = pool.acquire()
+    assert other is not onto
+    assert not other.stmt.label
+    assert id(onto) not in pool._marks  # the dropped one is forgotten
+    pool.release(other)
+
+
+def test_tbox_is_clean_after_injection():
+    pool = OntologyPool(create_ontology_tbox, size=1)
+    onto = pool.acquire()
+    initial = count_triples(onto)
+    algorithm = generate_algorithm("pool", seed=0, depth=2, loops=1, alternatives=1, stmts=1, iterations=2)
+    trace = make_trace_for_algorithm(algorithm)
+    TraceTester({"algorithm_name": algorithm["name"], "trace_name": "pool", "algorithm": algorithm,
+                 "trace": trace, "header_boolean_chain": None}).inject_to_ontology(onto)
+    assert count_triples(onto) > initial
+    pool.release(onto)
+
+    again = pool.acquire()
+    assert again is onto
+    assert count_triples(again) == initial
+    pool.release(again)
@@ -0,0 +1,67 @@
+# test_speculation.py
+
+""" Bookkeeping of `speculation.Speculator` rounds.
+Evaluation of an act is replaced with a function that only appends the act to the trace (no ontology, no Jena). """
+
+import pytest
+
+import speculation
+from bench.synthetic import generate_algorithm
+from ctrlstrct_run import make_trace_for_algorithm
+
+
+class FakeEvaluation:
+    """Stands for `ctrlstrct_test.evaluate_act()`: the act is appended to the trace as a correct one"""
+    def __init__(self):
+        self.algorithms = []  # algorithm dicts evaluations were given
+
+    def __call__(self, alg_tr, algorithm_element_id, act_type, user_language=None, deadline=None):
+        self.algorithms.append(alg_tr["algorithm"])
+        act = {"id": 1000 + len(alg_tr["trace"]), "executes": algorithm_element_id, "phase": act_type, "n": 1,
+               "is_valid": True}
+        return {"messages": [], "mistakes": [], "trace": alg_tr["trace"] + [act]}
+
+
+@pytest.fixture
+def evaluation(monkeypatch):
+    fake = FakeEvaluation()
+    monkeypatch.setattr(speculation, "evaluate_act", fake)
+    return fake
+
+
+def make_alg_tr(name="spec"):
+    algorithm = generate_algorithm(name, seed=0, depth=2, loops=1, alternatives=1, stmts=1, iterations=2)
+    make_trace_for_algorithm(algorithm)  # (fills algorithm["id2obj"], as the GUI gets it)
+    return {"trace_name": name, "algorithm_name": algorithm["name"], "algorithm": algorithm, "trace": [],
+            "header_boolean_chain": None}
+
+
+def first_click(alg_tr):
+    entry = speculation.AlgorithmModel.of(alg_tr["algorithm"]).entry
+    return entry.id, "started"
+
+
+def test_session_is_forgotten_when_its_round_is_over(evaluation):
+    speculator = speculation.Speculator(workers=2, budget=4)
+    alg_tr = make_alg_tr()
+    speculator.evaluate_act(alg_tr, *first_click(alg_tr), session="quiet")
+    speculator.pool.shutdown(wait=True)
+
+    assert speculator.speculated == 4
+    assert speculator._sessions == {}
+    assert speculator.stats()["pending"] == 0
+
+
+
+def test_round_shares_one_algorithm(evaluation):
+    speculator = speculation.Speculator(workers=2, budget=4)
+    alg_tr = make_alg_tr()
+    speculator.evaluate_act(alg_tr, *first_click(alg_tr), session="s")
+    speculator.pool.shutdown(wait=True)
+
+    click, *speculated = evaluation.algorithms
+    assert click is alg_tr["algorithm"]
+    assert len(speculated) == 4
+    assert all(algorithm is speculated[0] for algorithm in speculated)
+    assert speculated[0] is not alg_tr["algorithm"]  # (evaluation may supplement it)
+    assert {"entry_point", "id2obj"} <= speculated[0].keys()
@@ -0,0 +1,66 @@
+# test_trace_automaton.py
+
+""" `TraceAutomaton` against `TraceTester.make_correct_trace()` on synthetic algorithms. """
+
+import copy
+import random
+
+import pytest
+
+import trace_automaton
+from bench.synthetic import generate_algorithm
+from ctrlstrct_run import make_trace_for_algorithm
+from trace_automaton import TraceAutomaton
+
+ALGORITHMS = 150
+
+
+def synthetic_cases():
+    rng = random.Random(0)
+    for seed in range(ALGORITHMS):
+        yield seed, dict(depth=rng.randint(1, 4), loops=rng.randint(0, 4), alternatives=rng.randint(0, 4),
+                         stmts=rng.randint(1, 3), iterations=rng.randint(0, 3), functions=rng.randint(0, 2))
+
+
+def is_known_divergence(algorithm, trace, check) -> bool:
+    """`make_correct_trace()` goes on to the next branch's condition after a taken branch (see the module docstring)"""
+    previous, unexpected = trace[check.checked - 1], trace[check.checked]
+    return (algorithm["id2obj"][previous["executes"]]["type"] in ("if", "else-if") and previous["phase"] == "finished"
+            and algorithm["id2obj"][unexpected["executes"]]["type"] == "expr")
+
+
+@pytest.mark.parametrize("seed, shape", list(synthetic_cases()))
+def test_agrees_with_make_correct_trace(seed, shape):
+    algorithm = generate_algorithm("ta_%d" % seed, seed=seed, **shape)
+    trace = make_trace_for_algorithm(algorithm)
+    automaton = TraceAutomaton.of(algorithm)
+    assert automaton is not None
+
+    check = automaton.check(trace)
+    if not check.valid:
+        assert is_known_divergence(algorithm, trace, check), check
+        return
+    assert check.complete and check.next_act is None
+
+    for k in range(len(trace)):
+        prefix = automaton.check(trace[:k])
+        assert prefix.valid and not prefix.complete
+        assert prefix.next_act == (trace[k]["executes"], trace[k]["phase"])
+
+    rng = random.Random(seed)
+    for k in rng.sample(range(1, len(trace) - 1), min(5, len(trace) - 2)):
+        assert not automaton.check(trace[:k] + trace[k + 1:]).valid, "an act is missing"
+
+
+
+def test_compiled_once_per_algorithm_content(monkeypatch):
+    algorithm = generate_algorithm("ta_cache", seed=0, depth=2, loops=1, alternatives=1)
+    make_trace_for_algorithm(algorithm)
+    # (the same algorithm arrives as a new dict with each request)
+    assert TraceAutomaton.of(copy.deepcopy(algorithm)) is TraceAutomaton.of(copy.deepcopy(algorithm))
+
+    monkeypatch.setattr(trace_automaton, "AUTOMATON_CACHE_SIZE", 2)
+    others = [generate_algorithm("ta_cache_%d" % i, seed=i, depth=1) for i in range(3)]
+    for other in others:
+        TraceAutomaton.of(other)
+    assert len(TraceAutomaton._compiled) == 2
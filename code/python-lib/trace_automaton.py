@@ -0,0 +1,271 @@
+# trace_automaton.py
+
+""" Reasoning-free check of correct traces.
+
+An algorithm is compiled (once for the same content, see `AUTOMATON_CACHE_SIZE`) into a small automaton of its control flow: each state expects one act
+(`executes`, `phase`), the next state after a condition depends on the value attached to the condition's act,
+and a register keeps the pending interrupt (break / continue / return) while blocks are being left.
+
+The automaton accepts the acts of the algorithm as it executes: an alternative ends after the first branch
+whose condition is true. `TraceTester.make_correct_trace()` agrees with it except in one case:
+it looks at the last condition evaluated anywhere, so after a branch whose body ends with a false condition
+(e.g. of a loop) it goes on to the condition of the next branch. Such traces are rejected by the automaton
+and left to the rules.
+
+    automaton = TraceAutomaton.of(alg_dict)  # None if the algorithm has unsupported elements
+    check = automaton.check(trace)           # trace: list of act dicts (as from GUI)
+    check.valid, check.complete, check.next_act
+
+A trace that is a valid prefix of the correct trace for its own condition values needs no reasoning;
+anything else (including acts with unusual fields) is left to the rule engine.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+from alg_model import AlgorithmModel, acts_from_json, algorithm_digest
+
+AUTOMATON_CACHE_SIZE = 256  # compiled algorithms kept (least recently used are dropped)
+
+# instructions of the automaton (tuples: opcode, args...)
+ACT = 0          # (ACT, executes, phase): expect the act
+EXPR = 1         # (EXPR, executes): expect "performed" act of the condition, remember its value
+JUMP = 2         # (JUMP, target)
+JUMP_IF = 3      # (JUMP_IF, value, target): jump if the last condition value is `value`
+SET_MODE = 4     # (SET_MODE, mode): an interrupt happened
+JUMP_IF_MODE = 5 # (JUMP_IF_MODE, target): jump if an interrupt is pending
+LOOP_NEXT = 6    # (LOOP_NEXT, exit target): after loop body: handle pending break / continue / return
+RESET_MODE = 7   # (RESET_MODE,): end of function: return is handled
+END = 8          # (END,)
+
+NORMAL = "normal"
+
+LOOP_TYPES = {"while_loop", "do_while_loop", "do_until_loop", "for_loop", "foreach_loop", "infinite_loop"}
+
+
+class UnsupportedAlgorithm(Exception):
+    pass
+
+
+class TraceCheck:
+    """Result of checking a trace against the automaton"""
+    __slots__ = ('valid', 'complete', 'checked', 'next_act')
+
+    def __init__(self, valid, complete, checked, next_act):
+        self.valid = valid        # all acts are correct
+        self.complete = complete  # the trace contains the whole correct trace ("program finished" included)
+        self.checked = checked    # number of acts that matched
+        self.next_act = next_act  # (executes, phase) expected next (None if complete or invalid)
+
+    def __repr__(self):
+        return "TraceCheck(valid=%s, complete=%s, checked=%d, next_act=%s)" % (
+            self.valid, self.complete, self.checked, self.next_act)
+
+
+class TraceAutomaton:
+    """Compiled control flow of an algorithm: expected acts depending on condition values"""
+    # algorithm_digest() -> TraceAutomaton or None (the same algorithm arrives as a new dict with each request)
+    _compiled = OrderedDict()
+    _lock = Lock()
+
+    def __init__(self, model: AlgorithmModel):
+        self.entry_id = model.entry.id
+        self.program = []
+        self._compile_program(model.entry.data)
+
+    @classmethod
+    def of(cls, alg_dict: dict) -> 'TraceAutomaton':
+        """Automaton of given algorithm, compiled on first request (None if the algorithm cannot be compiled)"""
+        digest = algorithm_digest(alg_dict)
+        with cls._lock:
+            if digest in cls._compiled:
+                cls._compiled.move_to_end(digest)
+                return cls._compiled[digest]
+        model = AlgorithmModel.of(alg_dict)
+        automaton = None
+        if model.entry is not None:
+            try:
+                automaton = cls(model)
+            except (UnsupportedAlgorithm, KeyError, TypeError, ValueError) as e:
+                print("TraceAutomaton: algorithm is not supported:", e)
+        with cls._lock:
+            cls._compiled[digest] = automaton
+            while len(cls._compiled) > AUTOMATON_CACHE_SIZE:
+                cls._compiled.popitem(last=False)
+        return automaton
+
+    # compilation
+
+    def _emit(self, *instr) -> int:
+        self.program.append(instr)
+        return len(self.program) - 1
+
+    def _patch(self, at: int, target: int):
+        """Set jump target (the last arg) of instruction"""
+        self.program[at] = self.program[at][:-1] + (target,)
+
+    def _here(self) -> int:
+        return len(self.program)
+
+    def _compile_program(self, entry: dict):
+        self._emit(ACT, self.entry_id, "started")
+        self._compile(entry)
+        self._emit(ACT, self.entry_id, "finished")
+        self._emit(END)
+
+    def _compile_block(self, nodes):
+        """Statements in order, leaving the block on an interrupt"""
+        exits = []
+        for node in nodes:
+            self._compile(node)
+            exits.append(self._emit(JUMP_IF_MODE, None))
+        for at in exits:
+            self._patch(at, self._here())
+
+    def _compile(self, node: dict):
+        type_ = node["type"]
+        id_ = int(node["id"])
+
+        if type_ == "func":
+            body_id = int(node["body"]["id"])
+            self._emit(ACT, body_id, "started")
+            self._compile_block(node["body"]["body"])
+            self._emit(RESET_MODE)  # return encountered
+            self._emit(ACT, body_id, "finished")
+
+        elif type_ in ("sequence", "else"):
+            # do not wrap 'global_code'
+            wrap = node["name"] != 'global_code'
+            if wrap:
+                self._emit(ACT, id_, "started")
+            self._compile_block(node["body"])
+            if wrap:
+                self._emit(ACT, id_, "finished")
+
+        elif type_ == "alternative":
+            self._emit(ACT, id_, "started")
+            ends = []
+            for branch in node["branches"]:
+                if branch["type"] in ("if", "else-if"):
+                    self._compile(branch["cond"])
+                    skip = self._emit(JUMP_IF, False, None)
+                    self._emit(ACT, int(branch["id"]), "started")
+                    self._compile_block(branch["body"])
+                    self._emit(ACT, int(branch["id"]), "finished")
+                    # the branch is taken: the alternative ends.
+                    # (`make_correct_trace()` looks at the last condition evaluated anywhere, so after a body ending
+                    # with a false loop condition it goes on to the next branch; such traces are left to the rules)
+                    ends.append(self._emit(JUMP, None))
+                    self._patch(skip, self._here())
+                elif branch["type"] == "else":
+                    self._compile(branch)
+                    break
+                else:
+                    raise UnsupportedAlgorithm("branch of type %r" % branch["type"])
+            for at in ends:
+                self._patch(at, self._here())
+            self._emit(ACT, id_, "finished")
+
+        elif type_ == "expr":
+            self._emit(EXPR, id_)
+
+        elif type_ in ("stmt", "break", "continue", "return"):
+            self._emit(ACT, id_, "performed")
+            if type_ != "stmt":
+                self._emit(SET_MODE, type_)
+
+        elif type_ in LOOP_TYPES:
+            self._emit(ACT, id_, "started")
+            stop_value = type_ == "do_until_loop"  # condition value that ends the loop
+            exits = []
+            if type_ in ("for_loop", "foreach_loop"):
+                self._compile(node["init"])
+            if type_ in ("while_loop", "for_loop", "foreach_loop"):
+                self._compile(node["cond"])
+                exits.append(self._emit(JUMP_IF, stop_value, None))
+            top = self._here()
+            if type_ == "foreach_loop":
+                self._compile(node["update"])
+            self._compile(node["body"])  # a loop iteration
+            exits.append(self._emit(LOOP_NEXT, None))
+            if type_ == "for_loop":
+                self._compile(node["update"])
+            if type_ != "infinite_loop":
+                self._compile(node["cond"])
+                exits.append(self._emit(JUMP_IF, stop_value, None))
+            self._emit(JUMP, top)
+            for at in exits:
+                self._patch(at, self._here())
+            self._emit(ACT, id_, "finished")
+
+        else:
+            raise UnsupportedAlgorithm("element of type %r" % type_)
+
+    # execution
+
+    def check(self, trace) -> TraceCheck:
+        """Check that the acts (dicts) form a prefix of the correct trace (for the condition values in the acts)"""
+        program = self.program
+        pc, mode, value = 0, NORMAL, None
+        exec_counts = {}  # (executes, phase) -> n
+        checked = 0
+        acts = acts_from_json(trace)
+        i = 0
+        while True:
+            # follow jumps to the next expecting instruction
+            steps = 0
+            while True:
+                instr = program[pc]
+                op = instr[0]
+                if op in (ACT, EXPR, END):
+                    break
+                steps += 1
+                if steps > len(program):
+                    return TraceCheck(False, False, checked, None)  # a cycle without acts
+                if op == JUMP:
+                    pc = instr[1]
+                elif op == JUMP_IF:
+                    pc = instr[2] if value == instr[1] else pc + 1
+                elif op == SET_MODE:
+                    mode = instr[1]
+                    pc += 1
+                elif op == JUMP_IF_MODE:
+                    pc = instr[1] if mode != NORMAL else pc + 1
+                elif op == LOOP_NEXT:
+                    if mode == "continue":
+                        mode = NORMAL
+                        pc += 1
+                    elif mode == "break":
+                        mode = NORMAL
+                        pc = instr[1]
+                    elif mode != NORMAL:
+                        pc = instr[1]  # return encountered
+                    else:
+                        pc += 1
+                elif op == RESET_MODE:
+                    mode = NORMAL
+                    pc += 1
+
+            if op == END:
+                return TraceCheck(i == len(acts), i == len(acts), checked, None)
+            expected = (instr[1], "performed" if op == EXPR else instr[2])
+            if i == len(acts):
+                return TraceCheck(True, False, checked, expected)
+
+            act = acts[i]
+            if (act.executes, act.phase) != expected:
+                return TraceCheck(False, False, checked, None)
+            n = exec_counts[expected] = exec_counts.get(expected, 0) + 1
+            if act.n != n:
+                return TraceCheck(False, False, checked, None)
+            if op == EXPR:
+                value = act.value
+                if not isinstance(value, bool):
+                    return TraceCheck(False, False, checked, None)  # e.g. "not evaluated"
+            elif act.value is not None:
+                return TraceCheck(False, False, checked, None)
+            if act.is_valid is False:
+                return TraceCheck(False, False, checked, None)  # judged by the rules before
+            checked += 1
+            i += 1
+            pc += 1
@@ -1,7 +1,9 @@
 # json2alg2tr.py
 
 import copy
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 import json
 import re
 import threading
@@ -13,16 +15,123 @@ thread_globals = threading.local()
 SUPPORTED_LANGS = ("ru", "en")
 DEFAULT_LANG = "en"
 
+
+class RenderContext:
+    """ State of rendering algorithms & traces: output language, ids of created nodes and counters of acts.
+    Pass an own context to each request (e.g. from a thread pool) to keep them independent:
+
+        ctx = RenderContext("ru")
+        act_line_for_alg_element(elem, "started", context=ctx)
+
+    Code that does not pass a context uses the default context of current thread.
+    """
+    __slots__ = ('lang', 'max_id', 'n_of_item')
+
+    def __init__(self, lang=None, first_id=1):
+        assert lang is None or lang in SUPPORTED_LANGS, lang
+        self.lang = lang or get_target_lang()
+        self.max_id = first_id
+        self.n_of_item = {}  # item -> int
+
+    @contextmanager
+    def active(self):
+        """ Make this context current for the `with` block """
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+
+_active_context = ContextVar("render_context", default=None)
+
+
+def current_context() -> RenderContext:
+    """ The context activated with `RenderContext.active()` or the default context of current thread """
+    context = _active_context.get()
+    if context is None:
+        try:
+            context = thread_globals.context
+        except AttributeError:
+            context = thread_globals.context = RenderContext(DEFAULT_LANG)
+    return context
+
+
+def render_context(context: RenderContext = None, lang=None) -> RenderContext:
+    """ Context for an entry point that accepts both `context` and `lang`:
+    `lang` overrides the language of given `context`; without a context, `lang` is remembered
+    for current thread (as `set_target_lang()` does) and a new context is made. """
+    if context is None:
+        if lang:
+            set_target_lang(lang)
+        return RenderContext(lang)
+    if lang:
+        assert lang in SUPPORTED_LANGS, lang
+        context.lang = lang
+    return context
+
+
 def set_target_lang(lang_code: str):
-    # global TARGET_LANG
     assert lang_code in SUPPORTED_LANGS, lang_code
-    thread_globals.TARGET_LANG = lang_code
+    current_context().lang = lang_code
 
 def get_target_lang():
-    try:
-        return thread_globals.TARGET_LANG
-    except AttributeError:
-        return DEFAULT_LANG
+    return current_context().lang
+
+
+# word forms by grammemes ('nomn','gent')
+_RU_WORDS = {
+    "comment" 	: ("// ", ),
+    "algorithm" : ("алгоритм", "алгоритма"),
+    "program" 	: ("программа", "программы"),
+    "func" 		: ("функция", "функции"),
+    "alternative" : ("развилка", "развилки"),
+    "branch" 	: ("ветка", "ветки"),
+    "cond" 		: ("условие", "условия"),
+    "cond of" 		: ("условие", "условия"),
+    "if" 		: ("если", ),
+    "else if" 	: ("иначе если", ),
+    "else-if" 	: ("иначе если", ),
+    "else" 		: ("иначе", ),
+    "(branch) else" : ("иначe", ), # (e латинск.)
+    "while" 	: ("пока", ),
+    "do" 		: ("делать", ),
+    "for" 		: ("для", ),
+    "foreach" 	: ("для каждого", ),
+    "in" 		: ("в", ),
+    "trace" 	: ("трасса", ),
+    "nth time" 	: ("-й раз", ),
+    "True" 		: ("истина", ),
+    "False" 	: ("ложь", ),
+    True 		: ("истина", ),
+    False 		: ("ложь", ),
+    "None"		: ("ничего!", ),
+    None		: ("ничего!", ),
+    "not evaluated"		: ("не вычислено", ),
+    "(she) started" 	: ("началась", ),
+    "(she) finished"	: ("закончилась", ),
+    "(he) started" 		: ("начался", ),
+    "(he) finished" 	: ("закончился", ),
+    "(it) started" 		: ("началось", ),
+    "(it) finished" 	: ("закончилось", ),
+    "(she) performed" 	: ("выполнилась", ),
+    "(he) performed" 	: ("выполнился", ),
+    "(it) performed" 	: ("выполнилось", ),
+    "iteration" 	: ("итерация", "итерации"),
+    "loop" 			: ("цикл", "цикла"),
+    "init" 			: ("инициализация", ),
+    "update" 		: ("переход", ),
+    "from" 		: ("от", ),
+    "to" 		: ("до", ),
+    "with step" : ("с шагом", ),
+    # "container is not empty"	: ("контейнер не пуст", ),
+    "first element exists" 		: ("первый элемент существует", ),
+    "next element exists" 		: ("следующий элемент существует", ),
+    "to first element" 			: ("к первому элементу", ),
+    "to next element" 			: ("к следующему элементу", ),
+    "sequence" 			: ("следование", "следования"),
+    "stmt"				: ("действие", "действия", ),
+}
 
 
 def tr(word_en, case='nomn'):
@@ -47,58 +156,7 @@ def tr(word_en, case='nomn'):
 
     grammemes = ('nomn','gent')
     assert case in grammemes, "Unknown case: "+case
-    res = {
-        "comment" 	: ("// ", ),
-        "algorithm" : ("алгоритм", "алгоритма"),
-        "program" 	: ("программа", "программы"),
-        "func" 		: ("функция", "функции"),
-        "alternative" : ("развилка", "развилки"),
-        "branch" 	: ("ветка", "ветки"),
-        "cond" 		: ("условие", "условия"),
-        "cond of" 		: ("условие", "условия"),
-        "if" 		: ("если", ),
-        "else if" 	: ("иначе если", ),
-        "else-if" 	: ("иначе если", ),
-        "else" 		: ("иначе", ),
-        "(branch) else" : ("иначe", ), # (e латинск.)
-        "while" 	: ("пока", ),
-        "do" 		: ("делать", ),
-        "for" 		: ("для", ),
-        "foreach" 	: ("для каждого", ),
-        "in" 		: ("в", ),
-        "trace" 	: ("трасса", ),
-        "nth time" 	: ("-й раз", ),
-        "True" 		: ("истина", ),
-        "False" 	: ("ложь", ),
-        True 		: ("истина", ),
-        False 		: ("ложь", ),
-        "None"		: ("ничего!", ),
-        None		: ("ничего!", ),
-        "not evaluated"		: ("не вычислено", ),
-        "(she) started" 	: ("началась", ),
-        "(she) finished"	: ("закончилась", ),
-        "(he) started" 		: ("начался", ),
-        "(he) finished" 	: ("закончился", ),
-        "(it) started" 		: ("началось", ),
-        "(it) finished" 	: ("закончилось", ),
-        "(she) performed" 	: ("выполнилась", ),
-        "(he) performed" 	: ("выполнился", ),
-        "(it) performed" 	: ("выполнилось", ),
-        "iteration" 	: ("итерация", "итерации"),
-        "loop" 			: ("цикл", "цикла"),
-        "init" 			: ("инициализация", ),
-        "update" 		: ("переход", ),
-        "from" 		: ("от", ),
-        "to" 		: ("до", ),
-        "with step" : ("с шагом", ),
-        # "container is not empty"	: ("контейнер не пуст", ),
-        "first element exists" 		: ("первый элемент существует", ),
-        "next element exists" 		: ("следующий элемент существует", ),
-        "to first element" 			: ("к первому элементу", ),
-        "to next element" 			: ("к следующему элементу", ),
-        "sequence" 			: ("следование", "следования"),
-        "stmt"				: ("действие", "действия", ),
-    }.get(word_en, ())
+    res = _RU_WORDS.get(word_en, ())
     try:
         return res[grammemes.index(case)]
     except IndexError:
@@ -137,10 +195,12 @@ def stringify(obj, trace_format=True, _visitor=None):
 # ========= helper classes ========
 
 class GlobalCounter:
-    # "static" field:
-    N_of_item = {}  # item -> int
+    """ Counts items in current `RenderContext` """
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
+    @property
+    def N_of_item(self) -> dict:  # item -> int
+        return current_context().n_of_item
     def count_item(self, item='any') -> int:
         """ self.register_act("my_item") -> int: number of the item appearance (n of item) """
         count = self.N_of_item.get(item, 0)
@@ -152,18 +212,20 @@ class GlobalCounter:
         self.N_of_item.clear()
 
 class WithID:
-    _maxID = 1
+    """ Takes new ids from current `RenderContext` """
+    __slots__ = ()
     def __init__(self, id=None, *args, **kw):
         super().__init__(*args, **kw)
         self.ID = None
         self.makeID(id)
     def newID(self, existing_id=None):
+        context = current_context()
         if existing_id:
             assert isinstance(existing_id,int), existing_id
-            WithID._maxID = max(WithID._maxID + 1, int(existing_id))
+            context.max_id = max(context.max_id + 1, int(existing_id))
         else:
-            WithID._maxID += 1
-        return WithID._maxID
+            context.max_id += 1
+        return context.max_id
     def makeID(self, existing_id=None):
         if self.ID == None:
             self.ID = WithID.newID(existing_id)
@@ -326,6 +388,10 @@ class TraceJsonVisitor(JsonVisitor):
 
 class JsonNode(object):
     """ JsonNode is base for all json-encoded nodes """
+    __slots__ = ('parent', 'jn_type', 'name', 'data')
+    # поля с дочерними узлами (узел или список), в порядке их настройки; переопределяйте в подклассах,
+    # добавляющих такие поля. None: искать дочерние узлы среди всех полей объекта
+    child_fields = None
     def __init__(self, jn_type="unkn", name="noname"):
         super(JsonNode, self).__init__()
         self.parent = None
@@ -347,12 +413,14 @@ class JsonNode(object):
             child.setup(self)
 
     def get_children(self):
-        """ пройтись по всем полям, и для всех под-объектов дерева, в т.ч. в массивах, вернуть объекты нашего дерева """
+        """ пройтись по полям с дочерними узлами (`child_fields`), и для всех под-объектов дерева, в т.ч. в массивах, вернуть объекты нашего дерева """
         children = []
-        for k in vars(self):   # ! переопределение стандартных методов типа __dict__ ломает vars(self)
-            if k in ('parent', 'owner'):  # !!! ходим только по дочерним данным, игнорируя все где-либо определёные указатели на родительские узлы!
-                continue
-            val = getattr(self, k)
+        fields = self.child_fields
+        if fields is None:
+            fields = [k for k in getattr(self, '__dict__', ())   # ! переопределение стандартных методов типа __dict__ ломает vars(self)
+                      if k not in ('parent', 'owner')]  # !!! ходим только по дочерним данным, игнорируя все где-либо определёные указатели на родительские узлы!
+        for k in fields:
+            val = getattr(self, k, None)
             if isinstance(val, JsonNode):
                 children.append(val)
             elif isinstance(val, list):
@@ -413,20 +481,23 @@ class JsonNode(object):
         if not isinstance(json_node, dict):
             raise Exception("`json_node` must be dict or list or str, not  `%s`" % str(json_node))
 
-        keys = set(json_node.keys())
+        keys = frozenset(json_node.keys())
 
         using_tro = None  # a TypeRecognizeOption
 
-        _any_node_option = cls.any_node_tro()
-        for tro in cls.nodes_tro():
-            mandatory = tro.mandatory | _any_node_option.mandatory
-            optional = tro.optional | _any_node_option.optional
-            forbidden = tro.forbidden | _any_node_option.forbidden
-
-            # проверим, что всё на месте, и нет ничего лишнего
-            if not(mandatory - keys) and not(forbidden & keys) and not(keys - mandatory - optional):
-                using_tro = tro
-                break
+        if TYPE_DISPATCH:
+            using_tro = TypeDispatch.of(cls.nodes_tro(), cls.any_node_tro()).find(keys)
+        else:
+            _any_node_option = cls.any_node_tro()
+            for tro in cls.nodes_tro():
+                mandatory = tro.mandatory | _any_node_option.mandatory
+                optional = tro.optional | _any_node_option.optional
+                forbidden = tro.forbidden | _any_node_option.forbidden
+
+                # проверим, что всё на месте, и нет ничего лишнего
+                if not(mandatory - keys) and not(forbidden & keys) and not(keys - mandatory - optional):
+                    using_tro = tro
+                    break
 
         if not using_tro:
             raise Exception("cannot resolve json_node with following keys:  `%s`" % str(keys))
@@ -445,6 +516,8 @@ class JsonNode(object):
 
 
 class GenericAlgorithmJsonNode(JsonNode, WithID):
+    __slots__ = ('ID', 'expand_act', 'noexpand_act', 'gen', 'act_line_format_str')
+    child_fields = ()
     def __init__(self, *args, expand_act="auto",noexpand_act="auto", **kw):
         super().__init__(*args, **kw)
         self.expand_act = expand_act
@@ -509,6 +582,8 @@ if TraceTextVisitor:
 
 
 class AlgorithmRootJN(GenericAlgorithmJsonNode):
+    __slots__ = ('funcs_and_stmts', 'noexpand_types')
+    child_fields = ('funcs_and_stmts',)
     def __init__(self, jn_type="unkn", algorithm=None, noexpand_types=None, **kw):
         super(AlgorithmRootJN, self).__init__(jn_type, name='algorithm', **kw)
         assert jn_type == "algorithm", jn_type
@@ -603,6 +678,7 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_AlgorithmRootJN = _
 
 class StatementAtomJN(GenericAlgorithmJsonNode):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", name='noname', **kw):
         super().__init__(jn_type, name=name, **kw)
         assert jn_type == "stmt", jn_type
@@ -632,6 +708,7 @@ if TraceJsonVisitor:
 
 
 class NameOnlyStatementJN(GenericAlgorithmJsonNode):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", name='noname', **kw):
         super().__init__(jn_type, name=name, **kw)
         assert jn_type in ("break","continue","return",), jn_type
@@ -663,6 +740,8 @@ if TraceJsonVisitor:
 
 
 class FuncJN(GenericAlgorithmJsonNode):
+    __slots__ = ('body', 'is_entry', 'param_list')
+    child_fields = ('body',)
     def __init__(self, jn_type="unkn", func="noname", body=None, is_entry=None, param_list=None, **kw):
         super(FuncJN, self).__init__(jn_type, name=func, **kw)
         assert jn_type == "func", jn_type
@@ -730,6 +809,8 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_FuncJN = _
 
 class AlternativeJN(GenericAlgorithmJsonNode):
+    __slots__ = ('branches',)
+    child_fields = ('branches',)
     def __init__(self, jn_type="unkn", alternative=None, alt='noname', branches=None, **kw):
         super(AlternativeJN, self).__init__(jn_type, name=alternative or alt, **kw)
         assert jn_type == "alternative", jn_type
@@ -798,6 +879,8 @@ if TraceJsonVisitor:
 
 
 class GenericAlternativeBranch(GenericAlgorithmJsonNode):
+    __slots__ = ('stmts',)
+    child_fields = ('stmts',)
     def __init__(self, jn_type="unkn", stmt=None, **kw):
         super(GenericAlternativeBranch, self).__init__(jn_type, name="noname", **kw)
         assert jn_type in ("if", "else if", "else"), jn_type
@@ -829,6 +912,7 @@ if TraceTextVisitor:
     TraceTextVisitor.visit_GenericAlternativeBranch = _
 
 class GenericCondition(GenericAlgorithmJsonNode):
+    __slots__ = ('cond', 'owner')
     def __init__(self, cond=None, owner=None, name="", **kw):
         super(GenericCondition, self).__init__("cond", name=name, **kw)
         self.cond = cond
@@ -881,6 +965,8 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_GenericCondition = _
 
 class ConditionalAlternativeBranch(GenericAlternativeBranch):
+    __slots__ = ('cond', 'cond_obj')
+    child_fields = ('stmts', 'cond_obj')
     def __init__(self, jn_type="unkn", cond=None, stmt=None, **kw):
         super(ConditionalAlternativeBranch, self).__init__(jn_type, stmt=stmt, **kw)
         assert jn_type in ("if", "else if"), jn_type
@@ -942,16 +1028,19 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_ConditionalAlternativeBranch = _
 
 class IfBranchJN(ConditionalAlternativeBranch):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", then=None, **kw):
         super(IfBranchJN, self).__init__(jn_type, cond=kw["if"], stmt=then, **{k:kw[k] for k in kw if k!="if"})
         assert jn_type == "if", jn_type
 
 class ElseIfBranchJN(ConditionalAlternativeBranch):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", then=None, **kw):
         super(ElseIfBranchJN, self).__init__(jn_type, cond=kw["else if"], stmt=then, **{k:kw[k] for k in kw if k!="else if"})
         assert jn_type == "else if", jn_type
 
 class ElseBranchJN(GenericAlternativeBranch):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", **kw):
         super(ElseBranchJN, self).__init__(jn_type, stmt=kw["else"], **{k:kw[k] for k in kw if k!="else"})
         assert jn_type == "else", jn_type
@@ -995,6 +1084,8 @@ if TraceJsonVisitor:
 
 
 class GenericLoop(GenericAlgorithmJsonNode):
+    __slots__ = ('body',)
+    child_fields = ('body',)
     def __init__(self, jn_type="unkn", name="noname", body=None, **kw):
         super(GenericLoop, self).__init__(jn_type, name, **kw)
         assert jn_type in ("while", "do while", "for", "foreach"), jn_type
@@ -1056,6 +1147,8 @@ if TraceTextVisitor:
     TraceTextVisitor.loop_make_iteration = _
 
 class ConditionalLoop(GenericLoop):
+    __slots__ = ('cond', 'cond_obj')
+    child_fields = ('body', 'cond_obj')
     def __init__(self, jn_type="unkn", name="noname", cond=None, body=None, **kw):
         super(ConditionalLoop, self).__init__(jn_type, name, body, **kw)
         assert jn_type in ("while", "do while", "for"), jn_type
@@ -1074,6 +1167,7 @@ class ConditionalLoop(GenericLoop):
         return {"cond": self.cond}
 
 class WhileJN(ConditionalLoop):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", name="noname", body=None, **kw):
         super(WhileJN, self).__init__(jn_type, name, cond=kw["while"], body=body, **{k:kw[k] for k in kw if k!="while"})
         assert jn_type == "while", jn_type
@@ -1131,6 +1225,7 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_WhileJN = _
 
 class DoWhileJN(ConditionalLoop):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", name="noname", body=None, **kw):
         super(DoWhileJN, self).__init__(jn_type, name, cond=kw["do while"], body=body, **{k:kw[k] for k in kw if k!="do while"})
         assert jn_type == "do while", jn_type
@@ -1189,6 +1284,8 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_DoWhileJN = _
 
 class ForJN(ConditionalLoop):
+    __slots__ = ('loop_var', 'range_start', 'init_stmt', 'step', 'update_stmt', 'range_end',
+                 'init_act', 'cond_act', 'update_act')
     def __init__(self, jn_type="unkn", name="noname", body=None, **kw):
         assert "for" in kw
         self.loop_var = str(kw["for"])
@@ -1344,6 +1441,7 @@ if TraceJsonVisitor:
 
 
 class ForEachLoopCondition(GenericCondition):
+    __slots__ = ('is_first_time',)
     def __init__(self, cond=None, owner=None, **kw):
         super(ForEachLoopCondition, self).__init__(cond=tr("to next element"), owner=owner, name="", **kw)
         self.is_first_time = False  # это поле нужно явно устанавливать извне
@@ -1379,6 +1477,8 @@ if TraceJsonVisitor:
     TraceJsonVisitor.visit_ForEachLoopCondition = TraceJsonVisitor.visit_GenericCondition
 
 class ForEachJN(GenericLoop):
+    __slots__ = ('variable', 'container', 'cond_obj')
+    child_fields = ('body', 'cond_obj')
     def __init__(self, jn_type="unkn", name="noname", foreach=None, body=None, **kw):
         assert "in" in kw
         super(ForEachJN, self).__init__(jn_type, name, body=body, **{k:kw[k] for k in kw if k!="in"})
@@ -1503,6 +1603,8 @@ if TraceJsonVisitor:
 
 
 class SequenceJN(GenericAlgorithmJsonNode):
+    __slots__ = ('stmts',)
+    child_fields = ('stmts',)
     def __init__(self, stmts=None, **kw):
         super(SequenceJN, self).__init__(jn_type="sequence", **{k:kw[k] for k in kw if k!="jn_type"})
         assert self.jn_type == "sequence", self.jn_type
@@ -1555,6 +1657,7 @@ if TraceTextVisitor:
 
 
 class NamedSequenceJN(SequenceJN):
+    __slots__ = ()
     def __init__(self, jn_type="unkn", name="noname", sequence=None, **kw):
         super(NamedSequenceJN, self).__init__(stmts=sequence, jn_type=jn_type, name=name, **kw)
         assert jn_type == "sequence", jn_type
@@ -1848,6 +1951,49 @@ TypeRecognizeOption = namedtuple("TypeRecognizeOption", [
     "callback", "args"
     ])
 
+TYPE_DISPATCH = True  # set False to try all options of a node map for each JSON node (e.g. to compare)
+
+
+class TypeDispatch:
+    """ Выбор TypeRecognizeOption по набору ключей JSON-узла: опции объединяются с общей опцией один раз,
+    а найденная опция запоминается для каждой сигнатуры (frozenset ключей).
+    Note: a node map is expected not to be changed after first use. """
+    _dispatchers = {}  # (id(node map), id(common option)) -> TypeDispatch
+
+    def __init__(self, node_map: list, any_node_option: TypeRecognizeOption):
+        self.node_map = node_map  # (keeps the list alive so its id can't be reused)
+        self.any_node_option = any_node_option
+        self.options = [
+            (tro,
+             tro.mandatory | any_node_option.mandatory,
+             tro.mandatory | tro.optional | any_node_option.mandatory | any_node_option.optional,  # allowed keys
+             tro.forbidden | any_node_option.forbidden)
+            for tro in node_map
+        ]
+        self.by_signature = {}  # frozenset of keys -> TypeRecognizeOption
+
+    @classmethod
+    def of(cls, node_map, any_node_option) -> 'TypeDispatch':
+        key = (id(node_map), id(any_node_option))
+        dispatch = cls._dispatchers.get(key)
+        if dispatch is None:
+            dispatch = cls._dispatchers[key] = cls(node_map, any_node_option)
+        return dispatch
+
+    def find(self, keys: frozenset) -> TypeRecognizeOption:
+        """The first option that fits the keys (None if none)"""
+        try:
+            return self.by_signature[keys]
+        except KeyError:
+            pass
+        for tro, mandatory, allowed, forbidden in self.options:
+            # проверим, что всё на месте, и нет ничего лишнего
+            if mandatory <= keys and forbidden.isdisjoint(keys) and keys <= allowed:
+                self.by_signature[keys] = tro
+                return tro
+        return None  # (not remembered: such nodes are errors)
+
+
 # общее для всех узлов алгоритма
 _any_alg_node_option = TypeRecognizeOption(
         set(),
@@ -1976,13 +2122,25 @@ def boolean_line_usage_report(boolean_line, visitor_obj):
         return "%s (auto-expanded from %s)" % (actual_line, (boolean_line or "''"))
 
 
-def act_line_for_alg_element(alg_element: dict, phase: str, expr_value=False, use_exec_time=0, lang=None) -> dict:
+def act_line_for_alg_element(alg_element: dict, phase: str, expr_value=False, use_exec_time=0, lang=None,
+                             context: RenderContext = None) -> dict:
     """ Produce trace acts strings separately with minimum of config (no whole algorithm tree is required). We tried to maintain maximum flexibility.
     Not all algorithm structures are covered, but only the most frequently used ones.
+    `context`: RenderContext to render within (see `render_context()` for how it is combined with `lang`).
     """
-    if lang:
-        set_target_lang(lang)
+    context = render_context(context, lang)
+
+    with context.active():
+        if ACT_LINE_TEMPLATES:
+            text_trace = _act_line_from_template(alg_element, phase, expr_value, use_exec_time)
+            if text_trace is not None:
+                return text_trace
+
+        return _render_act_line(alg_element, phase, expr_value, use_exec_time)
 
+
+def _render_act_line(alg_element: dict, phase: str, expr_value=False, use_exec_time=0) -> str:
+    """ The full way of making act line: build JsonNode(s) for the element, format & patch the line """
     elem_type = alg_element["type"]
     elem_type = elem_type.replace('-', ' ')
     suffix = '_loop'
@@ -2093,10 +2251,103 @@ def act_line_for_alg_element(alg_element: dict, phase: str, expr_value=False, us
     # return "Not implemented: act_line_to_string(act_json) -> str"
 
 def find_tro_for_act_type(act_type: str):
-    for tro in _alg_node_map:
-        if tro.args["jn_type"] == act_type:
-            return tro
-    return None
+    global _act_type2tro
+    if _act_type2tro is None:
+        # (fill a new dict before publishing it, as other threads may look into it meanwhile)
+        act_type2tro = {}
+        for tro in reversed(_alg_node_map):  # (the first option wins)
+            act_type2tro[tro.args["jn_type"]] = tro
+        _act_type2tro = act_type2tro
+    return _act_type2tro.get(act_type)
+
+_act_type2tro = None
+
+
+# Act line templates.
+# A template is made once for (element type, phase, language, expr value, ...) by rendering
+# an element having placeholder names, so the line for any element of that type is then a single `str.format()`.
+
+ACT_LINE_TEMPLATES = True  # set False to always use the full rendering (e.g. to compare)
+ACT_LINE_TEMPLATES_SIZE = 1024  # templates kept (least recently used are dropped; expr values come from requests)
+
+_NAME_PH = "QqNAMEqQ"
+_COND_PH = "QqCONDqQ"
+# exec time placeholders for 0, one-digit and longer numbers (`patch_trace()` treats them differently);
+# there are no other digits in a template and no "1th", "2th", "3th" inside
+_N_PH = (0, 7, 90817260)
+_LOOP_BODY_SUFFIX = '_loop_body'
+# names that `patch_trace()` could change or move (these are rendered in full way)
+_UNSAFE_NAME_RE = re.compile(r"[^\w]|^\d|[123]th|program|alternative|global_code|iteration|condition|began|ended|executed")
+_act_line_templates = OrderedDict()
+_act_line_templates_lock = threading.Lock()
+
+
+def _template_key(alg_element: dict, phase, expr_value, use_exec_time):
+    """ -> (key, names to substitute) or None if the element cannot be rendered via template """
+    name = alg_element.get("name")
+    if not isinstance(name, str):
+        return None
+    elem_type = alg_element.get("type")
+    is_loop_body = elem_type == "sequence" and name.endswith(_LOOP_BODY_SUFFIX)
+    if is_loop_body:
+        name = name[:-len(_LOOP_BODY_SUFFIX)]
+    names = [name]
+    if "cond" in alg_element:
+        names.append(alg_element["cond"].get("name") if isinstance(alg_element["cond"], dict) else None)
+        if not isinstance(names[-1], str):
+            return None
+    if not all(names) or any(_UNSAFE_NAME_RE.search(nm) for nm in names):
+        return None
+    if not (isinstance(expr_value, bool) or expr_value is None or isinstance(expr_value, str) and not re.search(r"\d", expr_value)):
+        return None
+    if not isinstance(use_exec_time, int) or use_exec_time < 0:
+        return None
+    n_kind = min(len(str(use_exec_time)), 2) if use_exec_time else 0
+    key = (elem_type, phase, get_target_lang(), type(expr_value), expr_value, n_kind, is_loop_body, len(names))
+    return key, names
+
+
+def _compile_act_line_template(key) -> str:
+    elem_type, phase, _, _, expr_value, n_kind, is_loop_body, names_count = key
+    sample = {
+        "type": elem_type,
+        "name": _NAME_PH + (_LOOP_BODY_SUFFIX if is_loop_body else ''),
+    }
+    if names_count > 1:
+        sample["cond"] = {"name": _COND_PH}
+    n = _N_PH[n_kind]
+    line = _render_act_line(sample, phase, expr_value, n)
+    # make a format string of it
+    line = line.replace("{", "{{").replace("}", "}}")
+    line = line.replace(_NAME_PH, "{0}").replace(_COND_PH, "{1}")
+    if n:
+        line = line.replace("%dth" % n, "{2}{3}").replace(str(n), "{2}")
+    return line
+
+
+def _nth_suffix(n) -> str:
+    """ Same as `patch_trace()` does with "1th", "2th", "3th" """
+    return {"1": "st", "2": "nd", "3": "rd"}.get(str(n)[-1], "th")
+
+
+def _act_line_from_template(alg_element: dict, phase, expr_value, use_exec_time):
+    """ Render act line via template; None if it is not applicable for given element """
+    key_names = _template_key(alg_element, phase, expr_value, use_exec_time)
+    if not key_names:
+        return None
+    key, names = key_names
+    with _act_line_templates_lock:
+        template = _act_line_templates.get(key)
+        if template is not None:
+            _act_line_templates.move_to_end(key)
+    if template is None:
+        template = _compile_act_line_template(key)
+        with _act_line_templates_lock:
+            _act_line_templates[key] = template
+            while len(_act_line_templates) > ACT_LINE_TEMPLATES_SIZE:
+                _act_line_templates.popitem(last=False)
+    names.append('')
+    return template.format(names[0], names[1], use_exec_time, _nth_suffix(use_exec_time))
 
 
 def patch_trace(trace: str) -> str:
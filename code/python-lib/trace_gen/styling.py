@@ -17,18 +17,43 @@ The resulting HTML should be something like this:
 </span>`
 
 
-See also: `to_html()` function below for how to convert html_tags to HTML string.
+See also: `to_html()` function below for how to convert html_tags to HTML string
+(`line_to_html()` makes HTML of a line right away).
 
 Discovered later: Stan - HTML construction with Python code http://docs.g-vo.org/meetstan.html
 Found there: https://wiki.python.org/moin/Templating
 
 """
 
+from functools import lru_cache
+from html import escape
 import re
 
 # from trace_gen.dict_helpers import find_by_key_in
 
 
+SINGLE_PASS_HIGHLIGHTER = True  # set False to tokenize with the rule-by-rule lexer (e.g. to compare)
+
+KEYWORD_REGEX = r"(?:начался|началась|началось|began|закончился|закончилась|закончилось|ended|выполнился|выполнилась|выполнилось|executed|evaluated|calculated|если|иначе|делать|пока|для|от|до|шаг|с\s+шагом|if|else|do|while|for|from|to|with\s+step|step|каждого|в|из|по|к|foreach|each|in|break|continue|return)(?=\s|\b|$)"
+
+STRUCT_REGEX = r"(?:развилка|развилки|альтернативная|ветка|branch|alternative|selection|условия|переход|update|итерация|iteration|иначe|условие|цикла|condition|of|loop|инициализация|init|initialization|цикл|следование|sequence)(?=\s|\b|$)"
+
+# (regex, token type or None) tried in this order at each position of a line (all case-insensitive)
+LEXER_RULES = [
+    (KEYWORD_REGEX, "keyword"),
+    (r"true|false|ложь|истина|not evaluated|не вычислено", "atom"),
+    (r"(?P<quote>[\"'])(?:\.|[^\"'])*(?P=quote)", "string"),
+    (r"\d+(?:st|nd|rd|th)?", "number"),  # /0x[a-f\d]+|[-+]?(?:\.\d+|\d+\.?\d*)(?:e[-+]?\d+)?/i,
+    (r"(?:\/\/|#).*", "comment"),
+    (STRUCT_REGEX, "struct"),
+    (r"действие|action|statement|stmt", "action"),
+    (r"программа|program", "program"),
+    (r"функция|function", "function"),
+    (r"й|раз|time", None),
+    (r"[\wа-яё\d]+", "variable"),
+]
+
+
 def make_lexer():
     """create and return lexer function
     that receives a string with tokens
@@ -36,27 +61,9 @@ def make_lexer():
         0) count of chars consumed by token;
         1) type of token found or None.
     """
-    keyword_re = re.compile(r"(?:начался|началась|началось|began|закончился|закончилась|закончилось|ended|выполнился|выполнилась|выполнилось|executed|evaluated|calculated|если|иначе|делать|пока|для|от|до|шаг|с\s+шагом|if|else|do|while|for|from|to|with\s+step|step|каждого|в|из|по|к|foreach|each|in|break|continue|return)(?=\s|\b|$)", re.I)
-
-    struct_re = re.compile(r"(?:развилка|развилки|альтернативная|ветка|branch|alternative|selection|условия|переход|update|итерация|iteration|иначe|условие|цикла|condition|of|loop|инициализация|init|initialization|цикл|следование|sequence)(?=\s|\b|$)", re.I)
-
     simple_mode = {
       # The start state contains the rules that are intially used
-      'start': [
-        {'regex': keyword_re, 'token': "keyword"},
-        {'regex': re.compile(r"true|false|ложь|истина|not evaluated|не вычислено", re.I), 'token': "atom"},
-        {'regex': re.compile(r"([\"'])(?:\.|[^\"'])*\1", re.I), 'token': "string"},
-        {'regex': re.compile(r"\d+(?:st|nd|rd|th)?", re.I),
-          # /0x[a-f\d]+|[-+]?(?:\.\d+|\d+\.?\d*)(?:e[-+]?\d+)?/i,
-         'token': "number"},
-        {'regex': re.compile(r"(?:\/\/|#).*"), 'token': "comment"},
-        {'regex': struct_re, 'token': "struct"},
-        {'regex': re.compile(r"действие|action|statement|stmt", re.I), 'token': "action"},
-        {'regex': re.compile(r"программа|program", re.I), 'token': "program"},
-        {'regex': re.compile(r"функция|function", re.I), 'token': "function"},
-        {'regex': re.compile(r"й|раз|time", re.I), 'token': None},
-        {'regex': re.compile(r"[\wа-яё\d]+", re.I), 'token': "variable"}
-      ],
+      'start': [{'regex': re.compile(regex, re.I), 'token': token} for regex, token in LEXER_RULES],
     }
 
     state = 'start'
@@ -73,11 +80,48 @@ def make_lexer():
 _lexer = make_lexer()
 
 
+def make_master_regex(rules=LEXER_RULES) -> (re.Pattern, dict):
+    """Join all rules into one regex with a named group per rule (the first matching alternative wins,
+    as with trying the rules in order). Returns the regex and {group name -> token type}."""
+    group2token = {}
+    alternatives = []
+    for i, (regex, token) in enumerate(rules):
+        group = "rule%d" % i
+        group2token[group] = token
+        alternatives.append("(?P<%s>%s)" % (group, regex))
+    return re.compile("|".join(alternatives), re.I), group2token
+
+
+_master_regex, _group2token = make_master_regex()
+
+
+def iter_tokens(line: str) -> '(token, style), ...':
+    """Tokenize `line` in a single pass; text not matched by any rule is yielded with `None` style
+    (adjacent unstyled pieces are not joined here)."""
+    pos = 0
+    for m in _master_regex.finditer(line):
+        start = m.start()
+        if start > pos:
+            yield line[pos:start], None
+        yield m[0], _group2token[m.lastgroup]
+        pos = m.end()
+    if pos < len(line):
+        yield line[pos:], None
+
+
 def parse_line(line: str) -> '[(token, style), ...]':
     """For each token in given text `line` return token itself and CSS class that provides
      coloring for that token (keyword, identifier, literal, etc.)
     """
     tokens = []
+    if SINGLE_PASS_HIGHLIGHTER:
+        for tok, style in iter_tokens(line):
+            if not style and tokens and (not tokens[-1][1]):
+                tokens[-1] = (tokens[-1][0] + tok, style)
+            else:
+                tokens.append((tok, style))
+        return tokens
+
     while line:
         L, style = _lexer(line)
         tok = line[:L]
@@ -89,6 +133,23 @@ def parse_line(line: str) -> '[(token, style), ...]':
     return tokens
 
 
+def line_to_html(line: str, styles: dict = None) -> str:
+    """The same as `to_html(prepare_tags_for_line(line), styles=styles)`, written directly into a string buffer"""
+    if not SINGLE_PASS_HIGHLIGHTER:
+        return to_html(prepare_tags_for_line(line), styles=styles)
+    text = line.lstrip()
+    parts = ["&nbsp;" * (len(line) - len(text))]
+    for tok, style in iter_tokens(text):
+        tok = escape(tok, quote=False)
+        if not style:
+            parts.append(tok)
+        elif styles and styles.get(style):
+            parts.append('<span style="%s">%s</span>' % (styles[style].replace('"', ''), tok))
+        else:
+            parts.append('<span class="%s">%s</span>' % (style, tok))
+    return ''.join(parts)
+
+
 def prepare_tag_for_word(word, style=None) -> 'dict or str':
     """Return a html tag node wrapping given `word` in a `<span>` tag with `style` CSS class attached. """
     if style:
@@ -108,7 +169,7 @@ def prepare_tags_for_line(line: str) -> list:
     leading_spaces = len(line) - len(line.lstrip())
     if leading_spaces > 0:
         elements += ["&nbsp;" * leading_spaces]
-    elements += [prepare_tag_for_word(word, style) for word, style in parse_line(line.lstrip())]
+    elements += [prepare_tag_for_word(escape(word, quote=False), style) for word, style in parse_line(line.lstrip())]
     return elements
 
 
@@ -128,9 +189,11 @@ def prepare_tags_for_text(multiline_text) -> dict:
     return html
 
 
-def to_html(element: str or dict or list, sep='') -> str:
+def to_html(element: str or dict or list, sep='', styles: dict = None) -> str:
     """Serialize `element` (prepared tags) as html string.
-    If `element` is a list, then `sep` would be inserted between its elements (empty by default)."""
+    If `element` is a list, then `sep` would be inserted between its elements (empty by default).
+    `styles`: {CSS class -> declarations} (see `parse_stylesheet()`) to inline as `style=` attributes
+    instead of those classes (the tags are not changed)."""
     if not element:
         return ''
 
@@ -138,14 +201,17 @@ def to_html(element: str or dict or list, sep='') -> str:
         return str(element)
 
     if isinstance(element, (list, tuple)):
-        inner = sep.join(map(to_html, element))
+        inner = sep.join(to_html(e, styles=styles) for e in element)
         return inner
 
     if isinstance(element, dict):
         tag = element.get('tag', "")
-        attrs = ''.join(f' %s="%s"' % (k, to_html(v, sep=" ").replace('"', r'')) for k, v in element.get('attributes', {}).items())
+        attributes = element.get('attributes', {})
+        if styles and "class" in attributes:
+            attributes = inline_styles(attributes, styles)
+        attrs = ''.join(f' %s="%s"' % (k, to_html(v, sep=" ").replace('"', r'')) for k, v in attributes.items())
         # inner = ''.join(map(to_html, element.get('content', ())))
-        inner = to_html(element.get('content', ()))
+        inner = to_html(element.get('content', ()), styles=styles)
         if not tag:
             return inner
 
@@ -177,49 +243,49 @@ def find_by_key_in(key, dict_or_list, _not_entry=None):
                 yield from find_by_key_in(key, d, _not_entry)
 
 
+CSS_RULE_RE = re.compile(r'([\w-]+)\s*\{([^}]+?)\}')
+
+
+@lru_cache(maxsize=32)
+def parse_stylesheet(CSS_string: str) -> dict:
+    """Map each class (or other name right before `{`) of the stylesheet to its declarations;
+    the first rule wins. Parsed once per stylesheet (the recently used ones are kept; do not modify the result)."""
+    styles = {}
+    for m in CSS_RULE_RE.finditer(CSS_string):
+        styles.setdefault(m[1], m[2].strip())
+    return styles
+
+
+def inline_styles(attributes: dict, styles: dict) -> dict:
+    """Copy of tag `attributes` with the classes found in `styles` replaced with `style=` declarations
+    (empty classes are dropped as well)"""
+    css_classes = attributes.get("class")
+    if css_classes is None:
+        return attributes
+    attributes = dict(attributes)
+    inlined = [styles[cls] for cls in css_classes if cls and styles.get(cls)]
+    if inlined:
+        # set or reassign
+        attributes["style"] = attributes.get("style", []) + inlined  # stored as array
+    css_classes = [cls for cls in css_classes if cls and not styles.get(cls)]
+    if css_classes:
+        attributes["class"] = css_classes
+    else:
+        # remove class key if empty
+        del attributes["class"]
+    return attributes
+
+
 def inline_class_as_style(html_tags, CSS_string=None):
-    """insert css as `style=` attribute instead of `class=` and styles defined elsewhere"""
+    """insert css as `style=` attribute instead of `class=` and styles defined elsewhere.
+    Note: `to_html(html_tags, styles=parse_stylesheet(CSS_string))` does the same while serializing."""
     if not CSS_string:
         return html_tags
 
-    cls2style = {}
+    styles = parse_stylesheet(CSS_string)
 
     for html_tag in find_by_key_in("attributes", html_tags):
-        attributes = html_tag["attributes"]
-        if "class" not in attributes:
-            continue
-
-        css_classes = attributes["class"]
-        for cls in css_classes[:]:
-            if not cls:
-                # remove this empty class
-                css_classes.remove(cls)
-                continue
-            css = None
-            if cls not in cls2style:
-                pattern = r'\b' + cls + r'\s*\{([^}]+?)\}'
-                RE_CSS_STYLE = re.compile(pattern)
-                m = RE_CSS_STYLE.search(CSS_string)
-                if m:
-                    css = m[1].strip()
-                cls2style[cls] = css  # even if None
-            else:
-                css = cls2style[cls]
-
-            if not css:
-                continue
-
-            existing_style = html_tag["attributes"].get("style", [])  # stored as array
-            existing_style.append(css)
-            # set or reassign
-            html_tag["attributes"]["style"] = existing_style
-
-            # remove class replaced with CSS
-            css_classes.remove(cls)
-
-        # remove class key if empty
-        if not css_classes:
-            del html_tag["attributes"]["class"]
+        html_tag["attributes"] = inline_styles(html_tag["attributes"], styles)
     return html_tags
 
 